@@ -0,0 +1,46 @@
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.cache_policies import Inputs
+from prefect.utilities.hashing import hash_objects
+
+ARGUMENT_SIZES = [1_000, 100_000, 10_000_000, 100_000_000]
+
+
+def _bytes_argument(size: int) -> Any:
+    return bytes(size)
+
+
+def _array_argument(size: int) -> Any:
+    np = pytest.importorskip("numpy")
+    return np.zeros(size // 8, dtype="float64")
+
+
+@pytest.mark.parametrize("size", ARGUMENT_SIZES)
+@pytest.mark.parametrize(
+    "make_argument", [_bytes_argument, _array_argument], ids=["bytes", "numpy"]
+)
+def bench_inputs_compute_key(
+    benchmark: "BenchmarkFixture", make_argument: Any, size: int
+):
+    inputs = {"x": make_argument(size)}
+    policy = Inputs()
+    benchmark.extra_info["argument_bytes"] = size
+    benchmark(policy.compute_key, task_ctx=None, inputs=inputs, flow_parameters=None)
+
+
+@pytest.mark.parametrize("size", ARGUMENT_SIZES)
+@pytest.mark.parametrize(
+    "make_argument", [_bytes_argument, _array_argument], ids=["bytes", "numpy"]
+)
+def bench_hash_objects_baseline(
+    benchmark: "BenchmarkFixture", make_argument: Any, size: int
+):
+    # The cost of serializing and hashing the same inputs without content hashing
+    inputs = {"x": make_argument(size)}
+    benchmark.extra_info["argument_bytes"] = size
+    benchmark(hash_objects, inputs)
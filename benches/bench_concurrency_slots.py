@@ -0,0 +1,114 @@
+"""
+Benchmarks for acquiring and releasing global concurrency limit slots on the server
+from many concurrent clients, with slots counted directly in the database or by the
+in-memory slot ledger.
+
+Like the other benchmarks, these run against the database in your current settings.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Generator, Optional
+from uuid import UUID
+
+import pytest
+
+from prefect.server.concurrency.slot_ledger.memory import ConcurrencySlotLedger
+from prefect.server.database import PrefectDBInterface, provide_database_interface
+from prefect.server.models.concurrency_limits_v2 import (
+    bulk_decrement_active_slots,
+    bulk_increment_active_slots,
+    create_concurrency_limit,
+    delete_concurrency_limit,
+)
+from prefect.server.schemas.core import ConcurrencyLimitV2
+from prefect.settings import (
+    PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER,
+    temporary_settings,
+)
+
+CLIENT_COUNTS = [1, 10, 50]
+ACQUIRES_PER_CLIENT = 20
+LEDGERS = {
+    "database": None,
+    "memory": "prefect.server.concurrency.slot_ledger.memory",
+}
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.fixture(scope="module")
+def loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def db(loop: asyncio.AbstractEventLoop) -> PrefectDBInterface:
+    db = provide_database_interface()
+    loop.run_until_complete(db.create_db())
+    return db
+
+
+async def create_limit(db: PrefectDBInterface, name: str, limit: int) -> UUID:
+    async with db.session_context(begin_transaction=True) as session:
+        await delete_concurrency_limit(session=session, name=name)
+        model = await create_concurrency_limit(
+            session=session,
+            concurrency_limit=ConcurrencyLimitV2(name=name, limit=limit),
+        )
+        return model.id
+
+
+async def acquire_and_release(db: PrefectDBInterface, concurrency_limit_id: UUID):
+    for _ in range(ACQUIRES_PER_CLIENT):
+        # each acquire and release is its own request, like the API's
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                if await bulk_increment_active_slots(
+                    session=session,
+                    concurrency_limit_ids=[concurrency_limit_id],
+                    slots=1,
+                ):
+                    break
+                await session.rollback()
+            await asyncio.sleep(0)
+
+        async with db.session_context(begin_transaction=True) as session:
+            await bulk_decrement_active_slots(
+                session=session, concurrency_limit_ids=[concurrency_limit_id], slots=1
+            )
+
+
+@pytest.mark.parametrize("clients", CLIENT_COUNTS)
+@pytest.mark.parametrize("ledger", LEDGERS.keys())
+def bench_concurrent_acquires(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    db: PrefectDBInterface,
+    ledger: str,
+    clients: int,
+):
+    slot_ledger: Optional[str] = LEDGERS[ledger]
+
+    async def contend(concurrency_limit_id: UUID) -> None:
+        await asyncio.gather(
+            *(acquire_and_release(db, concurrency_limit_id) for _ in range(clients))
+        )
+
+    with temporary_settings({PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER: slot_ledger}):
+        # the limit admits half of the clients at a time, so they contend for slots
+        concurrency_limit_id = loop.run_until_complete(
+            create_limit(db, f"bench-{ledger}-{clients}", max(clients // 2, 1))
+        )
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(contend(concurrency_limit_id)),
+            rounds=5,
+        )
+        if slot_ledger:
+            loop.run_until_complete(ConcurrencySlotLedger().flush())
+
+    benchmark.extra_info["acquires_per_second"] = (
+        clients * ACQUIRES_PER_CLIENT / benchmark.stats.stats.mean
+    )
@@ -0,0 +1,109 @@
+"""
+Benchmarks for writing events to the database with each of the supported write
+methods.
+
+Like the other benchmarks, these run against the database in your current settings;
+the `copy` write method is only benchmarked when that database is PostgreSQL.
+"""
+
+import asyncio
+import statistics
+import time
+from typing import TYPE_CHECKING, Generator
+from uuid import uuid4
+
+import pytest
+
+from prefect.server.database import PrefectDBInterface, provide_database_interface
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.events.storage.database import write_events
+from prefect.settings import (
+    PREFECT_SERVER_EVENTS_POSTGRES_WRITE_METHOD,
+    temporary_settings,
+)
+from prefect.types._datetime import now
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+BATCH_SIZES = [100, 1_000, 5_000]
+ROUNDS = 10
+
+
+@pytest.fixture(scope="module")
+def loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def db(loop: asyncio.AbstractEventLoop) -> PrefectDBInterface:
+    db = provide_database_interface()
+    loop.run_until_complete(db.create_db())
+    return db
+
+
+def make_events(count: int) -> list[ReceivedEvent]:
+    return [
+        ReceivedEvent(
+            occurred=now("UTC"),
+            event="prefect.flow-run.Completed",
+            resource={"prefect.resource.id": f"prefect.flow-run.{uuid4()}"},
+            related=[
+                {
+                    "prefect.resource.id": f"prefect.flow.{uuid4()}",
+                    "prefect.resource.role": "flow",
+                },
+                {
+                    "prefect.resource.id": f"prefect.deployment.{uuid4()}",
+                    "prefect.resource.role": "deployment",
+                },
+                {
+                    "prefect.resource.id": "prefect.tag.benchmark",
+                    "prefect.resource.role": "tag",
+                },
+            ],
+            payload={"intended": {"from": "RUNNING", "to": "COMPLETED"}},
+            id=uuid4(),
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("batch_size", BATCH_SIZES)
+@pytest.mark.parametrize("write_method", ["insert", "copy"])
+def bench_write_events(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    db: PrefectDBInterface,
+    write_method: str,
+    batch_size: int,
+):
+    if write_method == "copy" and db.dialect.name != "postgresql":
+        pytest.skip("The copy write method is only used with PostgreSQL")
+
+    latencies: list[float] = []
+
+    async def flush(events: list[ReceivedEvent]) -> None:
+        start = time.perf_counter()
+        async with db.session_context(begin_transaction=True) as session:
+            await write_events(session, events)
+        latencies.append(time.perf_counter() - start)
+
+    def setup():
+        return (make_events(batch_size),), {}
+
+    with temporary_settings(
+        {PREFECT_SERVER_EVENTS_POSTGRES_WRITE_METHOD: write_method}
+    ):
+        benchmark.pedantic(
+            lambda events: loop.run_until_complete(flush(events)),
+            setup=setup,
+            rounds=ROUNDS,
+        )
+
+    benchmark.extra_info["events_per_second"] = batch_size / statistics.mean(latencies)
+    benchmark.extra_info["p99_flush_seconds"] = statistics.quantiles(
+        latencies, n=100, method="inclusive"
+    )[98]
@@ -0,0 +1,116 @@
+"""
+Benchmarks for streaming events to a server with `PrefectEventsClient`.
+
+The server here is a bare websocket server in the same process that only parses the
+messages it receives, so these measure the client's own throughput rather than the
+Prefect server's.
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Generator, List
+from uuid import uuid4
+
+import pytest
+from pydantic import TypeAdapter
+from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+from prefect.events import Event
+from prefect.events.clients import PrefectEventsClient
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+EVENTS = 10_000
+ROUNDS = 5
+
+_EVENT_LIST = TypeAdapter(List[Event])
+
+
+@pytest.fixture(scope="module")
+def loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+async def _receive(socket: ServerConnection) -> None:
+    try:
+        async for message in socket:
+            assert isinstance(message, str)
+            if message.startswith("["):
+                _EVENT_LIST.validate_json(message)
+            else:
+                Event.model_validate_json(message)
+    except ConnectionClosed:
+        pass
+
+
+@pytest.fixture(scope="module")
+def api_url(loop: asyncio.AbstractEventLoop) -> Generator[str, None, None]:
+    async def start() -> Server:
+        return await serve(_receive, "localhost", 0)
+
+    server = loop.run_until_complete(start())
+    port = next(iter(server.sockets)).getsockname()[1]
+    yield f"http://localhost:{port}"
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+
+
+def make_events(count: int) -> list[Event]:
+    return [
+        Event(
+            event="prefect.task-run.Completed",
+            resource={
+                "prefect.resource.id": f"prefect.task-run.{uuid4()}",
+                "prefect.resource.name": "my-task-0",
+            },
+            related=[
+                {
+                    "prefect.resource.id": f"prefect.flow-run.{uuid4()}",
+                    "prefect.resource.role": "flow-run",
+                },
+                {
+                    "prefect.resource.id": "prefect.tag.benchmark",
+                    "prefect.resource.role": "tag",
+                },
+            ],
+            payload={"intended": {"from": "RUNNING", "to": "COMPLETED"}},
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "batch_size,max_unconfirmed",
+    [(1, None), (1, 5_000), (100, None), (100, 5_000)],
+)
+def bench_emit_events(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    api_url: str,
+    batch_size: int,
+    max_unconfirmed: int,
+):
+    durations: list[float] = []
+
+    async def emit(events: list[Event]) -> None:
+        async with PrefectEventsClient(
+            api_url, batch_size=batch_size, max_unconfirmed=max_unconfirmed
+        ) as client:
+            start = time.perf_counter()
+            await client.emit_many(events)
+            durations.append(time.perf_counter() - start)
+
+    def setup():
+        return (make_events(EVENTS),), {}
+
+    benchmark.pedantic(
+        lambda events: loop.run_until_complete(emit(events)),
+        setup=setup,
+        rounds=ROUNDS,
+    )
+
+    benchmark.extra_info["events_per_second"] = EVENTS / min(durations)
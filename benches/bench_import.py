@@ -1,4 +1,6 @@
 import importlib
+import json
+import subprocess
 import sys
 from typing import TYPE_CHECKING
 
@@ -42,3 +44,45 @@ def bench_import_prefect_flow(benchmark: "BenchmarkFixture"):
         from prefect import flow  # noqa
 
     benchmark(import_prefect_flow)
+
+
+# Each module is imported in a fresh interpreter, so its cost includes everything it
+# pulls in that `python -c "pass"` doesn't, as it would for a short CLI invocation or
+# a serverless flow run starting cold.
+COLD_IMPORT_SCRIPT = """
+import json, sys, time
+baseline = set(sys.modules)
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": len(set(sys.modules) - baseline)}}))
+"""
+
+
+@pytest.mark.timeout(180)
+@pytest.mark.benchmark(group="cold-imports")
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import prefect",
+        "from prefect import flow, task",
+        "import prefect.flows",
+        "import prefect.tasks",
+        "import prefect.client.orchestration",
+        "import prefect.server.schemas",
+        "import prefect.blocks.core",
+        "import prefect.settings",
+    ],
+)
+def bench_cold_import(benchmark: "BenchmarkFixture", statement: str):
+    script = COLD_IMPORT_SCRIPT.format(statement=statement)
+    results: list[dict[str, float]] = []
+
+    def cold_import():
+        output = subprocess.check_output([sys.executable, "-c", script])
+        results.append(json.loads(output.splitlines()[-1]))
+
+    benchmark.pedantic(cold_import, rounds=3)
+
+    benchmark.extra_info["import_seconds"] = min(r["seconds"] for r in results)
+    benchmark.extra_info["modules_imported"] = results[-1]["modules"]
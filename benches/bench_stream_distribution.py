@@ -0,0 +1,156 @@
+"""
+Benchmarks for distributing logs and events to websocket subscribers, by the number of
+subscribers and whether they share filters.
+"""
+
+import asyncio
+import datetime
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Any, Callable, Generator
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from prefect.server.events import stream as event_stream
+from prefect.server.events.filters import (
+    EventFilter,
+    EventOccurredFilter,
+    EventResourceFilter,
+)
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.logs import stream as log_stream
+from prefect.server.schemas.core import Log
+from prefect.server.schemas.filters import LogFilter, LogFilterFlowRunId
+from prefect.types._datetime import now
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SUBSCRIBER_COUNTS = [1, 10, 200]
+MESSAGES_PER_ROUND = 100
+
+
+@pytest.fixture(scope="module")
+def loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def make_message(data: bytes) -> Mock:
+    message = Mock()
+    message.data = data
+    message.attributes = {"id": str(uuid4())}
+    return message
+
+
+def log_filter(flow_run_id: Any) -> LogFilter:
+    return LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id]))
+
+
+def event_filter(resource_id: str) -> EventFilter:
+    return EventFilter(
+        occurred=EventOccurredFilter(
+            since=now("UTC") - datetime.timedelta(days=1),
+            until=now("UTC") + datetime.timedelta(days=1),
+        ),
+        resource=EventResourceFilter(id=[resource_id]),
+    )
+
+
+def run_distribution(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    module: Any,
+    filters: list[Any],
+    messages: list[Mock],
+) -> None:
+    async def distribute(handler: Callable[[Mock], Any]) -> None:
+        for message in messages:
+            await handler(message)
+
+    stack = AsyncExitStack()
+    queues = [
+        loop.run_until_complete(stack.enter_async_context(module.subscribed(filter)))
+        for filter in filters
+    ]
+    handler = loop.run_until_complete(stack.enter_async_context(module.distributor()))
+
+    def drain():
+        for queue in queues:
+            while not queue.empty():
+                queue.get_nowait()
+
+    try:
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(distribute(handler)),
+            setup=drain,
+            rounds=20,
+        )
+    finally:
+        loop.run_until_complete(stack.aclose())
+
+    benchmark.extra_info["messages_per_second"] = (
+        len(messages) / benchmark.stats.stats.mean
+    )
+
+
+@pytest.mark.parametrize("subscribers", SUBSCRIBER_COUNTS)
+@pytest.mark.parametrize("shared_filters", [True, False], ids=["shared", "distinct"])
+def bench_log_distribution(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    subscribers: int,
+    shared_filters: bool,
+):
+    flow_run_ids = [uuid4() for _ in range(1 if shared_filters else subscribers)]
+    filters = [
+        log_filter(flow_run_ids[i % len(flow_run_ids)]) for i in range(subscribers)
+    ]
+    messages = [
+        make_message(
+            Log(
+                name="prefect.flow_runs",
+                level=20,
+                message="Hello!",
+                timestamp=now("UTC"),
+                flow_run_id=flow_run_ids[i % len(flow_run_ids)],
+            )
+            .model_dump_json()
+            .encode()
+        )
+        for i in range(MESSAGES_PER_ROUND)
+    ]
+    run_distribution(benchmark, loop, log_stream, filters, messages)
+
+
+@pytest.mark.parametrize("subscribers", SUBSCRIBER_COUNTS)
+@pytest.mark.parametrize("shared_filters", [True, False], ids=["shared", "distinct"])
+def bench_event_distribution(
+    benchmark: "BenchmarkFixture",
+    loop: asyncio.AbstractEventLoop,
+    subscribers: int,
+    shared_filters: bool,
+):
+    resource_ids = [
+        f"prefect.flow-run.{uuid4()}"
+        for _ in range(1 if shared_filters else subscribers)
+    ]
+    filters = [
+        event_filter(resource_ids[i % len(resource_ids)]) for i in range(subscribers)
+    ]
+    messages = [
+        make_message(
+            ReceivedEvent(
+                occurred=now("UTC"),
+                event="prefect.flow-run.Running",
+                resource={"prefect.resource.id": resource_ids[i % len(resource_ids)]},
+                id=uuid4(),
+            )
+            .model_dump_json()
+            .encode()
+        )
+        for i in range(MESSAGES_PER_ROUND)
+    ]
+    run_distribution(benchmark, loop, event_stream, filters, messages)
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import pytest
 
 if TYPE_CHECKING:
     from pytest_benchmark.fixture import BenchmarkFixture
@@ -10,6 +12,10 @@ def noop_function():
     pass
 
 
+def identity_function(x: Any) -> Any:
+    return x
+
+
 def bench_task_decorator(benchmark: "BenchmarkFixture"):
     benchmark(task, noop_function)
 
@@ -35,3 +41,19 @@ def bench_task_submit(benchmark: "BenchmarkFixture"):
         benchmark(noop_task.submit)
 
     benchmark_flow()
+
+
+# Like the large flow benchmarks in `bench_flows.py`, these take too long to run
+# repeatedly and are measured with a single round each.
+
+
+@pytest.mark.parametrize("map_size", [1_000, 10_000, 100_000])
+def bench_task_map(benchmark: "BenchmarkFixture", map_size: int):
+    noop_task = task(identity_function)
+
+    @flow
+    def benchmark_flow():
+        noop_task.map(range(map_size)).wait()
+
+    benchmark.pedantic(benchmark_flow, rounds=1)
+    benchmark.extra_info["tasks_per_second"] = map_size / benchmark.stats["mean"]
@@ -12,13 +12,13 @@ e.g. Jan 2023.
 
 from __future__ import annotations
 
+import calendar
 import datetime
 import functools
 import sys
 import warnings
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
-import dateparser
 from pydantic import BaseModel
 from typing_extensions import ParamSpec, TypeAlias, TypeVar
 
@@ -62,6 +62,19 @@ def _coerce_datetime(
 ) -> Optional[datetime.datetime]:
     if dt is None or isinstance(dt, datetime.datetime):
         return dt
+    try:
+        # deprecation dates are almost always given like "Jan 2023", which can be
+        # parsed without importing dateparser; like dateparser, use the current day
+        # of the month
+        parsed = datetime.datetime.strptime(dt, HUMAN_DATEFMT)
+    except ValueError:
+        pass
+    else:
+        days_in_month = calendar.monthrange(parsed.year, parsed.month)[1]
+        return parsed.replace(day=min(datetime.date.today().day, days_in_month))
+
+    import dateparser
+
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", category=DeprecationWarning)
         return dateparser.parse(dt)
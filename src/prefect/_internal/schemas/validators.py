@@ -19,8 +19,6 @@ from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, overload
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-import jsonschema
-
 from prefect.types._datetime import DateTime, create_datetime_instance, get_timezones
 from prefect.utilities.collections import isiterable
 from prefect.utilities.filesystem import relative_path_to_current_platform
@@ -57,6 +55,8 @@ def validate_values_conform_to_schema(
         ValueError: If the parameters do not conform to the schema.
 
     """
+    import jsonschema
+
     from prefect.utilities.collections import remove_nested_keys
 
     if ignore_required:
@@ -110,6 +110,8 @@ def validate_parameter_openapi_schema(
 ) -> Optional[M]:
     """Validate that the parameter_openapi_schema is a valid json schema."""
     if values.get("enforce_parameter_schema"):
+        import jsonschema
+
         try:
             if schema is not None:
                 # Most closely matches the schemas generated by pydantic
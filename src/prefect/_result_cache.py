@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, MutableMapping, Optional
+
+from prefect.logging import get_logger
+
+if TYPE_CHECKING:
+    import logging
+
+    from prefect._result_records import ResultRecord
+
+
+class ResultRecordCache(MutableMapping[str, "ResultRecord[Any]"]):
+    """
+    An in-memory LRU cache of result records, bounded by the number of bytes the
+    records occupy when serialized rather than by the number of entries.
+
+    The size of a record is supplied by the caller when it is added with `put`,
+    since the result store already holds the serialized bytes whenever it reads or
+    writes a record. Records added through item assignment are weighed by
+    serializing them.
+
+    Attributes:
+        max_bytes: The total size of records to keep in memory.
+        disk_cache: An optional second tier used to avoid re-reading serialized
+            records from remote storage.
+        hits: The number of lookups that were served from memory.
+        misses: The number of lookups that were not found in memory.
+        evictions: The number of records evicted to stay within `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int, disk_cache: Optional["ResultDiskCache"] = None):
+        self.max_bytes = max_bytes
+        self.disk_cache = disk_cache
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._records: OrderedDict[str, "ResultRecord[Any]"] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def current_bytes(self) -> int:
+        """The total size of the records currently held in memory."""
+        return self._current_bytes
+
+    def lookup(self, key: str) -> Optional["ResultRecord[Any]"]:
+        """
+        Retrieve a record, counting the lookup as a hit or a miss.
+
+        Returns:
+            The cached record, or `None` if the key is not cached.
+        """
+        with self._lock:
+            record = self._records.get(key)
+            if record is None:
+                self.misses += 1
+                return None
+            self._records.move_to_end(key)
+            self.hits += 1
+            return record
+
+    def put(self, key: str, record: "ResultRecord[Any]", nbytes: int) -> None:
+        """
+        Add a record to the cache, evicting the least recently used records until
+        the cache fits within its byte budget.
+
+        Records larger than the entire budget are not cached.
+        """
+        with self._lock:
+            self._remove(key)
+            if nbytes > self.max_bytes:
+                return
+            self._records[key] = record
+            self._sizes[key] = nbytes
+            self._current_bytes += nbytes
+            while self._current_bytes > self.max_bytes:
+                oldest = next(iter(self._records))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        if key in self._records:
+            del self._records[key]
+            self._current_bytes -= self._sizes.pop(key)
+
+    def stats(self) -> dict[str, int]:
+        """Return counters describing the cache's effectiveness."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._records),
+            "bytes": self._current_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __getitem__(self, key: str) -> "ResultRecord[Any]":
+        with self._lock:
+            record = self._records[key]
+            self._records.move_to_end(key)
+            return record
+
+    def __setitem__(self, key: str, record: "ResultRecord[Any]") -> None:
+        self.put(key, record, nbytes=len(record.serialize()))
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if key not in self._records:
+                raise KeyError(key)
+            self._remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._records))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._sizes.clear()
+            self._current_bytes = 0
+
+
+class ResultDiskCache:
+    """
+    A local disk cache of serialized result records.
+
+    Used as a second tier behind `ResultRecordCache` so that repeatedly reading the
+    same record from remote result storage does not go over the network. Entries are
+    stored under a hash of their storage key and are evicted least recently used
+    first, by modification time (which is refreshed on every read), once the
+    directory exceeds `max_bytes`.
+
+    Attributes:
+        path: The directory to store cached records in.
+        max_bytes: The total size of cached records to keep on disk.
+        hits: The number of reads that were served from disk.
+        misses: The number of reads that were not found on disk.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._approximate_bytes: Optional[int] = None
+        self.logger: "logging.Logger" = get_logger("results.disk_cache")
+
+    def _path_for(self, key: str) -> Path:
+        return self.path / hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read the serialized record stored for a key.
+
+        Returns:
+            The cached bytes, or `None` if the key is not cached.
+        """
+        path = self._path_for(key)
+        try:
+            content = path.read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        # Refresh the modification time so that eviction is least recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        """
+        Store the serialized record for a key, evicting older entries if needed.
+
+        Failures to write are logged and otherwise ignored since the cache is only
+        an optimization.
+        """
+        if len(content) > self.max_bytes:
+            return
+        path = self._path_for(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            self.logger.debug(
+                "Failed to write result %r to the disk cache: %s", key, exc
+            )
+            return
+
+        # Only scan the directory when this process's running total suggests the
+        # budget has been exceeded; the scan is linear in the number of entries
+        if self._approximate_bytes is not None:
+            self._approximate_bytes += len(content)
+        if self._approximate_bytes is None or self._approximate_bytes > self.max_bytes:
+            self._evict()
+
+    def discard(self, key: str) -> None:
+        """Remove the entry for a key if one exists."""
+        try:
+            self._path_for(key).unlink()
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries: list[tuple[float, int, Path]] = []
+            total = 0
+            try:
+                for entry in os.scandir(self.path):
+                    if not entry.is_file() or entry.name.endswith(".tmp"):
+                        continue
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+                    total += stat.st_size
+            except OSError:
+                return
+
+            if total > self.max_bytes:
+                for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        continue
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+
+            self._approximate_bytes = total
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import inspect
+import mmap
+import os
+import struct
+import sys
 import uuid
+from pathlib import Path
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Generic,
@@ -24,7 +30,11 @@ import prefect
 from prefect.exceptions import (
     SerializationError,
 )
-from prefect.serializers import PickleSerializer, Serializer
+from prefect.serializers import (
+    OutOfBandPickleSerializer,
+    PickleSerializer,
+    Serializer,
+)
 from prefect.types import DateTime
 
 if TYPE_CHECKING:
@@ -35,6 +45,11 @@ ResultSerializer = Union[Serializer, str]
 LITERAL_TYPES: set[type] = {type(None), bool, UUID}
 R = TypeVar("R")
 
+# Result records written with `ResultRecord.write_buffered` start with this marker
+# instead of the JSON written by `ResultRecord.serialize`
+BUFFERED_RECORD_MARKER = b"PFCTOOB1"
+_BUFFERED_RECORD_PREFIX = struct.Struct("<8sQ")
+
 
 class ResultRecordMetadata(BaseModel):
     """
@@ -195,6 +210,8 @@ class ResultRecord(BaseModel, Generic[R]):
         Returns:
             ResultRecord: the deserialized record
         """
+        if _is_buffered_prefix(data[: _BUFFERED_RECORD_PREFIX.size]):
+            return cls.deserialize_buffered(data)
         try:
             instance = cls.model_validate_json(data)
         except ValidationError:
@@ -212,6 +229,115 @@ class ResultRecord(BaseModel, Generic[R]):
             instance.result = instance.serializer.loads(instance.result.encode())
         return instance
 
+    def write_buffered(self, file: IO[bytes]) -> int:
+        """
+        Write the record to a binary file without building it in memory.
+
+        The record's serializer must be an `OutOfBandPickleSerializer`. The file
+        contains a marker, the JSON metadata and the serializer's frame. It can be
+        memory-mapped with `read_buffered` or loaded from bytes with `deserialize`.
+
+        Returns:
+            int: the number of bytes written
+        """
+        serializer = self.serializer
+        if not isinstance(serializer, OutOfBandPickleSerializer):
+            raise TypeError(
+                "Only records using an out-of-band pickle serializer can be written "
+                f"in buffered form; got serializer {serializer.type!r}."
+            )
+
+        metadata = self.serialize_metadata()
+        file.write(_BUFFERED_RECORD_PREFIX.pack(BUFFERED_RECORD_MARKER, len(metadata)))
+        file.write(metadata)
+        written = _BUFFERED_RECORD_PREFIX.size + len(metadata)
+        frame_start = _buffered_frame_start(len(metadata))
+        file.write(b"\0" * (frame_start - written))
+
+        try:
+            frame_size = serializer.write_frame(self.result, file)
+        except Exception as exc:
+            raise SerializationError(
+                f"Failed to serialize object of type {type(self.result).__name__!r} "
+                f"with serializer {serializer.type!r}."
+            ) from exc
+        return frame_start + frame_size
+
+    @classmethod
+    def read_buffered(cls, path: Path) -> Optional["ResultRecord[R]"]:
+        """
+        Load a record written with `write_buffered` by memory-mapping its file.
+
+        The result's out-of-band buffers reference the mapping rather than being
+        read into memory. The mapping is copy-on-write, so the result can be modified
+        without changing the file.
+
+        On Windows, a file cannot be replaced while it is mapped, so the file is read
+        into memory instead to allow the record to be overwritten later.
+
+        Returns:
+            ResultRecord: the deserialized record, or `None` if the file was not
+                written with `write_buffered`
+        """
+        data: Union[bytearray, mmap.mmap]
+        with open(path, "rb") as file:
+            prefix = file.read(_BUFFERED_RECORD_PREFIX.size)
+            if not _is_buffered_prefix(prefix):
+                return None
+            if sys.platform == "win32":
+                data = bytearray(os.fstat(file.fileno()).st_size)
+                file.seek(0)
+                file.readinto(data)
+            else:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        return cls.deserialize_buffered(data)
+
+    @classmethod
+    def deserialize_buffered(
+        cls, data: Union[bytes, bytearray, memoryview, mmap.mmap]
+    ) -> "ResultRecord[R]":
+        """
+        Deserialize a record written with `write_buffered`.
+
+        The result's out-of-band buffers reference `data` rather than being copied
+        from it.
+
+        Args:
+            data: the contents of the record's file
+
+        Returns:
+            ResultRecord: the deserialized record
+        """
+        view = memoryview(data)
+        prefix = bytes(view[: _BUFFERED_RECORD_PREFIX.size])
+        if not _is_buffered_prefix(prefix):
+            raise ValueError("Data was not written with `ResultRecord.write_buffered`.")
+
+        _, metadata_length = _BUFFERED_RECORD_PREFIX.unpack(prefix)
+        metadata = ResultRecordMetadata.load_bytes(
+            bytes(view[_BUFFERED_RECORD_PREFIX.size :][:metadata_length])
+        )
+        serializer = metadata.serializer
+        assert isinstance(serializer, OutOfBandPickleSerializer)
+        result = serializer.read_frame(view[_buffered_frame_start(metadata_length) :])
+        return cls(metadata=metadata, result=result)
+
+    @staticmethod
+    def read_buffered_metadata(path: Path) -> Optional[ResultRecordMetadata]:
+        """
+        Load only the metadata of a record written with `write_buffered`.
+
+        Returns:
+            ResultRecordMetadata: the metadata, or `None` if the file was not written
+                with `write_buffered`
+        """
+        with open(path, "rb") as file:
+            prefix = file.read(_BUFFERED_RECORD_PREFIX.size)
+            if not _is_buffered_prefix(prefix):
+                return None
+            _, metadata_length = _BUFFERED_RECORD_PREFIX.unpack(prefix)
+            return ResultRecordMetadata.load_bytes(file.read(metadata_length))
+
     @classmethod
     def deserialize_from_result_and_metadata(
         cls, result: bytes, metadata: bytes
@@ -238,3 +364,17 @@ class ResultRecord(BaseModel, Generic[R]):
         return self.model_dump(include={"metadata", "result"}) == other.model_dump(
             include={"metadata", "result"}
         )
+
+
+def _is_buffered_prefix(prefix: bytes) -> bool:
+    return (
+        len(prefix) == _BUFFERED_RECORD_PREFIX.size
+        and prefix[: len(BUFFERED_RECORD_MARKER)] == BUFFERED_RECORD_MARKER
+    )
+
+
+def _buffered_frame_start(metadata_length: int) -> int:
+    # Align the serializer's frame so that the buffers inside it are aligned in the
+    # file and therefore in memory once it is mapped
+    position = _BUFFERED_RECORD_PREFIX.size + metadata_length
+    return -(-position // 64) * 64
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import abc
 import asyncio
 import atexit
 import threading
@@ -7,6 +8,7 @@ import uuid
 from typing import (
     TYPE_CHECKING,
     Callable,
+    ClassVar,
 )
 
 import anyio
@@ -15,173 +17,283 @@ from typing_extensions import Self
 
 from prefect._internal.concurrency.api import create_call, from_async, from_sync
 from prefect._internal.concurrency.threads import get_global_loop
+from prefect.client.schemas.filters import (
+    FlowRunFilter,
+    FlowRunFilterId,
+    FlowRunFilterState,
+    FlowRunFilterStateType,
+)
 from prefect.client.schemas.objects import (
     TERMINAL_STATES,
 )
 from prefect.events.clients import get_events_subscriber
 from prefect.events.filters import EventFilter, EventNameFilter
 from prefect.logging import get_logger
+from prefect.utilities.collections import batched_iterable
 
 if TYPE_CHECKING:
     import logging
 
+    from prefect.client.orchestration import PrefectClient
+    from prefect.events import Event
+
+# The most runs read at once when polling for runs that finished while the event
+# subscription was disconnected, matching the API's default maximum page size
+POLL_BATCH_SIZE = 200
 
-class FlowRunWaiter:
+
+class RunEventSubscription:
+    """
+    A process-wide subscription to the terminal events of flow and task runs, shared
+    by the `FlowRunWaiter` and `TaskRunWaiter`.
+
+    A single websocket connection is filtered by the server to the terminal events of
+    the kinds of runs that are being waited on, and each event is routed to the
+    waiter for its kind of run by its resource ID.  Whenever the subscription
+    connects, whether it is reconnecting after the connection dropped or restarting
+    to include another kind of run, it polls for any of the awaited runs that
+    finished while it wasn't connected, reading them in batches of IDs.
+
+    The subscription runs on the global loop thread; it starts when the first waiter
+    registers and stops when the last one stops.
     """
-    A service used for waiting for a flow run to finish.
 
-    This service listens for flow run events and provides a way to wait for a specific
-    flow run to finish. This is useful for waiting for a flow run to finish before
-    continuing execution.
+    _instance: Self | None = None
+    _instance_lock = threading.Lock()
 
-    The service is a singleton and must be started before use. The service will
-    automatically start when the first instance is created. A single websocket
-    connection is used to listen for flow run events.
+    def __init__(self):
+        self.logger: "logging.Logger" = get_logger("RunEventSubscription")
+        self._waiters: dict[str, _RunWaiter] = {}
+        self._waiters_lock = threading.Lock()
+        self._consumer_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
 
-    The service can be used to wait for a flow run to finish by calling
-    `FlowRunWaiter.wait_for_flow_run` with the flow run ID to wait for. The method
-    will return when the flow run has finished or the timeout has elapsed.
+    @classmethod
+    def instance(cls) -> Self:
+        """
+        Get the singleton instance of RunEventSubscription.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
 
-    The service will automatically stop when the Python process exits or when the
-    global loop thread is stopped.
+    def register(self, waiter: _RunWaiter) -> None:
+        """
+        Route the terminal events of the waiter's kind of run to it, (re)starting the
+        subscription if it doesn't yet include them.  Must be called on the global
+        loop thread.
+        """
+        loop_thread = get_global_loop()
+        if not asyncio.get_running_loop() == loop_thread.loop:
+            raise RuntimeError(
+                "RunEventSubscription must run on the global loop thread."
+            )
+        self._loop = loop_thread.loop
 
-    Example:
-    ```python
-    import asyncio
-    from uuid import uuid4
+        with self._waiters_lock:
+            subscribed = waiter.resource_prefix in self._waiters
+            self._waiters[waiter.resource_prefix] = waiter
 
-    from prefect import flow
-    from prefect.flow_engine import run_flow_async
-    from prefect.flow_runs import FlowRunWaiter
+        if subscribed and self._consumer_task and not self._consumer_task.done():
+            return
 
+        if self._consumer_task:
+            self._consumer_task.cancel()
 
-    @flow
-    async def test_flow():
-        await asyncio.sleep(5)
-        print("Done!")
+        consumer_started = asyncio.Event()
+        self._consumer_task = self._loop.create_task(
+            self._consume_events(consumer_started)
+        )
+        asyncio.run_coroutine_threadsafe(consumer_started.wait(), self._loop)
 
+    def unregister(self, waiter: _RunWaiter) -> None:
+        """
+        Stop routing events to the given waiter, stopping the subscription if there
+        are no waiters left.
+        """
+        with self._waiters_lock:
+            if self._waiters.get(waiter.resource_prefix) is not waiter:
+                return
+            del self._waiters[waiter.resource_prefix]
+            if self._waiters:
+                return
 
-    async def main():
-        flow_run_id = uuid4()
-        asyncio.create_flow(run_flow_async(flow=test_flow, flow_run_id=flow_run_id))
+        self.logger.debug("Stopping RunEventSubscription")
+        if self._consumer_task:
+            self._consumer_task.cancel()
+            self._consumer_task = None
 
-        await FlowRunWaiter.wait_for_flow_run(flow_run_id)
-        print("Flow run finished")
+    def _event_filter(self) -> EventFilter:
+        with self._waiters_lock:
+            prefixes = sorted(self._waiters)
+        return EventFilter(
+            event=EventNameFilter(
+                name=[
+                    f"{prefix}.{state.name.title()}"
+                    for prefix in prefixes
+                    for state in TERMINAL_STATES
+                ],
+            )
+        )
+
+    async def _consume_events(self, consumer_started: asyncio.Event):
+        reconnecting = False
+        while True:
+            try:
+                async with get_events_subscriber(
+                    filter=self._event_filter(), reconnection_attempts=0
+                ) as subscriber:
+                    consumer_started.set()
+                    await self._poll_for_finished_runs()
+                    reconnecting = False
+                    async for event in subscriber:
+                        self._route(event)
+            except Exception:
+                self.logger.debug(
+                    "Event subscription disconnected, reconnecting", exc_info=True
+                )
 
+            if reconnecting:
+                # let the first attempt happen quickly in case this is just a
+                # standard load balancer timeout, but after that, take a beat to
+                # let things come back around
+                await asyncio.sleep(1)
+            reconnecting = True
 
-    if __name__ == "__main__":
-        asyncio.run(main())
-    ```
+    def _route(self, event: "Event") -> None:
+        try:
+            resource_id = event.resource["prefect.resource.id"]
+            self.logger.debug(f"Received event: {resource_id}")
+            prefix, _, run_id = resource_id.rpartition(".")
+            if waiter := self._waiters.get(prefix):
+                waiter.observe(uuid.UUID(run_id))
+        except Exception as exc:
+            self.logger.error(f"Error processing event: {exc}")
+
+    async def _poll_for_finished_runs(self) -> None:
+        from prefect.client.orchestration import get_client
+
+        with self._waiters_lock:
+            awaited = [
+                (waiter, waiter.awaited_run_ids()) for waiter in self._waiters.values()
+            ]
+        if not any(run_ids for _, run_ids in awaited):
+            return
+
+        try:
+            async with get_client() as client:
+                for waiter, awaited_run_ids in awaited:
+                    for run_ids in batched_iterable(awaited_run_ids, POLL_BATCH_SIZE):
+                        for run_id in await waiter.read_finished_run_ids(
+                            client, list(run_ids)
+                        ):
+                            waiter.observe(run_id)
+        except Exception as exc:
+            self.logger.error(f"Error polling for finished runs: {exc}")
+
+
+class _RunWaiter(abc.ABC):
+    """
+    The shared implementation of `FlowRunWaiter` and `TaskRunWaiter`, which keeps an
+    index from run IDs to the callbacks waiting on them and a short-lived cache of
+    the runs it has seen finish.
     """
 
+    # The prefix of the resource IDs of the runs this waits on, like
+    # "prefect.flow-run"
+    resource_prefix: ClassVar[str]
+
     _instance: Self | None = None
-    _instance_lock = threading.Lock()
+    _instance_lock: threading.Lock
 
     def __init__(self):
-        self.logger: "logging.Logger" = get_logger("FlowRunWaiter")
-        self._consumer_task: asyncio.Task[None] | None = None
-        self._observed_completed_flow_runs: TTLCache[uuid.UUID, bool] = TTLCache(
+        self.logger: "logging.Logger" = get_logger(type(self).__name__)
+        self._observed_completed_runs: TTLCache[uuid.UUID, bool] = TTLCache(
             maxsize=10000, ttl=600
         )
-        self._completion_events: dict[uuid.UUID, asyncio.Event] = {}
-        self._completion_callbacks: dict[uuid.UUID, Callable[[], None]] = {}
-        self._loop: asyncio.AbstractEventLoop | None = None
-        self._observed_completed_flow_runs_lock = threading.Lock()
-        self._completion_events_lock = threading.Lock()
+        self._callbacks: dict[uuid.UUID, list[Callable[[], None]]] = {}
+        self._lock = threading.Lock()
         self._started = False
 
     def start(self) -> None:
         """
-        Start the FlowRunWaiter service.
+        Start the waiter, subscribing it to the shared run event subscription.
         """
         if self._started:
             return
-        self.logger.debug("Starting FlowRunWaiter")
+        self.logger.debug(f"Starting {type(self).__name__}")
         loop_thread = get_global_loop()
 
         if not asyncio.get_running_loop() == loop_thread.loop:
-            raise RuntimeError("FlowRunWaiter must run on the global loop thread.")
+            raise RuntimeError(
+                f"{type(self).__name__} must run on the global loop thread."
+            )
 
-        self._loop = loop_thread.loop
-        if TYPE_CHECKING:
-            assert self._loop is not None
-
-        consumer_started = asyncio.Event()
-        self._consumer_task = self._loop.create_task(
-            self._consume_events(consumer_started)
-        )
-        asyncio.run_coroutine_threadsafe(consumer_started.wait(), self._loop)
+        RunEventSubscription.instance().register(self)
 
         loop_thread.add_shutdown_call(create_call(self.stop))
         atexit.register(self.stop)
         self._started = True
 
-    async def _consume_events(self, consumer_started: asyncio.Event):
-        async with get_events_subscriber(
-            filter=EventFilter(
-                event=EventNameFilter(
-                    name=[
-                        f"prefect.flow-run.{state.name.title()}"
-                        for state in TERMINAL_STATES
-                    ],
-                )
-            )
-        ) as subscriber:
-            consumer_started.set()
-            async for event in subscriber:
-                try:
-                    self.logger.debug(
-                        f"Received event: {event.resource['prefect.resource.id']}"
-                    )
-                    flow_run_id = uuid.UUID(
-                        event.resource["prefect.resource.id"].replace(
-                            "prefect.flow-run.", ""
-                        )
-                    )
-
-                    with self._observed_completed_flow_runs_lock:
-                        # Cache the flow run ID for a short period of time to avoid
-                        # unnecessary waits
-                        self._observed_completed_flow_runs[flow_run_id] = True
-                    with self._completion_events_lock:
-                        # Set the event for the flow run ID if it is in the cache
-                        # so the waiter can wake up the waiting coroutine
-                        if flow_run_id in self._completion_events:
-                            self._completion_events[flow_run_id].set()
-                        if flow_run_id in self._completion_callbacks:
-                            self._completion_callbacks[flow_run_id]()
-                except Exception as exc:
-                    self.logger.error(f"Error processing event: {exc}")
-
     def stop(self) -> None:
         """
-        Stop the FlowRunWaiter service.
+        Stop the waiter.
         """
-        self.logger.debug("Stopping FlowRunWaiter")
-        if self._consumer_task:
-            self._consumer_task.cancel()
-            self._consumer_task = None
+        self.logger.debug(f"Stopping {type(self).__name__}")
+        RunEventSubscription.instance().unregister(self)
         self.__class__._instance = None
         self._started = False
 
-    @classmethod
-    async def wait_for_flow_run(
-        cls, flow_run_id: uuid.UUID, timeout: float | None = None
-    ) -> None:
+    def observe(self, run_id: uuid.UUID) -> None:
         """
-        Wait for a flow run to finish.
+        Record that the given run has finished, waking up anything waiting on it.
+        """
+        with self._lock:
+            # Cache the run ID for a short period of time to avoid unnecessary waits
+            self._observed_completed_runs[run_id] = True
+            callbacks = self._callbacks.pop(run_id, [])
 
-        Note this relies on a websocket connection to receive events from the server
-        and will not work with an ephemeral server.
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as exc:
+                self.logger.error(f"Error processing event: {exc}")
 
-        Args:
-            flow_run_id: The ID of the flow run to wait for.
-            timeout: The maximum time to wait for the flow run to
-                finish. Defaults to None.
+    def awaited_run_ids(self) -> list[uuid.UUID]:
+        """
+        The IDs of the runs that are currently being waited on.
+        """
+        with self._lock:
+            return list(self._callbacks)
+
+    @abc.abstractmethod
+    async def read_finished_run_ids(
+        self, client: "PrefectClient", run_ids: list[uuid.UUID]
+    ) -> list[uuid.UUID]:
+        """
+        Reads which of the given runs have finished from the API.
         """
-        instance = cls.instance()
-        with instance._observed_completed_flow_runs_lock:
-            if flow_run_id in instance._observed_completed_flow_runs:
+
+    def _add_callback(self, run_id: uuid.UUID, callback: Callable[[], None]) -> bool:
+        # Returns False instead of adding the callback if the run already finished
+        with self._lock:
+            if run_id in self._observed_completed_runs:
+                return False
+            self._callbacks.setdefault(run_id, []).append(callback)
+            return True
+
+    def _remove_callback(self, run_id: uuid.UUID, callback: Callable[[], None]) -> None:
+        with self._lock:
+            callbacks = self._callbacks.get(run_id, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                self._callbacks.pop(run_id, None)
+
+    async def _wait(self, run_id: uuid.UUID, timeout: float | None = None) -> None:
+        with self._lock:
+            if run_id in self._observed_completed_runs:
                 return
 
         # Need to create event in loop thread to ensure it can be set
@@ -189,53 +301,30 @@ class FlowRunWaiter:
         finished_event = await from_async.wait_for_call_in_loop_thread(
             create_call(asyncio.Event)
         )
-        with instance._completion_events_lock:
-            # Cache the event for the flow run ID so the consumer can set it
-            # when the event is received
-            instance._completion_events[flow_run_id] = finished_event
 
-        try:
-            # Now check one more time whether the flow run arrived before we start to
-            # wait on it, in case it came in while we were setting up the event above.
-            with instance._observed_completed_flow_runs_lock:
-                if flow_run_id in instance._observed_completed_flow_runs:
-                    return
+        # Check one more time whether the run finished while we were setting up the
+        # event above, while registering the event to be set when it finishes
+        if not self._add_callback(run_id, finished_event.set):
+            return
 
+        try:
             with anyio.move_on_after(delay=timeout):
                 await from_async.wait_for_call_in_loop_thread(
                     create_call(finished_event.wait)
                 )
         finally:
-            with instance._completion_events_lock:
-                # Remove the event from the cache after it has been waited on
-                instance._completion_events.pop(flow_run_id, None)
+            self._remove_callback(run_id, finished_event.set)
 
-    @classmethod
-    def add_done_callback(
-        cls, flow_run_id: uuid.UUID, callback: Callable[[], None]
+    def _add_done_callback(
+        self, run_id: uuid.UUID, callback: Callable[[], None]
     ) -> None:
-        """
-        Add a callback to be called when a flow run finishes.
-
-        Args:
-            flow_run_id: The ID of the flow run to wait for.
-            callback: The callback to call when the flow run finishes.
-        """
-        instance = cls.instance()
-        with instance._observed_completed_flow_runs_lock:
-            if flow_run_id in instance._observed_completed_flow_runs:
-                callback()
-                return
-
-        with instance._completion_events_lock:
-            # Cache the event for the flow run ID so the consumer can set it
-            # when the event is received
-            instance._completion_callbacks[flow_run_id] = callback
+        if not self._add_callback(run_id, callback):
+            callback()
 
     @classmethod
     def instance(cls) -> Self:
         """
-        Get the singleton instance of FlowRunWaiter.
+        Get the singleton instance of the waiter.
         """
         with cls._instance_lock:
             if cls._instance is None:
@@ -252,3 +341,102 @@ class FlowRunWaiter:
             from_sync.call_soon_in_loop_thread(create_call(instance.start)).result()
 
         return instance
+
+
+class FlowRunWaiter(_RunWaiter):
+    """
+    A service used for waiting for a flow run to finish.
+
+    This service listens for flow run events and provides a way to wait for a specific
+    flow run to finish. This is useful for waiting for a flow run to finish before
+    continuing execution.
+
+    The service is a singleton and must be started before use. The service will
+    automatically start when the first instance is created. Flow run events are
+    received through the websocket connection of the `RunEventSubscription`, which
+    is shared with the `TaskRunWaiter`.
+
+    The service can be used to wait for a flow run to finish by calling
+    `FlowRunWaiter.wait_for_flow_run` with the flow run ID to wait for. The method
+    will return when the flow run has finished or the timeout has elapsed.
+
+    The service will automatically stop when the Python process exits or when the
+    global loop thread is stopped.
+
+    Example:
+    ```python
+    import asyncio
+    from uuid import uuid4
+
+    from prefect import flow
+    from prefect.flow_engine import run_flow_async
+    from prefect.flow_runs import FlowRunWaiter
+
+
+    @flow
+    async def test_flow():
+        await asyncio.sleep(5)
+        print("Done!")
+
+
+    async def main():
+        flow_run_id = uuid4()
+        asyncio.create_flow(run_flow_async(flow=test_flow, flow_run_id=flow_run_id))
+
+        await FlowRunWaiter.wait_for_flow_run(flow_run_id)
+        print("Flow run finished")
+
+
+    if __name__ == "__main__":
+        asyncio.run(main())
+    ```
+    """
+
+    resource_prefix: ClassVar[str] = "prefect.flow-run"
+
+    _instance: Self | None = None
+    _instance_lock = threading.Lock()
+
+    async def read_finished_run_ids(
+        self, client: "PrefectClient", run_ids: list[uuid.UUID]
+    ) -> list[uuid.UUID]:
+        flow_runs = await client.read_flow_runs(
+            flow_run_filter=FlowRunFilter(
+                id=FlowRunFilterId(any_=run_ids),
+                state=FlowRunFilterState(
+                    type=FlowRunFilterStateType(any_=list(TERMINAL_STATES))
+                ),
+            ),
+            limit=len(run_ids),
+        )
+        return [flow_run.id for flow_run in flow_runs]
+
+    @classmethod
+    async def wait_for_flow_run(
+        cls, flow_run_id: uuid.UUID, timeout: float | None = None
+    ) -> None:
+        """
+        Wait for a flow run to finish.
+
+        Note this relies on a websocket connection to receive events from the server
+        and will not work with an ephemeral server.
+
+        Args:
+            flow_run_id: The ID of the flow run to wait for.
+            timeout: The maximum time to wait for the flow run to
+                finish. Defaults to None.
+        """
+        await cls.instance()._wait(flow_run_id, timeout=timeout)
+
+    @classmethod
+    def add_done_callback(
+        cls, flow_run_id: uuid.UUID, callback: Callable[[], None]
+    ) -> None:
+        """
+        Add a callback to be called when a flow run finishes.
+
+        Args:
+            flow_run_id: The ID of the flow run to wait for.
+            callback: The callback to call when the flow run finishes.
+        """
+        cls.instance()._add_done_callback(flow_run_id, callback)
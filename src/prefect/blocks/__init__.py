@@ -1,7 +1,18 @@
-# ensure core blocks are registered
+# The core block modules are imported on first access, rather than with this package,
+# because `prefect.blocks.notifications` alone is a large share of `import prefect`.
+# `Block.get_block_class_from_key` imports them before looking up a block class, so
+# they are always registered by the time they're needed.
 
-import prefect.blocks.notifications as notifications
-import prefect.blocks.system as system
-import prefect.blocks.webhook as webhook
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from prefect.blocks import notifications, system, webhook
 
 __all__ = ["notifications", "system", "webhook"]
+
+
+def __getattr__(attr_name: str) -> Any:
+    if attr_name in __all__:
+        return importlib.import_module(f".{attr_name}", package=__name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {attr_name!r}")
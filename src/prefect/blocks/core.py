@@ -867,6 +867,10 @@ class Block(BaseModel, ABC):
         # Ensure collections are imported and have the opportunity to register types
         # before looking up the block class, but only do this once
         load_prefect_collections()
+        # The core block modules aren't imported with `prefect.blocks`
+        import prefect.blocks.notifications
+        import prefect.blocks.system
+        import prefect.blocks.webhook  # noqa: F401
 
         try:
             return lookup_type(cls, key)
@@ -16,7 +16,14 @@ from typing_extensions import Self
 
 from prefect.context import TaskRunContext
 from prefect.exceptions import HashError
-from prefect.utilities.hashing import hash_objects
+from prefect.utilities.hashing import (
+    CONTENT_HASH_MIN_BYTES,
+    CONTENT_HASHERS,
+    content_hash,
+    hash_buffer,
+    hash_objects,
+    stable_hash,
+)
 
 if TYPE_CHECKING:
     from prefect.filesystems import WritableFileSystem
@@ -38,10 +45,66 @@ def _register_stable_transforms() -> None:
         STABLE_TRANSFORMS[pd.DataFrame] = lambda df: [  # pyright: ignore
             df[col] for col in sorted(df.columns)
         ]
+        CONTENT_HASHERS[pd.DataFrame] = _hash_dataframe
     except (ImportError, ModuleNotFoundError):
         pass
 
 
+def _hash_dataframe(df: Any) -> Optional[str]:
+    """
+    Hash a large `pandas.DataFrame` using pandas' vectorized row hashing rather than
+    pickling its columns.
+    """
+    import pandas as pd  # pyright: ignore
+
+    if df.memory_usage(index=True).sum() < CONTENT_HASH_MIN_BYTES:
+        return None
+    try:
+        # Select columns by position since labels may be duplicated
+        order = sorted(range(len(df.columns)), key=lambda i: df.columns[i])
+        frame = df.iloc[:, order]
+        row_hashes = pd.util.hash_pandas_object(frame, index=True)
+    except TypeError:
+        # e.g. columns containing unhashable values such as lists, or column labels
+        # that cannot be sorted
+        return None
+
+    # Values of object columns are hashed by their string form, so that e.g. `1` and
+    # `"1"` hash the same; hash the kind of values in each column too to tell them
+    # apart, falling back to the type of each value when the kinds are mixed
+    object_columns = [
+        values
+        for values in [
+            frame.index.to_series(),
+            *(frame.iloc[:, i] for i in range(frame.shape[1])),
+        ]
+        if values.dtype == object
+    ]
+    value_kinds = [
+        pd.api.types.infer_dtype(values, skipna=False) for values in object_columns
+    ]
+    value_types = pd.DataFrame(
+        {
+            position: values.map(_type_name).to_numpy()
+            for position, (values, kind) in enumerate(zip(object_columns, value_kinds))
+            if kind.startswith("mixed") or kind == "unknown-array"
+        }
+    )
+    type_hashes = pd.util.hash_pandas_object(value_types, index=False)
+
+    return stable_hash(
+        str(list(frame.columns)),
+        str([repr(dtype) for dtype in [frame.index.dtype, *frame.dtypes]]),
+        str(value_kinds),
+        hash_buffer(row_hashes.to_numpy()),
+        hash_buffer(type_hashes.to_numpy()),
+    )
+
+
+def _type_name(value: Any) -> str:
+    return f"{type(value).__module__}.{type(value).__qualname__}"
+
+
 @dataclass
 class CachePolicy:
     """
@@ -367,6 +430,11 @@ class Inputs(CachePolicy):
 
         for key, val in inputs.items():
             if key not in exclude:
+                # Large buffers and data frames are hashed by content directly,
+                # which is much cheaper than serializing them
+                if (digest := content_hash(val)) is not None:
+                    hashed_inputs[key] = {"__content_hash__": digest}
+                    continue
                 transformer = STABLE_TRANSFORMS.get(type(val))  # type: ignore[reportUnknownMemberType]
                 hashed_inputs[key] = transformer(val) if transformer else val
 
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol, runtime_che
 import anyio
 import httpx
 from asgi_lifespan import LifespanManager
+from cachetools import LRUCache
 from httpx import HTTPStatusError, Request, Response
 from starlette import status
 from typing_extensions import Self
@@ -45,6 +46,12 @@ APP_LIFESPANS_LOCKS: dict[int, anyio.Lock] = defaultdict(anyio.Lock)
 
 logger: Logger = get_logger("client")
 
+# API routes whose objects are read repeatedly and are worth revalidating with their
+# ETag rather than fetching again
+HTTP_CACHE_ROUTES: frozenset[str] = frozenset(
+    {"deployments", "work_pools", "block_documents", "variables"}
+)
+
 
 # Define ASGI application types for type checking
 Scope = MutableMapping[str, Any]
@@ -183,6 +190,11 @@ class PrefectHttpxAsyncClient(httpx.AsyncClient):
 
     Additionally, this client will always call `raise_for_status` on responses.
 
+    Responses to `GET` requests for the routes in `HTTP_CACHE_ROUTES` that carry an
+    `ETag` are kept in memory, up to `PREFECT_CLIENT_HTTP_CACHE_MAX_BYTES` of them, and
+    requested again with `If-None-Match` so that the server can answer with
+    `304 Not Modified` instead of the full response.
+
     For more details on rate limit headers, see:
     [Configuring Cloudflare Rate Limiting](https://support.cloudflare.com/hc/en-us/articles/115001635128-Configuring-Rate-Limiting-from-UI)
     """
@@ -200,6 +212,16 @@ class PrefectHttpxAsyncClient(httpx.AsyncClient):
         self.csrf_client_id: uuid.UUID = uuid.uuid4()
         self.raise_on_all_errors: bool = raise_on_all_errors
 
+        http_cache_max_bytes = get_current_settings().client.http_cache_max_bytes
+        self.http_cache: Optional[LRUCache[str, Response]] = (
+            LRUCache(
+                maxsize=http_cache_max_bytes,
+                getsizeof=lambda response: len(response.content),
+            )
+            if http_cache_max_bytes
+            else None
+        )
+
         super().__init__(*args, **kwargs)
 
         user_agent = (
@@ -224,6 +246,13 @@ class PrefectHttpxAsyncClient(httpx.AsyncClient):
             else:
                 self.headers[header_name] = header_value
 
+    def _is_http_cache_route(self, url: httpx.URL) -> bool:
+        """Whether a URL is for one of the API routes in `HTTP_CACHE_ROUTES`"""
+        base_path = self.base_url.path.rstrip("/") + "/"
+        if not url.path.startswith(base_path):
+            return False
+        return url.path[len(base_path) :].split("/", 1)[0] in HTTP_CACHE_ROUTES
+
     async def _send_with_retry(
         self,
         request: Request,
@@ -342,8 +371,24 @@ class PrefectHttpxAsyncClient(httpx.AsyncClient):
         - 502 Bad Gateway
         - 503 Service unavailable
         - Any additional status codes provided in `PREFECT_CLIENT_RETRY_EXTRA_CODES`
+
+        Responses to `GET` requests are revalidated against the client's HTTP cache,
+        and a `304 Not Modified` from the server is answered with the cached response.
         """
 
+        cacheable = (
+            self.http_cache is not None
+            and request.method == "GET"
+            and not kwargs.get("stream")
+            and self._is_http_cache_route(request.url)
+        )
+        cached = None
+        if cacheable and "If-None-Match" not in request.headers:
+            assert self.http_cache is not None
+            cached = self.http_cache.get(str(request.url))
+            if cached is not None:
+                request.headers["If-None-Match"] = cached.headers["ETag"]
+
         super_send = super().send
         response = await self._send_with_retry(
             request=request,
@@ -372,6 +417,20 @@ class PrefectHttpxAsyncClient(httpx.AsyncClient):
             ),
         )
 
+        if cached is not None and response.status_code == status.HTTP_304_NOT_MODIFIED:
+            response = copy.copy(cached)
+            response.request = request
+        elif (
+            cacheable
+            and response.status_code == status.HTTP_200_OK
+            and "ETag" in response.headers
+        ):
+            assert self.http_cache is not None
+            if len(response.content) <= self.http_cache.maxsize:
+                self.http_cache[str(request.url)] = response
+            else:
+                self.http_cache.pop(str(request.url), None)
+
         # Convert to a Prefect response to add nicer errors messages
         response = PrefectResponse.from_httpx_response(response)
 
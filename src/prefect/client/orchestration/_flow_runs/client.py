@@ -367,6 +367,49 @@ class FlowRunClient(BaseClient):
         )
         return result
 
+    def set_flow_run_states(
+        self,
+        flow_run_ids: "Iterable[UUID]",
+        state: "State[T]",
+        force: bool = False,
+    ) -> "dict[UUID, OrchestrationResult[T]]":
+        """
+        Propose the same state for many flow runs in a single request.
+
+        Each flow run is orchestrated separately, as if its state had been set with
+        `set_flow_run_state`.
+
+        Args:
+            flow_run_ids: the ids of the flow runs
+            state: the state to set
+            force: if True, disregard orchestration logic when setting the states,
+                forcing the Prefect API to accept the states
+
+        Returns:
+            a mapping of flow run ids to OrchestrationResult models; flow runs that
+            do not exist are not included
+        """
+        from uuid import UUID, uuid4
+
+        from prefect.client.schemas import OrchestrationResult
+        from prefect.states import to_state_create
+
+        state_create = to_state_create(state)
+        state_create.state_details.transition_id = uuid4()
+        response = self.request(
+            "POST",
+            "/flow_runs/set_state",
+            json=dict(
+                flow_run_ids=[str(flow_run_id) for flow_run_id in flow_run_ids],
+                state=state_create.model_dump(mode="json", serialize_as_any=True),
+                force=force,
+            ),
+        )
+        return {
+            UUID(flow_run_id): OrchestrationResult.model_validate(result)
+            for flow_run_id, result in response.json().items()
+        }
+
     def read_flow_run_states(self, flow_run_id: "UUID") -> "list[State]":
         """
         Query for the states of a flow run
@@ -817,6 +860,49 @@ class FlowRunAsyncClient(BaseAsyncClient):
         )
         return result
 
+    async def set_flow_run_states(
+        self,
+        flow_run_ids: "Iterable[UUID]",
+        state: "State[T]",
+        force: bool = False,
+    ) -> "dict[UUID, OrchestrationResult[T]]":
+        """
+        Propose the same state for many flow runs in a single request.
+
+        Each flow run is orchestrated separately, as if its state had been set with
+        `set_flow_run_state`.
+
+        Args:
+            flow_run_ids: the ids of the flow runs
+            state: the state to set
+            force: if True, disregard orchestration logic when setting the states,
+                forcing the Prefect API to accept the states
+
+        Returns:
+            a mapping of flow run ids to OrchestrationResult models; flow runs that
+            do not exist are not included
+        """
+        from uuid import UUID, uuid4
+
+        from prefect.client.schemas import OrchestrationResult
+        from prefect.states import to_state_create
+
+        state_create = to_state_create(state)
+        state_create.state_details.transition_id = uuid4()
+        response = await self.request(
+            "POST",
+            "/flow_runs/set_state",
+            json=dict(
+                flow_run_ids=[str(flow_run_id) for flow_run_id in flow_run_ids],
+                state=state_create.model_dump(mode="json", serialize_as_any=True),
+                force=force,
+            ),
+        )
+        return {
+            UUID(flow_run_id): OrchestrationResult.model_validate(result)
+            for flow_run_id, result in response.json().items()
+        }
+
     async def read_flow_run_states(self, flow_run_id: "UUID") -> "list[State]":
         """
         Query for the states of a flow run
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import json
 from typing import TYPE_CHECKING, Any, Iterable, Union
 
 from prefect.client.orchestration.base import BaseAsyncClient, BaseClient
@@ -17,10 +19,31 @@ if TYPE_CHECKING:
     from prefect.client.schemas.sorting import LogSort
 
 
+def _gzip_json_request(content: Any) -> dict[str, Any]:
+    """
+    Build the keyword arguments for a request with a gzip-compressed JSON body.
+
+    A low compression level is used since log messages compress well and the request
+    is built on the event loop.
+    """
+    return dict(
+        content=gzip.compress(json.dumps(content).encode(), compresslevel=1),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+
+
 class LogClient(BaseClient):
-    def create_logs(self, logs: Iterable[Union["LogCreate", dict[str, Any]]]) -> None:
+    def create_logs(
+        self,
+        logs: Iterable[Union["LogCreate", dict[str, Any]]],
+        compress: bool = False,
+    ) -> None:
         """
         Create logs for a flow or task run
+
+        Args:
+            logs: An iterable of `LogCreate` objects or already json-compatible dicts
+            compress: Whether to gzip the request body
         """
         from prefect.client.schemas.actions import LogCreate
 
@@ -28,7 +51,10 @@ class LogClient(BaseClient):
             log.model_dump(mode="json") if isinstance(log, LogCreate) else log
             for log in logs
         ]
-        self.request("POST", "/logs/", json=serialized_logs)
+        if compress:
+            self.request("POST", "/logs/", **_gzip_json_request(serialized_logs))
+        else:
+            self.request("POST", "/logs/", json=serialized_logs)
 
     def read_logs(
         self,
@@ -56,13 +82,16 @@ class LogClient(BaseClient):
 
 class LogAsyncClient(BaseAsyncClient):
     async def create_logs(
-        self, logs: Iterable[Union["LogCreate", dict[str, Any]]]
+        self,
+        logs: Iterable[Union["LogCreate", dict[str, Any]]],
+        compress: bool = False,
     ) -> None:
         """
         Create logs for a flow or task run
 
         Args:
             logs: An iterable of `LogCreate` objects or already json-compatible dicts
+            compress: Whether to gzip the request body
         """
         from prefect.client.schemas.actions import LogCreate
 
@@ -70,7 +99,10 @@ class LogAsyncClient(BaseAsyncClient):
             log.model_dump(mode="json") if isinstance(log, LogCreate) else log
             for log in logs
         ]
-        await self.request("POST", "/logs/", json=serialized_logs)
+        if compress:
+            await self.request("POST", "/logs/", **_gzip_json_request(serialized_logs))
+        else:
+            await self.request("POST", "/logs/", json=serialized_logs)
 
     async def read_logs(
         self,
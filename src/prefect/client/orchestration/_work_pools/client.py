@@ -274,6 +274,8 @@ class WorkPoolClient(BaseClient):
         work_pool_name: str,
         work_queue_names: list[str] | None = None,
         scheduled_before: datetime | None = None,
+        limit: int | None = None,
+        wait_seconds: float | None = None,
     ) -> list["WorkerFlowRunResponse"]:
         """
         Retrieves scheduled flow runs for the provided set of work pool queues.
@@ -285,6 +287,9 @@ class WorkPoolClient(BaseClient):
                 to get scheduled flow runs.
             scheduled_before: Datetime used to filter returned flow runs. Flow runs
                 scheduled for after the given datetime string will not be returned.
+            limit: The maximum number of flow runs to return.
+            wait_seconds: If no flow runs are found, how long the server should wait
+                for flow runs to be scheduled before responding.
 
         Returns:
             A list of worker flow run responses containing information about the
@@ -297,6 +302,10 @@ class WorkPoolClient(BaseClient):
             body["work_queue_names"] = list(work_queue_names)
         if scheduled_before:
             body["scheduled_before"] = str(scheduled_before)
+        if limit is not None:
+            body["limit"] = limit
+        if wait_seconds:
+            body["wait_seconds"] = wait_seconds
 
         try:
             response = self.request(
@@ -558,6 +567,8 @@ class WorkPoolAsyncClient(BaseAsyncClient):
         work_pool_name: str,
         work_queue_names: list[str] | None = None,
         scheduled_before: datetime | None = None,
+        limit: int | None = None,
+        wait_seconds: float | None = None,
     ) -> list["WorkerFlowRunResponse"]:
         """
         Retrieves scheduled flow runs for the provided set of work pool queues.
@@ -569,6 +580,9 @@ class WorkPoolAsyncClient(BaseAsyncClient):
                 to get scheduled flow runs.
             scheduled_before: Datetime used to filter returned flow runs. Flow runs
                 scheduled for after the given datetime string will not be returned.
+            limit: The maximum number of flow runs to return.
+            wait_seconds: If no flow runs are found, how long the server should wait
+                for flow runs to be scheduled before responding.
 
         Returns:
             A list of worker flow run responses containing information about the
@@ -581,6 +595,10 @@ class WorkPoolAsyncClient(BaseAsyncClient):
             body["work_queue_names"] = list(work_queue_names)
         if scheduled_before:
             body["scheduled_before"] = str(scheduled_before)
+        if limit is not None:
+            body["limit"] = limit
+        if wait_seconds:
+            body["wait_seconds"] = wait_seconds
 
         try:
             response = await self.request(
@@ -81,6 +81,7 @@ ServerRoutes = Literal[
     "/flow_runs/history",
     "/flow_runs/lateness",
     "/flow_runs/paginate",
+    "/flow_runs/set_state",
     "/flows/",
     "/flows/{id}",
     "/flows/count",
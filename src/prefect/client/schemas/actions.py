@@ -4,7 +4,6 @@ from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
 from uuid import UUID, uuid4
 
-import jsonschema
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 import prefect.client.schemas.objects as objects
@@ -293,6 +292,8 @@ class DeploymentCreate(ActionBaseModel):
                     if "default" in v and k in required:
                         required.remove(k)
 
+            import jsonschema
+
             jsonschema.validate(self.job_variables, variables_schema)
 
 
@@ -370,6 +371,8 @@ class DeploymentUpdate(ActionBaseModel):
                         required.remove(k)
 
         if variables_schema is not None:
+            import jsonschema
+
             jsonschema.validate(self.job_variables, variables_schema)
 
 
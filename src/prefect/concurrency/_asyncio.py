@@ -14,7 +14,11 @@ from prefect.logging import get_logger
 from prefect.logging.loggers import get_run_logger
 from prefect.utilities.timeout import timeout_async
 
-from .services import ConcurrencySlotAcquisitionService
+from .services import (
+    ConcurrencySlotAcquisitionService,
+    ConcurrencySlotBroker,
+    LeasedSlotBlock,
+)
 
 
 class ConcurrencySlotAcquisitionError(Exception):
@@ -131,6 +135,43 @@ async def aacquire_concurrency_slots_with_lease(
         ) from exc
 
 
+async def aacquire_brokered_concurrency_slots(
+    names: list[str],
+    slots: int,
+    timeout_seconds: Optional[float] = None,
+    max_retries: Optional[int] = None,
+    lease_duration: float = 300,
+) -> tuple[ConcurrencySlotBroker, LeasedSlotBlock]:
+    """
+    Acquires slots from a block leased by the process's `ConcurrencySlotBroker` for
+    the given limits.  The slots must be handed back with the returned broker's
+    `release`.
+    """
+    broker = ConcurrencySlotBroker.instance(frozenset(names), lease_duration)
+    try:
+        block = await broker.acquire(slots, timeout_seconds, max_retries)
+    except TimeoutError as timeout:
+        raise AcquireConcurrencySlotTimeoutError(
+            f"Attempt to acquire concurrency slots timed out after {timeout_seconds} second(s)"
+        ) from timeout
+    except Exception as exc:
+        raise ConcurrencySlotAcquisitionError(
+            f"Unable to acquire concurrency slots on {names!r}"
+        ) from exc
+
+    if not block.limits:
+        try:
+            # Use a run logger if available
+            logger = get_run_logger()
+        except Exception:
+            logger = get_logger("concurrency")
+        logger.warning(
+            f"Concurrency limits {names!r} do not exist - skipping acquisition."
+        )
+
+    return broker, block
+
+
 async def arelease_concurrency_slots(
     names: list[str], slots: int, occupancy_seconds: float
 ) -> list[MinimalConcurrencyLimitResponse]:
@@ -5,12 +5,14 @@ from typing import Optional, Union
 import anyio
 
 from prefect.concurrency._leases import amaintain_concurrency_lease
+from prefect.settings.context import get_current_settings
 
 from ._asyncio import (
     AcquireConcurrencySlotTimeoutError as AcquireConcurrencySlotTimeoutError,
 )
 from ._asyncio import ConcurrencySlotAcquisitionError as ConcurrencySlotAcquisitionError
 from ._asyncio import (
+    aacquire_brokered_concurrency_slots,
     aacquire_concurrency_slots,
     aacquire_concurrency_slots_with_lease,
     arelease_concurrency_slots_with_lease,
@@ -68,6 +70,24 @@ async def concurrency(
 
     names = names if isinstance(names, list) else [names]
 
+    if get_current_settings().client.concurrency.lease_block_size > 1 and not strict:
+        # Take the slots from a block leased for this process, see
+        # `PREFECT_CLIENT_CONCURRENCY_LEASE_BLOCK_SIZE`
+        broker, block = await aacquire_brokered_concurrency_slots(
+            names=names,
+            slots=occupy,
+            timeout_seconds=timeout_seconds,
+            max_retries=max_retries,
+            lease_duration=lease_duration,
+        )
+        emitted_events = emit_concurrency_acquisition_events(block.limits, occupy)
+        try:
+            yield
+        finally:
+            broker.release(block, occupy)
+            emit_concurrency_release_events(block.limits, occupy, emitted_events)
+        return
+
     response = await aacquire_concurrency_slots_with_lease(
         names=names,
         slots=occupy,
@@ -1,15 +1,26 @@
 import asyncio
+import threading
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal, Optional
+from uuid import UUID
 
+import anyio
 import httpx
 from starlette import status
-from typing_extensions import TypeAlias, Unpack
+from typing_extensions import Self, TypeAlias, Unpack
 
 from prefect._internal.concurrency import logger
+from prefect._internal.concurrency.api import create_call
 from prefect._internal.concurrency.services import FutureQueueService
+from prefect._internal.concurrency.threads import get_global_loop
 from prefect.client.orchestration import get_client
+from prefect.client.schemas.responses import (
+    ConcurrencyLimitWithLeaseResponse,
+    MinimalConcurrencyLimitResponse,
+)
+from prefect.settings.context import get_current_settings
 from prefect.utilities.timeout import timeout_async
 
 if TYPE_CHECKING:
@@ -62,3 +73,249 @@ class ConcurrencySlotAcquisitionService(
                     await asyncio.sleep(retry_after)
                     if max_retries is not None:
                         max_retries -= 1
+
+
+@dataclass(eq=False)
+class LeasedSlotBlock:
+    """A block of slots leased together from the same concurrency limits"""
+
+    lease_id: UUID
+    limits: list[MinimalConcurrencyLimitResponse]
+    slots: int
+    in_use: int = 0
+    release_handle: Optional[asyncio.TimerHandle] = field(default=None, repr=False)
+
+    @property
+    def available(self) -> int:
+        return self.slots - self.in_use
+
+
+class ConcurrencySlotBroker:
+    """
+    Hands out slots of the same concurrency limits to the uses of those limits in
+    this process, from blocks of slots leased from the API together.
+
+    Rather than leasing and releasing slots for each use, a use takes its slots from
+    a block that the broker has already leased, only leasing a new block (of
+    `PREFECT_CLIENT_CONCURRENCY_LEASE_BLOCK_SIZE` slots, or just the slots needed if
+    that many aren't available) when no block has room.  Slots handed back are
+    reused by later uses, and a block is only released back to the API once none of
+    its slots have been in use for `PREFECT_CLIENT_CONCURRENCY_LEASE_IDLE_TIMEOUT`
+    seconds.  Leases can only be released as a whole, so a partially used block
+    holds all of its slots until it is idle.  All blocks are renewed together by a
+    single renewal loop.
+
+    The limits are still enforced by the server, since every slot that is handed
+    out belongs to a leased block.  If a block's lease can't be renewed, the uses of
+    its slots carry on without them, as with non-strict leases.
+
+    The broker runs on the global loop thread.
+    """
+
+    _instances: dict[tuple[frozenset[str], float], Self] = {}
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        concurrency_limit_names: frozenset[str],
+        lease_duration: float,
+        block_size: int,
+        idle_timeout: float,
+    ):
+        self.concurrency_limit_names: list[str] = sorted(concurrency_limit_names)
+        self.lease_duration = lease_duration
+        self.block_size = block_size
+        self.idle_timeout = idle_timeout
+        self._loop: asyncio.AbstractEventLoop = get_global_loop().loop
+        self._blocks: list[LeasedSlotBlock] = []
+        self._slots_released: Optional[asyncio.Event] = None
+        self._renewal_task: Optional[asyncio.Task[None]] = None
+
+    @classmethod
+    def instance(
+        cls, concurrency_limit_names: frozenset[str], lease_duration: float
+    ) -> Self:
+        """
+        Get the broker for the given concurrency limits and lease duration.
+        """
+        with cls._instance_lock:
+            key = (concurrency_limit_names, lease_duration)
+            if key not in cls._instances:
+                settings = get_current_settings().client.concurrency
+                instance = cls(
+                    concurrency_limit_names,
+                    lease_duration,
+                    block_size=settings.lease_block_size,
+                    idle_timeout=settings.lease_idle_timeout,
+                )
+                get_global_loop().add_shutdown_call(create_call(instance.shutdown))
+                cls._instances[key] = instance
+            return cls._instances[key]
+
+    async def acquire(
+        self,
+        slots: int,
+        timeout_seconds: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ) -> LeasedSlotBlock:
+        """
+        Take `slots` slots from a leased block, waiting for them if needed.  The
+        slots must be handed back with `release`.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._acquire(slots, timeout_seconds, max_retries), self._loop
+        )
+        return await asyncio.wrap_future(future)
+
+    def release(self, block: LeasedSlotBlock, slots: int) -> None:
+        """
+        Hand back slots taken from the given block.  May be called from any thread.
+        """
+        self._loop.call_soon_threadsafe(self._release, block, slots)
+
+    async def shutdown(self) -> None:
+        """
+        Release every leased block back to the API.
+        """
+        with self._instance_lock:
+            key = (frozenset(self.concurrency_limit_names), self.lease_duration)
+            if self._instances.get(key) is self:
+                self._instances.pop(key)
+        if self._renewal_task:
+            self._renewal_task.cancel()
+        blocks, self._blocks = self._blocks, []
+        if not blocks:
+            return
+        async with get_client() as client:
+            for block in blocks:
+                try:
+                    await client.release_concurrency_slots_with_lease(block.lease_id)
+                except Exception:
+                    logger.debug(
+                        "Unable to release concurrency lease %s",
+                        block.lease_id,
+                        exc_info=True,
+                    )
+
+    async def _acquire(
+        self, slots: int, timeout_seconds: Optional[float], max_retries: Optional[int]
+    ) -> LeasedSlotBlock:
+        with timeout_async(seconds=timeout_seconds):
+            async with get_client() as client:
+                while True:
+                    if self._slots_released is None:
+                        self._slots_released = asyncio.Event()
+                    slots_released = self._slots_released
+
+                    block = next(
+                        (block for block in self._blocks if block.available >= slots),
+                        None,
+                    )
+                    if block is None:
+                        try:
+                            block = await self._lease_block(client, slots)
+                        except httpx.HTTPStatusError as exc:
+                            if not exc.response.status_code == status.HTTP_423_LOCKED:
+                                raise
+
+                            if max_retries is not None and max_retries <= 0:
+                                raise exc
+                            retry_after = float(exc.response.headers["Retry-After"])
+                            logger.debug(
+                                f"Unable to acquire concurrency slot. Retrying in {retry_after} second(s)."
+                            )
+                            # slots handed back by other uses in this process can be
+                            # taken before it's time to retry
+                            with anyio.move_on_after(retry_after):
+                                await slots_released.wait()
+                            if max_retries is not None:
+                                max_retries -= 1
+                            continue
+
+                    block.in_use += slots
+                    if block.release_handle:
+                        block.release_handle.cancel()
+                        block.release_handle = None
+                    return block
+
+    async def _lease_block(
+        self, client: "PrefectClient", slots: int
+    ) -> LeasedSlotBlock:
+        # Try to lease a whole block first, falling back to just the slots needed
+        # when the limits don't have room for a block
+        sizes = [self.block_size, slots] if self.block_size > slots else [slots]
+        for size in sizes:
+            try:
+                response = await client.increment_concurrency_slots_with_lease(
+                    names=self.concurrency_limit_names,
+                    slots=size,
+                    mode="concurrency",
+                    lease_duration=self.lease_duration,
+                )
+            except httpx.HTTPStatusError as exc:
+                if size > slots and exc.response.status_code in (
+                    status.HTTP_423_LOCKED,
+                    status.HTTP_422_UNPROCESSABLE_ENTITY,
+                ):
+                    continue
+                raise
+
+            result = ConcurrencyLimitWithLeaseResponse.model_validate(response.json())
+            if result.limits:
+                # there's no point in asking for blocks larger than the limits
+                self.block_size = min(
+                    self.block_size, *(limit.limit for limit in result.limits)
+                )
+            block = LeasedSlotBlock(
+                lease_id=result.lease_id, limits=result.limits, slots=size
+            )
+            self._blocks.append(block)
+            if self._renewal_task is None or self._renewal_task.done():
+                self._renewal_task = asyncio.create_task(self._renew_blocks())
+            return block
+
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def _release(self, block: LeasedSlotBlock, slots: int) -> None:
+        block.in_use -= slots
+
+        if self._slots_released is not None:
+            self._slots_released.set()
+            self._slots_released = None
+
+        if block.in_use == 0 and block in self._blocks:
+            block.release_handle = self._loop.call_later(
+                self.idle_timeout,
+                lambda: asyncio.ensure_future(self._release_block(block)),
+            )
+
+    async def _release_block(self, block: LeasedSlotBlock) -> None:
+        if block.in_use or block not in self._blocks:
+            return
+        self._blocks.remove(block)
+        block.release_handle = None
+        try:
+            async with get_client() as client:
+                await client.release_concurrency_slots_with_lease(block.lease_id)
+        except Exception:
+            logger.debug(
+                "Unable to release concurrency lease %s", block.lease_id, exc_info=True
+            )
+
+    async def _renew_blocks(self) -> None:
+        async with get_client() as client:
+            while self._blocks:
+                # Renew the leases 3/4 of the way through the lease duration
+                await asyncio.sleep(self.lease_duration * 0.75)
+                for block in list(self._blocks):
+                    try:
+                        await client.renew_concurrency_lease(
+                            lease_id=block.lease_id,
+                            lease_duration=self.lease_duration,
+                        )
+                    except Exception:
+                        logger.warning(
+                            "Concurrency lease renewal failed - slots are no longer reserved. Execution will continue, but concurrency limits may be exceeded."
+                        )
+                        if block in self._blocks:
+                            self._blocks.remove(block)
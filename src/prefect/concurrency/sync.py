@@ -10,9 +10,11 @@ from prefect.client.schemas.responses import (
     MinimalConcurrencyLimitResponse,
 )
 from prefect.concurrency._leases import maintain_concurrency_lease
+from prefect.settings.context import get_current_settings
 from prefect.utilities.asyncutils import run_coro_as_sync
 
 from ._asyncio import (
+    aacquire_brokered_concurrency_slots,
     aacquire_concurrency_slots,
     aacquire_concurrency_slots_with_lease,
     arelease_concurrency_slots_with_lease,
@@ -107,6 +109,26 @@ def concurrency(
 
     names = names if isinstance(names, list) else [names]
 
+    if get_current_settings().client.concurrency.lease_block_size > 1 and not strict:
+        # Take the slots from a block leased for this process, see
+        # `PREFECT_CLIENT_CONCURRENCY_LEASE_BLOCK_SIZE`
+        broker, block = run_coro_as_sync(
+            aacquire_brokered_concurrency_slots(
+                names,
+                occupy,
+                timeout_seconds=timeout_seconds,
+                max_retries=max_retries,
+                lease_duration=lease_duration,
+            )
+        )
+        emitted_events = emit_concurrency_acquisition_events(block.limits, occupy)
+        try:
+            yield
+        finally:
+            broker.release(block, occupy)
+            emit_concurrency_release_events(block.limits, occupy, emitted_events)
+        return
+
     acquisition_response = _acquire_concurrency_slots_with_lease(
         names,
         occupy,
@@ -1,15 +1,18 @@
 import abc
 import asyncio
+from collections import deque
 from datetime import timedelta
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    Deque,
     Dict,
     List,
     MutableMapping,
     Optional,
+    Sequence,
     Tuple,
     Type,
     cast,
@@ -19,6 +22,7 @@ from uuid import UUID
 import orjson
 from cachetools import TTLCache
 from prometheus_client import Counter
+from pydantic import TypeAdapter
 from typing_extensions import Self
 from websockets import Subprotocol
 from websockets.asyncio.client import ClientConnection
@@ -39,6 +43,7 @@ from prefect.settings import (
     PREFECT_CLOUD_API_URL,
     PREFECT_DEBUG_MODE,
     PREFECT_SERVER_ALLOW_EPHEMERAL_MODE,
+    get_current_settings,
 )
 
 if TYPE_CHECKING:
@@ -73,6 +78,8 @@ if TYPE_CHECKING:
 
 logger: "logging.Logger" = get_logger(__name__)
 
+_EVENT_LIST: TypeAdapter[List[Event]] = TypeAdapter(List[Event])
+
 
 def http_to_ws(url: str) -> str:
     return url.replace("https://", "wss://").replace("http://", "ws://").rstrip("/")
@@ -167,10 +174,27 @@ class EventsClient(abc.ABC):
         finally:
             EVENTS_EMITTED.labels(self.client_name).inc()
 
+    async def emit_many(self, events: Sequence[Event]) -> None:
+        """Emit several events, in order"""
+        if not hasattr(self, "_in_context"):
+            raise TypeError(
+                "Events may only be emitted while this client is being used as a "
+                "context manager"
+            )
+
+        try:
+            return await self._emit_many(events)
+        finally:
+            EVENTS_EMITTED.labels(self.client_name).inc(len(events))
+
     @abc.abstractmethod
     async def _emit(self, event: Event) -> None:  # pragma: no cover
         ...
 
+    async def _emit_many(self, events: Sequence[Event]) -> None:
+        for event in events:
+            await self._emit(event)
+
     async def __aenter__(self) -> Self:
         self._in_context = True
         return self
@@ -249,12 +273,15 @@ class PrefectEventsClient(EventsClient):
 
     _websocket: Optional[ClientConnection]
     _unconfirmed_events: List[Event]
+    _checkpoints: Deque[Tuple["asyncio.Future[float]", int]]
 
     def __init__(
         self,
         api_url: Optional[str] = None,
         reconnection_attempts: int = 10,
         checkpoint_every: int = 700,
+        batch_size: Optional[int] = None,
+        max_unconfirmed: Optional[int] = None,
     ):
         """
         Args:
@@ -263,6 +290,11 @@ class PrefectEventsClient(EventsClient):
                 the client should attempt to reconnect
             checkpoint_every: How often the client should sync with the server to
                 confirm receipt of all previously sent events
+            batch_size: The maximum number of events `emit_many` sends in a single
+                websocket message; defaults to `PREFECT_CLIENT_EVENTS_BATCH_SIZE`
+            max_unconfirmed: How many sent events may be awaiting confirmation before
+                the client waits on the server; defaults to
+                `PREFECT_CLIENT_EVENTS_MAX_UNCONFIRMED`, or `checkpoint_every`
         """
         api_url = api_url or PREFECT_API_URL.value()
         if not api_url:
@@ -277,6 +309,16 @@ class PrefectEventsClient(EventsClient):
         self._unconfirmed_events = []
         self._checkpoint_every = checkpoint_every
 
+        settings = get_current_settings().client.events
+        self._batch_size = batch_size or settings.batch_size
+        self._max_unconfirmed = max(
+            max_unconfirmed or settings.max_unconfirmed or checkpoint_every,
+            checkpoint_every,
+        )
+        # pings that have been sent to checkpoint unconfirmed events, along with how
+        # many of the unconfirmed events each one will confirm
+        self._checkpoints = deque()
+
     async def __aenter__(self) -> Self:
         # Don't handle any errors in the initial connection, because these are most
         # likely a permission or configuration issue that should propagate
@@ -335,39 +377,60 @@ class PrefectEventsClient(EventsClient):
         # Clear the unconfirmed events here, because they are going back through emit
         # and will be added again through the normal checkpointing process
         self._unconfirmed_events = []
-        for event in events_to_resend:
-            await self.emit(event)
+        self._checkpoints.clear()
+        await self.emit_many(events_to_resend)
         logger.debug("Finished resending unconfirmed events.")
 
     async def _checkpoint(self) -> None:
         assert self._websocket
 
-        unconfirmed_count = len(self._unconfirmed_events)
-
-        if unconfirmed_count < self._checkpoint_every:
-            return
-
-        logger.debug("Pinging to checkpoint unconfirmed events.")
-        pong = await self._websocket.ping()
-        await pong
-        self._log_debug("Pong received. Events checkpointed.")
-
-        # once the pong returns, we know for sure that we've sent all the messages
-        # we had enqueued prior to that.  There could be more that came in after, so
-        # don't clear the list, just the ones that we are sure of.
-        self._unconfirmed_events = self._unconfirmed_events[unconfirmed_count:]
+        checkpointed = self._checkpoints[-1][1] if self._checkpoints else 0
+        if len(self._unconfirmed_events) - checkpointed >= self._checkpoint_every:
+            logger.debug("Pinging to checkpoint unconfirmed events.")
+            pong = cast("asyncio.Future[float]", await self._websocket.ping())
+            self._checkpoints.append((pong, len(self._unconfirmed_events)))
+
+        # Only wait on a checkpoint once too many events are unconfirmed, so that
+        # events can keep being sent while earlier checkpoints are in flight
+        while self._checkpoints and (
+            self._checkpoints[0][0].done()
+            or len(self._unconfirmed_events) >= self._max_unconfirmed
+        ):
+            pong, confirmed = self._checkpoints.popleft()
+            await pong
+            self._log_debug("Pong received. Events checkpointed.")
+
+            # once the pong returns, we know for sure that we've sent all the messages
+            # we had enqueued prior to that.  There could be more that came in after,
+            # so don't clear the list, just the ones that we are sure of.
+            self._unconfirmed_events = self._unconfirmed_events[confirmed:]
+            self._checkpoints = deque(
+                (pong, count - confirmed) for pong, count in self._checkpoints
+            )
 
-        EVENT_WEBSOCKET_CHECKPOINTS.labels(self.client_name).inc()
+            EVENT_WEBSOCKET_CHECKPOINTS.labels(self.client_name).inc()
 
     async def _emit(self, event: Event) -> None:
         self._log_debug("Emitting event id=%s.", event.id)
+        await self._send([event], event.model_dump_json())
+
+    async def _emit_many(self, events: Sequence[Event]) -> None:
+        if self._batch_size == 1:
+            return await super()._emit_many(events)
 
-        self._unconfirmed_events.append(event)
+        for i in range(0, len(events), self._batch_size):
+            batch = list(events[i : i + self._batch_size])
+            self._log_debug("Emitting a batch of %s events.", len(batch))
+            # serialize the whole batch in one call, as a JSON array of events
+            await self._send(batch, _EVENT_LIST.dump_json(batch).decode())
+
+    async def _send(self, events: List[Event], message: str) -> None:
+        self._unconfirmed_events.extend(events)
 
         logger.debug(
-            "Added event id=%s to unconfirmed events list. "
+            "Added %s events to unconfirmed events list. "
             "There are now %s unconfirmed events.",
-            event.id,
+            len(events),
             len(self._unconfirmed_events),
         )
 
@@ -379,15 +442,16 @@ class PrefectEventsClient(EventsClient):
                 #
                 # Otherwise, after the first time through this loop, we're recovering
                 # from a ConnectionClosed, so reconnect now, resending any unconfirmed
-                # events before we send this one.
+                # events (including these) instead of sending them again here.
                 if not self._websocket or i > 0:
                     self._log_debug("Attempting websocket reconnection.")
                     await self._reconnect()
                     assert self._websocket
+                    return
 
-                self._log_debug("Sending event id=%s.", event.id)
-                await self._websocket.send(event.model_dump_json())
-                self._log_debug("Checkpointing event id=%s.", event.id)
+                self._log_debug("Sending %s events.", len(events))
+                await self._websocket.send(message)
+                self._log_debug("Checkpointing %s events.", len(events))
                 await self._checkpoint()
 
                 return
@@ -442,6 +506,13 @@ class AssertingPassthroughEventsClient(PrefectEventsClient):
         # record the event for inspection
         self.events.append(event)
 
+    async def _emit_many(self, events: Sequence[Event]) -> None:
+        await super()._emit_many(events)
+
+        # batched events are sent without passing through `_emit`
+        if self._batch_size > 1:
+            self.events.extend(events)
+
     async def __aenter__(self) -> Self:
         await super().__aenter__()
         self.events = []
@@ -477,6 +548,8 @@ class PrefectCloudEventsClient(PrefectEventsClient):
             self._events_socket_url,
             additional_headers={"Authorization": f"bearer {api_key}"},
         )
+        # Prefect Cloud expects a single event in each message
+        self._batch_size = 1
 
 
 SEEN_EVENTS_SIZE = 500_000
@@ -1,15 +1,20 @@
+import logging
+import queue
 from contextlib import asynccontextmanager
 from contextvars import Context, copy_context
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 from uuid import UUID
 
 from typing_extensions import Self
 
+from prefect._internal.concurrency import logger
+from prefect._internal.concurrency.api import create_call
 from prefect._internal.concurrency.services import QueueService
 from prefect.settings import (
     PREFECT_API_KEY,
     PREFECT_API_URL,
     PREFECT_CLOUD_API_URL,
+    get_current_settings,
 )
 from prefect.utilities.context import temporary_context
 
@@ -75,6 +80,42 @@ class EventsWorker(QueueService[Event]):
         self._context_cache[event.id] = copy_context()
         return event
 
+    async def _main_loop(self) -> None:
+        max_batch_size = get_current_settings().client.events.batch_size
+        if max_batch_size == 1:
+            return await super()._main_loop()
+
+        done = False
+        while not done:
+            items: List[Optional[Event]] = [
+                await self._queue_get_thread.submit(
+                    create_call(self._queue.get)
+                ).aresult()
+            ]
+            # Batch up whatever else is already waiting, without waiting for more, so
+            # batches only grow when events are arriving faster than they're sent
+            while items[-1] is not None and len(items) < max_batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            done = items[-1] is None
+            events = [event for event in items if event is not None]
+            try:
+                if events:
+                    await self._handle_batch(events)
+            except Exception:
+                logger.error(
+                    "Service %r failed to process a batch of %s events",
+                    type(self).__name__,
+                    len(events),
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
     async def _handle(self, event: Event):
         context = self._context_cache.pop(event.id)
         with temporary_context(context=context):
@@ -82,6 +123,28 @@ class EventsWorker(QueueService[Event]):
 
         await self._client.emit(event)
 
+    async def _handle_batch(self, events: List[Event]) -> None:
+        prepared: List[Event] = []
+        for event in events:
+            # An event that can't be prepared is dropped on its own, as it would be
+            # when events are handled one at a time
+            try:
+                context = self._context_cache.pop(event.id)
+                with temporary_context(context=context):
+                    await self.attach_related_resources_from_context(event)
+            except Exception:
+                logger.error(
+                    "Service %r failed to process item %r",
+                    type(self).__name__,
+                    event,
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
+                continue
+            prepared.append(event)
+
+        if prepared:
+            await self._client.emit_many(prepared)
+
     async def attach_related_resources_from_context(self, event: Event) -> None:
         if "prefect.resource.lineage-group" in event.resource:
             # We attach related resources to lineage events in `emit_lineage_event`,
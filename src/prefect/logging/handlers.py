@@ -3,7 +3,9 @@ from __future__ import annotations
 import inspect
 import json
 import logging
+import queue
 import sys
+import threading
 import time
 import traceback
 import uuid
@@ -32,7 +34,10 @@ from prefect.settings import (
     PREFECT_LOGGING_MARKUP,
     PREFECT_LOGGING_TO_API_BATCH_INTERVAL,
     PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_LOGGING_TO_API_COMPRESSION,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
+    PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE,
+    PREFECT_LOGGING_TO_API_QUEUE_OVERFLOW_POLICY,
     PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW,
 )
 from prefect.types._datetime import from_timestamp
@@ -49,23 +54,145 @@ if TYPE_CHECKING:
     from prefect.client.schemas.objects import FlowRun, TaskRun
 
 
+# The smallest batch size, in bytes, that adaptive batching will aim for
+MIN_ADAPTIVE_BATCH_SIZE = 64 * 1024
+
+# Under the "sample" overflow policy, one in this many logs is kept when the queue is
+# full
+OVERFLOW_SAMPLE_RATE = 10
+
+# Weight given to the newest observation in moving averages of request latency and
+# log throughput
+_SMOOTHING = 0.3
+
+
 class APILogWorker(BatchedQueueService[Dict[str, Any]]):
+    """
+    A service that sends batches of logs to the API in the background.
+
+    The size of each batch adapts to the rate at which logs arrive, the latency of
+    requests to the API, and the number of logs waiting in the queue, aiming to send
+    everything that arrives during one request or batch interval in a single request.
+    The batch size never exceeds `PREFECT_LOGGING_TO_API_BATCH_SIZE`.
+
+    The queue holds at most `PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE` logs; when it is
+    full, `PREFECT_LOGGING_TO_API_QUEUE_OVERFLOW_POLICY` determines whether logs are
+    dropped or the caller waits.
+
+    Attributes:
+        sent: The number of logs sent to the API.
+        dropped: The number of logs discarded because the queue was full.
+        failed: The number of logs that could not be sent to the API.
+    """
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        self._overflow_count = 0
+        # Bytes of logs added to the queue, and bytes of logs that have been sent or
+        # dropped; the difference is the backlog including the batch being built.
+        # Both are updated from the threads that log and from the worker thread.
+        self._bytes_lock = threading.Lock()
+        self._enqueued_bytes = 0
+        self._handled_bytes = 0
+        self._batch_bytes = 0
+        self._bytes_per_second: float | None = None
+        self._latency: float | None = None
+        self._last_batch_time = time.monotonic()
+        self._last_batch_enqueued_bytes = 0
+
     @property
     def max_batch_size(self) -> int:
-        return max(
+        ceiling = max(
             PREFECT_LOGGING_TO_API_BATCH_SIZE.value()
             - PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value(),
             PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value(),
         )
+        if self._bytes_per_second is None:
+            return ceiling
+
+        # Size batches to hold what arrives during one send cycle, plus whatever is
+        # already waiting in the queue
+        cycle = max(self.min_interval or 0, self._latency or 0)
+        with self._bytes_lock:
+            backlog = max(self._enqueued_bytes - self._handled_bytes, 0)
+        target = int(self._bytes_per_second * cycle) + backlog
+        return max(min(target, ceiling), min(MIN_ADAPTIVE_BATCH_SIZE, ceiling))
 
     @property
     def min_interval(self) -> float | None:
         return PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()
 
+    def send(self, item: Dict[str, Any]) -> None:
+        """
+        Send a log to this instance of the service, applying the queue overflow policy
+        if the queue is full.
+        """
+        max_queue_size = PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE.value()
+        if max_queue_size and self._queue.qsize() >= max_queue_size:
+            if not self._make_room(max_queue_size):
+                return
+
+        # Read the size first; the worker thread removes it once it takes the item
+        payload_size = item.get("__payload_size__") or 0
+        super().send(item)
+        with self._bytes_lock:
+            self._enqueued_bytes += payload_size
+
+    def _make_room(self, max_queue_size: int) -> bool:
+        """
+        Apply the queue overflow policy to a full queue.
+
+        Returns:
+            Whether the new log should be added to the queue.
+        """
+        policy = PREFECT_LOGGING_TO_API_QUEUE_OVERFLOW_POLICY.value()
+
+        # Blocking on the global loop would prevent this service from draining the
+        # queue, so fall back to dropping logs there
+        if policy == "block" and not in_global_loop():
+            with self._queue.not_full:
+                # `qsize` cannot be used while holding the queue's lock
+                while len(self._queue.queue) >= max_queue_size and not self._stopped:
+                    self._queue.not_full.wait(timeout=0.1)
+            return True
+
+        if self.dropped == 0 and sys.stderr:
+            sys.stderr.write(
+                "--- Log queue is full; logs will be dropped until the API catches"
+                " up ---\n"
+            )
+
+        self._overflow_count += 1
+        if policy == "sample" and self._overflow_count % OVERFLOW_SAMPLE_RATE:
+            self.dropped += 1
+            return False
+
+        with self._lock:
+            if self._stopped:
+                return True
+            try:
+                oldest = self._queue.get_nowait()
+            except queue.Empty:
+                return True
+            self._queue.task_done()
+        if oldest is not None:
+            with self._bytes_lock:
+                self._handled_bytes += oldest.get("__payload_size__") or 0
+        self.dropped += 1
+        return True
+
     async def _handle_batch(self, items: list[dict[str, Any]]):
+        batch_bytes, self._batch_bytes = self._batch_bytes, 0
+        start = time.monotonic()
         try:
-            await self._client.create_logs(items)
+            await self._client.create_logs(
+                items, compress=PREFECT_LOGGING_TO_API_COMPRESSION.value()
+            )
         except Exception as e:
+            self.failed += len(items)
             # Roughly replicate the behavior of the stdlib logger error handling
             if logging.raiseExceptions and sys.stderr:
                 sys.stderr.write("--- Error logging to API ---\n")
@@ -74,6 +201,47 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
                 else:
                     # Only log the exception message in non-DEBUG mode
                     sys.stderr.write(str(e))
+        else:
+            self.sent += len(items)
+        finally:
+            with self._bytes_lock:
+                self._handled_bytes += batch_bytes
+            self._observe_batch(latency=time.monotonic() - start)
+
+    def _observe_batch(self, latency: float) -> None:
+        """
+        Update the moving averages used to size batches after a batch is sent.
+        """
+        now = time.monotonic()
+        with self._bytes_lock:
+            enqueued_bytes = self._enqueued_bytes
+        elapsed = now - self._last_batch_time
+        arrived = enqueued_bytes - self._last_batch_enqueued_bytes
+        self._last_batch_time = now
+        self._last_batch_enqueued_bytes = enqueued_bytes
+
+        if elapsed > 0:
+            rate = arrived / elapsed
+            self._bytes_per_second = (
+                rate
+                if self._bytes_per_second is None
+                else _SMOOTHING * rate + (1 - _SMOOTHING) * self._bytes_per_second
+            )
+        self._latency = (
+            latency
+            if self._latency is None
+            else _SMOOTHING * latency + (1 - _SMOOTHING) * self._latency
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters describing the logs handled by this service."""
+        return {
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "queued": self._queue.qsize(),
+            "max_batch_size": self.max_batch_size,
+        }
 
     @asynccontextmanager
     async def _lifespan(self):
@@ -92,7 +260,9 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
         return super().instance(*settings, *args)
 
     def _get_size(self, item: Dict[str, Any]) -> int:
-        return item.pop("__payload_size__", None) or len(json.dumps(item).encode())
+        payload_size = item.pop("__payload_size__", None)
+        self._batch_bytes += payload_size or 0
+        return payload_size or len(json.dumps(item).encode())
 
 
 class APILogHandler(logging.Handler):
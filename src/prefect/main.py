@@ -16,7 +16,6 @@ import prefect.runtime  # pyright: ignore[reportUnusedImport] # TODO: Does this
 
 # Import modules that register types
 import prefect.serializers  # pyright: ignore[reportUnusedImport]
-import prefect.blocks.notifications  # pyright: ignore[reportUnusedImport]
 import prefect.blocks.system  # pyright: ignore[reportUnusedImport]
 
 # Initialize the process-wide profile and registry at import time
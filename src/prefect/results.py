@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
 import socket
 import threading
@@ -21,6 +22,7 @@ from typing import (
 )
 from uuid import UUID
 
+import anyio
 from cachetools import LRUCache
 from pydantic import (
     BaseModel,
@@ -37,6 +39,7 @@ from prefect._internal.compatibility.async_dispatch import async_dispatch
 from prefect._internal.compatibility.blocks import call_explicitly_async_block_method
 from prefect._internal.compatibility.deprecated import deprecated_callable
 from prefect._internal.concurrency.event_loop import get_running_loop
+from prefect._result_cache import ResultDiskCache, ResultRecordCache
 from prefect._result_records import R, ResultRecord, ResultRecordMetadata
 from prefect.blocks.core import Block
 from prefect.exceptions import (
@@ -50,7 +53,7 @@ from prefect.filesystems import (
 )
 from prefect.locking.protocol import LockManager
 from prefect.logging import get_logger
-from prefect.serializers import Serializer
+from prefect.serializers import OutOfBandPickleSerializer, Serializer
 from prefect.settings.context import get_current_settings
 from prefect.types import DateTime
 from prefect.utilities.annotations import NotSet
@@ -290,8 +293,18 @@ def _format_user_supplied_storage_key(key: str) -> str:
 T = TypeVar("T")
 
 
-def default_cache() -> LRUCache[str, "ResultRecord[Any]"]:
-    return LRUCache(maxsize=1000)
+def default_cache() -> ResultRecordCache:
+    settings = get_current_settings().results
+    disk_cache = (
+        ResultDiskCache(
+            path=settings.disk_cache_path, max_bytes=settings.disk_cache_max_bytes
+        )
+        if settings.disk_cache_path is not None
+        else None
+    )
+    return ResultRecordCache(
+        max_bytes=settings.memory_cache_max_bytes, disk_cache=disk_cache
+    )
 
 
 def result_storage_discriminator(x: Any) -> str:
@@ -307,6 +320,36 @@ def result_storage_discriminator(x: Any) -> str:
     return "None"
 
 
+def _write_buffered_record(path: Path, result_record: "ResultRecord[Any]") -> int:
+    """
+    Write a result record to a local path with `ResultRecord.write_buffered`.
+
+    The record is written to a temporary file that then replaces the destination so
+    that readers never see a partially written record. Results already memory-mapped
+    from the destination keep the old file's data. Windows does not allow replacing
+    a mapped file, so `ResultRecord.read_buffered` does not map files there.
+    """
+    path.parent.mkdir(exist_ok=True, parents=True)
+    if path.exists() and not path.is_file():
+        raise ValueError(f"Path {path} already exists and is not a file.")
+
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "wb") as file:
+            size = result_record.write_buffered(file)
+        try:
+            os.replace(tmp_path, path)
+        except PermissionError as exc:
+            # Windows refuses to replace a file that another process has open
+            raise PermissionError(
+                f"Could not replace the result record at {path}. It may be open in "
+                "another process."
+            ) from exc
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return size
+
+
 class ResultStore(BaseModel):
     """
     Manages the storage and retrieval of results.
@@ -319,6 +362,10 @@ class ResultStore(BaseModel):
         lock_manager: The lock manager to use for locking result records. If not provided,
             the store cannot be used in transactions with the SERIALIZABLE isolation level.
         cache_result_in_memory: Whether to cache results in memory.
+        cache: The cache of result records, bounded by the serialized size of the
+            records it holds. Defaults to a cache configured by the
+            `PREFECT_RESULTS_MEMORY_CACHE_*` and `PREFECT_RESULTS_DISK_CACHE_*` settings.
+            An `LRUCache` bounded by the number of records is also accepted.
         serializer: The serializer to use for results.
         storage_key_fn: The function to generate storage keys.
     """
@@ -338,7 +385,9 @@ class ResultStore(BaseModel):
     cache_result_in_memory: bool = Field(default=True)
     serializer: Serializer = Field(default_factory=get_default_result_serializer)
     storage_key_fn: Callable[[], str] = Field(default=DEFAULT_STORAGE_KEY_FN)
-    cache: LRUCache[str, "ResultRecord[Any]"] = Field(default_factory=default_cache)
+    cache: Union[ResultRecordCache, LRUCache[str, "ResultRecord[Any]"]] = Field(
+        default_factory=default_cache
+    )
 
     @property
     def result_storage_block_id(self) -> UUID | None:
@@ -346,6 +395,34 @@ class ResultStore(BaseModel):
             return None
         return getattr(self.result_storage, "_block_document_id", None)
 
+    @property
+    def _disk_cache(self) -> ResultDiskCache | None:
+        return getattr(self.cache, "disk_cache", None)
+
+    def _cache_lookup(self, key: str) -> "ResultRecord[Any] | None":
+        if isinstance(self.cache, ResultRecordCache):
+            return self.cache.lookup(key)
+        return self.cache.get(key)
+
+    def _cache_put(self, key: str, record: "ResultRecord[Any]", nbytes: int) -> None:
+        if isinstance(self.cache, ResultRecordCache):
+            self.cache.put(key, record, nbytes=nbytes)
+        else:
+            self.cache[key] = record
+
+    def _disk_cache_key(self, storage_key: str) -> str:
+        """
+        The key of a record in the disk cache, which may be shared by stores using
+        different storage. Storage keys are only unique within their storage, so
+        they are qualified by the storage's block document ID, or by a hash of its
+        configuration if it has not been saved.
+        """
+        storage_id = self.result_storage_block_id
+        if storage_id is None and self.result_storage is not None:
+            configuration = self.result_storage.model_dump_json().encode()
+            storage_id = hashlib.sha256(configuration).hexdigest()
+        return f"{storage_id}:{storage_key}"
+
     @classmethod
     async def _from_metadata(cls, metadata: ResultRecordMetadata) -> "ResultRecord[R]":
         """
@@ -495,13 +572,22 @@ class ResultStore(BaseModel):
                 return False
         else:
             try:
-                content = await call_explicitly_async_block_method(
-                    self.result_storage, "read_path", (key,), {}
+                local_path = self._local_record_path(key)
+                buffered_metadata = (
+                    ResultRecord.read_buffered_metadata(local_path)
+                    if local_path is not None
+                    else None
                 )
-                if content is None:
-                    return False
-                record: ResultRecord[Any] = ResultRecord.deserialize(content)
-                metadata = record.metadata
+                if buffered_metadata is not None:
+                    metadata = buffered_metadata
+                else:
+                    content = await call_explicitly_async_block_method(
+                        self.result_storage, "read_path", (key,), {}
+                    )
+                    if content is None:
+                        return False
+                    record: ResultRecord[Any] = ResultRecord.deserialize(content)
+                    metadata = record.metadata
             except Exception:
                 return False
 
@@ -537,6 +623,18 @@ class ResultStore(BaseModel):
         """
         return await self._exists(key=key, _sync=False)
 
+    def _local_record_path(self, key: str) -> Path | None:
+        """
+        The local path a record is stored at if it can be read and written in
+        buffered form, i.e. the result and its metadata are stored together on the
+        local file system.
+        """
+        if self.metadata_storage is not None or not isinstance(
+            self.result_storage, LocalFileSystem
+        ):
+            return None
+        return self.result_storage._resolve_path(key)
+
     def _resolved_key_path(self, key: str) -> str:
         if self.result_storage_block_id is None and (
             _resolve_path := getattr(self.result_storage, "_resolve_path", None)
@@ -571,14 +669,21 @@ class ResultStore(BaseModel):
 
         resolved_key_path = self._resolved_key_path(key)
 
-        if resolved_key_path in self.cache:
-            cached_result: ResultRecord[Any] = self.cache[resolved_key_path]
+        if (cached_result := self._cache_lookup(resolved_key_path)) is not None:
             await emit_result_read_event(self, resolved_key_path, cached=True)
             return cached_result
 
         if self.result_storage is None:
             self.result_storage = await aget_default_result_storage()
 
+        # Remote storage can be fronted by a local disk cache; local storage is
+        # already on disk so there is nothing to gain from caching it again
+        disk_cache = (
+            self._disk_cache
+            if not isinstance(self.result_storage, LocalFileSystem)
+            else None
+        )
+
         if self.metadata_storage is not None:
             metadata_content = await call_explicitly_async_block_method(
                 self.metadata_storage,
@@ -590,34 +695,76 @@ class ResultStore(BaseModel):
             assert metadata.storage_key is not None, (
                 "Did not find storage key in metadata"
             )
-            result_content = await call_explicitly_async_block_method(
-                self.result_storage,
-                "read_path",
-                (metadata.storage_key,),
-                {},
+            result_content = (
+                disk_cache.get(self._disk_cache_key(metadata.storage_key))
+                if disk_cache
+                else None
             )
+            if result_content is None:
+                result_content = await call_explicitly_async_block_method(
+                    self.result_storage,
+                    "read_path",
+                    (metadata.storage_key,),
+                    {},
+                )
+                if disk_cache:
+                    disk_cache.put(
+                        self._disk_cache_key(metadata.storage_key), result_content
+                    )
             result_record: ResultRecord[Any] = (
                 ResultRecord.deserialize_from_result_and_metadata(
                     result=result_content, metadata=metadata_content
                 )
             )
+            content_size = len(result_content) + len(metadata_content)
+            await emit_result_read_event(self, resolved_key_path)
+        elif (buffered := self._read_buffered(key)) is not None:
+            result_record, content_size = buffered
             await emit_result_read_event(self, resolved_key_path)
         else:
-            content = await call_explicitly_async_block_method(
-                self.result_storage,
-                "read_path",
-                (key,),
-                {},
+            content = (
+                disk_cache.get(self._disk_cache_key(resolved_key_path))
+                if disk_cache
+                else None
             )
+            if content is None:
+                content = await call_explicitly_async_block_method(
+                    self.result_storage,
+                    "read_path",
+                    (key,),
+                    {},
+                )
+                if disk_cache:
+                    disk_cache.put(self._disk_cache_key(resolved_key_path), content)
             result_record: ResultRecord[Any] = ResultRecord.deserialize(
                 content, backup_serializer=self.serializer
             )
+            content_size = len(content)
             await emit_result_read_event(self, resolved_key_path)
 
         if self.cache_result_in_memory:
-            self.cache[resolved_key_path] = result_record
+            self._cache_put(resolved_key_path, result_record, nbytes=content_size)
         return result_record
 
+    def _read_buffered(self, key: str) -> tuple["ResultRecord[Any]", int] | None:
+        """
+        Memory-map a record written in buffered form from local storage.
+
+        Returns:
+            The record and the size of its file, or `None` if the record is not
+            stored locally in buffered form.
+        """
+        if (local_path := self._local_record_path(key)) is None:
+            return None
+        try:
+            result_record = ResultRecord.read_buffered(local_path)
+        except (FileNotFoundError, IsADirectoryError):
+            # Let the storage block report missing records
+            return None
+        if result_record is None:
+            return None
+        return result_record, local_path.stat().st_size
+
     def read(
         self,
         key: str,
@@ -783,32 +930,50 @@ class ResultStore(BaseModel):
         if self.result_storage is None:
             self.result_storage = await aget_default_result_storage()
 
+        # Records serialized with out-of-band buffers are streamed to local storage
+        # so that the serialized result is never held in memory in full
+        if isinstance(result_record.serializer, OutOfBandPickleSerializer) and (
+            local_path := self._local_record_path(key)
+        ):
+            content_size = await anyio.to_thread.run_sync(
+                partial(_write_buffered_record, local_path, result_record)
+            )
+            await emit_result_write_event(self, result_record.metadata.storage_key)
         # If metadata storage is configured, write result and metadata separately
-        if self.metadata_storage is not None:
+        elif self.metadata_storage is not None:
+            result_content = result_record.serialize_result()
+            metadata_content = result_record.serialize_metadata()
             await call_explicitly_async_block_method(
                 self.result_storage,
                 "write_path",
                 (result_record.metadata.storage_key,),
-                {"content": result_record.serialize_result()},
+                {"content": result_content},
             )
             await call_explicitly_async_block_method(
                 self.metadata_storage,
                 "write_path",
                 (base_key,),
-                {"content": result_record.serialize_metadata()},
+                {"content": metadata_content},
             )
+            content_size = len(result_content) + len(metadata_content)
             await emit_result_write_event(self, result_record.metadata.storage_key)
         # Otherwise, write the result metadata and result together
         else:
+            content = result_record.serialize()
             await call_explicitly_async_block_method(
                 self.result_storage,
                 "write_path",
                 (result_record.metadata.storage_key,),
-                {"content": result_record.serialize()},
+                {"content": content},
             )
+            content_size = len(content)
             await emit_result_write_event(self, result_record.metadata.storage_key)
+
+        # Drop any copy of a previous record for this key from the disk cache
+        if self._disk_cache is not None:
+            self._disk_cache.discard(self._disk_cache_key(key))
         if self.cache_result_in_memory:
-            self.cache[key] = result_record
+            self._cache_put(key, result_record, nbytes=content_size)
 
     def persist_result_record(
         self, result_record: "ResultRecord[Any]", holder: str | None = None
@@ -0,0 +1,211 @@
+"""
+A pool of Python interpreters that have already imported Prefect's engine, and any
+other configured modules, and are each waiting to execute a single flow run.
+
+Each interpreter is started with `python -m prefect.runner._warm_pool` and blocks
+reading one line from stdin with the environment and working directory of the flow
+run it should execute.  It then replaces its own environment with the given one and
+runs `prefect.engine` exactly as `python -m prefect.engine` would, so a flow run in a
+warm interpreter has its own process, just like a flow run in a fresh one, and is
+cancelled the same way.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import runpy
+import subprocess
+import sys
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Optional, TypeVar, Union
+
+import anyio
+import anyio.abc
+
+from prefect.logging import get_logger
+from prefect.settings import get_current_settings
+from prefect.utilities.processutils import (
+    TextSink,
+    consume_process_output,
+    get_sys_executable,
+)
+
+T = TypeVar("T")
+
+logger = get_logger("runner.warm_pool")
+
+
+class WarmProcessPool:
+    """
+    Keeps `size` interpreters started ahead of time, replacing each one as soon as it
+    is taken to execute a flow run.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        preload_modules: Optional[list[str]] = None,
+        **kwargs: Any,
+    ):
+        """
+        Args:
+            size: The number of idle interpreters to keep started.
+            preload_modules: Additional modules for each interpreter to import before
+                it waits for a flow run.
+            **kwargs: Additional keyword arguments for `anyio.open_process`.
+        """
+        self.size = size
+        self.preload_modules: list[str] = list(preload_modules or [])
+        self._kwargs = kwargs
+        self._idle: list[anyio.abc.Process] = []
+
+    async def __aenter__(self) -> "WarmProcessPool":
+        for _ in range(self.size):
+            await self._start_process()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        idle, self._idle = self._idle, []
+        with anyio.CancelScope(shield=True):
+            for process in idle:
+                await _close(process)
+
+    async def take(self) -> Optional[anyio.abc.Process]:
+        """
+        Takes an idle interpreter out of the pool and starts another in its place.
+
+        Returns None if no idle interpreter is still alive, in which case the flow run
+        should be started in a fresh interpreter.
+        """
+        while self._idle:
+            process = self._idle.pop(0)
+            await self._start_process()
+            if process.returncode is None:
+                return process
+            logger.warning(
+                "Warm interpreter %s exited with status code %s before it was used.",
+                process.pid,
+                process.returncode,
+            )
+            await _close(process)
+        return None
+
+    async def _start_process(self) -> None:
+        env = {
+            **get_current_settings().to_environment_variables(exclude_unset=True),
+            **os.environ,
+        }
+        command = [get_sys_executable(), "-m", __name__, *self.preload_modules]
+        self._idle.append(
+            await anyio.open_process(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=env,
+                **self._kwargs,
+            )
+        )
+
+
+async def run_warm_process(
+    process: anyio.abc.Process,
+    *,
+    env: dict[str, Optional[str]],
+    cwd: Union[Path, str, None] = None,
+    stream_output: Union[
+        bool, tuple[Optional[TextSink[str]], Optional[TextSink[str]]]
+    ] = False,
+    task_status: Optional[anyio.abc.TaskStatus[T]] = None,
+    task_status_handler: Optional[Callable[[anyio.abc.Process], T]] = None,
+) -> anyio.abc.Process:
+    """
+    Like `prefect.utilities.processutils.run_process`, but hands the environment and
+    working directory of a flow run to an interpreter from a `WarmProcessPool`
+    instead of starting a new process.
+    """
+    if stream_output is True:
+        stream_output = (sys.stdout, sys.stderr)
+
+    try:
+        assert process.stdin is not None
+        payload = {
+            "env": {key: value for key, value in env.items() if value is not None},
+            "cwd": str(cwd) if cwd else None,
+        }
+        await process.stdin.send(json.dumps(payload).encode() + b"\n")
+        await process.stdin.aclose()
+
+        if task_status is not None:
+            value: Any = process.pid
+            if task_status_handler:
+                value = task_status_handler(process)
+            task_status.started(value)
+
+        # always read the output so the interpreter doesn't block on a full pipe
+        await consume_process_output(
+            process,
+            stdout_sink=stream_output[0] if stream_output else None,
+            stderr_sink=stream_output[1] if stream_output else None,
+        )
+        await process.wait()
+    finally:
+        with anyio.CancelScope(shield=True):
+            await _close(process)
+
+    return process
+
+
+async def _close(process: anyio.abc.Process) -> None:
+    try:
+        process.terminate()
+    except OSError:
+        # Occurs if the process is already terminated
+        pass
+    await process.aclose()
+
+
+def _main() -> None:
+    import prefect.flow_engine  # noqa: F401
+
+    for module in sys.argv[1:]:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            logger.warning("Failed to preload module %r", module, exc_info=True)
+
+    line = sys.stdin.readline()
+    if not line:
+        # the runner exited without using this interpreter
+        return
+
+    payload = json.loads(line)
+    os.environ.clear()
+    os.environ.update(payload["env"])
+    if payload["cwd"]:
+        os.chdir(payload["cwd"])
+    # `python -m` puts the starting directory first on the path
+    sys.path[0] = os.getcwd()
+    sys.argv = sys.argv[:1]
+
+    # Settings and logging were loaded from the runner's environment at import time,
+    # so load them again from the flow run's
+    import prefect.context
+    from prefect.logging.configuration import setup_logging
+
+    prefect.context.GLOBAL_SETTINGS_CONTEXT = prefect.context.root_settings_context()
+    setup_logging(incremental=False)
+
+    runpy.run_module("prefect.engine", run_name="__main__", alter_sys=True)
+
+
+if __name__ == "__main__":
+    _main()
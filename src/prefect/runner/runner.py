@@ -135,6 +135,7 @@ if TYPE_CHECKING:
     from prefect.client.schemas.responses import DeploymentResponse
     from prefect.client.types.flexible_schedule_list import FlexibleScheduleList
     from prefect.deployments.runner import RunnerDeployment
+    from prefect.runner._warm_pool import WarmProcessPool
 
 __all__ = ["Runner"]
 
@@ -236,6 +237,7 @@ class Runner:
         self._flow_run_process_map: dict[UUID, ProcessMapEntry] = dict()
         self.__flow_run_process_map_lock: asyncio.Lock | None = None
         self._flow_run_bundle_map: dict[UUID, SerializedBundle] = dict()
+        self._warm_pool: WarmProcessPool | None = None
         # Flip to True when we are rescheduling flow runs to avoid marking flow runs as crashed
         self._rescheduling: bool = False
 
@@ -790,15 +792,32 @@ class Runner:
                 await storage.pull_code()
                 setattr(storage, "last_adhoc_pull", datetime.datetime.now())
 
-        process = await run_process(
-            command=runner_command,
-            stream_output=stream_output,
-            task_status=task_status,
-            task_status_handler=lambda process: process,
-            env=env,
-            cwd=storage.destination if storage else cwd,
-            **kwargs,
+        warm_process = (
+            await self._warm_pool.take()
+            if self._warm_pool is not None and command is None
+            else None
         )
+        if warm_process is not None:
+            from prefect.runner._warm_pool import run_warm_process
+
+            process = await run_warm_process(
+                warm_process,
+                stream_output=stream_output,
+                task_status=task_status,
+                task_status_handler=lambda process: process,
+                env=env,
+                cwd=storage.destination if storage else cwd,
+            )
+        else:
+            process = await run_process(
+                command=runner_command,
+                stream_output=stream_output,
+                task_status=task_status,
+                task_status_handler=lambda process: process,
+                env=env,
+                cwd=storage.destination if storage else cwd,
+                **kwargs,
+            )
 
         if process.returncode is None:
             raise RuntimeError("Process exited with None return code")
@@ -1505,6 +1524,24 @@ class Runner:
         await self._exit_stack.enter_async_context(self._client)
         await self._exit_stack.enter_async_context(self._events_client)
 
+        warm_pool_settings = get_current_settings().runner.warm_pool
+        if warm_pool_settings.size:
+            # imported here so that warm interpreters, which run that module with
+            # `python -m`, don't import it twice
+            from prefect.runner._warm_pool import WarmProcessPool
+
+            self._warm_pool = await self._exit_stack.enter_async_context(
+                WarmProcessPool(
+                    size=warm_pool_settings.size,
+                    preload_modules=warm_pool_settings.preload_modules,
+                    **(
+                        {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+                        if sys.platform == "win32"
+                        else {}
+                    ),
+                )
+            )
+
         if not hasattr(self, "_runs_task_group") or not self._runs_task_group:
             self._runs_task_group: anyio.abc.TaskGroup = anyio.create_task_group()
         await self._exit_stack.enter_async_context(self._runs_task_group)
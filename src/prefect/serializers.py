@@ -13,7 +13,10 @@ bytes to an object respectively.
 
 import base64
 import io
-from typing import Any, ClassVar, Generic, Optional, Union, overload
+import json
+import pickle
+import struct
+from typing import IO, Any, ClassVar, Generic, Optional, Union, overload
 
 from pydantic import (
     BaseModel,
@@ -163,6 +166,108 @@ class PickleSerializer(Serializer[D]):
         return pickler.loads(base64.decodebytes(blob))
 
 
+class OutOfBandPickleSerializer(Serializer[D]):
+    """
+    Serializes objects using pickle protocol 5 with out-of-band buffers.
+
+    Objects that expose their memory as buffers, such as NumPy arrays and Arrow
+    buffers, are not copied into the pickle stream. Instead, the pickle and each
+    buffer are written one after another into a frame, with every buffer aligned to
+    a 64 byte boundary. This allows a frame to be written to a file without ever
+    building the full payload in memory, and read back from a memory-mapped file
+    with the loaded objects referencing the mapped memory directly.
+
+    - Uses `cloudpickle` by default. See `picklelib` for using alternative libraries;
+        the library must support protocol 5 and the `buffer_callback` argument.
+    - `dumps` and `loads` wrap a complete frame in base64 for safe transmission.
+        Use `write_frame` and `read_frame` to avoid the extra copies.
+    """
+
+    type: str = Field(default="pickle/out-of-band", frozen=True)
+
+    picklelib: str = "cloudpickle"
+
+    @field_validator("picklelib")
+    def check_picklelib(cls, value: str) -> str:
+        return validate_picklelib(value)
+
+    def write_frame(self, obj: D, file: IO[bytes]) -> int:
+        """
+        Write a frame containing the object to a binary file.
+
+        Buffers are written directly from the memory of the objects that own them.
+
+        Returns:
+            The number of bytes written.
+        """
+        pickler = from_qualified_name(self.picklelib)
+        buffers: list[pickle.PickleBuffer] = []
+        data: bytes = pickler.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+
+        # Offsets depend on the size of the header, which contains the offsets; the
+        # header is padded to a fixed width to break the cycle
+        sections = [len(data)] + [raw.nbytes for raw in raw_buffers]
+        header_size = _frame_header_size(len(sections))
+        offsets: list[int] = []
+        position = header_size
+        for size in sections:
+            position = _align(position)
+            offsets.append(position)
+            position += size
+
+        header = json.dumps(
+            {"sections": [[o, n] for o, n in zip(offsets, sections)]}
+        ).encode()
+        file.write(struct.pack("<Q", header_size))
+        file.write(header.ljust(header_size - 8))
+
+        written = header_size
+        for offset, content in zip(offsets, [memoryview(data)] + raw_buffers):
+            file.write(b"\0" * (offset - written))
+            file.write(content)
+            written = offset + content.nbytes
+
+        for buffer in buffers:
+            buffer.release()
+        return written
+
+    def read_frame(self, frame: Union[bytes, memoryview]) -> D:
+        """
+        Load the object stored in a frame written by `write_frame`.
+
+        Loaded buffers reference `frame` rather than copying from it, so when `frame`
+        is a view of a memory-mapped file the data is paged in lazily.
+        """
+        view = memoryview(frame)
+        (header_size,) = struct.unpack_from("<Q", view)
+        header = json.loads(bytes(view[8:header_size]))
+        sections = [view[o : o + n] for o, n in header["sections"]]
+        pickler = from_qualified_name(self.picklelib)
+        return pickler.loads(sections[0], buffers=sections[1:])
+
+    def dumps(self, obj: D) -> bytes:
+        file = io.BytesIO()
+        self.write_frame(obj, file)
+        return base64.encodebytes(file.getbuffer())
+
+    def loads(self, blob: bytes) -> D:
+        return self.read_frame(base64.decodebytes(blob))
+
+
+_FRAME_ALIGNMENT = 64
+
+
+def _align(position: int) -> int:
+    return -(-position // _FRAME_ALIGNMENT) * _FRAME_ALIGNMENT
+
+
+def _frame_header_size(section_count: int) -> int:
+    # 8 bytes for the header size followed by JSON with room for two 20 digit
+    # integers per section
+    return _align(8 + 32 + section_count * 48)
+
+
 class JSONSerializer(Serializer[D]):
     """
     Serializes data to JSON.
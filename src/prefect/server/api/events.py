@@ -5,6 +5,7 @@ from fastapi import Response, WebSocket, status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends, Path
 from fastapi.params import Body, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 from starlette.status import WS_1002_PROTOCOL_ERROR
@@ -42,6 +43,8 @@ logger: "logging.Logger" = get_logger(__name__)
 
 router: PrefectRouter = PrefectRouter(prefix="/events", tags=["Events"])
 
+_EVENT_LIST: TypeAdapter[List[Event]] = TypeAdapter(List[Event])
+
 
 @router.post("", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
 async def create_events(
@@ -62,15 +65,25 @@ async def create_events(
 
 @router.websocket("/in")
 async def stream_events_in(websocket: WebSocket) -> None:
-    """Open a WebSocket to stream incoming Events"""
+    """
+    Open a WebSocket to stream incoming Events
+
+    Each message is either a single Event or, from clients that send events in
+    batches, a JSON array of Events.
+    """
 
     await websocket.accept()
 
     try:
         async with messaging.create_event_publisher() as publisher:
-            async for event_json in websocket.iter_text():
-                event = Event.model_validate_json(event_json)
-                await publisher.publish_event(event.receive())
+            async for message in websocket.iter_text():
+                if message.startswith("["):
+                    events = _EVENT_LIST.validate_json(message)
+                else:
+                    events = [Event.model_validate_json(message)]
+
+                for event in events:
+                    await publisher.publish_event(event.receive())
     except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:  # pragma: no cover
         pass  # it's fine if a client disconnects either normally or abnormally
 
@@ -202,7 +215,7 @@ async def read_events(
     results).
     """
     filter = filter or EventFilter()
-    async with db.session_context() as session:
+    async with db.session_context(read_only=True) as session:
         events, total, next_token = await database.query_events(
             session=session,
             filter=filter,
@@ -228,7 +241,7 @@ async def read_account_events_page(
     Returns the next page of Events for a previous query against the given Account, and
     the URL to request the next page (if there are more results).
     """
-    async with db.session_context() as session:
+    async with db.session_context(read_only=True) as session:
         try:
             events, total, next_token = await database.query_next_page(
                 session=session, page_token=page_token
@@ -272,7 +285,7 @@ async def count_account_events(
     that can be counted include the day the event occurred, the type of event, or
     the IDs of the resources associated with the event.
     """
-    async with db.session_context() as session:
+    async with db.session_context(read_only=True) as session:
         return await handle_event_count_request(
             session=session,
             filter=filter,
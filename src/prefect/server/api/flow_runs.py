@@ -59,6 +59,11 @@ logger: "logging.Logger" = get_logger("server.api")
 
 router: PrefectRouter = PrefectRouter(prefix="/flow_runs", tags=["Flow Runs"])
 
+# Bulk state changes are committed in batches so that a large request doesn't hold
+# locks on all of its flow runs at once
+BULK_SET_STATE_BATCH_SIZE = 100
+BULK_SET_STATE_MAX_FLOW_RUNS = 10_000
+
 
 @router.post("/")
 async def create_flow_run(
@@ -193,7 +198,7 @@ async def count_flow_runs(
     """
     Query for flow runs.
     """
-    async with db.session_context() as session:
+    async with db.session_context(read_only=True) as session:
         return await models.flow_runs.count_flow_runs(
             session=session,
             flow_filter=flows,
@@ -357,6 +362,13 @@ async def read_flow_run_graph_v2(
         default=jsonable_encoder(earliest_possible_datetime()),
         description="Only include runs that start or end after this time.",
     ),
+    updated_since: Optional[datetime.datetime] = Query(
+        default=None,
+        description=(
+            "Only include runs, artifacts and states created or updated since about"
+            " a minute before this time, along with the parents of those runs."
+        ),
+    ),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> Graph:
     """
@@ -368,6 +380,7 @@ async def read_flow_run_graph_v2(
                 session=session,
                 flow_run_id=flow_run_id,
                 since=since,
+                updated_since=updated_since,
             )
         except FlowRunGraphTooLarge as e:
             raise HTTPException(
@@ -545,7 +558,7 @@ async def read_flow_runs(
     """
     Query for flow runs.
     """
-    async with db.session_context() as session:
+    async with db.session_context(read_only=True) as session:
         db_flow_runs = await models.flow_runs.read_flow_runs(
             session=session,
             flow_filter=flows,
@@ -655,6 +668,73 @@ async def set_flow_run_state(
     return orchestration_result
 
 
+@router.post("/set_state")
+async def bulk_set_flow_run_state(
+    flow_run_ids: List[UUID] = Body(
+        ...,
+        min_length=1,
+        max_length=BULK_SET_STATE_MAX_FLOW_RUNS,
+        description="The ids of the flow runs to set the state of.",
+    ),
+    state: schemas.actions.StateCreate = Body(..., description="The intended state."),
+    force: bool = Body(
+        False,
+        description=(
+            "If false, orchestration rules will be applied that may alter or prevent"
+            " the state transitions. If True, orchestration rules are not applied."
+        ),
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    flow_policy: type[FlowRunOrchestrationPolicy] = Depends(
+        orchestration_dependencies.provide_flow_policy
+    ),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_flow_orchestration_parameters
+    ),
+    api_version: str = Depends(dependencies.provide_request_api_version),
+    client_version: Optional[str] = Depends(dependencies.get_prefect_client_version),
+) -> Dict[UUID, OrchestrationResult]:
+    """
+    Set the same state on many flow runs, invoking orchestration rules for each run.
+
+    Flow runs are orchestrated in batches, each committed in its own transaction. If
+    orchestrating a flow run raises an error, only that flow run's changes are rolled
+    back and its result is aborted. Flow runs that do not exist are not included in
+    the response.
+    """
+    # (circular import)
+    from prefect.server.api.server import is_client_retryable_exception
+
+    # pass the request version to the orchestration engine to support compatibility code
+    orchestration_parameters.update({"api-version": api_version})
+
+    proposed_state = schemas.states.State.model_validate(state)
+
+    async def orchestrate(batch: List[UUID]) -> Dict[UUID, OrchestrationResult]:
+        async with db.session_context(
+            begin_transaction=True, with_for_update=True
+        ) as session:
+            return await models.flow_runs.bulk_set_flow_run_state(
+                session=session,
+                flow_run_ids=batch,
+                state=proposed_state,
+                force=force,
+                flow_policy=flow_policy,
+                orchestration_parameters=orchestration_parameters,
+                client_version=client_version,
+                raise_error=is_client_retryable_exception,
+            )
+
+    results: Dict[UUID, OrchestrationResult] = {}
+    flow_run_ids = list(dict.fromkeys(flow_run_ids))
+    for i in range(0, len(flow_run_ids), BULK_SET_STATE_BATCH_SIZE):
+        results.update(
+            await orchestrate(flow_run_ids[i : i + BULK_SET_STATE_BATCH_SIZE])
+        )
+
+    return results
+
+
 @router.post("/{id:uuid}/input", status_code=status.HTTP_201_CREATED)
 async def create_flow_run_input(
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
@@ -779,7 +859,7 @@ async def paginate_flow_runs(
     """
     offset = (page - 1) * limit
 
-    async with db.session_context() as session:
+    async with db.session_context(read_only=True) as session:
         runs = await models.flow_runs.read_flow_runs(
             session=session,
             flow_filter=flows,
@@ -51,7 +51,7 @@ async def read_logs(
     """
     Query for logs.
     """
-    async with db.session_context() as session:
+    async with db.session_context(read_only=True) as session:
         return logs_adapter.validate_python(
             await models.logs.read_logs(
                 session=session, log_filter=logs, offset=offset, limit=limit, sort=sort
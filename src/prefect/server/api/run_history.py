@@ -4,6 +4,7 @@ Utilities for querying flow and task run history.
 
 import datetime
 import json
+import math
 from typing import TYPE_CHECKING, List, Optional
 
 import pydantic
@@ -66,25 +67,69 @@ async def run_history(
     ).cte("intervals")
 
     # apply filters to the flow runs (and related states)
-    runs = (
-        await run_filter_function(
-            db,
+    runs_query = await run_filter_function(
+        db,
+        sa.select(
+            run_model.expected_start_time,
+            run_model.state_type,
+            run_model.state_name,
+            sa.literal(1, literal_execute=True).label("count_runs"),
+            # estimated run times only includes positive run times (to avoid any unexpected corner cases)
+            sa.func.greatest(
+                0, sa.extract("epoch", run_model.estimated_run_time)
+            ).label("estimated_run_time"),
+            # estimated lateness is the sum of any positive start time deltas
+            sa.func.greatest(
+                0, sa.extract("epoch", run_model.estimated_start_time_delta)
+            ).label("estimated_lateness"),
+        ).select_from(run_model),
+        flow_filter=flows,
+        flow_run_filter=flow_runs,
+        task_run_filter=task_runs,
+        deployment_filter=deployments,
+        work_pool_filter=work_pools,
+        work_queue_filter=work_queues,
+    )
+
+    # when the intervals are made of whole minutes, read finished runs from the
+    # pre-aggregated rollups where they are up to date
+    rollups = await _read_rollups(
+        db,
+        session,
+        run_type,
+        history_start,
+        history_end,
+        history_interval,
+        flows=flows,
+        flow_runs=flow_runs,
+        task_runs=task_runs,
+        deployments=deployments,
+        work_pools=work_pools,
+        work_queues=work_queues,
+    )
+    if rollups is not None:
+        frontier, rollup_filters = rollups
+        runs_query = sa.union_all(
+            runs_query.where(
+                sa.or_(
+                    run_model.state_type.is_(None),
+                    run_model.state_type.in_(
+                        models.run_history_rollups.NON_TERMINAL_STATES
+                    ),
+                    run_model.expected_start_time >= frontier,
+                )
+            ),
             sa.select(
-                run_model.id,
-                run_model.expected_start_time,
-                run_model.estimated_run_time,
-                run_model.estimated_start_time_delta,
-                run_model.state_type,
-                run_model.state_name,
-            ).select_from(run_model),
-            flow_filter=flows,
-            flow_run_filter=flow_runs,
-            task_run_filter=task_runs,
-            deployment_filter=deployments,
-            work_pool_filter=work_pools,
-            work_queue_filter=work_queues,
+                db.RunHistoryRollup.interval_start,
+                db.RunHistoryRollup.state_type,
+                db.RunHistoryRollup.state_name,
+                db.RunHistoryRollup.count_runs,
+                db.RunHistoryRollup.sum_estimated_run_time,
+                db.RunHistoryRollup.sum_estimated_lateness,
+            ).where(*rollup_filters, db.RunHistoryRollup.interval_start < frontier),
         )
-    ).alias("runs")
+
+    runs = runs_query.alias("runs")
     # outer join intervals to the filtered runs to create a dataset composed of
     # every interval and the aggregate of all its runs. The runs aggregate is represented
     # by a descriptive JSON object
@@ -94,28 +139,18 @@ async def run_history(
             intervals.c.interval_end,
             # build a JSON object, ignoring the case where the count of runs is 0
             sa.case(
-                (sa.func.count(runs.c.id) == 0, None),
+                (sa.func.count(runs.c.count_runs) == 0, None),
                 else_=db.queries.build_json_object(
                     "state_type",
                     runs.c.state_type,
                     "state_name",
                     runs.c.state_name,
                     "count_runs",
-                    sa.func.count(runs.c.id),
-                    # estimated run times only includes positive run times (to avoid any unexpected corner cases)
+                    sa.func.sum(runs.c.count_runs),
                     "sum_estimated_run_time",
-                    sa.func.sum(
-                        sa.func.greatest(
-                            0, sa.extract("epoch", runs.c.estimated_run_time)
-                        )
-                    ),
-                    # estimated lateness is the sum of any positive start time deltas
+                    sa.func.sum(runs.c.estimated_run_time),
                     "sum_estimated_lateness",
-                    sa.func.sum(
-                        sa.func.greatest(
-                            0, sa.extract("epoch", runs.c.estimated_start_time_delta)
-                        )
-                    ),
+                    sa.func.sum(runs.c.estimated_lateness),
                 ),
             ).label("state_agg"),
         )
@@ -168,3 +203,56 @@ async def run_history(
     return pydantic.TypeAdapter(
         List[schemas.responses.HistoryResponse]
     ).validate_python(records)
+
+
+async def _read_rollups(
+    db: PrefectDBInterface,
+    session: sa.orm.Session,
+    run_type: Literal["flow_run", "task_run"],
+    history_start: DateTime,
+    history_end: DateTime,
+    history_interval: datetime.timedelta,
+    flows: Optional[schemas.filters.FlowFilter] = None,
+    flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
+    task_runs: Optional[schemas.filters.TaskRunFilter] = None,
+    deployments: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pools: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_queues: Optional[schemas.filters.WorkQueueFilter] = None,
+) -> Optional[tuple[datetime.datetime, list[sa.ColumnElement[bool]]]]:
+    """
+    Returns the rollup frontier and the filters to apply to the rollups, or None if
+    the history can't be read from the rollups.
+    """
+    if not models.run_history_rollups.is_aligned(history_start) or (
+        history_interval % models.run_history_rollups.ROLLUP_INTERVAL
+    ):
+        return None
+
+    interval_count = min(
+        500,
+        math.ceil(
+            (history_end - history_start).total_seconds()
+            / history_interval.total_seconds()
+        ),
+    )
+    rollup_filters = models.run_history_rollups.rollup_filters(
+        run_type,
+        window_start=history_start,
+        window_end=history_start + interval_count * history_interval,
+        flow_filter=flows,
+        flow_run_filter=flow_runs,
+        task_run_filter=task_runs,
+        deployment_filter=deployments,
+        work_pool_filter=work_pools,
+        work_queue_filter=work_queues,
+    )
+    if rollup_filters is None:
+        return None
+
+    frontier = await models.run_history_rollups.read_rollup_frontier(
+        session=session, series=run_type
+    )
+    if frontier is None:
+        return None
+
+    return frontier, rollup_filters
@@ -46,6 +46,7 @@ import prefect.settings
 from prefect.client.constants import SERVER_API_VERSION
 from prefect.logging import get_logger
 from prefect.server.api.dependencies import EnforceMinimumAPIVersion
+from prefect.server.concurrency.slot_ledger import get_concurrency_slot_ledger
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.services.base import RunInAllServers, Service
 from prefect.server.utilities.database import get_dialect
@@ -655,6 +656,10 @@ def create_app(
             async with Services.running():
                 LIFESPAN_RAN_FOR_APP.add(app)
                 yield
+
+            # write through any slot counts that are only held in memory
+            if slot_ledger := get_concurrency_slot_ledger():
+                await slot_ledger.flush()
         else:
             yield
 
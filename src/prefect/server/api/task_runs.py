@@ -119,7 +119,7 @@ async def count_task_runs(
     """
     Count task runs.
     """
-    async with db.session_context() as session:
+    async with db.session_context(read_only=True) as session:
         return await models.task_runs.count_task_runs(
             session=session,
             flow_filter=flows,
@@ -206,7 +206,7 @@ async def read_task_runs(
     """
     Query for task runs.
     """
-    async with db.session_context() as session:
+    async with db.session_context(read_only=True) as session:
         return await models.task_runs.read_task_runs(
             session=session,
             flow_filter=flows,
@@ -235,7 +235,7 @@ async def paginate_task_runs(
     """
     offset = (page - 1) * limit
 
-    async with db.session_context() as session:
+    async with db.session_context(read_only=True) as session:
         runs = await models.task_runs.read_task_runs(
             session=session,
             flow_filter=flows,
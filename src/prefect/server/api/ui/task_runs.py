@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
@@ -93,43 +93,114 @@ async def read_dashboard_task_run_counts(
             / delta.total_seconds()
         ).label("bucket")
 
-        raw_counts = (
-            (
-                await models.task_runs._apply_task_run_filters(
-                    db,
-                    sa.select(
-                        bucket_expression,
-                        sa.func.min(db.TaskRun.end_time).label("oldest"),
-                        sa.func.sum(
-                            sa.case(
-                                (
-                                    db.TaskRun.state_type.in_(FAILED_STATES),
-                                    1,
-                                ),
-                                else_=0,
-                            )
-                        ).label("failed_count"),
-                        sa.func.sum(
-                            sa.case(
-                                (
-                                    db.TaskRun.state_type.notin_(FAILED_STATES),
-                                    1,
-                                ),
-                                else_=0,
-                            )
-                        ).label("successful_count"),
+        raw_counts_query = (
+            await models.task_runs._apply_task_run_filters(
+                db,
+                sa.select(
+                    bucket_expression,
+                    sa.func.min(db.TaskRun.end_time).label("oldest"),
+                    sa.func.sum(
+                        sa.case(
+                            (
+                                db.TaskRun.state_type.in_(FAILED_STATES),
+                                1,
+                            ),
+                            else_=0,
+                        )
+                    ).label("failed_count"),
+                    sa.func.sum(
+                        sa.case(
+                            (
+                                db.TaskRun.state_type.notin_(FAILED_STATES),
+                                1,
+                            ),
+                            else_=0,
+                        )
+                    ).label("successful_count"),
+                ),
+                flow_filter=flows,
+                flow_run_filter=flow_runs,
+                task_run_filter=task_runs,
+                deployment_filter=deployments,
+                work_pool_filter=work_pools,
+                work_queue_filter=work_queues,
+            )
+        ).group_by("bucket", db.TaskRun.start_time)
+
+        # When each bucket is made of whole minutes, count the task runs from the
+        # pre-aggregated rollups where they are up to date
+        rollup_end = end_time + timedelta(microseconds=1)
+        minutes = round((rollup_end - start_time).total_seconds()) // 60
+        rollup_filters = None
+        if (
+            task_runs.start_time.after_ == start_time
+            and models.run_history_rollups.is_aligned(rollup_end)
+            and minutes % bucket_count == 0
+        ):
+            # only whole minutes before the end of the window are read from the rollups
+            if task_runs.start_time.before_:
+                rollup_end = min(
+                    rollup_end,
+                    (task_runs.start_time.before_ + timedelta(microseconds=1)).replace(
+                        second=0, microsecond=0
                     ),
-                    flow_filter=flows,
-                    flow_run_filter=flow_runs,
-                    task_run_filter=task_runs,
-                    deployment_filter=deployments,
-                    work_pool_filter=work_pools,
-                    work_queue_filter=work_queues,
                 )
+            rollup_filters = models.run_history_rollups.rollup_filters(
+                "task_run_start_time",
+                window_start=start_time,
+                window_end=rollup_end,
+                flow_filter=flows,
+                flow_run_filter=flow_runs,
+                task_run_filter=task_runs,
+                deployment_filter=deployments,
+                work_pool_filter=work_pools,
+                work_queue_filter=work_queues,
             )
-            .group_by("bucket", db.TaskRun.start_time)
-            .subquery()
-        )
+        frontier = None
+        if rollup_filters is not None:
+            frontier = await models.run_history_rollups.read_rollup_frontier(
+                session=session, series="task_run_start_time"
+            )
+        if rollup_filters is not None and frontier is not None:
+            frontier = min(frontier, rollup_end)
+            RunHistoryRollup = db.RunHistoryRollup
+            raw_counts_query = sa.union_all(
+                raw_counts_query.where(db.TaskRun.start_time >= frontier),
+                sa.select(
+                    # minutes start on whole seconds, so round away any imprecision
+                    sa.func.floor(
+                        sa.func.round(
+                            sa.func.date_diff_seconds(
+                                RunHistoryRollup.interval_start, start_datetime
+                            )
+                        )
+                        / ((minutes // bucket_count) * 60)
+                    ).label("bucket"),
+                    sa.func.min(RunHistoryRollup.interval_start).label("oldest"),
+                    sa.func.sum(
+                        sa.case(
+                            (
+                                RunHistoryRollup.state_type.in_(FAILED_STATES),
+                                RunHistoryRollup.count_runs,
+                            ),
+                            else_=0,
+                        )
+                    ).label("failed_count"),
+                    sa.func.sum(
+                        sa.case(
+                            (
+                                RunHistoryRollup.state_type.notin_(FAILED_STATES),
+                                RunHistoryRollup.count_runs,
+                            ),
+                            else_=0,
+                        )
+                    ).label("successful_count"),
+                )
+                .where(*rollup_filters, RunHistoryRollup.interval_start < frontier)
+                .group_by("bucket"),
+            )
+
+        raw_counts = raw_counts_query.subquery()
 
         # Aggregate the raw counts by bucket
         query = (
@@ -2,6 +2,8 @@
 Routes for interacting with work queue objects.
 """
 
+import asyncio
+import datetime
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
@@ -31,6 +33,9 @@ from prefect.server.models.work_queues import (
 from prefect.server.models.workers import emit_work_pool_status_event
 from prefect.server.schemas.statuses import WorkQueueStatus
 from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.work_queue_notifications import (
+    waiting_for_scheduled_flow_runs,
+)
 from prefect.types import DateTime
 from prefect.types._datetime import now
 
@@ -368,12 +373,29 @@ async def get_scheduled_flow_runs(
         None, description="The minimum time to look for scheduled flow runs"
     ),
     limit: int = dependencies.LimitBody(),
+    wait_seconds: float = Body(
+        0,
+        ge=0,
+        le=30,
+        description=(
+            "If no scheduled flow runs are found, how long to wait for flow runs to"
+            " be scheduled before responding"
+        ),
+    ),
     worker_lookups: WorkerLookups = Depends(WorkerLookups),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.responses.WorkerFlowRunResponse]:
     """
-    Load scheduled runs for a worker
+    Load scheduled runs for a worker.
+
+    When `wait_seconds` is given and no runs are found, the request is held open
+    until runs are scheduled into the work queues, an already-scheduled run comes
+    within `scheduled_before`, or `wait_seconds` pass.  While waiting,
+    `scheduled_before` moves forward with the current time.
     """
+    started = now("UTC")
+    deadline = started + datetime.timedelta(seconds=wait_seconds)
+
     async with db.session_context() as session:
         work_pool_id = await worker_lookups._get_work_pool_id_from_name(
             session=session, work_pool_name=work_pool_name
@@ -399,15 +421,52 @@ async def get_scheduled_flow_runs(
             ]
             work_queue_ids = [wq.id for wq in work_queues]
 
-    async with db.session_context(begin_transaction=True) as session:
-        queue_response = await models.workers.get_scheduled_flow_runs(
-            session=session,
-            work_pool_ids=[work_pool_id],
-            work_queue_ids=work_queue_ids,
-            scheduled_before=scheduled_before,
-            scheduled_after=scheduled_after,
-            limit=limit,
-        )
+    with waiting_for_scheduled_flow_runs([wq.id for wq in work_queues]) as scheduled:
+        while True:
+            # clear before looking, so runs scheduled while we look aren't missed
+            scheduled.clear()
+            current = now("UTC")
+            async with db.session_context(begin_transaction=True) as session:
+                queue_response = await models.workers.get_scheduled_flow_runs(
+                    session=session,
+                    work_pool_ids=[work_pool_id],
+                    work_queue_ids=work_queue_ids,
+                    scheduled_before=(
+                        scheduled_before + (current - started)
+                        if scheduled_before
+                        else None
+                    ),
+                    scheduled_after=scheduled_after,
+                    limit=limit,
+                )
+
+            if queue_response or current >= deadline or not limit:
+                break
+
+            timeout = (deadline - current).total_seconds()
+            if scheduled_before:
+                # runs that are already scheduled don't send notifications, so also
+                # wake up when the next of them comes within `scheduled_before`
+                async with db.session_context() as session:
+                    upcoming = await models.workers.get_scheduled_flow_runs(
+                        session=session,
+                        work_pool_ids=[work_pool_id],
+                        work_queue_ids=work_queue_ids,
+                        scheduled_before=scheduled_before + (deadline - started),
+                        scheduled_after=scheduled_after,
+                        limit=1,
+                    )
+                next_start = (
+                    upcoming[0].flow_run.next_scheduled_start_time if upcoming else None
+                )
+                if next_start:
+                    due = next_start - (scheduled_before - started)
+                    timeout = min(timeout, max((due - current).total_seconds(), 0))
+
+            try:
+                await asyncio.wait_for(scheduled.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
 
     background_tasks.add_task(
         mark_work_queues_ready,
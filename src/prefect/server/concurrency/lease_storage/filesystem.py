@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import heapq
 import json
+import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, TypedDict
-from uuid import UUID
+from typing import Any, Iterator, TypedDict
+from uuid import UUID, uuid4
 
 import anyio
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from prefect.server.concurrency.lease_storage import (
     ConcurrencyLeaseStorage as _ConcurrencyLeaseStorage,
 )
@@ -26,6 +35,223 @@ class _LeaseFile(TypedDict):
     created_at: str
 
 
+# The log is compacted once it has more than this many entries and at least twice as
+# many entries as there are leases
+COMPACTION_MIN_ENTRIES = 1000
+
+
+class _ExpirationLog:
+    """
+    The expirations of the leases in a storage path, held in memory and persisted as
+    an append-only log of JSON lines, where a `null` expiration removes a lease.
+
+    Creating, renewing and revoking a lease appends one entry to the log and costs
+    O(log N) in memory, and the expired leases are read from a heap ordered by
+    expiration.  Entries appended by other processes are read from the log before
+    each operation, and the log is rewritten with only the current expirations once
+    most of its entries are outdated.  Processes sharing the log take an exclusive
+    lock on a separate lock file for each operation, so that entries aren't
+    appended to a log that is being compacted.  A compacted log starts with a unique
+    header line, which tells readers that it replaced the log they were reading.
+
+    File locks aren't available on Windows, so the log is never compacted there.
+    Operations block on file I/O and locks, so call them from a worker thread.
+    """
+
+    def __init__(self, storage_path: Path):
+        self.path: Path = storage_path / "expirations.log"
+        self.legacy_path: Path = storage_path / "expirations.json"
+        self.lock_path: Path = storage_path / "expirations.lock"
+        self.expirations: dict[UUID, datetime] = {}
+        self._heap: list[tuple[datetime, UUID]] = []
+        self._entries = 0
+        # the first line of the log as last read and how far it has been read
+        self._first_line: bytes | None = None
+        self._offset = 0
+        self._thread_lock = threading.Lock()
+
+    def set(self, lease_id: UUID, expiration: datetime) -> None:
+        with self._locked():
+            self._refresh()
+            self._append([(lease_id, expiration)])
+
+    def remove(self, lease_id: UUID) -> None:
+        with self._locked():
+            self._refresh()
+            if lease_id in self.expirations:
+                self._append([(lease_id, None)])
+
+    def active(self, now: datetime, limit: int) -> list[UUID]:
+        with self._locked():
+            self._refresh()
+        active: list[UUID] = []
+        for lease_id, expiration in self.expirations.items():
+            if len(active) >= limit:
+                break
+            if expiration > now:
+                active.append(lease_id)
+        return active
+
+    def expired(self, now: datetime, limit: int) -> list[UUID]:
+        with self._locked():
+            self._refresh()
+        expired: dict[UUID, tuple[datetime, UUID]] = {}
+        while self._heap and len(expired) < limit:
+            expiration, lease_id = self._heap[0]
+            if expiration >= now:
+                break
+            entry = heapq.heappop(self._heap)
+            # entries for leases that have since been renewed or revoked are dropped
+            if self.expirations.get(lease_id) == expiration:
+                expired.setdefault(lease_id, entry)
+
+        # expired leases stay in the heap until they are revoked
+        for entry in expired.values():
+            heapq.heappush(self._heap, entry)
+        return list(expired)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the log within this process and, where file locks
+        are supported, across processes.
+        """
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, "ab") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _reset(self) -> None:
+        self.expirations.clear()
+        self._heap.clear()
+        self._entries = 0
+        self._first_line = None
+        self._offset = 0
+
+    def _refresh(self) -> None:
+        """Read the entries appended to the log since it was last read."""
+        try:
+            file = open(self.path, "rb")
+        except FileNotFoundError:
+            if self._offset:
+                self._reset()
+            self._import_legacy_index()
+            return
+
+        with file:
+            first_line = file.readline()
+            if not first_line.endswith(b"\n"):
+                # nothing has been written in full yet
+                return
+
+            size = os.fstat(file.fileno()).st_size
+            if first_line != self._first_line or size < self._offset:
+                # the log was compacted or replaced, so read it again from the start
+                self._reset()
+                self._first_line = first_line
+            if size == self._offset:
+                return
+
+            file.seek(self._offset)
+            data = file.read()
+
+        # a trailing partial line is read once its writer has finished it
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            self._apply(line)
+        self._offset += end
+
+    def _apply(self, line: bytes) -> None:
+        try:
+            entry = json.loads(line)
+            lease_id = UUID(entry["id"])
+            expiration = (
+                datetime.fromisoformat(entry["expiration"])
+                if entry["expiration"]
+                else None
+            )
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return
+
+        self._entries += 1
+        if expiration is None:
+            self.expirations.pop(lease_id, None)
+        elif self.expirations.get(lease_id) != expiration:
+            self.expirations[lease_id] = expiration
+            heapq.heappush(self._heap, (expiration, lease_id))
+
+    def _append(self, entries: list[tuple[UUID, datetime | None]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            f.write(_log_lines(entries))
+        self._refresh()
+
+        if (
+            fcntl is not None
+            and self._entries > COMPACTION_MIN_ENTRIES
+            and self._entries > 2 * len(self.expirations)
+        ):
+            self._compact()
+
+    def _compact(self) -> None:
+        header = json.dumps({"compacted": uuid4().hex}).encode() + b"\n"
+        content = header + _log_lines(list(self.expirations.items()))
+        compacted = self.path.with_suffix(".log.tmp")
+        with open(compacted, "wb") as f:
+            f.write(content)
+        os.replace(compacted, self.path)
+
+        self._heap = [
+            (expiration, lease_id) for lease_id, expiration in self.expirations.items()
+        ]
+        heapq.heapify(self._heap)
+        self._entries = len(self.expirations)
+        self._first_line = header
+        self._offset = len(content)
+
+    def _import_legacy_index(self) -> None:
+        """Move the expirations from an index written by earlier versions to the log."""
+        if not self.legacy_path.exists():
+            return
+
+        try:
+            index: dict[str, str] = json.loads(self.legacy_path.read_text())
+            entries: list[tuple[UUID, datetime | None]] = [
+                (UUID(lease_id), datetime.fromisoformat(expiration))
+                for lease_id, expiration in index.items()
+            ]
+        except (json.JSONDecodeError, AttributeError, TypeError, ValueError):
+            entries = []
+
+        self.legacy_path.unlink(missing_ok=True)
+        if entries:
+            self._append(entries)
+
+
+def _log_lines(entries: list[tuple[UUID, datetime | None]]) -> bytes:
+    return b"".join(
+        json.dumps(
+            {
+                "id": str(lease_id),
+                "expiration": expiration.isoformat() if expiration else None,
+            }
+        ).encode()
+        + b"\n"
+        for lease_id, expiration in entries
+    )
+
+
+_expiration_logs: dict[Path, _ExpirationLog] = {}
+
+
 class ConcurrencyLeaseStorage(_ConcurrencyLeaseStorage):
     """
     A file-based concurrency lease storage implementation that stores leases on disk.
@@ -44,41 +270,13 @@ class ConcurrencyLeaseStorage(_ConcurrencyLeaseStorage):
     def _lease_file_path(self, lease_id: UUID) -> Path:
         return self.storage_path / f"{lease_id}.json"
 
-    def _expiration_index_path(self) -> anyio.Path:
-        return anyio.Path(self.storage_path / "expirations.json")
-
-    async def _load_expiration_index(self) -> dict[str, str]:
-        """Load the expiration index from disk."""
-        expiration_file = self._expiration_index_path()
-        if not await expiration_file.exists():
-            return {}
-
-        try:
-            return json.loads(await expiration_file.read_text())
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return {}
-
-    def _save_expiration_index(self, index: dict[str, str]) -> None:
-        """Save the expiration index to disk."""
-        self._ensure_storage_path()
-        expiration_file = self._expiration_index_path()
-
-        with open(expiration_file, "w") as f:
-            json.dump(index, f)
-
-    async def _update_expiration_index(
-        self, lease_id: UUID, expiration: datetime
-    ) -> None:
-        """Update a single lease's expiration in the index."""
-        index = await self._load_expiration_index()
-        index[str(lease_id)] = expiration.isoformat()
-        self._save_expiration_index(index)
-
-    async def _remove_from_expiration_index(self, lease_id: UUID) -> None:
-        """Remove a lease from the expiration index."""
-        index = await self._load_expiration_index()
-        index.pop(str(lease_id), None)
-        self._save_expiration_index(index)
+    @property
+    def _expirations(self) -> _ExpirationLog:
+        """The expiration index shared by every storage using this storage path."""
+        storage_path = self.storage_path.resolve()
+        if storage_path not in _expiration_logs:
+            _expiration_logs[storage_path] = _ExpirationLog(storage_path)
+        return _expiration_logs[storage_path]
 
     def _serialize_lease(
         self, lease: ResourceLease[ConcurrencyLimitLeaseMetadata]
@@ -130,8 +328,7 @@ class ConcurrencyLeaseStorage(_ConcurrencyLeaseStorage):
         with open(lease_file, "w") as f:
             json.dump(lease_data, f)
 
-        # Update expiration index
-        await self._update_expiration_index(lease.id, expiration)
+        await anyio.to_thread.run_sync(self._expirations.set, lease.id, expiration)
 
         return lease
 
@@ -153,7 +350,7 @@ class ConcurrencyLeaseStorage(_ConcurrencyLeaseStorage):
         except (json.JSONDecodeError, KeyError, ValueError):
             # Clean up corrupted lease file
             lease_file.unlink(missing_ok=True)
-            await self._remove_from_expiration_index(lease_id)
+            await anyio.to_thread.run_sync(self._expirations.remove, lease_id)
             return None
 
     async def renew_lease(self, lease_id: UUID, ttl: timedelta) -> None:
@@ -174,58 +371,26 @@ class ConcurrencyLeaseStorage(_ConcurrencyLeaseStorage):
             with open(lease_file, "w") as f:
                 json.dump(lease_data, f)
 
-            # Update expiration index
-            await self._update_expiration_index(lease_id, new_expiration)
+            await anyio.to_thread.run_sync(
+                self._expirations.set, lease_id, new_expiration
+            )
         except (json.JSONDecodeError, KeyError, ValueError):
             # Clean up corrupted lease file
             lease_file.unlink(missing_ok=True)
-            await self._remove_from_expiration_index(lease_id)
+            await anyio.to_thread.run_sync(self._expirations.remove, lease_id)
 
     async def revoke_lease(self, lease_id: UUID) -> None:
         lease_file = self._lease_file_path(lease_id)
         lease_file.unlink(missing_ok=True)
 
-        # Remove from expiration index
-        await self._remove_from_expiration_index(lease_id)
+        await anyio.to_thread.run_sync(self._expirations.remove, lease_id)
 
     async def read_active_lease_ids(self, limit: int = 100) -> list[UUID]:
-        active_leases: list[UUID] = []
-        now = datetime.now(timezone.utc)
-
-        expiration_index = await self._load_expiration_index()
-
-        for lease_id_str, expiration_str in expiration_index.items():
-            if len(active_leases) >= limit:
-                break
-
-            try:
-                lease_id = UUID(lease_id_str)
-                expiration = datetime.fromisoformat(expiration_str)
-
-                if expiration > now:
-                    active_leases.append(lease_id)
-            except (ValueError, TypeError):
-                continue
-
-        return active_leases
+        return await anyio.to_thread.run_sync(
+            self._expirations.active, datetime.now(timezone.utc), limit
+        )
 
     async def read_expired_lease_ids(self, limit: int = 100) -> list[UUID]:
-        expired_leases: list[UUID] = []
-        now = datetime.now(timezone.utc)
-
-        expiration_index = await self._load_expiration_index()
-
-        for lease_id_str, expiration_str in expiration_index.items():
-            if len(expired_leases) >= limit:
-                break
-
-            try:
-                lease_id = UUID(lease_id_str)
-                expiration = datetime.fromisoformat(expiration_str)
-
-                if expiration < now:
-                    expired_leases.append(lease_id)
-            except (ValueError, TypeError):
-                continue
-
-        return expired_leases
+        return await anyio.to_thread.run_sync(
+            self._expirations.expired, datetime.now(timezone.utc), limit
+        )
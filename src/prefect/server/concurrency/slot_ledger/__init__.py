@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Protocol, Sequence, runtime_checkable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.settings.context import get_current_settings
+
+if TYPE_CHECKING:
+    from prefect.server.database import orm_models
+
+
+@runtime_checkable
+class ConcurrencySlotLedgerModule(Protocol):
+    ConcurrencySlotLedger: type[ConcurrencySlotLedger]
+
+
+class ConcurrencySlotLedger(Protocol):
+    """
+    Counts the active and denied slots of concurrency limits outside of the database,
+    writing the counts through to the database periodically.
+
+    Each method mirrors the function of the same name in
+    `prefect.server.models.concurrency_limits_v2`, including how slots decay over time.
+    Changes are tied to the transaction of the given session, so that they are undone
+    or never made if it rolls back.
+    """
+
+    async def increment_active_slots(
+        self, session: AsyncSession, concurrency_limit_ids: list[UUID], slots: int
+    ) -> bool:
+        """
+        Occupy `slots` on every given limit, or on none of them if any limit is
+        inactive or doesn't have enough free slots.
+
+        Args:
+            session: A database session, used to load limits the ledger hasn't seen yet.
+            concurrency_limit_ids: The IDs of the limits to occupy slots on.
+            slots: The number of slots to occupy on each limit.
+
+        Returns:
+            True if the slots were occupied on every limit.
+        """
+        ...
+
+    async def decrement_active_slots(
+        self,
+        session: AsyncSession,
+        concurrency_limit_ids: list[UUID],
+        slots: int,
+        occupancy_seconds: float | None = None,
+    ) -> bool:
+        """
+        Free `slots` on every given active limit.
+
+        Args:
+            session: A database session, used to load limits the ledger hasn't seen yet.
+            concurrency_limit_ids: The IDs of the limits to free slots on.
+            slots: The number of slots to free on each limit.
+            occupancy_seconds: How long the slots were held, if known.
+
+        Returns:
+            True if the slots were freed on every limit.
+        """
+        ...
+
+    async def update_denied_slots(
+        self, session: AsyncSession, concurrency_limit_ids: list[UUID], slots: int
+    ) -> bool:
+        """
+        Record that `slots` were denied on every given active limit.
+
+        Returns:
+            True if the denied slots were recorded on every limit.
+        """
+        ...
+
+    async def evict(
+        self, session: AsyncSession, concurrency_limit_ids: list[UUID]
+    ) -> None:
+        """
+        Write the counts of the given limits through to the database with the given
+        session and forget them, so that they are read again on their next use.  This
+        must be called before a limit is changed or deleted in the database.
+        """
+        ...
+
+    def merge(
+        self, concurrency_limits: Sequence["orm_models.ConcurrencyLimitV2"]
+    ) -> None:
+        """
+        Replace the slot counts of limits read from the database with the ledger's
+        counts, without marking the limits as changed.
+        """
+        ...
+
+    async def flush(self) -> None:
+        """Write all pending counts through to the database."""
+        ...
+
+
+def get_concurrency_slot_ledger() -> ConcurrencySlotLedger | None:
+    """
+    Returns a ConcurrencySlotLedger instance based on the configured slot ledger
+    module, or None if slots are counted directly in the database.
+
+    Will raise a ValueError if the configured module does not pass a type check.
+    """
+    slot_ledger = get_current_settings().server.concurrency.slot_ledger
+    if not slot_ledger:
+        return None
+
+    concurrency_slot_ledger_module = importlib.import_module(slot_ledger)
+    if not isinstance(concurrency_slot_ledger_module, ConcurrencySlotLedgerModule):
+        raise ValueError(
+            f"The module {slot_ledger} does not contain a ConcurrencySlotLedger class"
+        )
+    return concurrency_slot_ledger_module.ConcurrencySlotLedger()
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.orm.attributes import set_committed_value
+
+from prefect.logging import get_logger
+from prefect.server.concurrency.slot_ledger import (
+    ConcurrencySlotLedger as _ConcurrencySlotLedger,
+)
+from prefect.server.database import provide_database_interface
+from prefect.server.models.concurrency_limits_v2 import (
+    MINIMUM_OCCUPANCY_SECONDS_PER_SLOT,
+    OCCUPANCY_SAMPLES_MULTIPLIER,
+)
+from prefect.settings.context import get_current_settings
+
+if TYPE_CHECKING:
+    from prefect.server.database import orm_models
+
+logger = get_logger(__name__)
+
+# The key in `Session.info` holding the ledger changes waiting on the session's
+# transaction
+_CHANGES_KEY = "prefect_concurrency_slot_ledger_changes"
+
+
+@dataclass
+class SlotCounts:
+    """The slot accounting columns of a single `concurrency_limit_v2` row"""
+
+    active: bool
+    limit: int
+    active_slots: int
+    denied_slots: int
+    slot_decay_per_second: float
+    avg_slot_occupancy_seconds: float
+    updated: datetime
+
+    def slots_after_decay(self, now: datetime) -> tuple[int, int]:
+        # Mirrors `active_slots_after_decay` and `denied_slots_after_decay`
+        elapsed = max((now - self.updated).total_seconds(), 0.0)
+        denied_decay_per_second = (
+            self.slot_decay_per_second
+            if self.slot_decay_per_second > 0.0
+            else 1.0 / self.avg_slot_occupancy_seconds
+        )
+        return (
+            max(
+                0, self.active_slots - math.floor(self.slot_decay_per_second * elapsed)
+            ),
+            max(0, self.denied_slots - math.floor(denied_decay_per_second * elapsed)),
+        )
+
+    def decay(self, now: datetime) -> None:
+        # Like the database, decay restarts from `updated` on every change to a limit
+        self.active_slots, self.denied_slots = self.slots_after_decay(now)
+        self.updated = now
+
+
+@dataclass
+class _PendingChange:
+    """A change to the ledger that waits on the outcome of a database transaction"""
+
+    # The innermost transaction, possibly a savepoint, the change was made in
+    transaction: SessionTransaction
+    on_commit: Optional[Callable[[], None]] = None
+    on_rollback: Optional[Callable[[], None]] = None
+
+
+def _is_within(
+    transaction: Optional[SessionTransaction], ancestor: SessionTransaction
+) -> bool:
+    while transaction is not None:
+        if transaction is ancestor:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+class ConcurrencySlotLedger(_ConcurrencySlotLedger):
+    """
+    A singleton concurrency slot ledger that counts slots in memory, so that
+    acquiring and releasing slots doesn't wait on row locks in the database.
+
+    The counts are only shared within a single server process, so this ledger should
+    only be used when one server process handles all concurrency slot requests.
+
+    Changes follow the transaction of the session they are made with: occupied slots
+    are reserved right away and released if the transaction rolls back, while freed
+    and denied slots are only counted once it commits.
+    """
+
+    _instance: "ConcurrencySlotLedger | None" = None
+    _initialized: bool = False
+
+    def __new__(cls) -> "ConcurrencySlotLedger":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self.__class__._initialized:
+            return
+
+        self.counts: dict[UUID, SlotCounts] = {}
+        self.dirty: set[UUID] = set()
+        # Slots freed on limits that were evicted before the change committed, to
+        # apply when the limit is next loaded
+        self.deferred_frees: dict[UUID, int] = {}
+        self._flusher: asyncio.Task[None] | None = None
+        self.__class__._initialized = True
+
+    async def increment_active_slots(
+        self, session: AsyncSession, concurrency_limit_ids: list[UUID], slots: int
+    ) -> bool:
+        limits = await self._read(session, concurrency_limit_ids)
+        if len(limits) < len(concurrency_limit_ids):
+            return False
+
+        now = datetime.now(timezone.utc)
+        for counts in limits.values():
+            active_slots, _ = counts.slots_after_decay(now)
+            if not counts.active or active_slots + slots > counts.limit:
+                return False
+
+        for counts in limits.values():
+            counts.decay(now)
+            counts.active_slots += slots
+        self.dirty.update(concurrency_limit_ids)
+
+        # Reserve the slots now so that concurrent transactions can't take them too
+        self._after_transaction(
+            session,
+            on_rollback=partial(self._free, list(limits), slots, None),
+        )
+        return True
+
+    async def decrement_active_slots(
+        self,
+        session: AsyncSession,
+        concurrency_limit_ids: list[UUID],
+        slots: int,
+        occupancy_seconds: float | None = None,
+    ) -> bool:
+        active_ids = [
+            id
+            for id, counts in (await self._read(session, concurrency_limit_ids)).items()
+            if counts.active
+        ]
+        self._after_transaction(
+            session,
+            on_commit=partial(self._free, active_ids, slots, occupancy_seconds),
+        )
+        return len(active_ids) == len(concurrency_limit_ids)
+
+    async def update_denied_slots(
+        self, session: AsyncSession, concurrency_limit_ids: list[UUID], slots: int
+    ) -> bool:
+        active_ids = [
+            id
+            for id, counts in (await self._read(session, concurrency_limit_ids)).items()
+            if counts.active
+        ]
+        self._after_transaction(
+            session, on_commit=partial(self._deny, active_ids, slots)
+        )
+        return len(active_ids) == len(concurrency_limit_ids)
+
+    def merge(
+        self, concurrency_limits: Sequence["orm_models.ConcurrencyLimitV2"]
+    ) -> None:
+        for concurrency_limit in concurrency_limits:
+            counts = self.counts.get(concurrency_limit.id)
+            if counts is None:
+                continue
+            # Set the values as loaded so that the session doesn't write them back
+            set_committed_value(concurrency_limit, "active_slots", counts.active_slots)
+            set_committed_value(concurrency_limit, "denied_slots", counts.denied_slots)
+            set_committed_value(
+                concurrency_limit,
+                "avg_slot_occupancy_seconds",
+                counts.avg_slot_occupancy_seconds,
+            )
+            set_committed_value(concurrency_limit, "updated", counts.updated)
+
+    def _free(
+        self,
+        concurrency_limit_ids: list[UUID],
+        slots: int,
+        occupancy_seconds: float | None,
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        for concurrency_limit_id in concurrency_limit_ids:
+            counts = self.counts.get(concurrency_limit_id)
+            if counts is None:
+                self.deferred_frees[concurrency_limit_id] = (
+                    self.deferred_frees.get(concurrency_limit_id, 0) + slots
+                )
+                continue
+
+            counts.decay(now)
+            counts.active_slots = max(0, counts.active_slots - slots)
+            if occupancy_seconds:
+                occupancy_seconds_per_slot = max(
+                    occupancy_seconds / slots, MINIMUM_OCCUPANCY_SECONDS_PER_SLOT
+                )
+                samples = counts.limit * OCCUPANCY_SAMPLES_MULTIPLIER
+                counts.avg_slot_occupancy_seconds += (
+                    occupancy_seconds_per_slot / samples
+                    - counts.avg_slot_occupancy_seconds / samples
+                )
+            self.dirty.add(concurrency_limit_id)
+
+    def _deny(self, concurrency_limit_ids: list[UUID], slots: int) -> None:
+        now = datetime.now(timezone.utc)
+        for concurrency_limit_id in concurrency_limit_ids:
+            if (counts := self.counts.get(concurrency_limit_id)) is None:
+                continue
+            counts.decay(now)
+            counts.denied_slots += slots
+            self.dirty.add(concurrency_limit_id)
+
+    def _after_transaction(
+        self,
+        session: AsyncSession,
+        on_commit: Optional[Callable[[], None]] = None,
+        on_rollback: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Call `on_commit` once the session's current transaction commits, or
+        `on_rollback` if it, or the savepoint the change was made in, rolls back.
+        """
+        sync_session = session.sync_session
+        if not sync_session.in_transaction():
+            # The session only begins its transaction with its first statement, which
+            # may not have run yet when the limits are cached
+            sync_session.begin()
+        transaction = (
+            sync_session.get_nested_transaction() or sync_session.get_transaction()
+        )
+        assert transaction is not None
+
+        if not sa.event.contains(sync_session, "after_commit", self._committed):
+            sa.event.listen(sync_session, "after_commit", self._committed)
+            sa.event.listen(sync_session, "after_soft_rollback", self._rolled_back)
+            sa.event.listen(sync_session, "after_transaction_end", self._ended)
+        sync_session.info.setdefault(_CHANGES_KEY, []).append(
+            _PendingChange(transaction, on_commit, on_rollback)
+        )
+
+    def _committed(self, session: Session) -> None:
+        changes: list[_PendingChange] = session.info.pop(_CHANGES_KEY, [])
+        for change in changes:
+            if change.on_commit:
+                change.on_commit()
+
+    def _rolled_back(
+        self, session: Session, previous_transaction: SessionTransaction
+    ) -> None:
+        self._undo(session, previous_transaction)
+
+    def _ended(self, session: Session, transaction: SessionTransaction) -> None:
+        # A session closed without committing or rolling back its transaction
+        if transaction.parent is None:
+            self._undo(session, transaction)
+
+    def _undo(self, session: Session, transaction: SessionTransaction) -> None:
+        changes: list[_PendingChange] = session.info.pop(_CHANGES_KEY, [])
+        kept: list[_PendingChange] = []
+        for change in changes:
+            if not _is_within(change.transaction, transaction):
+                kept.append(change)
+            elif change.on_rollback:
+                change.on_rollback()
+        if kept:
+            session.info[_CHANGES_KEY] = kept
+
+    async def evict(
+        self, session: AsyncSession, concurrency_limit_ids: list[UUID]
+    ) -> None:
+        pending = self._take_pending(concurrency_limit_ids)
+        for concurrency_limit_id in concurrency_limit_ids:
+            self.counts.pop(concurrency_limit_id, None)
+        await self._write(session, pending)
+
+    async def flush(self) -> None:
+        pending = self._take_pending(list(self.dirty))
+        if not pending:
+            return
+
+        try:
+            db = provide_database_interface()
+            async with db.session_context(begin_transaction=True) as session:
+                await self._write(session, pending)
+        except Exception:
+            # write the limits again on the next flush
+            self.dirty.update(row["b_id"] for row in pending)
+            raise
+
+    async def _read(
+        self, session: AsyncSession, concurrency_limit_ids: list[UUID]
+    ) -> dict[UUID, SlotCounts]:
+        self._ensure_flushing()
+
+        missing = [id for id in concurrency_limit_ids if id not in self.counts]
+        if missing:
+            db = provide_database_interface()
+            result = await session.execute(
+                sa.select(
+                    db.ConcurrencyLimitV2.id,
+                    db.ConcurrencyLimitV2.active,
+                    db.ConcurrencyLimitV2.limit,
+                    db.ConcurrencyLimitV2.active_slots,
+                    db.ConcurrencyLimitV2.denied_slots,
+                    db.ConcurrencyLimitV2.slot_decay_per_second,
+                    db.ConcurrencyLimitV2.avg_slot_occupancy_seconds,
+                    db.ConcurrencyLimitV2.updated,
+                ).where(db.ConcurrencyLimitV2.id.in_(missing))
+            )
+            for id, *columns in result.all():
+                # another caller may have loaded (and changed) the limit while
+                # this one was waiting on the database
+                if id in self.counts:
+                    continue
+                counts = self.counts[id] = SlotCounts(*columns)
+                if freed := self.deferred_frees.pop(id, 0):
+                    counts.active_slots = max(0, counts.active_slots - freed)
+                    self.dirty.add(id)
+
+        return {
+            id: self.counts[id] for id in concurrency_limit_ids if id in self.counts
+        }
+
+    def _take_pending(self, concurrency_limit_ids: list[UUID]) -> list[dict[str, Any]]:
+        pending: list[dict[str, Any]] = []
+        for concurrency_limit_id in concurrency_limit_ids:
+            if concurrency_limit_id not in self.dirty:
+                continue
+            self.dirty.discard(concurrency_limit_id)
+            if counts := self.counts.get(concurrency_limit_id):
+                pending.append(
+                    {
+                        "b_id": concurrency_limit_id,
+                        "b_active_slots": counts.active_slots,
+                        "b_denied_slots": counts.denied_slots,
+                        "b_avg_slot_occupancy_seconds": counts.avg_slot_occupancy_seconds,
+                        "b_updated": counts.updated,
+                    }
+                )
+        return pending
+
+    async def _write(
+        self, session: AsyncSession, pending: list[dict[str, Any]]
+    ) -> None:
+        if not pending:
+            return
+
+        db = provide_database_interface()
+        table = db.ConcurrencyLimitV2.__table__
+        await session.execute(
+            sa.update(table)
+            .where(table.c.id == sa.bindparam("b_id"))
+            .values(
+                active_slots=sa.bindparam("b_active_slots"),
+                denied_slots=sa.bindparam("b_denied_slots"),
+                avg_slot_occupancy_seconds=sa.bindparam("b_avg_slot_occupancy_seconds"),
+                updated=sa.bindparam("b_updated"),
+            ),
+            pending,
+        )
+
+    def _ensure_flushing(self) -> None:
+        loop = asyncio.get_running_loop()
+        if (
+            self._flusher is None
+            or self._flusher.done()
+            or self._flusher.get_loop() is not loop
+        ):
+            self._flusher = loop.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(
+                get_current_settings().server.concurrency.slot_ledger_flush_interval
+            )
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to write concurrency slot counts")
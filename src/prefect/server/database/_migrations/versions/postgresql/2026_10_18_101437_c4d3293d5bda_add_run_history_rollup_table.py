@@ -0,0 +1,136 @@
+"""Add run_history_rollup tables
+
+Revision ID: c4d3293d5bda
+Revises: 3b86c5ea017a
+Create Date: 2026-10-18 10:14:37.582016
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "c4d3293d5bda"
+down_revision = "3b86c5ea017a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "run_history_rollup",
+        sa.Column("series", sa.String(), nullable=False),
+        sa.Column(
+            "interval_start",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "state_type",
+            # the state_type enum already exists for the flow_run and task_run tables
+            postgresql.ENUM(name="state_type", create_type=False),
+            nullable=True,
+        ),
+        sa.Column("state_name", sa.String(), nullable=True),
+        sa.Column("flow_id", prefect.server.utilities.database.UUID(), nullable=True),
+        sa.Column(
+            "deployment_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column(
+            "work_queue_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column("count_runs", sa.Integer(), nullable=False),
+        sa.Column("sum_estimated_run_time", sa.Float(), nullable=False),
+        sa.Column("sum_estimated_lateness", sa.Float(), nullable=False),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_run_history_rollup")),
+    )
+    op.create_index(
+        "ix_run_history_rollup__series_interval_start",
+        "run_history_rollup",
+        ["series", "interval_start"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_run_history_rollup__updated"),
+        "run_history_rollup",
+        ["updated"],
+        unique=False,
+    )
+
+    op.create_table(
+        "run_history_rollup_stale_interval",
+        sa.Column("series", sa.String(), nullable=False),
+        sa.Column(
+            "interval_start",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint(
+            "id", name=op.f("pk_run_history_rollup_stale_interval")
+        ),
+        sa.UniqueConstraint(
+            "series",
+            "interval_start",
+            name=op.f("uq_run_history_rollup_stale_interval__series_interval_start"),
+        ),
+    )
+    op.create_index(
+        op.f("ix_run_history_rollup_stale_interval__updated"),
+        "run_history_rollup_stale_interval",
+        ["updated"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_run_history_rollup_stale_interval__updated"),
+        table_name="run_history_rollup_stale_interval",
+    )
+    op.drop_table("run_history_rollup_stale_interval")
+    op.drop_index(
+        op.f("ix_run_history_rollup__updated"), table_name="run_history_rollup"
+    )
+    op.drop_index(
+        "ix_run_history_rollup__series_interval_start", table_name="run_history_rollup"
+    )
+    op.drop_table("run_history_rollup")
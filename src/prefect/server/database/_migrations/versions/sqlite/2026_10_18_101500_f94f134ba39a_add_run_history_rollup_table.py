@@ -0,0 +1,158 @@
+"""Add run_history_rollup tables
+
+Revision ID: f94f134ba39a
+Revises: 8bb517bae6f9
+Create Date: 2026-10-18 10:15:00.219734
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "f94f134ba39a"
+down_revision = "8bb517bae6f9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "run_history_rollup",
+        sa.Column("series", sa.String(), nullable=False),
+        sa.Column(
+            "interval_start",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "state_type",
+            sa.Enum(
+                "SCHEDULED",
+                "PENDING",
+                "RUNNING",
+                "COMPLETED",
+                "FAILED",
+                "CANCELLED",
+                "CRASHED",
+                "PAUSED",
+                "CANCELLING",
+                name="state_type",
+            ),
+            nullable=True,
+        ),
+        sa.Column("state_name", sa.String(), nullable=True),
+        sa.Column("flow_id", prefect.server.utilities.database.UUID(), nullable=True),
+        sa.Column(
+            "deployment_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column(
+            "work_queue_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column("count_runs", sa.Integer(), nullable=False),
+        sa.Column("sum_estimated_run_time", sa.Float(), nullable=False),
+        sa.Column("sum_estimated_lateness", sa.Float(), nullable=False),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n       "
+                " || lower(hex(randomblob(2)))\n        || '-4'\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " substr('89ab',abs(random()) % 4 + 1, 1)\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_run_history_rollup")),
+    )
+    with op.batch_alter_table("run_history_rollup", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_run_history_rollup__series_interval_start",
+            ["series", "interval_start"],
+            unique=False,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_run_history_rollup__updated"), ["updated"], unique=False
+        )
+
+    op.create_table(
+        "run_history_rollup_stale_interval",
+        sa.Column("series", sa.String(), nullable=False),
+        sa.Column(
+            "interval_start",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n       "
+                " || lower(hex(randomblob(2)))\n        || '-4'\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " substr('89ab',abs(random()) % 4 + 1, 1)\n        ||"
+                " substr(lower(hex(randomblob(2))),2)\n        || '-'\n        ||"
+                " lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint(
+            "id", name=op.f("pk_run_history_rollup_stale_interval")
+        ),
+        sa.UniqueConstraint(
+            "series",
+            "interval_start",
+            name=op.f("uq_run_history_rollup_stale_interval__series_interval_start"),
+        ),
+    )
+    with op.batch_alter_table(
+        "run_history_rollup_stale_interval", schema=None
+    ) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_run_history_rollup_stale_interval__updated"),
+            ["updated"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table(
+        "run_history_rollup_stale_interval", schema=None
+    ) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_run_history_rollup_stale_interval__updated"))
+
+    op.drop_table("run_history_rollup_stale_interval")
+
+    with op.batch_alter_table("run_history_rollup", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_run_history_rollup__updated"))
+        batch_op.drop_index("ix_run_history_rollup__series_interval_start")
+
+    op.drop_table("run_history_rollup")
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import os
+import random
 import sqlite3
 import ssl
+import time
 import traceback
 from abc import ABC, abstractmethod
 from asyncio import AbstractEventLoop, get_running_loop
@@ -26,6 +28,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import ConnectionPoolEntry
 from typing_extensions import TypeAlias
 
+from prefect.logging import get_logger
 from prefect.settings import (
     PREFECT_API_DATABASE_CONNECTION_TIMEOUT,
     PREFECT_API_DATABASE_ECHO,
@@ -55,6 +58,31 @@ SQLITE_BEGIN_MODE: ContextVar[Optional[str]] = ContextVar(  # novm
 _EngineCacheKey: TypeAlias = tuple[AbstractEventLoop, str, bool, Optional[float]]
 ENGINES: dict[_EngineCacheKey, AsyncEngine] = {}
 
+logger = get_logger("server.database")
+
+# how long to trust a read replica's replication lag before checking it again
+REPLICA_LAG_CHECK_SECONDS = 5.0
+
+# the seconds since a replica last replayed a transaction from the primary, or 0 if it
+# is streaming from the primary and has replayed everything it has received; NULL if
+# it hasn't replayed anything yet.  A replica that isn't streaming may be missing
+# transactions it hasn't received, and the receiver's status is only visible to roles
+# with the privileges of pg_read_all_stats, so replicas read by other roles are only
+# current while they keep replaying transactions
+REPLICA_LAG_QUERY = sa.text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            AND EXISTS (
+                SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming'
+            )
+        THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
 
 class ConnectionTracker:
     """A test utility which tracks the connections given out by a connection pool, to
@@ -63,6 +91,7 @@ class ConnectionTracker:
     all_connections: dict[AdaptedConnection, list[str]]
     open_connections: dict[AdaptedConnection, list[str]]
     left_field_closes: dict[AdaptedConnection, list[str]]
+    pools: dict[str, sa.pool.Pool]
     connects: int
     closes: int
     active: bool
@@ -72,14 +101,29 @@ class ConnectionTracker:
         self.all_connections = {}
         self.open_connections = {}
         self.left_field_closes = {}
+        self.pools = {}
         self.connects = 0
         self.closes = 0
 
-    def track_pool(self, pool: sa.pool.Pool) -> None:
+    def track_pool(self, pool: sa.pool.Pool, name: Optional[str] = None) -> None:
+        self.pools[name or repr(pool)] = pool
         event.listen(pool, "connect", self.on_connect)
         event.listen(pool, "close", self.on_close)
         event.listen(pool, "close_detached", self.on_close_detached)
 
+    def pool_status(self) -> dict[str, dict[str, int]]:
+        """The size and number of checked out connections of each tracked pool, by
+        the name it was tracked with"""
+        return {
+            name: {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+            for name, pool in self.pools.items()
+            if isinstance(pool, sa.pool.QueuePool)
+        }
+
     def on_connect(
         self,
         adapted_connection: AdaptedConnection,
@@ -140,6 +184,8 @@ class BaseDatabaseConfiguration(ABC):
         connection_app_name: Optional[str] = None,
         statement_cache_size: Optional[int] = None,
         prepared_statement_cache_size: Optional[int] = None,
+        read_replica_urls: Optional[list[str]] = None,
+        read_replica_max_lag: Optional[float] = None,
     ) -> None:
         self.connection_url = connection_url
         self.echo: bool = echo or PREFECT_API_DATABASE_ECHO.value()
@@ -167,6 +213,19 @@ class BaseDatabaseConfiguration(ABC):
             prepared_statement_cache_size
             or get_current_settings().server.database.sqlalchemy.connect_args.prepared_statement_cache_size
         )
+        if read_replica_urls is None:
+            urls = get_current_settings().server.database.read_replica_urls
+            read_replica_urls = [
+                url.strip()
+                for url in (urls.get_secret_value() if urls else "").split(",")
+                if url.strip()
+            ]
+        self.read_replica_urls: list[str] = read_replica_urls
+        self.read_replica_max_lag: float = (
+            read_replica_max_lag
+            if read_replica_max_lag is not None
+            else get_current_settings().server.database.read_replica_max_lag
+        )
 
     def unique_key(self) -> tuple[Hashable, ...]:
         """
@@ -178,6 +237,10 @@ class BaseDatabaseConfiguration(ABC):
     async def engine(self) -> AsyncEngine:
         """Returns a SqlAlchemy engine"""
 
+    async def read_engine(self) -> AsyncEngine:
+        """Returns a SqlAlchemy engine for read-only queries"""
+        return await self.engine()
+
     @abstractmethod
     async def session(self, engine: AsyncEngine) -> AsyncSession:
         """
@@ -209,7 +272,13 @@ class BaseDatabaseConfiguration(ABC):
 
 
 class AsyncPostgresConfiguration(BaseDatabaseConfiguration):
-    async def engine(self) -> AsyncEngine:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # when each read replica's lag was last checked, and the lag it had, or None
+        # if it couldn't be checked
+        self._replica_lags: dict[str, tuple[float, Optional[float]]] = {}
+
+    async def engine(self, connection_url: Optional[str] = None) -> AsyncEngine:
         """Retrieves an async SQLAlchemy engine.
 
         Args:
@@ -223,12 +292,13 @@ class AsyncPostgresConfiguration(BaseDatabaseConfiguration):
         Returns:
             AsyncEngine: a SQLAlchemy engine
         """
+        connection_url = connection_url or self.connection_url
 
         loop = get_running_loop()
 
         cache_key = (
             loop,
-            self.connection_url,
+            connection_url,
             self.echo,
             self.timeout,
         )
@@ -292,7 +362,7 @@ class AsyncPostgresConfiguration(BaseDatabaseConfiguration):
                 kwargs["max_overflow"] = self.sqlalchemy_max_overflow
 
             engine = create_async_engine(
-                self.connection_url,
+                connection_url,
                 echo=self.echo,
                 # "pre-ping" connections upon checkout to ensure they have not been
                 # closed on the server side
@@ -309,12 +379,60 @@ class AsyncPostgresConfiguration(BaseDatabaseConfiguration):
                 logfire.instrument_sqlalchemy(engine)  # pyright: ignore
 
             if TRACKER.active:
-                TRACKER.track_pool(engine.pool)
+                TRACKER.track_pool(
+                    engine.pool, name=engine.url.render_as_string(hide_password=True)
+                )
 
             ENGINES[cache_key] = engine
             await self.schedule_engine_disposal(cache_key)
         return ENGINES[cache_key]
 
+    async def read_engine(self) -> AsyncEngine:
+        """Retrieves an engine for read-only queries.
+
+        Read-only queries are sent to a random read replica whose replication lag is
+        within `read_replica_max_lag`, or to the primary database if there are no
+        such replicas.
+        """
+        current = [
+            url
+            for url in self.read_replica_urls
+            if (lag := await self._replica_lag(url)) is not None
+            and lag <= self.read_replica_max_lag
+        ]
+        if not current:
+            return await self.engine()
+        return await self.engine(random.choice(current))
+
+    async def _replica_lag(self, connection_url: str) -> Optional[float]:
+        """The replication lag of a read replica, in seconds, or None if it is
+        unknown, checking it again if it hasn't been checked recently."""
+        checked = self._replica_lags.get(connection_url)
+        if checked and time.monotonic() - checked[0] < REPLICA_LAG_CHECK_SECONDS:
+            return checked[1]
+
+        # other queries keep using the last known lag while this one checks it
+        self._replica_lags[connection_url] = (
+            time.monotonic(),
+            checked[1] if checked else None,
+        )
+
+        lag: Optional[float] = None
+        try:
+            engine = await self.engine(connection_url)
+            async with engine.connect() as connection:
+                result = await connection.scalar(REPLICA_LAG_QUERY)
+            lag = float(result) if result is not None else None
+        except Exception:
+            logger.warning(
+                "Unable to check the replication lag of read replica %s",
+                sa.make_url(connection_url).render_as_string(hide_password=True),
+                exc_info=True,
+            )
+
+        self._replica_lags[connection_url] = (time.monotonic(), lag)
+        return lag
+
     async def schedule_engine_disposal(self, cache_key: _EngineCacheKey) -> None:
         """
         Dispose of an engine once the event loop is closing.
@@ -436,7 +554,9 @@ class AioSqliteConfiguration(BaseDatabaseConfiguration):
                 logfire.instrument_sqlalchemy(engine)  # pyright: ignore
 
             if TRACKER.active:
-                TRACKER.track_pool(engine.pool)
+                TRACKER.track_pool(
+                    engine.pool, name=engine.url.render_as_string(hide_password=True)
+                )
 
             ENGINES[cache_key] = engine
             await self.schedule_engine_disposal(cache_key)
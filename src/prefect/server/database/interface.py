@@ -108,16 +108,29 @@ class PrefectDBInterface(metaclass=DBSingleton):
 
         return engine
 
-    async def session(self) -> AsyncSession:
+    async def read_engine(self) -> AsyncEngine:
+        """
+        Provides a SqlAlchemy engine for read-only queries, which may be connected to
+        a read replica of the database.
+        """
+        return await self.database_config.read_engine()
+
+    async def session(self, read_only: bool = False) -> AsyncSession:
         """
         Provides a SQLAlchemy session.
+
+        Args:
+            read_only: if True, the session may be connected to a read replica
         """
-        engine = await self.engine()
+        engine = await (self.read_engine() if read_only else self.engine())
         return await self.database_config.session(engine)
 
     @asynccontextmanager
     async def session_context(
-        self, begin_transaction: bool = False, with_for_update: bool = False
+        self,
+        begin_transaction: bool = False,
+        with_for_update: bool = False,
+        read_only: bool = False,
     ):
         """
         Provides a SQLAlchemy session and a context manager for opening/closing
@@ -126,8 +139,10 @@ class PrefectDBInterface(metaclass=DBSingleton):
         Args:
             begin_transaction: if True, the context manager will begin a SQL transaction.
                 Exiting the context manager will COMMIT or ROLLBACK any changes.
+            read_only: if True, the session will only be used to read, and may be
+                connected to a read replica that lags slightly behind the database.
         """
-        session = await self.session()
+        session = await self.session(read_only=read_only)
         async with session:
             if begin_transaction:
                 async with self.database_config.begin_transaction(
@@ -271,6 +286,18 @@ class PrefectDBInterface(metaclass=DBSingleton):
         """An configuration model"""
         return orm_models.Configuration
 
+    @property
+    def RunHistoryRollup(self) -> type[orm_models.RunHistoryRollup]:
+        """A run history rollup model"""
+        return orm_models.RunHistoryRollup
+
+    @property
+    def RunHistoryRollupStaleInterval(
+        self,
+    ) -> type[orm_models.RunHistoryRollupStaleInterval]:
+        """A run history rollup stale interval model"""
+        return orm_models.RunHistoryRollupStaleInterval
+
     @property
     def Variable(self) -> type[orm_models.Variable]:
         """A variable model"""
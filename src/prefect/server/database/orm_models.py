@@ -1095,6 +1095,44 @@ class Configuration(Base):
     __table_args__: Any = (sa.UniqueConstraint("key"),)
 
 
+class RunHistoryRollup(Base):
+    """
+    SQLAlchemy model of the pre-aggregated history of runs in a terminal state,
+    counted per minute by state, flow, deployment and work queue.
+    """
+
+    series: Mapped[str]
+    interval_start: Mapped[DateTime]
+    state_type: Mapped[Optional[schemas.states.StateType]] = mapped_column(
+        sa.Enum(schemas.states.StateType, name="state_type")
+    )
+    state_name: Mapped[Optional[str]]
+    flow_id: Mapped[Optional[uuid.UUID]]
+    deployment_id: Mapped[Optional[uuid.UUID]]
+    work_queue_id: Mapped[Optional[uuid.UUID]]
+    count_runs: Mapped[int]
+    sum_estimated_run_time: Mapped[float]
+    sum_estimated_lateness: Mapped[float]
+
+    __table_args__: Any = (
+        sa.Index(
+            "ix_run_history_rollup__series_interval_start", "series", "interval_start"
+        ),
+    )
+
+
+class RunHistoryRollupStaleInterval(Base):
+    """
+    SQLAlchemy model of a minute of run history whose rollups must be recomputed
+    because of changes that aren't recorded on its runs, such as deleted runs.
+    """
+
+    series: Mapped[str]
+    interval_start: Mapped[DateTime]
+
+    __table_args__: Any = (sa.UniqueConstraint("series", "interval_start"),)
+
+
 class SavedSearch(Base):
     """SQLAlchemy model of a saved search."""
 
@@ -33,7 +33,8 @@ from prefect.server.schemas.graph import Edge, Graph, GraphArtifact, GraphState,
 from prefect.server.schemas.states import StateType
 from prefect.server.utilities.database import UUID as UUIDTypeDecorator
 from prefect.server.utilities.database import Timestamp, bindparams_from_clause
-from prefect.types._datetime import DateTime
+from prefect.settings import get_current_settings
+from prefect.types._datetime import DateTime, earliest_possible_datetime
 
 T = TypeVar("T", infer_variance=True)
 
@@ -48,10 +49,24 @@ class FlowRunGraphV2Node(NamedTuple):
     parent_ids: Optional[list[UUID]]
     child_ids: Optional[list[UUID]]
     encapsulating_ids: Optional[list[UUID]]
+    updated: DateTime
+
+
+class CachedFlowRunGraphNodes(NamedTuple):
+    # the number of runs in the graph, when they were updated, and the maximum number
+    # of nodes the graph was read with
+    fingerprint: tuple[Any, ...]
+    # None if the graph has too many nodes to return all at once
+    nodes: Optional[list[FlowRunGraphV2Node]]
 
 
 ONE_HOUR = 60 * 60
 
+# Runs' `updated` timestamps are taken when their transactions start rather than when
+# they commit, so graphs read with an `updated_since` cursor also include changes from
+# this long before it, which may have committed after the previous read
+UPDATED_SINCE_OVERLAP = datetime.timedelta(minutes=1)
+
 
 jinja_env: Environment = Environment(
     loader=PackageLoader("prefect.server.database", package_path="sql"),
@@ -401,6 +416,15 @@ class BaseQueryComponents(ABC):
 
         """
 
+    @cached_property
+    def _flow_run_graph_cache(self) -> Cache[UUID, CachedFlowRunGraphNodes]:
+        """The nodes of recently read flow run graphs, by flow run ID"""
+        return TTLCache(
+            maxsize=get_current_settings().server.flow_run_graph.cache_max_nodes,
+            ttl=ONE_HOUR,
+            getsizeof=lambda cached: len(cached.nodes or ()) + 1,
+        )
+
     @db_injector
     async def flow_run_graph_v2(
         self,
@@ -410,8 +434,14 @@ class BaseQueryComponents(ABC):
         since: DateTime,
         max_nodes: int,
         max_artifacts: int,
+        updated_since: Optional[DateTime] = None,
     ) -> Graph:
-        """Returns the query that selects all of the nodes and edges for a flow run graph (version 2)."""
+        """Returns the query that selects all of the nodes and edges for a flow run graph (version 2).
+
+        If `updated_since` is given, only the nodes, artifacts and states created or
+        updated since shortly before then are returned, along with the parents of
+        those nodes, whose children may have changed.
+        """
         FlowRun = db.FlowRun
         result = await session.execute(
             sa.select(
@@ -426,21 +456,40 @@ class BaseQueryComponents(ABC):
         except NoResultFound:
             raise ObjectNotFoundError(f"Flow run {flow_run_id} not found")
 
-        query = self._flow_run_graph_v2_query
-        results = await session.execute(
-            query,
-            params=dict(flow_run_id=flow_run_id, since=since, max_nodes=max_nodes + 1),
+        if updated_since is not None:
+            updated_since = updated_since - UPDATED_SINCE_OVERLAP
+
+        rows = await self._get_flow_run_graph_nodes(
+            db, session, flow_run_id, since, max_nodes
         )
 
         graph_artifacts = await self._get_flow_run_graph_artifacts(
-            db, session, flow_run_id, max_artifacts
+            db, session, flow_run_id, max_artifacts, updated_since=updated_since
+        )
+        graph_states = await self._get_flow_run_graph_states(
+            session, flow_run_id, updated_since=updated_since
         )
-        graph_states = await self._get_flow_run_graph_states(session, flow_run_id)
+
+        if updated_since is not None:
+            changed = {
+                row.id
+                for row in rows
+                if row.updated >= updated_since or row.id in graph_artifacts
+            }
+            parents_of_changed = {
+                id
+                for row in rows
+                if row.id in changed
+                for id in (*(row.parent_ids or ()), *(row.encapsulating_ids or ()))
+            }
+            rows = [
+                row for row in rows if row.id in changed or row.id in parents_of_changed
+            ]
 
         nodes: list[tuple[UUID, Node]] = []
         root_node_ids: list[UUID] = []
 
-        for row in results.t:
+        for row in rows:
             if not row.parent_ids:
                 root_node_ids.append(row.id)
 
@@ -466,12 +515,6 @@ class BaseQueryComponents(ABC):
                 )
             )
 
-            if len(nodes) > max_nodes:
-                raise FlowRunGraphTooLarge(
-                    f"The graph of flow run {flow_run_id} has more than "
-                    f"{max_nodes} nodes."
-                )
-
         return Graph(
             start_time=start_time,
             end_time=end_time,
@@ -481,12 +524,98 @@ class BaseQueryComponents(ABC):
             states=graph_states,
         )
 
+    async def _get_flow_run_graph_nodes(
+        self,
+        db: PrefectDBInterface,
+        session: AsyncSession,
+        flow_run_id: UUID,
+        since: DateTime,
+        max_nodes: int,
+    ) -> list[FlowRunGraphV2Node]:
+        """Get the nodes of a flow run graph that start or end after `since`.
+
+        The whole graph is cached until any of its runs change, so that polling the
+        graph of a running flow only queries for its nodes again when they change.
+        """
+        TaskRun, FlowRun = db.TaskRun, db.FlowRun
+
+        # every state change updates a run, and counting the runs catches deletions.
+        # Runs' updates don't commit in the order of their `updated` timestamps, so
+        # the sum of every run's time since it was created also changes when an
+        # update commits after a later one
+        result = await session.execute(
+            sa.select(
+                sa.func.count(TaskRun.id),
+                sa.func.max(TaskRun.updated),
+                sa.func.sum(
+                    sa.func.date_diff_seconds(TaskRun.updated, TaskRun.created)
+                ),
+                sa.func.max(FlowRun.updated),
+                sa.func.sum(
+                    sa.func.date_diff_seconds(FlowRun.updated, FlowRun.created)
+                ),
+            )
+            .select_from(TaskRun)
+            .join(
+                FlowRun, isouter=True, onclause=FlowRun.parent_task_run_id == TaskRun.id
+            )
+            .where(TaskRun.flow_run_id == flow_run_id)
+        )
+        # the largest graph that can be returned decides whether the graph is cached
+        fingerprint = (*result.one(), max_nodes)
+
+        query = self._flow_run_graph_v2_query
+        cached = self._flow_run_graph_cache.get(flow_run_id)
+        if cached is None or cached.fingerprint != fingerprint:
+            results = await session.execute(
+                query,
+                params=dict(
+                    flow_run_id=flow_run_id,
+                    since=earliest_possible_datetime(),
+                    max_nodes=max_nodes + 1,
+                ),
+            )
+            all_rows = list(results.t)
+            cached = CachedFlowRunGraphNodes(
+                fingerprint=fingerprint,
+                nodes=all_rows if len(all_rows) <= max_nodes else None,
+            )
+            try:
+                self._flow_run_graph_cache[flow_run_id] = cached
+            except ValueError:
+                # the graph is too large to cache, or caching is disabled
+                pass
+
+        if cached.nodes is not None:
+            return [
+                row
+                for row in cached.nodes
+                if row.end_time is None or row.end_time >= since
+            ]
+
+        if since > earliest_possible_datetime():
+            # the whole graph is too large, but the part of it since `since` may not be
+            results = await session.execute(
+                query,
+                params=dict(
+                    flow_run_id=flow_run_id, since=since, max_nodes=max_nodes + 1
+                ),
+            )
+            rows = list(results.t)
+            if len(rows) <= max_nodes:
+                return rows
+
+        raise FlowRunGraphTooLarge(
+            f"The graph of flow run {flow_run_id} has more than {max_nodes} nodes."
+        )
+
     async def _get_flow_run_graph_artifacts(
         self,
         db: PrefectDBInterface,
         session: AsyncSession,
         flow_run_id: UUID,
         max_artifacts: int,
+        updated_since: Optional[DateTime] = None,
     ) -> dict[Optional[UUID], list[GraphArtifact]]:
         """Get the artifacts for a flow run grouped by task run id.
 
@@ -497,7 +626,11 @@ class BaseQueryComponents(ABC):
 
         query = (
             sa.select(Artifact, ArtifactCollection.id.label("latest_in_collection_id"))
-            .where(Artifact.flow_run_id == flow_run_id, Artifact.type != "result")
+            .where(
+                Artifact.flow_run_id == flow_run_id,
+                Artifact.type != "result",
+                *([Artifact.updated >= updated_since] if updated_since else []),
+            )
             .join(
                 ArtifactCollection,
                 onclause=sa.and_(
@@ -530,12 +663,17 @@ class BaseQueryComponents(ABC):
         return dict(artifacts_by_task)
 
     async def _get_flow_run_graph_states(
-        self, session: AsyncSession, flow_run_id: UUID
+        self,
+        session: AsyncSession,
+        flow_run_id: UUID,
+        updated_since: Optional[DateTime] = None,
     ) -> list[GraphState]:
         """Get the flow run states for a flow run graph."""
         states = await models.flow_run_states.read_flow_run_states(session, flow_run_id)
         return [
-            GraphState.model_validate(state, from_attributes=True) for state in states
+            GraphState.model_validate(state, from_attributes=True)
+            for state in states
+            if updated_since is None or state.created >= updated_since
         ]
 
 
@@ -672,6 +810,9 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
                     "parent"
                 ),
                 (input.c.key == "__parents__").label("has_encapsulating_task"),
+                sa.func.greatest(
+                    sa.func.coalesce(FlowRun.updated, TaskRun.updated), TaskRun.updated
+                ).label("updated"),
             )
             .join_from(TaskRun, input, onclause=sa.true(), isouter=True)
             .join(argument, onclause=sa.true(), isouter=True)
@@ -743,6 +884,7 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
                 with_parents.c.parent_ids,
                 with_children.c.child_ids,
                 with_encapsulating.c.encapsulating_ids,
+                edges.c.updated,
             )
             .distinct(edges.c.id)
             .join(with_parents, isouter=True, onclause=with_parents.c.id == edges.c.id)
@@ -767,6 +909,7 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
                 graph.c.parent_ids,
                 graph.c.child_ids,
                 graph.c.encapsulating_ids,
+                graph.c.updated,
             )
             .where(sa.or_(graph.c.end_time.is_(None), graph.c.end_time >= param_since))
             .order_by(graph.c.start_time, graph.c.end_time)
@@ -990,6 +1133,9 @@ class AioSqliteQueryComponents(BaseQueryComponents):
                 ).label("end_time"),
                 argument.c.value["id"].astext.label("parent"),
                 (input.c.key == "__parents__").label("has_encapsulating_task"),
+                sa.func.greatest(
+                    sa.func.coalesce(FlowRun.updated, TaskRun.updated), TaskRun.updated
+                ).label("updated"),
             )
             .join_from(TaskRun, input, onclause=sa.true(), isouter=True)
             .join(argument, onclause=sa.true(), isouter=True)
@@ -1054,6 +1200,7 @@ class AioSqliteQueryComponents(BaseQueryComponents):
                 with_parents.c.parent_ids,
                 with_children.c.child_ids,
                 with_encapsulating.c.encapsulating_ids,
+                edges.c.updated,
             )
             .distinct()
             .join(with_parents, isouter=True, onclause=with_parents.c.id == edges.c.id)
@@ -1079,6 +1226,7 @@ class AioSqliteQueryComponents(BaseQueryComponents):
                 sa.type_coerce(graph.c.parent_ids, UUIDList),
                 sa.type_coerce(graph.c.child_ids, UUIDList),
                 sa.type_coerce(graph.c.encapsulating_ids, UUIDList),
+                graph.c.updated,
             )
             .where(sa.or_(graph.c.end_time.is_(None), graph.c.end_time >= param_since))
             .order_by(graph.c.start_time, graph.c.end_time)
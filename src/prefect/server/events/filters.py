@@ -4,7 +4,7 @@ import sys
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Union
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
@@ -27,6 +27,31 @@ from .schemas.events import Event, Resource, ResourceSpecification
 if TYPE_CHECKING:
     from sqlalchemy.sql.expression import ColumnElement, ColumnExpressionArgument
 
+EventPredicate = Callable[[Event], bool]
+
+
+def _includes_every_event(event: Event) -> bool:
+    return True
+
+
+def all_of(predicates: Iterable[EventPredicate]) -> EventPredicate:
+    """Combine predicates into one that includes the events all of them include"""
+    compiled = [
+        predicate for predicate in predicates if predicate is not _includes_every_event
+    ]
+    if not compiled:
+        return _includes_every_event
+    if len(compiled) == 1:
+        return compiled[0]
+
+    def includes(event: Event) -> bool:
+        for predicate in compiled:
+            if not predicate(event):
+                return False
+        return True
+
+    return includes
+
 
 class AutomationFilterCreated(PrefectFilterBaseModel):
     """Filter by `Automation.created`."""
@@ -150,6 +175,17 @@ class EventDataFilter(PrefectBaseModel, extra="forbid"):
         """Would the given filter exclude this event?"""
         return not self.includes(event)
 
+    def predicate(self) -> EventPredicate:
+        """
+        Compile the current criteria of this filter into a function equivalent to
+        `includes`, for checking many events against the same filter without
+        re-interpreting the filter for each one.
+        """
+        if type(self).includes is not EventDataFilter.includes:
+            return self.includes
+
+        return all_of(filter.predicate() for filter in self.get_filters())
+
     def build_where_clauses(self) -> Sequence["ColumnExpressionArgument[bool]"]:
         """Convert the criteria to a WHERE clause."""
         clauses: list["ColumnExpressionArgument[bool]"] = []
@@ -181,6 +217,14 @@ class EventOccurredFilter(EventDataFilter):
     def includes(self, event: Event) -> bool:
         return self.since <= event.occurred <= self.until
 
+    def predicate(self) -> EventPredicate:
+        since, until = self.since, self.until
+
+        def includes(event: Event) -> bool:
+            return since <= event.occurred <= until
+
+        return includes
+
     @db_injector
     def build_where_clauses(
         self, db: PrefectDBInterface
@@ -226,6 +270,27 @@ class EventNameFilter(EventDataFilter):
 
         return True
 
+    def predicate(self) -> EventPredicate:
+        if not (self.prefix or self.exclude_prefix or self.name or self.exclude_name):
+            return _includes_every_event
+
+        prefixes = tuple(self.prefix) if self.prefix else None
+        excluded_prefixes = tuple(self.exclude_prefix or ())
+        names = frozenset(self.name) if self.name else None
+        excluded_names = frozenset(self.exclude_name or ())
+
+        def includes(event: Event) -> bool:
+            name = event.event
+            if prefixes is not None and not name.startswith(prefixes):
+                return False
+            if name.startswith(excluded_prefixes):
+                return False
+            if names is not None and name not in names:
+                return False
+            return name not in excluded_names
+
+        return includes
+
     @db_injector
     def build_where_clauses(
         self, db: PrefectDBInterface
@@ -312,6 +377,16 @@ class EventResourceFilter(EventDataFilter):
 
         return True
 
+    def predicate(self) -> EventPredicate:
+        resource_matches = _resource_matcher(self.id, self.id_prefix, self.labels)
+        if resource_matches is None:
+            return _includes_every_event
+
+        def includes(event: Event) -> bool:
+            return resource_matches(event.resource)
+
+        return includes
+
     @db_injector
     def build_where_clauses(
         self, db: PrefectDBInterface
@@ -384,6 +459,32 @@ class EventResourceFilter(EventDataFilter):
         return filters
 
 
+def _resource_matcher(
+    ids: Optional[list[str]],
+    id_prefixes: Optional[list[str]],
+    labels: Optional[ResourceSpecification],
+) -> Optional[Callable[[Resource], bool]]:
+    """Compiles the `id`, `id_prefix`, and `labels` criteria shared by the resource
+    filters into a function of a single resource, or None if there are no criteria"""
+    if not (ids or id_prefixes or labels):
+        return None
+
+    id_set = frozenset(ids) if ids else None
+    prefixes = tuple(id_prefixes) if id_prefixes else None
+    labels_match = labels.matcher() if labels else None
+
+    def matches(resource: Resource) -> bool:
+        if id_set is not None and resource.id not in id_set:
+            return False
+        if prefixes is not None and not resource.id.startswith(prefixes):
+            return False
+        if labels_match is not None and not labels_match(resource):
+            return False
+        return True
+
+    return matches
+
+
 class EventRelatedFilter(EventDataFilter):
     id: Optional[list[str]] = Field(
         None, description="Only include events for related resources with these IDs"
@@ -519,6 +620,21 @@ class EventAnyResourceFilter(EventDataFilter):
 
         return True
 
+    def predicate(self) -> EventPredicate:
+        resource_matches = _resource_matcher(self.id, self.id_prefix, self.labels)
+        if resource_matches is None:
+            return _includes_every_event
+
+        def includes(event: Event) -> bool:
+            if resource_matches(event.resource):
+                return True
+            for resource in event.related:
+                if resource_matches(resource):
+                    return True
+            return False
+
+        return includes
+
     @db_injector
     def build_where_clauses(
         self, db: PrefectDBInterface
@@ -600,6 +716,17 @@ class EventIDFilter(EventDataFilter):
 
         return True
 
+    def predicate(self) -> EventPredicate:
+        if not self.id:
+            return _includes_every_event
+
+        ids = frozenset(self.id)
+
+        def includes(event: Event) -> bool:
+            return event.id in ids
+
+        return includes
+
     @db_injector
     def build_where_clauses(
         self, db: PrefectDBInterface
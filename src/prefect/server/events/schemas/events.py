@@ -3,6 +3,7 @@ from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Iterable,
@@ -256,6 +257,40 @@ def matches(expected: str, value: Optional[str]) -> bool:
     return match if positive else not match
 
 
+def any_matcher(expected: Iterable[str]) -> Callable[[Optional[str]], bool]:
+    """Returns a function equivalent to checking whether a value `matches` any of the
+    expected strings, with the expected strings parsed ahead of time"""
+    simple: set[str] = set()
+    prefixes: List[str] = []
+    negated_simple: List[str] = []
+    negated_prefixes: List[str] = []
+    for candidate in expected:
+        positive = not candidate.startswith("!")
+        if not positive:
+            candidate = candidate[1:]
+        if candidate.endswith("*"):
+            (prefixes if positive else negated_prefixes).append(candidate[:-1])
+        else:
+            (simple.add if positive else negated_simple.append)(candidate)
+
+    prefix_tuple = tuple(prefixes)
+
+    def matcher(value: Optional[str]) -> bool:
+        if value is None:
+            return False
+        if value in simple or value.startswith(prefix_tuple):
+            return True
+        for candidate in negated_simple:
+            if value != candidate:
+                return True
+        for prefix in negated_prefixes:
+            if not value.startswith(prefix):
+                return True
+        return False
+
+    return matcher
+
+
 class ResourceSpecification(RootModel[Dict[str, Union[str, List[str]]]]):
     def matches_every_resource(self) -> bool:
         return len(self.root) == 0
@@ -285,6 +320,21 @@ class ResourceSpecification(RootModel[Dict[str, Union[str, List[str]]]]):
                 return False
         return True
 
+    def matcher(self) -> Callable[[Resource], bool]:
+        """Returns a function equivalent to `matches` for the current labels, for
+        checking many resources against the same specification"""
+        label_matchers = [
+            (label, any_matcher(expected)) for label, expected in self.items()
+        ]
+
+        def matcher(resource: Resource) -> bool:
+            for label, label_matcher in label_matchers:
+                if not label_matcher(resource.get(label)):
+                    return False
+            return True
+
+        return matcher
+
     def items(self) -> Iterable[Tuple[str, List[str]]]:
         return [
             (label, [value] if isinstance(value, str) else value)
@@ -1,7 +1,9 @@
+import json
 from typing import TYPE_CHECKING, Any, Generator, Optional, Sequence
 
 import pydantic
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
@@ -21,7 +23,10 @@ from prefect.server.events.storage import (
     to_page_token,
 )
 from prefect.server.utilities.database import get_dialect
-from prefect.settings import PREFECT_API_DATABASE_CONNECTION_URL
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_SERVER_EVENTS_POSTGRES_WRITE_METHOD,
+)
 
 if TYPE_CHECKING:
     import logging
@@ -208,7 +213,10 @@ async def write_events(session: AsyncSession, events: list[ReceivedEvent]) -> No
     if events:
         dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
         if dialect.name == "postgresql":
-            await _write_postgres_events(session, events)
+            if PREFECT_SERVER_EVENTS_POSTGRES_WRITE_METHOD.value() == "copy":
+                await _copy_postgres_events(session, events)
+            else:
+                await _write_postgres_events(session, events)
         else:
             await _write_sqlite_events(session, events)
 
@@ -285,6 +293,126 @@ async def _write_postgres_events(
         await session.execute(db.queries.insert(db.EventResource).values(resource_rows))
 
 
+# A per-connection temporary table that events are copied into before being moved
+# into the `events` table, since `COPY` itself can't skip duplicate events
+EVENTS_STAGING_TABLE = "prefect_events_staging"
+
+
+@db_injector
+async def _copy_postgres_events(
+    db: PrefectDBInterface, session: AsyncSession, events: list[ReceivedEvent]
+) -> None:
+    """
+    Write events to the Postgres database using `COPY`.
+
+    Events are copied into a temporary staging table and moved into the `events`
+    table with a single `INSERT ... ON CONFLICT DO NOTHING`, so that duplicate events
+    are skipped just as they are by `_write_postgres_events`.  The resources of the
+    newly inserted events are then copied directly into `event_resources`.  Unlike
+    parameterized `INSERT`s, neither step is limited by the number of query
+    parameters, so each call writes all of the given events in one round trip per
+    statement.
+
+    Args:
+        session: a Postgres events session
+        events: the events to insert
+    """
+    event_rows = [event.as_database_row() for event in events]
+    columns = list(event_rows[0])
+
+    await session.execute(
+        sa.text(
+            f"CREATE TEMPORARY TABLE IF NOT EXISTS {EVENTS_STAGING_TABLE} "
+            f"(LIKE {db.Event.__tablename__} INCLUDING DEFAULTS) "
+            "ON COMMIT DELETE ROWS"
+        )
+    )
+    await _copy_rows(session, db.Event.__table__, EVENTS_STAGING_TABLE, event_rows)
+
+    # `created` and `updated` take their server defaults in the staging table, and
+    # are moved along with the copied columns so that SQLAlchemy doesn't fill them in
+    staged_columns = [
+        *columns,
+        *(c for c in ("created", "updated") if c not in columns),
+    ]
+    staging = sa.table(
+        EVENTS_STAGING_TABLE, *[sa.column(name) for name in staged_columns]
+    )
+    staged = sa.delete(staging).returning(*staging.c).cte("staged")
+    result = await session.scalars(
+        postgresql.insert(db.Event.__table__)
+        .from_select(staged_columns, sa.select(*staged.c))
+        .on_conflict_do_nothing()
+        .returning(db.Event.id)
+        .add_cte(staged)
+    )
+    inserted_event_ids = set(result.all())
+
+    resource_rows: list[dict[str, Any]] = []
+    for event in events:
+        if event.id not in inserted_event_ids:
+            # duplicate events were skipped, and their resources already exist
+            continue
+        resource_rows.extend(event.as_database_resource_rows())
+
+    if resource_rows:
+        await _copy_rows(
+            session,
+            db.EventResource.__table__,
+            db.EventResource.__tablename__,
+            resource_rows,
+        )
+
+
+async def _copy_rows(
+    session: AsyncSession,
+    table: sa.Table,
+    target: str,
+    rows: list[dict[str, Any]],
+) -> None:
+    """
+    `COPY` rows shaped like the given table's columns into the `target` table using
+    the session's underlying `asyncpg` connection and transaction.
+    """
+    columns = list(rows[0])
+    json_columns = {name for name in columns if _is_json_type(table.columns[name].type)}
+    records = [
+        tuple(
+            _json_text(row[name]) if name in json_columns else row[name]
+            for name in columns
+        )
+        for row in rows
+    ]
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    assert driver_connection is not None
+    await driver_connection.copy_records_to_table(
+        target, records=records, columns=columns
+    )
+
+
+def _is_json_type(type_: sa.types.TypeEngine[Any]) -> bool:
+    if isinstance(type_, sa.types.TypeDecorator):
+        type_ = type_.impl_instance
+    return isinstance(type_, sa.JSON)
+
+
+def _json_text(value: Any) -> Optional[str]:
+    """
+    Serialize a value for a JSON column, replacing the `NaN`, `Infinity`, and
+    `-Infinity` values that Postgres doesn't support with `null`, as the `JSON`
+    column type does for parameterized inserts.
+    """
+    if value is None:
+        return None
+    try:
+        return json.dumps(value, allow_nan=False)
+    except ValueError:
+        return json.dumps(json.loads(json.dumps(value), parse_constant=lambda c: None))
+
+
 def get_max_query_parameters() -> int:
     dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
     if dialect.name == "postgresql":
@@ -8,13 +8,16 @@ from typing import (
     AsyncGenerator,
     AsyncIterable,
     Dict,
+    FrozenSet,
+    List,
     NoReturn,
     Optional,
     Set,
+    Tuple,
 )
 
 from prefect.logging import get_logger
-from prefect.server.events.filters import EventFilter
+from prefect.server.events.filters import EventFilter, EventPredicate, all_of
 from prefect.server.events.schemas.events import ReceivedEvent
 from prefect.server.services.base import RunInAllServers, Service
 from prefect.server.utilities import messaging
@@ -33,6 +36,17 @@ filters: Dict["Queue[ReceivedEvent]", EventFilter] = {}
 # new messages will be dropped
 SUBSCRIPTION_BACKLOG = 256
 
+# A subscriber and the predicate for its filter's `occurred` window
+Subscriber = Tuple["Queue[ReceivedEvent]", EventPredicate]
+
+# The subscribers grouped by filters that are identical apart from their `occurred`
+# windows, each with the shared criteria compiled to a predicate, so that every
+# distinct filter is evaluated once per event.  Windows are clamped and default to
+# the time of subscribing, so they rarely match and are checked per subscriber.
+# These are rebuilt by `routes` whenever the set of subscribers changes.
+_routes: List[Tuple[EventPredicate, List[Subscriber]]] = []
+_routed_subscribers: FrozenSet["Queue[ReceivedEvent]"] = frozenset()
+
 
 @asynccontextmanager
 async def subscribed(
@@ -77,6 +91,40 @@ async def events(
         yield consume()
 
 
+def routes() -> List[Tuple[EventPredicate, List[Subscriber]]]:
+    """
+    Returns the current subscribers, grouped by their compiled filters apart from
+    the `occurred` window, which is compiled for each subscriber
+    """
+    global _routes, _routed_subscribers
+
+    if _routed_subscribers == subscribers:
+        return _routes
+
+    complete = True
+    groups: Dict[str, Tuple[EventPredicate, List[Subscriber]]] = {}
+    for queue in subscribers:
+        filter = filters.get(queue)
+        if filter is None:
+            complete = False
+            continue
+
+        key = filter.model_dump_json(exclude={"occurred"})
+        if key not in groups:
+            shared = all_of(
+                subfilter.predicate()
+                for subfilter in filter.get_filters()
+                if subfilter is not filter.occurred
+            )
+            groups[key] = (shared, [])
+        groups[key][1].append((queue, filter.occurred.predicate()))
+
+    _routes = list(groups.values())
+    # Only cache the routes once every subscriber's filter has been registered
+    _routed_subscribers = frozenset(subscribers) if complete else frozenset()
+    return _routes
+
+
 @asynccontextmanager
 async def distributor() -> AsyncGenerator[messaging.MessageHandler, None]:
     async def message_handler(message: messaging.Message):
@@ -89,15 +137,17 @@ async def distributor() -> AsyncGenerator[messaging.MessageHandler, None]:
 
         if subscribers:
             event = ReceivedEvent.model_validate_json(message.data)
-            for queue in subscribers:
-                filter = filters[queue]
-                if filter.excludes(event):
+            for includes, group in routes():
+                if not includes(event):
                     continue
 
-                try:
-                    queue.put_nowait(event)
-                except asyncio.QueueFull:
-                    continue
+                for queue, occurred in group:
+                    if not occurred(event):
+                        continue
+                    try:
+                        queue.put_nowait(event)
+                    except asyncio.QueueFull:
+                        continue
 
     yield message_handler
 
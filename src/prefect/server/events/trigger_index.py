@@ -0,0 +1,208 @@
+"""
+An inverted index over the loaded event triggers, used by the triggers service to
+narrow down which triggers could be interested in an event before evaluating each of
+them in full.
+"""
+
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from prefect.server.events.schemas.automations import EventTrigger
+from prefect.server.events.schemas.events import ReceivedEvent, Resource
+
+# The label that resource specifications are preferably indexed by
+RESOURCE_ID_LABEL = "prefect.resource.id"
+
+
+class PatternIndex:
+    """
+    Maps string patterns to the triggers that use them, where each pattern is either an
+    exact value or a prefix (from a pattern with a trailing wildcard).  Finding the
+    triggers for a value costs one lookup per distinct prefix length, independent of
+    the number of triggers.
+    """
+
+    def __init__(self) -> None:
+        self._exact: Dict[str, Set[UUID]] = defaultdict(set)
+        self._prefixes: Dict[str, Set[UUID]] = defaultdict(set)
+        self._prefix_lengths: Counter[int] = Counter()
+
+    def __bool__(self) -> bool:
+        return bool(self._exact or self._prefixes)
+
+    def add(
+        self, trigger_id: UUID, exact: Iterable[str], prefixes: Iterable[str]
+    ) -> None:
+        for value in exact:
+            self._exact[value].add(trigger_id)
+        for prefix in prefixes:
+            if trigger_id not in self._prefixes[prefix]:
+                self._prefixes[prefix].add(trigger_id)
+                self._prefix_lengths[len(prefix)] += 1
+
+    def remove(
+        self, trigger_id: UUID, exact: Iterable[str], prefixes: Iterable[str]
+    ) -> None:
+        for value in exact:
+            _discard(self._exact, value, trigger_id)
+        for prefix in prefixes:
+            if _discard(self._prefixes, prefix, trigger_id):
+                self._prefix_lengths[len(prefix)] -= 1
+                if not self._prefix_lengths[len(prefix)]:
+                    del self._prefix_lengths[len(prefix)]
+
+    def lookup(self, value: Optional[str]) -> Set[UUID]:
+        """Returns the triggers with a pattern that may match the given value"""
+        if value is None:
+            return set()
+
+        found: Set[UUID] = set()
+        if matched := self._exact.get(value):
+            found |= matched
+        for length in self._prefix_lengths:
+            if length <= len(value) and (matched := self._prefixes.get(value[:length])):
+                found |= matched
+        return found
+
+
+def _discard(index: Dict[str, Set[UUID]], key: str, trigger_id: UUID) -> bool:
+    trigger_ids = index.get(key)
+    if not trigger_ids or trigger_id not in trigger_ids:
+        return False
+    trigger_ids.discard(trigger_id)
+    if not trigger_ids:
+        del index[key]
+    return True
+
+
+# The exact values and prefixes a trigger was indexed by, or None if the trigger
+# isn't constrained along that dimension
+IndexKeys = Optional[Tuple[List[str], List[str]]]
+
+
+class TriggerIndex:
+    """
+    An inverted index of event triggers by the event names they expect (or come
+    `after`) and by the primary resource labels they `match`.
+
+    The candidates returned by `candidates` are a superset of the triggers that cover
+    an event, so callers must still confirm each one with `EventTrigger.covers`.
+    """
+
+    def __init__(self) -> None:
+        self._events = PatternIndex()
+        self._any_event: Set[UUID] = set()
+        self._event_keys: Dict[UUID, IndexKeys] = {}
+
+        self._resources: Dict[str, PatternIndex] = defaultdict(PatternIndex)
+        self._any_resource: Set[UUID] = set()
+        self._resource_keys: Dict[UUID, Tuple[str, IndexKeys]] = {}
+
+    def __len__(self) -> int:
+        return len(self._event_keys)
+
+    def __contains__(self, trigger_id: UUID) -> bool:
+        return trigger_id in self._event_keys
+
+    def add(self, trigger: EventTrigger) -> None:
+        """Indexes the given trigger, replacing any earlier version of it"""
+        self.remove(trigger.id)
+
+        event_keys = _event_keys(trigger)
+        self._event_keys[trigger.id] = event_keys
+        if event_keys is None:
+            self._any_event.add(trigger.id)
+        else:
+            self._events.add(trigger.id, *event_keys)
+
+        label, resource_keys = _resource_keys(trigger)
+        self._resource_keys[trigger.id] = (label, resource_keys)
+        if resource_keys is None:
+            self._any_resource.add(trigger.id)
+        else:
+            self._resources[label].add(trigger.id, *resource_keys)
+
+    def remove(self, trigger_id: UUID) -> None:
+        """Removes the given trigger from the index, if it is present"""
+        if trigger_id not in self._event_keys:
+            return
+
+        event_keys = self._event_keys.pop(trigger_id)
+        if event_keys is None:
+            self._any_event.discard(trigger_id)
+        else:
+            self._events.remove(trigger_id, *event_keys)
+
+        label, resource_keys = self._resource_keys.pop(trigger_id)
+        if resource_keys is None:
+            self._any_resource.discard(trigger_id)
+        else:
+            self._resources[label].remove(trigger_id, *resource_keys)
+            if not self._resources[label]:
+                del self._resources[label]
+
+    def clear(self) -> None:
+        self._events = PatternIndex()
+        self._any_event.clear()
+        self._event_keys.clear()
+        self._resources.clear()
+        self._any_resource.clear()
+        self._resource_keys.clear()
+
+    def candidates(self, event: ReceivedEvent) -> Set[UUID]:
+        """Returns the triggers that may cover the given event"""
+        by_event = self._events.lookup(event.event)
+        by_event |= self._any_event
+        if not by_event:
+            return by_event
+
+        by_resource = self._resource_candidates(event.resource)
+        if len(by_resource) < len(by_event):
+            return by_resource & by_event
+        return by_event & by_resource
+
+    def _resource_candidates(self, resource: Resource) -> Set[UUID]:
+        found = set(self._any_resource)
+        for label, index in self._resources.items():
+            found |= index.lookup(resource.get(label))
+        return found
+
+
+def _event_keys(trigger: EventTrigger) -> IndexKeys:
+    # Mirrors `EventTrigger.event_pattern`, which is matched from the start of the
+    # event name, so every pattern is indexed by its literal text up to the first
+    # wildcard, and triggers without any `expect`ations match all events
+    if not trigger.expect:
+        return None
+
+    prefixes: List[str] = []
+    for pattern in trigger.expect | trigger.after:
+        prefix = pattern.split("*", 1)[0]
+        if not prefix:
+            return None
+        prefixes.append(prefix)
+    return [], prefixes
+
+
+def _resource_keys(trigger: EventTrigger) -> Tuple[str, IndexKeys]:
+    # A resource specification requires every label to match, so it is enough to
+    # index one of them; only labels whose values are all positive patterns can be
+    # indexed, since a negated pattern matches almost any value
+    labels = sorted(
+        trigger.match.items(), key=lambda item: item[0] != RESOURCE_ID_LABEL
+    )
+    for label, values in labels:
+        if not values or any(value.startswith("!") for value in values):
+            continue
+
+        exact: List[str] = []
+        prefixes: List[str] = []
+        for value in values:
+            if value.endswith("*"):
+                prefixes.append(value[:-1])
+            else:
+                exact.append(value)
+        return label, (exact, prefixes)
+
+    return "", None
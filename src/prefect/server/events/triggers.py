@@ -56,6 +56,7 @@ from prefect.server.events.schemas.automations import (
     TriggerState,
 )
 from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.events.trigger_index import TriggerIndex
 from prefect.server.utilities.messaging import Message, MessageHandler
 from prefect.server.utilities.postgres_listener import (
     get_pg_notify_connection,
@@ -640,6 +641,7 @@ async def evaluate_periodically(periodic_granularity: timedelta) -> None:
 # account and workspace
 automations_by_id: Dict[UUID, Automation] = {}
 triggers: Dict[TriggerID, EventTrigger] = {}
+trigger_index = TriggerIndex()
 next_proactive_runs: Dict[TriggerID, prefect.types._datetime.DateTime] = {}
 
 # This lock governs any changes to the set of loaded automations; any routine that will
@@ -656,8 +658,12 @@ def _automations_lock() -> asyncio.Lock:
 
 
 def find_interested_triggers(event: ReceivedEvent) -> Collection[EventTrigger]:
-    candidates = triggers.values()
-    return [trigger for trigger in candidates if trigger.covers(event)]
+    interested: List[EventTrigger] = []
+    for trigger_id in trigger_index.candidates(event):
+        trigger = triggers.get(trigger_id)
+        if trigger and trigger.covers(event):
+            interested.append(trigger)
+    return interested
 
 
 def load_automation(automation: Optional[Automation]) -> None:
@@ -675,6 +681,7 @@ def load_automation(automation: Optional[Automation]) -> None:
 
     for trigger in event_triggers:
         triggers[trigger.id] = trigger
+        trigger_index.add(trigger)
         next_proactive_runs.pop(trigger.id, None)
 
 
@@ -683,6 +690,7 @@ def forget_automation(automation_id: UUID) -> None:
     if automation := automations_by_id.pop(automation_id, None):
         for trigger in automation.triggers():
             triggers.pop(trigger.id, None)
+            trigger_index.remove(trigger.id)
             next_proactive_runs.pop(trigger.id, None)
 
 
@@ -996,6 +1004,7 @@ async def reset() -> None:
     await reset_events_clock()
     automations_by_id.clear()
     triggers.clear()
+    trigger_index.clear()
     next_proactive_runs.clear()
 
 
@@ -11,6 +11,7 @@ from typing import (
     TYPE_CHECKING,
     AsyncGenerator,
     AsyncIterable,
+    Callable,
     NoReturn,
 )
 
@@ -27,6 +28,8 @@ if TYPE_CHECKING:
 
 logger: "logging.Logger" = get_logger(__name__)
 
+LogPredicate = Callable[[Log], bool]
+
 subscribers: set["Queue[Log]"] = set()
 filters: dict["Queue[Log]", LogFilter] = {}
 
@@ -34,6 +37,17 @@ filters: dict["Queue[Log]", LogFilter] = {}
 # new messages will be dropped
 SUBSCRIPTION_BACKLOG = 256
 
+# A subscriber and the predicate for its filter's `timestamp` window, if it has one
+Subscriber = tuple["Queue[Log]", "LogPredicate | None"]
+
+# The subscribers grouped by filters that are identical apart from their `timestamp`
+# windows, each with the shared criteria compiled to a predicate, so that every
+# distinct filter is evaluated once per log.  Windows are usually relative to the
+# time of subscribing, so they rarely match and are checked per subscriber.  These
+# are rebuilt by `routes` whenever the set of subscribers changes.
+_routes: list[tuple[LogPredicate, list[Subscriber]]] = []
+_routed_subscribers: frozenset["Queue[Log]"] = frozenset()
+
 
 @asynccontextmanager
 async def subscribed(
@@ -107,43 +121,97 @@ def log_matches_filter(log: Log, filter: LogFilter) -> bool:
     Returns:
         True if the log matches the filter, False otherwise
     """
-    # Check level filter
+    return log_filter_predicate(filter)(log)
+
+
+def log_filter_predicate(filter: LogFilter) -> LogPredicate:
+    """
+    Compile the given filter into a function that checks whether a log matches it,
+    for checking many logs against the same filter.
+
+    Args:
+        filter: The filter to compile
+
+    Returns:
+        A function that returns True if a log matches the filter, False otherwise
+    """
+    level_ge = level_le = None
     if filter.level:
-        if filter.level.ge_ is not None and log.level < filter.level.ge_:
-            return False
-        if filter.level.le_ is not None and log.level > filter.level.le_:
-            return False
+        level_ge, level_le = filter.level.ge_, filter.level.le_
 
-    # Check timestamp filter
+    before = after = None
     if filter.timestamp:
-        if (
-            filter.timestamp.before_ is not None
-            and log.timestamp > filter.timestamp.before_
-        ):
+        before, after = filter.timestamp.before_, filter.timestamp.after_
+
+    flow_run_ids = None
+    if filter.flow_run_id and filter.flow_run_id.any_ is not None:
+        flow_run_ids = frozenset(filter.flow_run_id.any_)
+
+    task_run_ids = task_run_id_is_null = None
+    if filter.task_run_id:
+        if filter.task_run_id.any_ is not None:
+            task_run_ids = frozenset(filter.task_run_id.any_)
+        task_run_id_is_null = filter.task_run_id.is_null_
+
+    def matches(log: Log) -> bool:
+        if level_ge is not None and log.level < level_ge:
+            return False
+        if level_le is not None and log.level > level_le:
+            return False
+        if before is not None and log.timestamp > before:
+            return False
+        if after is not None and log.timestamp < after:
+            return False
+        if flow_run_ids is not None and log.flow_run_id not in flow_run_ids:
+            return False
+        if task_run_ids is not None and log.task_run_id not in task_run_ids:
             return False
-        if (
-            filter.timestamp.after_ is not None
-            and log.timestamp < filter.timestamp.after_
+        if task_run_id_is_null is not None and task_run_id_is_null != (
+            log.task_run_id is None
         ):
             return False
+        return True
 
-    # Check flow_run_id filter
-    if filter.flow_run_id:
-        if filter.flow_run_id.any_ is not None:
-            if log.flow_run_id not in filter.flow_run_id.any_:
-                return False
+    return matches
 
-    # Check task_run_id filter
-    if filter.task_run_id:
-        if filter.task_run_id.any_ is not None:
-            if log.task_run_id not in filter.task_run_id.any_:
-                return False
-        if filter.task_run_id.is_null_ is not None:
-            is_null = log.task_run_id is None
-            if filter.task_run_id.is_null_ != is_null:
-                return False
 
-    return True
+def routes() -> list[tuple[LogPredicate, list[Subscriber]]]:
+    """
+    Get the current subscribers, grouped by their compiled filters apart from the
+    `timestamp` window, which is compiled for each subscriber.
+
+    Returns:
+        A list of predicates, each with the queues of the subscribers sharing it and
+        the predicates for their windows
+    """
+    global _routes, _routed_subscribers
+
+    if _routed_subscribers == subscribers:
+        return _routes
+
+    complete = True
+    groups: dict[str, tuple[LogPredicate, list[Subscriber]]] = {}
+    for queue in subscribers:
+        filter = filters.get(queue)
+        if filter is None:
+            complete = False
+            continue
+
+        key = filter.model_dump_json(exclude={"timestamp"})
+        if key not in groups:
+            shared = filter.model_copy(update={"timestamp": None})
+            groups[key] = (log_filter_predicate(shared), [])
+        window = (
+            log_filter_predicate(LogFilter(timestamp=filter.timestamp))
+            if filter.timestamp
+            else None
+        )
+        groups[key][1].append((queue, window))
+
+    _routes = list(groups.values())
+    # Only cache the routes once every subscriber's filter has been registered
+    _routed_subscribers = frozenset(subscribers) if complete else frozenset()
+    return _routes
 
 
 @asynccontextmanager
@@ -170,15 +238,17 @@ async def distributor() -> AsyncGenerator[messaging.MessageHandler, None]:
                 logger.warning(f"Failed to parse log message: {e}")
                 return
 
-            for queue in subscribers:
-                filter = filters[queue]
-                if not log_matches_filter(log, filter):
+            for matches, group in routes():
+                if not matches(log):
                     continue
 
-                try:
-                    queue.put_nowait(log)
-                except asyncio.QueueFull:
-                    continue
+                for queue, window in group:
+                    if window is not None and not window(log):
+                        continue
+                    try:
+                        queue.put_nowait(log)
+                    except asyncio.QueueFull:
+                        continue
 
     yield message_handler
 
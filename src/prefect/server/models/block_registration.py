@@ -5,6 +5,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import prefect.blocks.notifications  # noqa: F401 # registers notification blocks
 from prefect.blocks.core import Block
 from prefect.blocks.system import JSON, DateTime, Secret
 from prefect.blocks.webhook import Webhook
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import ColumnElement
 
 import prefect.server.schemas as schemas
+from prefect.server.concurrency.slot_ledger import get_concurrency_slot_ledger
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 
 
@@ -49,6 +50,14 @@ def denied_slots_after_decay(db: PrefectDBInterface) -> ColumnElement[float]:
     )
 
 
+def _merge_slot_ledger(
+    concurrency_limits: Sequence[orm_models.ConcurrencyLimitV2],
+) -> None:
+    # Slots counted by a ledger are only written to the database periodically
+    if slot_ledger := get_concurrency_slot_ledger():
+        slot_ledger.merge(concurrency_limits)
+
+
 # OCCUPANCY_SAMPLES_MULTIPLIER is used to determine how many samples to use when
 # calculating the average occupancy seconds per slot.
 OCCUPANCY_SAMPLES_MULTIPLIER = 2
@@ -91,7 +100,10 @@ async def read_concurrency_limit(
     )
     query = sa.select(db.ConcurrencyLimitV2).where(where)
     result = await session.execute(query)
-    return result.scalar()
+    concurrency_limit = result.scalar()
+    if concurrency_limit is not None:
+        _merge_slot_ledger([concurrency_limit])
+    return concurrency_limit
 
 
 @db_injector
@@ -109,7 +121,9 @@ async def read_all_concurrency_limits(
         query = query.limit(limit)
 
     result = await session.execute(query)
-    return result.scalars().unique().all()
+    concurrency_limits = result.scalars().unique().all()
+    _merge_slot_ledger(concurrency_limits)
+    return concurrency_limits
 
 
 @db_injector
@@ -126,6 +140,9 @@ async def update_concurrency_limit(
     if not current_concurrency_limit:
         return False
 
+    if slot_ledger := get_concurrency_slot_ledger():
+        await slot_ledger.evict(session, [current_concurrency_limit.id])
+
     if not concurrency_limit_id and not name:
         raise ValueError("Must provide either concurrency_limit_id or name")
 
@@ -159,6 +176,14 @@ async def delete_concurrency_limit(
         if concurrency_limit_id
         else db.ConcurrencyLimitV2.name == name
     )
+
+    if slot_ledger := get_concurrency_slot_ledger():
+        current_concurrency_limit = await read_concurrency_limit(
+            session, concurrency_limit_id=concurrency_limit_id, name=name
+        )
+        if current_concurrency_limit:
+            await slot_ledger.evict(session, [current_concurrency_limit.id])
+
     query = sa.delete(db.ConcurrencyLimitV2).where(where)
 
     result = await session.execute(query)
@@ -176,6 +201,7 @@ async def bulk_read_concurrency_limits(
         db.ConcurrencyLimitV2.name.in_(names)
     )
     existing_limits = list((await session.execute(existing_query)).scalars().all())
+    _merge_slot_ledger(existing_limits)
 
     return existing_limits
 
@@ -187,6 +213,11 @@ async def bulk_increment_active_slots(
     concurrency_limit_ids: List[UUID],
     slots: int,
 ) -> bool:
+    if slot_ledger := get_concurrency_slot_ledger():
+        return await slot_ledger.increment_active_slots(
+            session, concurrency_limit_ids, slots
+        )
+
     active_slots = active_slots_after_decay(db)
     denied_slots = denied_slots_after_decay(db)
 
@@ -217,6 +248,11 @@ async def bulk_decrement_active_slots(
     slots: int,
     occupancy_seconds: Optional[float] = None,
 ) -> bool:
+    if slot_ledger := get_concurrency_slot_ledger():
+        return await slot_ledger.decrement_active_slots(
+            session, concurrency_limit_ids, slots, occupancy_seconds
+        )
+
     query = (
         sa.update(db.ConcurrencyLimitV2)
         .where(
@@ -264,6 +300,11 @@ async def bulk_update_denied_slots(
     concurrency_limit_ids: List[UUID],
     slots: int,
 ) -> bool:
+    if slot_ledger := get_concurrency_slot_ledger():
+        return await slot_ledger.update_denied_slots(
+            session, concurrency_limit_ids, slots
+        )
+
     query = (
         sa.update(db.ConcurrencyLimitV2)
         .where(
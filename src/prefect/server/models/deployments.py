@@ -20,11 +20,15 @@ from sqlalchemy.sql import Select
 from prefect._internal.uuid7 import uuid7
 from prefect.logging import get_logger
 from prefect.server import models, schemas
+from prefect.server.concurrency.slot_ledger import get_concurrency_slot_ledger
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 from prefect.server.events.clients import PrefectServerEventsClient
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.models.events import deployment_status_event
 from prefect.server.schemas.statuses import DeploymentStatus
+from prefect.server.utilities.work_queue_notifications import (
+    notify_scheduled_flow_runs,
+)
 from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_MAX_RUNS,
     PREFECT_API_SERVICES_SCHEDULER_MAX_SCHEDULED_TIME,
@@ -340,6 +344,8 @@ async def _create_or_update_deployment_concurrency_limit(
         )
         await session.refresh(deployment)
     elif deployment.global_concurrency_limit:
+        if slot_ledger := get_concurrency_slot_ledger():
+            await slot_ledger.evict(session, [deployment.global_concurrency_limit.id])
         deployment.global_concurrency_limit.limit = limit
     else:
         limit_name = f"deployment:{deployment_id}"
@@ -590,6 +596,15 @@ async def delete_deployment(
 async def _delete_related_concurrency_limit(
     db: PrefectDBInterface, session: AsyncSession, deployment_id: UUID
 ):
+    if slot_ledger := get_concurrency_slot_ledger():
+        concurrency_limit_id = await session.scalar(
+            sa.select(db.Deployment.concurrency_limit_id).where(
+                db.Deployment.id == deployment_id
+            )
+        )
+        if concurrency_limit_id:
+            await slot_ledger.evict(session, [concurrency_limit_id])
+
     return await session.execute(
         delete(db.ConcurrencyLimitV2).where(
             db.ConcurrencyLimitV2.id
@@ -714,8 +729,6 @@ async def _generate_scheduled_flow_runs(
     Returns:
         a list of dictionary representations of the `FlowRun` objects to schedule
     """
-    runs: list[dict[str, Any]] = []
-
     deployment = await session.get(db.Deployment, deployment_id)
 
     if not deployment:
@@ -729,69 +742,206 @@ async def _generate_scheduled_flow_runs(
         ),
     )
 
+    labels = await with_system_labels_for_deployment_flow_run(
+        session=session,
+        deployment=deployment,
+    )
+
+    runs: list[dict[str, Any]] = []
     for deployment_schedule in active_deployment_schedules:
-        dates: list[DateTime] = []
+        dates = _get_scheduled_dates(
+            deployment_schedule.schedule,
+            start_time=start_time,
+            end_time=end_time,
+            min_time=min_time,
+            min_runs=min_runs,
+            max_runs=max_runs,
+        )
+        runs.extend(
+            _scheduled_flow_runs(
+                deployment,
+                deployment_schedule,
+                dates=dates,
+                labels=labels,
+                auto_scheduled=auto_scheduled,
+            )
+        )
 
-        # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
-        for dt in deployment_schedule.schedule._get_dates_generator(
-            n=max_runs, start=start_time, end=end_time
-        ):
-            dates.append(dt)
+    return runs
 
-            # at any point, if we satisfy both of the minimums, we can stop
-            if len(dates) >= min_runs and dt >= (start_time + min_time):
-                break
 
-        tags = deployment.tags
-        if auto_scheduled:
-            tags = ["auto-scheduled"] + tags
+async def _generate_scheduled_flow_runs_for_deployments(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    deployment_ids: Sequence[UUID],
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    min_time: datetime.timedelta,
+    min_runs: int,
+    max_runs: int,
+    auto_scheduled: bool = True,
+) -> list[dict[str, Any]]:
+    """
+    Generates scheduled flow runs for many deployments at once, with the same
+    semantics as `_generate_scheduled_flow_runs`.
 
-        parameters = {
-            **deployment.parameters,
-            **deployment_schedule.parameters,
-        }
+    The deployments and their active schedules are read with one query each rather
+    than two queries per deployment, and the dates for identical schedules (like the
+    many deployments that run on the same cron schedule) are only computed once.
+    Deployments whose runs can't be generated are logged and skipped.
 
-        # Generate system labels for flow runs from this deployment
-        labels = await with_system_labels_for_deployment_flow_run(
-            session=session,
-            deployment=deployment,
+    Args:
+        session: a database session
+        deployment_ids: the ids of the deployments to schedule
+        start_time: the time from which to start scheduling runs
+        end_time: runs will be scheduled until at most this time
+        min_time: runs will be scheduled until at least this far in the future
+        min_runs: a minimum amount of runs to schedule
+        max_runs: a maximum amount of runs to schedule
+
+    Returns:
+        a list of dictionary representations of the `FlowRun` objects to schedule
+    """
+    if not deployment_ids:
+        return []
+
+    deployments = (
+        await session.execute(
+            sa.select(db.Deployment)
+            .where(db.Deployment.id.in_(deployment_ids))
+            .order_by(db.Deployment.id)
+        )
+    ).scalars()
+
+    schedules_by_deployment: dict[UUID, list[schemas.core.DeploymentSchedule]] = {}
+    schedules = await session.execute(
+        sa.select(db.DeploymentSchedule)
+        .where(
+            db.DeploymentSchedule.deployment_id.in_(deployment_ids),
+            db.DeploymentSchedule.active.is_(True),
+        )
+        .order_by(db.DeploymentSchedule.updated.desc())
+    )
+    for schedule in schedules.scalars():
+        schedules_by_deployment.setdefault(schedule.deployment_id, []).append(
+            schemas.core.DeploymentSchedule.model_validate(
+                schedule, from_attributes=True
+            )
         )
 
-        for date in dates:
-            runs.append(
-                {
-                    "id": uuid7(),
-                    "flow_id": deployment.flow_id,
-                    "deployment_id": deployment_id,
-                    "deployment_version": deployment.version,
-                    "work_queue_name": deployment.work_queue_name,
-                    "work_queue_id": deployment.work_queue_id,
-                    "parameters": parameters,
-                    "infrastructure_document_id": deployment.infrastructure_document_id,
-                    "idempotency_key": f"scheduled {deployment.id} {deployment_schedule.id} {date}",
-                    "tags": tags,
-                    "labels": labels,
-                    "auto_scheduled": auto_scheduled,
-                    "state": schemas.states.Scheduled(
-                        scheduled_time=date,
-                        message="Flow run scheduled",
-                    ).model_dump(),
-                    "state_type": schemas.states.StateType.SCHEDULED,
-                    "state_name": "Scheduled",
-                    "next_scheduled_start_time": date,
-                    "expected_start_time": date,
-                    "created_by": {
-                        "id": deployment_schedule.id,
-                        "display_value": deployment_schedule.slug
-                        or deployment_schedule.schedule.__class__.__name__,
-                        "type": "SCHEDULE",
-                    },
-                }
+    dates_by_schedule: dict[str, list[DateTime]] = {}
+    runs: list[dict[str, Any]] = []
+    for deployment in deployments:
+        try:
+            labels = await with_system_labels_for_deployment_flow_run(
+                session=session,
+                deployment=deployment,
             )
+            for deployment_schedule in schedules_by_deployment.get(deployment.id, []):
+                schedule = deployment_schedule.schedule
+                key = f"{type(schedule).__name__}:{schedule.model_dump_json()}"
+                if key not in dates_by_schedule:
+                    dates_by_schedule[key] = _get_scheduled_dates(
+                        schedule,
+                        start_time=start_time,
+                        end_time=end_time,
+                        min_time=min_time,
+                        min_runs=min_runs,
+                        max_runs=max_runs,
+                    )
+                runs.extend(
+                    _scheduled_flow_runs(
+                        deployment,
+                        deployment_schedule,
+                        dates=dates_by_schedule[key],
+                        labels=labels,
+                        auto_scheduled=auto_scheduled,
+                    )
+                )
+        except Exception:
+            logger.exception(f"Error scheduling deployment {deployment.id!r}.")
 
     return runs
 
 
+def _get_scheduled_dates(
+    schedule: schemas.schedules.SCHEDULE_TYPES,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    min_time: datetime.timedelta,
+    min_runs: int,
+    max_runs: int,
+) -> list[DateTime]:
+    """
+    Returns the fewest dates of the given schedule that satisfy the min and max times
+    and counts described by `_generate_scheduled_flow_runs`.
+    """
+    dates: list[DateTime] = []
+
+    # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
+    for dt in schedule._get_dates_generator(n=max_runs, start=start_time, end=end_time):
+        dates.append(dt)
+
+        # at any point, if we satisfy both of the minimums, we can stop
+        if len(dates) >= min_runs and dt >= (start_time + min_time):
+            break
+
+    return dates
+
+
+def _scheduled_flow_runs(
+    deployment: orm_models.Deployment,
+    deployment_schedule: schemas.core.DeploymentSchedule,
+    dates: Iterable[DateTime],
+    labels: schemas.core.KeyValueLabels,
+    auto_scheduled: bool,
+) -> list[dict[str, Any]]:
+    """
+    Returns the dictionary representations of the flow runs for the given dates of
+    one of a deployment's schedules.
+    """
+    tags = deployment.tags
+    if auto_scheduled:
+        tags = ["auto-scheduled"] + tags
+
+    parameters = {
+        **deployment.parameters,
+        **deployment_schedule.parameters,
+    }
+
+    return [
+        {
+            "id": uuid7(),
+            "flow_id": deployment.flow_id,
+            "deployment_id": deployment.id,
+            "deployment_version": deployment.version,
+            "work_queue_name": deployment.work_queue_name,
+            "work_queue_id": deployment.work_queue_id,
+            "parameters": parameters,
+            "infrastructure_document_id": deployment.infrastructure_document_id,
+            "idempotency_key": f"scheduled {deployment.id} {deployment_schedule.id} {date}",
+            "tags": tags,
+            "labels": labels,
+            "auto_scheduled": auto_scheduled,
+            "state": schemas.states.Scheduled(
+                scheduled_time=date,
+                message="Flow run scheduled",
+            ).model_dump(),
+            "state_type": schemas.states.StateType.SCHEDULED,
+            "state_name": "Scheduled",
+            "next_scheduled_start_time": date,
+            "expected_start_time": date,
+            "created_by": {
+                "id": deployment_schedule.id,
+                "display_value": deployment_schedule.slug
+                or deployment_schedule.schedule.__class__.__name__,
+                "type": "SCHEDULE",
+            },
+        }
+        for date in dates
+    ]
+
+
 @db_injector
 async def _insert_scheduled_flow_runs(
     db: PrefectDBInterface, session: AsyncSession, runs: list[dict[str, Any]]
@@ -812,31 +962,23 @@ async def _insert_scheduled_flow_runs(
     if not runs:
         return []
 
-    # gracefully insert the flow runs against the idempotency key
-    # this syntax (insert statement, values to insert) is most efficient
-    # because it uses a single bind parameter
-    await session.execute(
-        db.queries.insert(db.FlowRun).on_conflict_do_nothing(
-            index_elements=db.orm.flow_run_unique_upsert_columns
-        ),
+    # gracefully insert the flow runs against the idempotency key, returning only the
+    # rows that were newly inserted; this syntax (insert statement, values to insert)
+    # is sent as multi-row INSERT statements rather than one statement per run
+    result = await session.execute(
+        db.queries.insert(db.FlowRun)
+        .on_conflict_do_nothing(index_elements=db.orm.flow_run_unique_upsert_columns)
+        .returning(db.FlowRun.id),
         runs,
     )
-
-    # query for the rows that were newly inserted (by checking for any flow runs with
-    # no corresponding flow run states)
-    inserted_rows = sa.select(db.FlowRun.id).where(
-        db.FlowRun.id.in_([r["id"] for r in runs]),
-        ~select(db.FlowRunState.id)
-        .where(db.FlowRunState.flow_run_id == db.FlowRun.id)
-        .exists(),
-    )
-    inserted_flow_run_ids = (await session.execute(inserted_rows)).scalars().all()
+    inserted_flow_run_ids = result.scalars().all()
+    newly_inserted = set(inserted_flow_run_ids)
 
     # insert flow run states that correspond to the newly-insert rows
     insert_flow_run_states: list[dict[str, Any]] = [
         {"id": uuid7(), "flow_run_id": r["id"], **r["state"]}
         for r in runs
-        if r["id"] in inserted_flow_run_ids
+        if r["id"] in newly_inserted
     ]
     if insert_flow_run_states:
         # this syntax (insert statement, values to insert) is most efficient
@@ -854,6 +996,10 @@ async def _insert_scheduled_flow_runs(
 
         await session.execute(stmt)
 
+        await notify_scheduled_flow_runs(
+            session, [r.get("work_queue_id") for r in runs if r["id"] in newly_inserted]
+        )
+
     return inserted_flow_run_ids
 
 
@@ -9,6 +9,7 @@ from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     List,
     Optional,
@@ -29,6 +30,7 @@ from sqlalchemy.sql import Select
 
 import prefect.server.models as models
 import prefect.server.schemas as schemas
+from prefect._internal.uuid7 import uuid7
 from prefect.logging.loggers import get_logger
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 from prefect.server.exceptions import ObjectNotFoundError
@@ -43,6 +45,9 @@ from prefect.server.schemas.graph import Graph
 from prefect.server.schemas.responses import OrchestrationResult
 from prefect.server.schemas.states import State
 from prefect.server.utilities.schemas import PrefectBaseModel
+from prefect.server.utilities.work_queue_notifications import (
+    notify_scheduled_flow_runs,
+)
 from prefect.settings import (
     PREFECT_API_MAX_FLOW_RUN_GRAPH_ARTIFACTS,
     PREFECT_API_MAX_FLOW_RUN_GRAPH_NODES,
@@ -496,6 +501,10 @@ async def delete_flow_run(
     if deployment_id:
         await cleanup_flow_run_concurrency_slots(session=session, flow_run=flow_run)
 
+    await models.run_history_rollups.mark_flow_runs_stale(
+        session, db.FlowRun.id == flow_run_id
+    )
+
     # Delete the flow run
     result = await session.execute(
         delete(db.FlowRun).where(db.FlowRun.id == flow_run_id)
@@ -545,6 +554,151 @@ async def set_flow_run_state(
     if not run:
         raise ObjectNotFoundError(f"Flow run with id {flow_run_id} not found")
 
+    context = await _orchestrate_flow_run_state(
+        session=session,
+        run=run,
+        state=state,
+        force=force,
+        flow_policy=flow_policy,
+        orchestration_parameters=orchestration_parameters,
+        client_version=client_version,
+    )
+
+    if context.orchestration_error is not None:
+        raise context.orchestration_error
+
+    if (
+        context.validated_state is not None
+        and context.validated_state.type == schemas.states.StateType.SCHEDULED
+    ):
+        await notify_scheduled_flow_runs(session, [run.work_queue_id])
+
+    result = OrchestrationResult(
+        state=context.validated_state,
+        status=context.response_status,
+        details=context.response_details,
+    )
+
+    return result
+
+
+@db_injector
+async def bulk_set_flow_run_state(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run_ids: Sequence[UUID],
+    state: schemas.states.State,
+    force: bool = False,
+    flow_policy: Optional[Type[FlowRunOrchestrationPolicy]] = None,
+    orchestration_parameters: Optional[Dict[str, Any]] = None,
+    client_version: Optional[str] = None,
+    raise_error: Callable[[Exception], bool] = lambda exc: True,
+) -> Dict[UUID, OrchestrationResult]:
+    """
+    Proposes the same state for many flow runs, orchestrating each one as
+    `set_flow_run_state` would.
+
+    The runs are read and locked with a single query, and each run is given its own
+    copy of the proposed state and orchestrated within its own savepoint.  If
+    orchestrating a run raises an error that `raise_error` declines to raise, only
+    that run's changes are rolled back and its result is aborted.
+
+    Args:
+        session: a database session
+        flow_run_ids: the flow run ids
+        state: a flow run state model
+        force: if False, orchestration rules will be applied that may alter or prevent
+            the state transition. If True, orchestration rules are not applied.
+        raise_error: whether an error orchestrating a run should be raised rather
+            than aborting the run; by default every error is raised
+
+    Returns:
+        a mapping of flow run ids to OrchestrationResult objects; runs that do not
+        exist are not included
+    """
+    query = (
+        sa.select(db.FlowRun)
+        .where(db.FlowRun.id.in_(set(flow_run_ids)))
+        # lock rows in a consistent order to avoid deadlocking with other requests
+        .order_by(db.FlowRun.id)
+        .options(
+            selectinload(db.FlowRun.work_queue).selectinload(db.WorkQueue.work_pool)
+        )
+        .with_for_update()
+    )
+    runs = (await session.execute(query)).scalars().all()
+
+    results: Dict[UUID, OrchestrationResult] = {}
+    scheduled_work_queue_ids: List[Optional[UUID]] = []
+    for run in runs:
+        run_id = run.id
+        run_state = state.model_copy(update={"id": uuid7()}, deep=True)
+        run_state.state_details.flow_run_id = run_id
+
+        try:
+            async with session.begin_nested():
+                context = await _orchestrate_flow_run_state(
+                    session=session,
+                    run=run,
+                    state=run_state,
+                    force=force,
+                    flow_policy=flow_policy,
+                    # rules may record their own parameters on the context
+                    orchestration_parameters=(
+                        dict(orchestration_parameters)
+                        if orchestration_parameters is not None
+                        else None
+                    ),
+                    client_version=client_version,
+                )
+
+                if context.orchestration_error is not None:
+                    raise context.orchestration_error
+        except Exception as exc:
+            if raise_error(exc):
+                raise
+            logger.warning(
+                f"Error orchestrating the state of flow run {run_id}", exc_info=True
+            )
+            results[run_id] = _aborted_orchestration_result(exc)
+            continue
+
+        if (
+            context.validated_state is not None
+            and context.validated_state.type == schemas.states.StateType.SCHEDULED
+        ):
+            scheduled_work_queue_ids.append(run.work_queue_id)
+
+        results[run.id] = OrchestrationResult(
+            state=context.validated_state,
+            status=context.response_status,
+            details=context.response_details,
+        )
+
+    await notify_scheduled_flow_runs(session, scheduled_work_queue_ids)
+
+    return results
+
+
+def _aborted_orchestration_result(exc: Exception) -> OrchestrationResult:
+    return OrchestrationResult(
+        state=None,
+        status=schemas.responses.SetStateStatus.ABORT,
+        details=schemas.responses.StateAbortDetails(
+            reason=f"Error orchestrating state: {exc!r}"
+        ),
+    )
+
+
+async def _orchestrate_flow_run_state(
+    session: AsyncSession,
+    run: orm_models.FlowRun,
+    state: schemas.states.State,
+    force: bool,
+    flow_policy: Optional[Type[FlowRunOrchestrationPolicy]],
+    orchestration_parameters: Optional[Dict[str, Any]],
+    client_version: Optional[str],
+) -> FlowOrchestrationContext:
     initial_state = run.state.as_state() if run.state else None
     initial_state_type = initial_state.type if initial_state else None
     proposed_state_type = state.type if state else None
@@ -581,16 +735,7 @@ async def set_flow_run_state(
 
         await context.validate_proposed_state()
 
-    if context.orchestration_error is not None:
-        raise context.orchestration_error
-
-    result = OrchestrationResult(
-        state=context.validated_state,
-        status=context.response_status,
-        details=context.response_details,
-    )
-
-    return result
+    return context
 
 
 @db_injector
@@ -599,9 +744,12 @@ async def read_flow_run_graph(
     session: AsyncSession,
     flow_run_id: UUID,
     since: datetime.datetime = earliest_possible_datetime(),
+    updated_since: Optional[datetime.datetime] = None,
 ) -> Graph:
     """Given a flow run, return the graph of it's task and subflow runs. If a `since`
-    datetime is provided, only return items that may have changed since that time."""
+    datetime is provided, only return items that may have changed since that time.
+    If an `updated_since` datetime is provided, only return items that were created
+    or updated since that time."""
     if isinstance(since, str):
         since = DateTime.fromisoformat(since)
 
@@ -611,6 +759,7 @@ async def read_flow_run_graph(
         since=since,
         max_nodes=PREFECT_API_MAX_FLOW_RUN_GRAPH_NODES.value(),
         max_artifacts=PREFECT_API_MAX_FLOW_RUN_GRAPH_ARTIFACTS.value(),
+        updated_since=updated_since,
     )
 
 
@@ -11,6 +11,7 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
+import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 
@@ -285,6 +286,10 @@ async def delete_flow(
     Returns:
         bool: whether or not the flow was deleted
     """
+    # the flow's runs are deleted with it
+    await models.run_history_rollups.mark_flow_runs_stale(
+        session, db.FlowRun.flow_id == flow_id
+    )
 
     result = await session.execute(delete(db.Flow).where(db.Flow.id == flow_id))
     return result.rowcount > 0
@@ -0,0 +1,450 @@
+"""
+Functions for maintaining and reading pre-aggregated run history.
+
+Runs in a terminal state are counted per minute in the `run_history_rollup` table, by
+state, flow, deployment and work queue, so that run history can be read from the
+rollups rather than by aggregating the run tables on every request.  The rollups are
+kept up to date by the `RunHistoryRollups` service, which recomputes every minute
+containing a run updated since it last ran.  Changes that don't update a run, such as
+deleting it or clearing its work queue, mark the minutes it was counted in as stale
+for the service to recompute.
+
+Because the rollups lag behind the run tables, readers combine the two: runs that are
+not in a terminal state, and all runs in minutes at or after the rollup "frontier",
+are read from the run tables, and everything else is read from the rollups.  The
+frontier is no later than the earliest stale minute.
+"""
+
+import datetime
+from typing import Literal, Optional, Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import visitors
+
+from prefect.server import schemas
+from prefect.server.database import PrefectDBInterface, db_injector, orm_models
+from prefect.server.models import configuration
+from prefect.settings import get_current_settings
+from prefect.types._datetime import parse_datetime
+
+ROLLUP_INTERVAL = datetime.timedelta(minutes=1)
+
+# Runs are found by their `updated` timestamps, which are taken when a transaction
+# starts rather than when it commits, so each pass looks back this far before the
+# last one to find runs whose transactions committed after it
+WATERMARK_OVERLAP = datetime.timedelta(minutes=1)
+
+WATERMARKS_CONFIGURATION_KEY = "run_history_rollups"
+
+# the run type and timestamp that each series of rollups is counted by
+SERIES: dict[str, tuple[Literal["flow_run", "task_run"], str]] = {
+    "flow_run": ("flow_run", "expected_start_time"),
+    "task_run": ("task_run", "expected_start_time"),
+    "task_run_start_time": ("task_run", "start_time"),
+}
+
+NON_TERMINAL_STATES = [
+    state_type
+    for state_type in schemas.states.StateType
+    if state_type not in schemas.states.TERMINAL_STATES
+]
+
+
+def is_aligned(dt: datetime.datetime) -> bool:
+    """Whether a timestamp falls on the start of a rollup interval"""
+    return dt.second == 0 and dt.microsecond == 0
+
+
+def _series_columns(
+    db: PrefectDBInterface, series: str
+) -> tuple[Union[type[orm_models.FlowRun], type[orm_models.TaskRun]], sa.Column]:
+    run_type, timestamp = SERIES[series]
+    model = db.FlowRun if run_type == "flow_run" else db.TaskRun
+    return model, getattr(model, timestamp)
+
+
+@db_injector
+async def read_watermarks(
+    db: PrefectDBInterface, session: AsyncSession
+) -> dict[str, datetime.datetime]:
+    """
+    Reads the latest run update that each series of rollups includes.
+
+    The configuration table is read directly, rather than through its cache, because
+    the watermarks are written by the service, which may run in another process.
+    """
+    value = await session.scalar(
+        sa.select(db.Configuration.value).where(
+            db.Configuration.key == WATERMARKS_CONFIGURATION_KEY
+        )
+    )
+    return {
+        series: parse_datetime(watermark) for series, watermark in (value or {}).items()
+    }
+
+
+async def write_watermarks(
+    session: AsyncSession, watermarks: dict[str, datetime.datetime]
+) -> None:
+    """Records the latest run update that each series of rollups includes."""
+    await configuration.write_configuration(
+        session=session,
+        configuration=schemas.core.Configuration(
+            key=WATERMARKS_CONFIGURATION_KEY,
+            value={
+                series: watermark.isoformat()
+                for series, watermark in watermarks.items()
+            },
+        ),
+    )
+
+
+@db_injector
+async def read_updated_intervals(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    series: str,
+    since: Optional[datetime.datetime] = None,
+) -> tuple[Optional[datetime.datetime], list[datetime.datetime]]:
+    """
+    Finds the minutes containing runs of a series that were updated after `since`.
+
+    Args:
+        session: a database session
+        series: the series of rollups
+        since: only consider runs updated after this time, or all runs if None
+
+    Returns:
+        The latest update that was considered, to be recorded as the series'
+        watermark once the minutes have been refreshed, and the start of each minute.
+    """
+    model, timestamp = _series_columns(db, series)
+    updated_since = [model.updated > since] if since else []
+
+    until = await session.scalar(
+        sa.select(sa.func.max(model.updated)).where(*updated_since)
+    )
+    if until is None:
+        return None, []
+
+    interval_start = sa.func.date_trunc_minute(timestamp)
+    result = await session.execute(
+        sa.select(interval_start)
+        .where(*updated_since, model.updated <= until, timestamp.is_not(None))
+        .distinct()
+        .order_by(interval_start)
+    )
+    return until, list(result.scalars())
+
+
+@db_injector
+async def mark_flow_runs_stale(
+    db: PrefectDBInterface, session: AsyncSession, *where: sa.ColumnElement[bool]
+) -> None:
+    """
+    Marks the minutes that the flow runs matching `where`, and their task runs, are
+    counted in as stale.  Must be called before the runs are deleted or changed, in
+    the same transaction.
+
+    Args:
+        session: a database session
+        where: filters on the flow run table
+    """
+    if not get_current_settings().server.services.run_history_rollups.enabled:
+        return
+
+    flow_run_ids = sa.select(db.FlowRun.id).where(*where)
+    for series, (run_type, _) in SERIES.items():
+        model, timestamp = _series_columns(db, series)
+        await _mark_stale(
+            session,
+            series,
+            timestamp,
+            model.id.in_(flow_run_ids)
+            if run_type == "flow_run"
+            else model.flow_run_id.in_(flow_run_ids),
+        )
+
+
+@db_injector
+async def mark_task_runs_stale(
+    db: PrefectDBInterface, session: AsyncSession, *where: sa.ColumnElement[bool]
+) -> None:
+    """
+    Marks the minutes that the task runs matching `where` are counted in as stale.
+    Must be called before the runs are deleted or changed, in the same transaction.
+
+    Args:
+        session: a database session
+        where: filters on the task run table
+    """
+    if not get_current_settings().server.services.run_history_rollups.enabled:
+        return
+
+    for series, (run_type, _) in SERIES.items():
+        if run_type == "task_run":
+            _, timestamp = _series_columns(db, series)
+            await _mark_stale(session, series, timestamp, *where)
+
+
+@db_injector
+async def _mark_stale(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    series: str,
+    timestamp: sa.Column,
+    *where: sa.ColumnElement[bool],
+) -> None:
+    interval_start = sa.func.date_trunc_minute(timestamp)
+    result = await session.execute(
+        sa.select(interval_start).where(*where, timestamp.is_not(None)).distinct()
+    )
+    rows = [{"series": series, "interval_start": start} for start in result.scalars()]
+    if rows:
+        await session.execute(
+            db.queries.insert(db.RunHistoryRollupStaleInterval).on_conflict_do_nothing(
+                index_elements=["series", "interval_start"]
+            ),
+            rows,
+        )
+
+
+@db_injector
+async def read_stale_intervals(
+    db: PrefectDBInterface, session: AsyncSession, series: str
+) -> list[datetime.datetime]:
+    """Finds the start of each minute of a series that is marked as stale."""
+    StaleInterval = db.RunHistoryRollupStaleInterval
+    result = await session.execute(
+        sa.select(StaleInterval.interval_start)
+        .where(StaleInterval.series == series)
+        .order_by(StaleInterval.interval_start)
+    )
+    return list(result.scalars())
+
+
+@db_injector
+async def refresh_intervals(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    series: str,
+    interval_starts: Sequence[datetime.datetime],
+) -> None:
+    """
+    Recomputes the rollups of a series for the minutes starting at the given times.
+
+    Args:
+        session: a database session
+        series: the series of rollups
+        interval_starts: the start of each minute to recompute, in ascending order
+    """
+    if not interval_starts:
+        return
+
+    RunHistoryRollup = db.RunHistoryRollup
+    await session.execute(
+        sa.delete(RunHistoryRollup).where(
+            RunHistoryRollup.series == series,
+            RunHistoryRollup.interval_start.in_(interval_starts),
+        )
+    )
+    StaleInterval = db.RunHistoryRollupStaleInterval
+    await session.execute(
+        sa.delete(StaleInterval).where(
+            StaleInterval.series == series,
+            StaleInterval.interval_start.in_(interval_starts),
+        )
+    )
+
+    model, timestamp = _series_columns(db, series)
+    interval_start = sa.func.date_trunc_minute(timestamp)
+    flow_run = db.FlowRun
+    query = sa.select(
+        interval_start.label("interval_start"),
+        model.state_type,
+        model.state_name,
+        flow_run.flow_id,
+        flow_run.deployment_id,
+        flow_run.work_queue_id,
+        sa.func.count(model.id).label("count_runs"),
+        # a run's estimated run time is its total run time once it is finished
+        sa.func.sum(
+            sa.func.greatest(0, sa.extract("epoch", model.total_run_time))
+        ).label("sum_estimated_run_time"),
+        sa.func.sum(
+            sa.func.greatest(0, sa.extract("epoch", model.estimated_start_time_delta))
+        ).label("sum_estimated_lateness"),
+    )
+    if model is db.TaskRun:
+        query = query.select_from(model).join(
+            flow_run, flow_run.id == model.flow_run_id, isouter=True
+        )
+    query = query.where(
+        timestamp >= interval_starts[0],
+        timestamp < interval_starts[-1] + ROLLUP_INTERVAL,
+        interval_start.in_(interval_starts),
+        model.state_type.in_(schemas.states.TERMINAL_STATES),
+    ).group_by(
+        interval_start,
+        model.state_type,
+        model.state_name,
+        flow_run.flow_id,
+        flow_run.deployment_id,
+        flow_run.work_queue_id,
+    )
+
+    rows = (await session.execute(query)).mappings().all()
+    if rows:
+        await session.execute(
+            sa.insert(RunHistoryRollup), [{**row, "series": series} for row in rows]
+        )
+
+
+@db_injector
+async def read_rollup_frontier(
+    db: PrefectDBInterface, session: AsyncSession, series: str
+) -> Optional[datetime.datetime]:
+    """
+    Finds the start of the earliest minute whose rollups may be missing changes to
+    its runs, either because they were updated after the series' watermark or
+    because the minute is marked as stale.  Runs in that minute or later must be
+    read from the run tables.
+
+    Returns None if rollups are disabled or have not yet been computed for the
+    series, in which case all runs must be read from the run tables.
+    """
+    if not get_current_settings().server.services.run_history_rollups.enabled:
+        return None
+
+    watermark = (await read_watermarks(session=session)).get(series)
+    if watermark is None:
+        return None
+
+    model, timestamp = _series_columns(db, series)
+    earliest_change = await session.scalar(
+        sa.select(sa.func.min(timestamp)).where(
+            model.updated > watermark - WATERMARK_OVERLAP
+        )
+    )
+    StaleInterval = db.RunHistoryRollupStaleInterval
+    earliest_stale = await session.scalar(
+        sa.select(sa.func.min(StaleInterval.interval_start)).where(
+            StaleInterval.series == series
+        )
+    )
+    frontier = min(earliest_change or watermark, earliest_stale or watermark, watermark)
+    return frontier.astimezone(datetime.timezone.utc).replace(second=0, microsecond=0)
+
+
+def _can_roll_up(
+    run_filter: Union[schemas.filters.FlowRunFilter, schemas.filters.TaskRunFilter],
+    timestamp: str,
+    window_start: datetime.datetime,
+    window_end: datetime.datetime,
+) -> bool:
+    for field in type(run_filter).model_fields:
+        if field not in ("operator", "state", timestamp):
+            if getattr(run_filter, field) is not None:
+                return False
+
+    timestamp_filter = getattr(run_filter, timestamp)
+    if timestamp_filter is None:
+        return True
+    if getattr(timestamp_filter, "is_null_", None) is not None:
+        return False
+
+    after, before = timestamp_filter.after_, timestamp_filter.before_
+    # bounds outside of the window don't exclude any runs within it, and bounds within
+    # it only exclude whole minutes if they fall on minute boundaries
+    return (after is None or after <= window_start or is_aligned(after)) and (
+        before is None
+        or before >= window_end
+        or is_aligned(before + datetime.timedelta(microseconds=1))
+    )
+
+
+@db_injector
+def rollup_filters(
+    db: PrefectDBInterface,
+    series: str,
+    window_start: datetime.datetime,
+    window_end: datetime.datetime,
+    flow_filter: Optional[schemas.filters.FlowFilter] = None,
+    flow_run_filter: Optional[schemas.filters.FlowRunFilter] = None,
+    task_run_filter: Optional[schemas.filters.TaskRunFilter] = None,
+    deployment_filter: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pool_filter: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_queue_filter: Optional[schemas.filters.WorkQueueFilter] = None,
+) -> Optional[list[sa.ColumnElement[bool]]]:
+    """
+    Translates filters on runs to the equivalent filters on the rollups of a series
+    between two minute boundaries.
+
+    Returns None if the rollups can't be filtered exactly the same way, for example
+    because the filters refer to run names or tags, which aren't rolled up.
+    """
+    RunHistoryRollup = db.RunHistoryRollup
+    model, timestamp = _series_columns(db, series)
+    run_filter, other_run_filter = (
+        (flow_run_filter, task_run_filter)
+        if model is db.FlowRun
+        else (task_run_filter, flow_run_filter)
+    )
+    if other_run_filter is not None:
+        return None
+
+    filters: list[sa.ColumnElement[bool]] = [
+        RunHistoryRollup.series == series,
+        RunHistoryRollup.interval_start >= window_start,
+        RunHistoryRollup.interval_start < window_end,
+    ]
+
+    if run_filter is not None:
+        if not _can_roll_up(run_filter, timestamp.key, window_start, window_end):
+            return None
+        rollup_columns = {
+            "state_type": RunHistoryRollup.state_type,
+            "state_name": RunHistoryRollup.state_name,
+            timestamp.key: RunHistoryRollup.interval_start,
+        }
+
+        def to_rollup_column(element: visitors.ExternallyTraversible):
+            if isinstance(element, sa.Column) and element.table is model.__table__:
+                return rollup_columns[element.key].expression
+            return None
+
+        filters.append(
+            visitors.replacement_traverse(
+                run_filter.as_sql_filter(), {}, to_rollup_column
+            )
+        )
+
+    if flow_filter is not None:
+        filters.append(
+            RunHistoryRollup.flow_id.in_(
+                sa.select(db.Flow.id).where(flow_filter.as_sql_filter())
+            )
+        )
+    if deployment_filter is not None:
+        filters.append(
+            RunHistoryRollup.deployment_id.in_(
+                sa.select(db.Deployment.id).where(deployment_filter.as_sql_filter())
+            )
+        )
+    if work_queue_filter is not None:
+        filters.append(
+            RunHistoryRollup.work_queue_id.in_(
+                sa.select(db.WorkQueue.id).where(work_queue_filter.as_sql_filter())
+            )
+        )
+    if work_pool_filter is not None:
+        filters.append(
+            RunHistoryRollup.work_queue_id.in_(
+                sa.select(db.WorkQueue.id)
+                .join(db.WorkPool, db.WorkPool.id == db.WorkQueue.work_pool_id)
+                .where(work_pool_filter.as_sql_filter())
+            )
+        )
+
+    return filters
@@ -455,6 +455,9 @@ async def delete_task_run(
     Returns:
         bool: whether or not the task run was deleted
     """
+    await models.run_history_rollups.mark_task_runs_stale(
+        session, db.TaskRun.id == task_run_id
+    )
 
     result = await session.execute(
         delete(db.TaskRun).where(db.TaskRun.id == task_run_id)
@@ -298,6 +298,11 @@ async def delete_work_queue(
     Returns:
         bool: whether or not the WorkQueue was deleted
     """
+    # the queue's runs are left without a work queue
+    await models.run_history_rollups.mark_flow_runs_stale(
+        session, db.FlowRun.work_queue_id == work_queue_id
+    )
+
     result = await session.execute(
         delete(db.WorkQueue).where(db.WorkQueue.id == work_queue_id)
     )
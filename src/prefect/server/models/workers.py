@@ -19,6 +19,7 @@ import sqlalchemy as sa
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect._internal.uuid7 import uuid7
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
@@ -282,6 +283,13 @@ async def delete_work_pool(
     Returns:
         bool: whether or not the WorkPool was deleted
     """
+    # the pool's queues are deleted with it, leaving their runs without a work queue
+    await models.run_history_rollups.mark_flow_runs_stale(
+        session,
+        db.FlowRun.work_queue_id.in_(
+            sa.select(db.WorkQueue.id).where(db.WorkQueue.work_pool_id == work_pool_id)
+        ),
+    )
 
     result = await session.execute(
         delete(db.WorkPool).where(db.WorkPool.id == work_pool_id)
@@ -664,6 +672,11 @@ async def delete_work_queue(
     if work_queue is None:
         return False
 
+    # the queue's runs are left without a work queue
+    await models.run_history_rollups.mark_flow_runs_stale(
+        session, db.FlowRun.work_queue_id == work_queue_id
+    )
+
     await session.delete(work_queue)
     try:
         await session.flush()
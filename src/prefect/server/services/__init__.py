@@ -5,3 +5,4 @@ import prefect.server.services.pause_expirations
 import prefect.server.services.scheduler
 import prefect.server.services.telemetry
 import prefect.server.services.repossessor
+import prefect.server.services.run_history_rollups
@@ -43,6 +43,7 @@ def _known_service_modules() -> list[ModuleType]:
         late_runs,
         pause_expirations,
         repossessor,
+        run_history_rollups,
         scheduler,
         task_run_recorder,
         telemetry,
@@ -55,6 +56,7 @@ def _known_service_modules() -> list[ModuleType]:
         late_runs,
         pause_expirations,
         repossessor,
+        run_history_rollups,
         scheduler,
         task_run_recorder,
         telemetry,
@@ -0,0 +1,91 @@
+"""
+The RunHistoryRollups service. Responsible for keeping the per-minute rollups of
+finished runs that answer run history and dashboard queries up to date.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import prefect.server.models as models
+from prefect.server.database import PrefectDBInterface
+from prefect.server.database.dependencies import db_injector
+from prefect.server.services.base import LoopService
+from prefect.settings.context import get_current_settings
+from prefect.settings.models.server.services import ServicesBaseSetting
+
+
+class RunHistoryRollups(LoopService):
+    """
+    Recomputes the run history rollups for every minute containing a flow or task run
+    that was updated since the service last ran, and every minute marked as stale.
+
+    The first time the service runs, it rolls up the whole history of runs.
+    """
+
+    @classmethod
+    def service_settings(cls) -> ServicesBaseSetting:
+        return get_current_settings().server.services.run_history_rollups
+
+    def __init__(self, loop_seconds: float | None = None, **kwargs: Any):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or get_current_settings().server.services.run_history_rollups.loop_seconds,
+            **kwargs,
+        )
+
+        # recompute this many minutes of rollups in each transaction
+        self.batch_size = 500
+
+    @db_injector
+    async def run_once(self, db: PrefectDBInterface) -> None:
+        async with db.session_context() as session:
+            watermarks = await models.run_history_rollups.read_watermarks(
+                session=session
+            )
+
+        for series in models.run_history_rollups.SERIES:
+            watermark = watermarks.get(series)
+            async with db.session_context() as session:
+                (
+                    until,
+                    interval_starts,
+                ) = await models.run_history_rollups.read_updated_intervals(
+                    session=session,
+                    series=series,
+                    since=(
+                        watermark - models.run_history_rollups.WATERMARK_OVERLAP
+                        if watermark
+                        else None
+                    ),
+                )
+                stale_interval_starts = (
+                    await models.run_history_rollups.read_stale_intervals(
+                        session=session, series=series
+                    )
+                )
+            interval_starts = sorted({*interval_starts, *stale_interval_starts})
+
+            for i in range(0, len(interval_starts), self.batch_size):
+                async with db.session_context(begin_transaction=True) as session:
+                    await models.run_history_rollups.refresh_intervals(
+                        session=session,
+                        series=series,
+                        interval_starts=interval_starts[i : i + self.batch_size],
+                    )
+
+            if until is not None and (watermark is None or until > watermark):
+                watermarks[series] = until
+                self.logger.debug(
+                    "Rolled up %d minutes of %s history.", len(interval_starts), series
+                )
+
+        async with db.session_context(begin_transaction=True) as session:
+            await models.run_history_rollups.write_watermarks(
+                session=session, watermarks=watermarks
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(RunHistoryRollups(handle_signals=True).start())
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import time
 from typing import Any, Sequence
 from uuid import UUID
 
@@ -71,6 +72,9 @@ class Scheduler(LoopService):
         self.insert_batch_size: int = (
             PREFECT_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE.value()
         )
+        # the time spent in each phase of the most recent loop, in seconds, along
+        # with the number of deployments and runs it handled
+        self.last_loop_timings: dict[str, float] = {}
 
     @db_injector
     async def run_once(self, db: PrefectDBInterface) -> None:
@@ -84,7 +88,10 @@ class Scheduler(LoopService):
         All inserted flow runs are committed to the database at the termination of the
         loop.
         """
+        timings = dict.fromkeys(("select", "generate", "insert"), 0.0)
+        total_deployments = 0
         total_inserted_runs = 0
+        loop_start = time.perf_counter()
 
         last_id = None
         while True:
@@ -95,24 +102,33 @@ class Scheduler(LoopService):
                 if last_id:
                     query = query.where(db.Deployment.id > last_id)
 
+                start = time.perf_counter()
                 result = await session.execute(query)
                 deployment_ids = result.scalars().unique().all()
+                timings["select"] += time.perf_counter() - start
 
                 # collect runs across all deployments
+                start = time.perf_counter()
                 try:
                     runs_to_insert = await self._collect_flow_runs(
                         session=session, deployment_ids=deployment_ids
                     )
                 except TryAgain:
                     continue
+                finally:
+                    timings["generate"] += time.perf_counter() - start
+
+            total_deployments += len(deployment_ids)
 
             # bulk insert the runs based on batch size setting
+            start = time.perf_counter()
             for batch in batched_iterable(runs_to_insert, self.insert_batch_size):
                 async with db.session_context(begin_transaction=True) as session:
                     inserted_runs = await self._insert_scheduled_flow_runs(
                         session=session, runs=list(batch)
                     )
                     total_inserted_runs += len(inserted_runs)
+            timings["insert"] += time.perf_counter() - start
 
             # if this is the last page of deployments, exit the loop
             if len(deployment_ids) < self.deployment_batch_size:
@@ -121,7 +137,18 @@ class Scheduler(LoopService):
                 # record the last deployment ID
                 last_id = deployment_ids[-1]
 
-        self.logger.info(f"Scheduled {total_inserted_runs} runs.")
+        timings["total"] = time.perf_counter() - loop_start
+        self.last_loop_timings = {
+            **timings,
+            "deployments": total_deployments,
+            "runs": total_inserted_runs,
+        }
+        self.logger.info(
+            f"Scheduled {total_inserted_runs} runs for {total_deployments} "
+            f"deployments in {timings['total']:.3f}s (selecting: "
+            f"{timings['select']:.3f}s, generating: {timings['generate']:.3f}s, "
+            f"inserting: {timings['insert']:.3f}s)."
+        )
 
     @db_injector
     def _get_select_deployments_to_schedule_query(
@@ -192,6 +219,41 @@ class Scheduler(LoopService):
         self,
         session: sa.orm.Session,
         deployment_ids: Sequence[UUID],
+    ) -> list[dict[str, Any]]:
+        if (
+            type(self)._generate_scheduled_flow_runs
+            is not Scheduler._generate_scheduled_flow_runs
+        ):
+            # Keep honoring overrides of the per-deployment hook
+            return await self._collect_flow_runs_per_deployment(
+                session=session, deployment_ids=deployment_ids
+            )
+
+        right_now = now("UTC")
+        # guard against erroneously configured schedules; errors for individual
+        # deployments are logged and skipped while generating their runs
+        try:
+            return await self._generate_scheduled_flow_runs_for_deployments(
+                session=session,
+                deployment_ids=deployment_ids,
+                start_time=right_now,
+                end_time=right_now + self.max_scheduled_time,
+                min_time=self.min_scheduled_time,
+                min_runs=self.min_runs,
+                max_runs=self.max_runs,
+            )
+        except Exception:
+            self.logger.exception(
+                f"Error scheduling deployments {list(deployment_ids)!r}.",
+            )
+            return []
+        finally:
+            await self._rollback_if_invalidated(session)
+
+    async def _collect_flow_runs_per_deployment(
+        self,
+        session: sa.orm.Session,
+        deployment_ids: Sequence[UUID],
     ) -> list[dict[str, Any]]:
         runs_to_insert: list[dict[str, Any]] = []
         for deployment_id in deployment_ids:
@@ -214,27 +276,30 @@ class Scheduler(LoopService):
                     f"Error scheduling deployment {deployment_id!r}.",
                 )
             finally:
-                connection = await session.connection()
-                if connection.invalidated:
-                    # If the error we handled above was the kind of database error that
-                    # causes underlying transaction to rollback and the connection to
-                    # become invalidated, rollback this session.  Errors that may cause
-                    # this are connection drops, database restarts, and things of the
-                    # sort.
-                    #
-                    # This rollback _does not rollback a transaction_, since that has
-                    # actually already happened due to the error above.  It brings the
-                    # Python session in sync with underlying connection so that when we
-                    # exec the outer with block, the context manager will not attempt to
-                    # commit the session.
-                    #
-                    # Then, raise TryAgain to break out of these nested loops, back to
-                    # the outer loop, where we'll begin a new transaction with
-                    # session.begin() in the next loop iteration.
-                    await session.rollback()
-                    raise TryAgain()
+                await self._rollback_if_invalidated(session)
         return runs_to_insert
 
+    async def _rollback_if_invalidated(self, session: sa.orm.Session) -> None:
+        connection = await session.connection()
+        if connection.invalidated:
+            # If the error we handled above was the kind of database error that
+            # causes underlying transaction to rollback and the connection to
+            # become invalidated, rollback this session.  Errors that may cause
+            # this are connection drops, database restarts, and things of the
+            # sort.
+            #
+            # This rollback _does not rollback a transaction_, since that has
+            # actually already happened due to the error above.  It brings the
+            # Python session in sync with underlying connection so that when we
+            # exec the outer with block, the context manager will not attempt to
+            # commit the session.
+            #
+            # Then, raise TryAgain to break out of these nested loops, back to
+            # the outer loop, where we'll begin a new transaction with
+            # session.begin() in the next loop iteration.
+            await session.rollback()
+            raise TryAgain()
+
     @db_injector
     async def _generate_scheduled_flow_runs(
         self,
@@ -251,7 +316,9 @@ class Scheduler(LoopService):
         Given a `deployment_id` and schedule params, generates a list of flow run
         objects and associated scheduled states that represent scheduled flow runs.
 
-        Pass-through method for overrides.
+        Pass-through method for overrides. When a subclass overrides it, the scheduler
+        generates runs one deployment at a time through it instead of calling
+        `_generate_scheduled_flow_runs_for_deployments`.
 
 
         Args:
@@ -285,6 +352,58 @@ class Scheduler(LoopService):
             max_runs=max_runs,
         )
 
+    @db_injector
+    async def _generate_scheduled_flow_runs_for_deployments(
+        self,
+        db: PrefectDBInterface,
+        session: sa.orm.Session,
+        deployment_ids: Sequence[UUID],
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        min_time: datetime.timedelta,
+        min_runs: int,
+        max_runs: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Given a page of `deployment_ids` and schedule params, generates a list of flow
+        run objects and associated scheduled states that represent scheduled flow runs.
+        The deployments and their schedules are loaded together, and identical
+        schedules are only expanded once per page.
+
+        Pass-through method for overrides.
+
+
+        Args:
+            session: a database session
+            deployment_ids: the ids of the deployments to schedule
+            start_time: the time from which to start scheduling runs
+            end_time: runs will be scheduled until at most this time
+            min_time: runs will be scheduled until at least this far in the future
+            min_runs: a minimum amount of runs to schedule
+            max_runs: a maximum amount of runs to schedule
+
+        This function will generate the minimum number of runs that satisfy the min
+        and max times, and the min and max counts. Specifically, the following order
+        will be respected:
+
+            - Runs will be generated starting on or after the `start_time`
+            - No more than `max_runs` runs will be generated
+            - No runs will be generated after `end_time` is reached
+            - At least `min_runs` runs will be generated
+            - Runs will be generated until at least `start_time + min_time` is reached
+
+        """
+        return await models.deployments._generate_scheduled_flow_runs_for_deployments(
+            db,
+            session=session,
+            deployment_ids=deployment_ids,
+            start_time=start_time,
+            end_time=end_time,
+            min_time=min_time,
+            min_runs=min_runs,
+            max_runs=max_runs,
+        )
+
     async def _insert_scheduled_flow_runs(
         self,
         session: sa.orm.Session,
@@ -292,7 +411,7 @@ class Scheduler(LoopService):
     ) -> Sequence[UUID]:
         """
         Given a list of flow runs to schedule, as generated by
-        `_generate_scheduled_flow_runs`, inserts them into the database. Note this is a
+        `_generate_scheduled_flow_runs_for_deployments`, inserts them into the database. Note this is a
         separate method to facilitate batch operations on many scheduled runs.
 
         Pass-through method for overrides.
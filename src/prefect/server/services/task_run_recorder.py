@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, AsyncGenerator, NoReturn, Optional
+from datetime import timedelta
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, AsyncGenerator, NoReturn, Optional, Sequence
 from uuid import UUID
 
+import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import prefect.server.models as models
 from prefect.logging import get_logger
 from prefect.server.database import (
     PrefectDBInterface,
@@ -45,24 +49,139 @@ def causal_ordering() -> CausalOrdering:
 
 
 @db_injector
-async def _insert_task_run_state(
-    db: PrefectDBInterface, session: AsyncSession, task_run: TaskRun
+async def _insert_task_run_states(
+    db: PrefectDBInterface, session: AsyncSession, task_runs: Sequence[TaskRun]
 ):
-    if TYPE_CHECKING:
-        assert task_run.state is not None
-    await session.execute(
-        db.queries.insert(db.TaskRunState)
-        .values(
-            created=now("UTC"),
-            task_run_id=task_run.id,
-            **task_run.state.model_dump(),
+    created = now("UTC")
+    states: list[dict[str, Any]] = []
+    for task_run in task_runs:
+        if TYPE_CHECKING:
+            assert task_run.state is not None
+        states.append(
+            {
+                "created": created,
+                "task_run_id": task_run.id,
+                **task_run.state.model_dump(),
+            }
         )
-        .on_conflict_do_nothing(
+
+    # rows are matched to the table's columns by name; the ORM entity would match
+    # them by attribute name instead, and silently drop `data`, whose attribute is
+    # named `_data`
+    await session.execute(
+        db.queries.insert(db.TaskRunState.__table__).on_conflict_do_nothing(
             index_elements=[
                 "id",
             ]
+        ),
+        states,
+    )
+
+
+@db_injector
+async def _upsert_task_runs(
+    db: PrefectDBInterface, session: AsyncSession, task_runs: Sequence[TaskRun]
+):
+    """
+    Upserts the given task runs, collapsing multiple transitions of the same task run
+    into one row as if they had been applied in the order of their state timestamps.
+    Rows only update task runs whose current state is older than theirs.
+    """
+    collapsed: dict[UUID, dict[str, Any]] = {}
+    for attributes in sorted(
+        map(_task_run_attributes, task_runs), key=itemgetter("state_timestamp")
+    ):
+        collapsed.setdefault(attributes["id"], {}).update(attributes)
+
+    await _mark_moved_task_runs_stale(session, list(collapsed.values()))
+
+    # the rows of one statement must all have the same columns, and the columns that
+    # an event didn't set must not be updated, so rows are upserted by their columns
+    rows_by_columns: dict[frozenset[str], list[dict[str, Any]]] = {}
+    created = now("UTC")
+    for attributes in collapsed.values():
+        rows_by_columns.setdefault(frozenset(attributes), []).append(
+            {**attributes, "created": created}
+        )
+
+    for columns, rows in rows_by_columns.items():
+        insert = db.queries.insert(db.TaskRun)
+        await session.execute(
+            insert.on_conflict_do_update(
+                index_elements=["id"],
+                set_={
+                    "updated": now("UTC"),
+                    **{
+                        column: getattr(insert.excluded, column)
+                        for column in sorted(columns - {"id"})
+                    },
+                },
+                where=db.TaskRun.state_timestamp < insert.excluded.state_timestamp,
+            ),
+            rows,
         )
+
+
+@db_injector
+async def _mark_moved_task_runs_stale(
+    db: PrefectDBInterface, session: AsyncSession, rows: Sequence[dict[str, Any]]
+):
+    """
+    Marks the run history rollups of task runs whose timestamps will be changed by
+    the given rows as stale, since they'll no longer be counted in the same minutes.
+    """
+    if not get_current_settings().server.services.run_history_rollups.enabled:
+        return
+
+    rows_by_id = {row["id"]: row for row in rows}
+    timestamps = ["expected_start_time", "start_time"]
+    existing = await session.execute(
+        sa.select(
+            db.TaskRun.id,
+            db.TaskRun.state_timestamp,
+            *(getattr(db.TaskRun, timestamp) for timestamp in timestamps),
+        ).where(db.TaskRun.id.in_(rows_by_id))
     )
+    moved: list[UUID] = []
+    for task_run in existing:
+        row = rows_by_id[task_run.id]
+        if (
+            task_run.state_timestamp is not None
+            and task_run.state_timestamp >= row["state_timestamp"]
+        ):
+            # the row won't be applied by the upsert
+            continue
+        if any(
+            timestamp in row and row[timestamp] != getattr(task_run, timestamp)
+            for timestamp in timestamps
+        ):
+            moved.append(task_run.id)
+    if moved:
+        await models.run_history_rollups.mark_task_runs_stale(
+            session, db.TaskRun.id.in_(moved)
+        )
+
+
+def _task_run_attributes(task_run: TaskRun) -> dict[str, Any]:
+    assert task_run.state
+
+    return {
+        **task_run.model_dump_for_orm(
+            exclude={
+                "state_id",
+                "state",
+                "created",
+                "estimated_run_time",
+                "estimated_start_time_delta",
+            },
+            exclude_unset=True,
+        ),
+        # denormalized state attributes
+        "state_id": task_run.state.id,
+        "state_type": task_run.state.type,
+        "state_name": task_run.state.name,
+        "state_timestamp": task_run.state.timestamp,
+    }
 
 
 def task_run_from_event(event: ReceivedEvent) -> TaskRun:
@@ -94,74 +213,101 @@ def task_run_from_event(event: ReceivedEvent) -> TaskRun:
 
 
 async def record_task_run_event(event: ReceivedEvent) -> None:
-    task_run = task_run_from_event(event)
-
-    task_run_attributes = task_run.model_dump_for_orm(
-        exclude={
-            "state_id",
-            "state",
-            "created",
-            "estimated_run_time",
-            "estimated_start_time_delta",
-        },
-        exclude_unset=True,
-    )
+    await record_task_run_events([event])
 
-    assert task_run.state
 
-    denormalized_state_attributes = {
-        "state_id": task_run.state.id,
-        "state_type": task_run.state.type,
-        "state_name": task_run.state.name,
-        "state_timestamp": task_run.state.timestamp,
-    }
+async def record_task_run_events(events: Sequence[ReceivedEvent]) -> None:
+    """
+    Records the task runs and states from the given events in one transaction, with
+    one multi-row upsert of the task runs and one multi-row insert of their states.
+    """
+    task_runs = [task_run_from_event(event) for event in events]
 
     db = provide_database_interface()
     async with db.session_context() as session:
-        # Combine all attributes for a single atomic operation
-        all_attributes = {
-            **task_run_attributes,
-            **denormalized_state_attributes,
-            "created": now("UTC"),
-        }
+        await _upsert_task_runs(session, task_runs)
 
-        # Single atomic INSERT ... ON CONFLICT DO UPDATE
-        await session.execute(
-            db.queries.insert(db.TaskRun)
-            .values(**all_attributes)
-            .on_conflict_do_update(
-                index_elements=["id"],
-                set_={
-                    "updated": now("UTC"),
-                    **task_run_attributes,
-                    **denormalized_state_attributes,
-                },
-                where=db.TaskRun.state_timestamp < task_run.state.timestamp,
-            )
-        )
-
-        # Still need to insert the task_run_state separately
-        await _insert_task_run_state(session, task_run)
+        # Every state is recorded, even those collapsed out of the task run upsert
+        await _insert_task_run_states(session, task_runs)
 
         await session.commit()
 
-    logger.debug(
-        "Recorded task run state change",
-        extra={
-            "task_run_id": task_run.id,
-            "flow_run_id": task_run.flow_run_id,
-            "event_id": event.id,
-            "event_follows": event.follows,
-            "event": event.event,
-            "occurred": event.occurred,
-            "current_state_type": task_run.state_type,
-            "current_state_name": task_run.state_name,
-        },
-    )
+    for event, task_run in zip(events, task_runs):
+        logger.debug(
+            "Recorded task run state change",
+            extra={
+                "task_run_id": task_run.id,
+                "flow_run_id": task_run.flow_run_id,
+                "event_id": event.id,
+                "event_follows": event.follows,
+                "event": event.event,
+                "occurred": event.occurred,
+                "current_state_type": task_run.state_type,
+                "current_state_name": task_run.state_name,
+            },
+        )
 
 
 @asynccontextmanager
-async def consumer() -> AsyncGenerator[MessageHandler, None]:
+async def consumer(
+    batch_size: int = 1,
+    flush_every: timedelta = timedelta(seconds=0.5),
+) -> AsyncGenerator[MessageHandler, None]:
+    """
+    Set up a message handler that records client-orchestrated task run events.
+
+    With the default `batch_size` of 1, each event is recorded before its message is
+    acknowledged.  With a larger `batch_size`, events are buffered and recorded every
+    `batch_size` events, or every `flush_every` interval to flush any remaining
+    events; if a batch can't be recorded, its events are retried one at a time.
+    """
+    queue: asyncio.Queue[ReceivedEvent] = asyncio.Queue()
+
+    async def record(event: ReceivedEvent) -> None:
+        try:
+            await record_task_run_event(event)
+        except EventArrivedEarly:
+            # We're safe to ACK this message because it has been parked by the
+            # causal ordering mechanism and will be reprocessed when the preceding
+            # event arrives.
+            pass
+
+    async def flush() -> None:
+        batch: list[ReceivedEvent] = []
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        if not batch:
+            return
+
+        logger.debug(f"Recording {len(batch)} task run events...")
+        try:
+            await record_task_run_events(batch)
+            return
+        except Exception:
+            logger.debug(
+                "Error recording task run events, recording them individually",
+                exc_info=True,
+            )
+
+        for event in batch:
+            try:
+                await record(event)
+            except Exception:
+                logger.exception(
+                    "Error recording task run event %s for %s",
+                    event.id,
+                    event.resource.get("prefect.resource.id"),
+                )
+
+    async def flush_periodically():
+        try:
+            while True:
+                await asyncio.sleep(flush_every.total_seconds())
+                if queue.qsize():
+                    await flush()
+        except asyncio.CancelledError:
+            return
+
     async def message_handler(message: Message):
         event: ReceivedEvent = ReceivedEvent.model_validate_json(message.data)
 
@@ -178,15 +324,26 @@ async def consumer() -> AsyncGenerator[MessageHandler, None]:
             event.resource.get("prefect.resource.id"),
         )
 
-        try:
-            await record_task_run_event(event)
-        except EventArrivedEarly:
-            # We're safe to ACK this message because it has been parked by the
-            # causal ordering mechanism and will be reprocessed when the preceding
-            # event arrives.
-            pass
+        if batch_size <= 1:
+            await record(event)
+            return
+
+        await queue.put(event)
+
+        if queue.qsize() >= batch_size:
+            await flush()
+
+    periodic_flush = (
+        asyncio.create_task(flush_periodically()) if batch_size > 1 else None
+    )
 
-    yield message_handler
+    try:
+        yield message_handler
+    finally:
+        if periodic_flush:
+            periodic_flush.cancel()
+        if queue.qsize():
+            await flush()
 
 
 class TaskRunRecorder(RunInAllServers, Service):
@@ -221,7 +378,11 @@ class TaskRunRecorder(RunInAllServers, Service):
             name=generate_unique_consumer_name("task-run-recorder"),
         )
 
-        async with consumer() as handler:
+        settings = get_current_settings().server.services.task_run_recorder
+        async with consumer(
+            batch_size=settings.batch_size,
+            flush_every=timedelta(seconds=settings.flush_interval),
+        ) as handler:
             self.consumer_task = asyncio.create_task(self.consumer.run(handler))
             self.metrics_task = asyncio.create_task(log_metrics_periodically())
 
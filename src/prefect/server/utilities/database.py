@@ -416,6 +416,18 @@ class date_diff_seconds(functions.GenericFunction[float]):
         super().__init__(*args, **kwargs)
 
 
+class date_trunc_minute(functions.GenericFunction[DateTime]):
+    """Platform-independent truncation of a timestamp to the start of its minute"""
+
+    type: Timestamp = Timestamp()
+    inherit_cache: bool = True
+
+    def __init__(
+        self, dt: _SQLExpressionOrLiteral[datetime.datetime], **kwargs: Any
+    ) -> None:
+        super().__init__(sa.type_coerce(dt, Timestamp()), **kwargs)
+
+
 # timestamp and interval arithmetic implementations for PostgreSQL
 
 
@@ -443,6 +455,19 @@ def date_diff_seconds_postgresql(
     return compiler.process(sa.func.extract("epoch", operator.sub(*as_utc)), **kwargs)
 
 
+@compiles(date_trunc_minute, "postgresql")
+def date_trunc_minute_postgresql(
+    element: date_trunc_minute, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    (dt,) = element.clauses
+    # literals rather than bound parameters, so that the expression is identical each
+    # time it appears in a query and can be grouped by
+    utc = sa.literal("UTC", literal_execute=True)
+    minute = sa.literal("minute", literal_execute=True)
+    truncated = sa.func.date_trunc(minute, sa.func.timezone(utc, dt))
+    return compiler.process(sa.func.timezone(utc, truncated), **kwargs)
+
+
 # SQLite implementations for the Timestamp and Interval arithmetic functions.
 #
 # The following concepts are at play here:
@@ -548,6 +573,19 @@ def date_diff_seconds_sqlite(
     return compiler.process(operator.sub(*as_jdn) * SECONDS_PER_DAY, **kwargs)
 
 
+@compiles(date_trunc_minute, "sqlite")
+def date_trunc_minute_sqlite(
+    element: date_trunc_minute, compiler: SQLCompiler, **kwargs: Any
+) -> str:
+    (dt,) = element.clauses
+    # truncate the stored ISO8601 string rather than going through julianday(), which
+    # rounds to the millisecond and could carry a timestamp over into the next minute
+    truncated = sa.func.substr(
+        dt, sa.literal(1, literal_execute=True), sa.literal(16, literal_execute=True)
+    ).concat(sa.literal(":00.000000", literal_execute=True))
+    return compiler.process(truncated, **kwargs)
+
+
 # PostgreSQL JSON(B) Comparator operators ported to SQLite
 
 
@@ -2,11 +2,13 @@
 Utilities for the Prefect REST API server.
 """
 
+import hashlib
+import zlib
 from collections.abc import Coroutine, Sequence
 from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING, Any, Callable, get_type_hints
 
-from fastapi import APIRouter, Request, Response, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.routing import APIRoute
 from starlette.routing import BaseRoute
 from starlette.routing import Route as StarletteRoute
@@ -27,6 +29,87 @@ def method_paths_from_routes(routes: Sequence[BaseRoute]) -> set[str]:
     return method_paths
 
 
+# The largest request body that will be accepted after decompression, guarding
+# against small compressed payloads that expand to exhaust memory
+MAX_DECOMPRESSED_REQUEST_BODY_SIZE = 64 * 1024 * 1024
+
+
+class GzipRequest(Request):
+    """
+    A request whose body was sent with `Content-Encoding: gzip` and is decompressed
+    when read.
+    """
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_decompressed_body"):
+            decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+            try:
+                body = decompressor.decompress(
+                    await super().body(), MAX_DECOMPRESSED_REQUEST_BODY_SIZE
+                )
+            except zlib.error:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid gzip-encoded request body.",
+                )
+            if decompressor.unconsumed_tail:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail="Decompressed request body is too large.",
+                )
+            self._decompressed_body = body
+        return self._decompressed_body
+
+
+def etag(body: bytes) -> str:
+    """
+    A weak entity tag for a response body, since the body may be sent with a different
+    content encoding
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, tag: str) -> bool:
+    """
+    Whether an `If-None-Match` header matches an entity tag, using the weak comparison
+    that HTTP requires for `If-None-Match`
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == tag.removeprefix("W/")
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_response(request: Request, response: Response) -> Response:
+    """
+    Tags a successful response to a `GET` request with an `ETag` of its body, and
+    replaces it with an empty `304 Not Modified` if the request's `If-None-Match`
+    header shows the client already has that body.
+    """
+    body = getattr(response, "body", None)
+    if (
+        request.method != "GET"
+        or response.status_code != status.HTTP_200_OK
+        or not isinstance(body, bytes)
+    ):
+        return response
+
+    tag = response.headers.setdefault("ETag", etag(body))
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, tag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in ("content-length", "content-type")
+            },
+        )
+    return response
+
+
 class PrefectAPIRoute(APIRoute):
     """
     A FastAPIRoute class which attaches an async stack to requests that exits before
@@ -37,12 +120,19 @@ class PrefectAPIRoute(APIRoute):
     dependencies. If we want to close a dependency before the request is complete
     (i.e. before returning a response to the user), we need a stack with a different
     scope. This extension adds this stack at `request.state.response_scoped_stack`.
+
+    Request bodies sent with `Content-Encoding: gzip` are decompressed before they are
+    parsed, and responses to `GET` requests are tagged with an `ETag` so that clients
+    can make conditional requests for them with `If-None-Match`.
     """
 
     def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
         default_handler = super().get_route_handler()
 
         async def handle_response_scoped_depends(request: Request) -> Response:
+            if request.headers.get("content-encoding", "").lower() == "gzip":
+                request = GzipRequest(request.scope, request.receive)
+
             # Create a new stack scoped to exit before the response is returned
             response = None
             async with AsyncExitStack() as stack:
@@ -51,7 +141,7 @@ class PrefectAPIRoute(APIRoute):
 
             if TYPE_CHECKING:
                 assert response is not None
-            return response
+            return conditional_response(request, response)
 
         return handle_response_scoped_depends
 
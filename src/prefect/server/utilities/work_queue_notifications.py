@@ -0,0 +1,157 @@
+"""
+Notifies long-polling workers when flow runs are scheduled into their work queues.
+
+On PostgreSQL, notifications are sent with NOTIFY when the transaction that scheduled
+the runs commits, so that every server process can wake its own waiting workers.  On
+SQLite, there is only one server process, so waiters are woken in memory after the
+transaction commits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+from uuid import UUID
+
+import orjson
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.logging import get_logger
+from prefect.server.utilities.database import get_dialect
+from prefect.settings import get_current_settings
+
+logger = get_logger(__name__)
+
+SCHEDULED_FLOW_RUNS_CHANNEL = "prefect_scheduled_flow_runs"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more, so work queue IDs are sent
+# in chunks well under that
+MAX_WORK_QUEUE_IDS_PER_NOTIFY = 100
+
+_waiters: dict[UUID, set[asyncio.Event]] = {}
+_listener: Optional[asyncio.Task[None]] = None
+
+
+async def notify_scheduled_flow_runs(
+    session: AsyncSession, work_queue_ids: Iterable[Optional[UUID]]
+) -> None:
+    """
+    Wakes workers waiting on the given work queues once the session's transaction
+    commits.
+
+    Args:
+        session: the session of the transaction that scheduled the flow runs
+        work_queue_ids: the work queues the flow runs were scheduled into
+    """
+    ids = sorted({id for id in work_queue_ids if id is not None})
+    if not ids:
+        return
+
+    sync_session = session.sync_session
+    if get_dialect(sync_session).name == "postgresql":
+        for i in range(0, len(ids), MAX_WORK_QUEUE_IDS_PER_NOTIFY):
+            payload = (
+                orjson.dumps(
+                    [str(id) for id in ids[i : i + MAX_WORK_QUEUE_IDS_PER_NOTIFY]]
+                )
+                .decode()
+                .replace("'", "''")
+            )
+            await session.execute(
+                sa.text(f"NOTIFY {SCHEDULED_FLOW_RUNS_CHANNEL}, '{payload}'")
+            )
+    else:
+
+        @sa.event.listens_for(sync_session, "after_commit", once=True)
+        def wake_after_commit(session: sa.orm.Session) -> None:
+            wake(ids)
+
+
+def wake(work_queue_ids: Iterable[UUID]) -> None:
+    """Wakes the workers in this process waiting on any of the given work queues"""
+    for work_queue_id in work_queue_ids:
+        for event in _waiters.get(work_queue_id, ()):
+            event.set()
+
+
+@contextmanager
+def waiting_for_scheduled_flow_runs(
+    work_queue_ids: Iterable[UUID],
+) -> Iterator[asyncio.Event]:
+    """
+    Registers a waiter for flow runs scheduled into any of the given work queues.
+
+    The yielded event is set whenever flow runs are scheduled into one of the work
+    queues; callers should clear it before each time they look for scheduled runs, so
+    that runs scheduled while they are looking are not missed.
+    """
+    _ensure_listening()
+
+    event = asyncio.Event()
+    work_queue_ids = set(work_queue_ids)
+    for work_queue_id in work_queue_ids:
+        _waiters.setdefault(work_queue_id, set()).add(event)
+    try:
+        yield event
+    finally:
+        for work_queue_id in work_queue_ids:
+            events = _waiters.get(work_queue_id)
+            if events is not None:
+                events.discard(event)
+                if not events:
+                    del _waiters[work_queue_id]
+
+
+def _ensure_listening() -> None:
+    global _listener
+
+    connection_url = get_current_settings().server.database.connection_url
+    if connection_url is None:
+        return
+    if get_dialect(connection_url.get_secret_value()).name != "postgresql":
+        return
+
+    loop = asyncio.get_running_loop()
+    if _listener is None or _listener.done() or _listener.get_loop() is not loop:
+        _listener = loop.create_task(_listen_for_scheduled_flow_runs())
+
+
+async def _listen_for_scheduled_flow_runs() -> None:
+    from prefect.server.utilities.postgres_listener import (
+        get_pg_notify_connection,
+        pg_listen,
+    )
+
+    settings = get_current_settings().server.services.triggers
+
+    while True:
+        conn = None
+        try:
+            conn = await get_pg_notify_connection()
+            if not conn:
+                return
+
+            async for payload in pg_listen(
+                conn,
+                SCHEDULED_FLOW_RUNS_CHANNEL,
+                heartbeat_interval=settings.pg_notify_heartbeat_interval_seconds,
+            ):
+                try:
+                    wake(UUID(id) for id in orjson.loads(payload))
+                except Exception:
+                    logger.exception("Error processing scheduled flow run notification")
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.error(
+                f"Error listening for scheduled flow runs: {e}. Reconnecting in "
+                f"{settings.pg_notify_reconnect_interval_seconds}s...",
+                exc_info=True,
+            )
+            # waiters still wake up at their deadlines while we reconnect
+            await asyncio.sleep(settings.pg_notify_reconnect_interval_seconds)
+        finally:
+            if conn and not conn.is_closed():
+                await conn.close()
@@ -1,4 +1,4 @@
-from typing import ClassVar, Dict
+from typing import ClassVar, Dict, Optional
 
 from pydantic import AliasChoices, AliasPath, Field
 from pydantic_settings import SettingsConfigDict
@@ -37,6 +37,67 @@ class ClientMetricsSettings(PrefectBaseSettings):
     )
 
 
+class ClientConcurrencySettings(PrefectBaseSettings):
+    """
+    Settings for controlling how the client acquires global concurrency slots
+    """
+
+    model_config: ClassVar[SettingsConfigDict] = build_settings_config(
+        ("client", "concurrency")
+    )
+
+    lease_block_size: int = Field(
+        default=1,
+        ge=1,
+        description="""
+        The number of slots the `concurrency` context manager leases at once from the
+        same concurrency limits, to be handed out to other uses of those limits in the
+        same process without calling the API. Defaults to 1, which leases slots for
+        each use separately.
+        """,
+    )
+
+    lease_idle_timeout: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="""
+        When leasing slots in blocks, the number of seconds a block is held after all
+        of its slots have been handed back before it is released to the server.
+        """,
+    )
+
+
+class ClientEventsSettings(PrefectBaseSettings):
+    """
+    Settings for controlling how the client streams events to the server
+    """
+
+    model_config: ClassVar[SettingsConfigDict] = build_settings_config(
+        ("client", "events")
+    )
+
+    batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="""
+        The maximum number of events to send to a Prefect server in a single websocket
+        message. Defaults to 1, which sends each event in its own message. Larger
+        batches require a Prefect server that accepts batched messages; events sent to
+        Prefect Cloud are always sent one per message.
+        """,
+    )
+
+    max_unconfirmed: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="""
+        The number of sent events the client may have outstanding before it waits for
+        the server to confirm receipt of them. Defaults to the client's checkpoint
+        interval, which waits for every checkpoint before sending more events.
+        """,
+    )
+
+
 class ClientSettings(PrefectBaseSettings):
     """
     Settings for controlling API client behavior
@@ -98,7 +159,28 @@ class ClientSettings(PrefectBaseSettings):
         examples=[{"X-Custom-Header": "value"}, {"Authorization": "Bearer token"}],
     )
 
+    http_cache_max_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        ge=0,
+        description="""
+        The number of bytes of API responses to `GET` requests for deployments, work
+        pools, block documents and variables that each client keeps in memory, so that
+        it can ask the server whether they have changed with `If-None-Match` instead of
+        fetching them again. Set to 0 to disable the cache.
+        """,
+    )
+
     metrics: ClientMetricsSettings = Field(
         default_factory=ClientMetricsSettings,
         description="Settings for controlling metrics reporting from the client",
     )
+
+    concurrency: ClientConcurrencySettings = Field(
+        default_factory=ClientConcurrencySettings,
+        description="Settings for controlling how the client acquires global concurrency slots",
+    )
+
+    events: ClientEventsSettings = Field(
+        default_factory=ClientEventsSettings,
+        description="Settings for controlling how the client streams events to the server",
+    )
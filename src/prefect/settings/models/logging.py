@@ -59,6 +59,30 @@ class LoggingToAPISettings(PrefectBaseSettings):
         description="The maximum size in bytes for a single log.",
     )
 
+    compression: bool = Field(
+        default=False,
+        description="If `True`, batches of logs will be gzip-compressed before being sent to the API. The API must accept gzip-encoded request bodies.",
+    )
+
+    max_queue_size: int = Field(
+        default=100_000,
+        ge=0,
+        description="The maximum number of logs to hold in memory while waiting to send them to the API. Set to 0 for no limit.",
+    )
+
+    queue_overflow_policy: Literal["drop-oldest", "sample", "block"] = Field(
+        default="drop-oldest",
+        description="""
+        Controls the behavior when the queue of logs waiting to be sent to the API is full.
+
+        The following options are available:
+
+        - "drop-oldest": Discard the oldest queued log to make room for the new one.
+        - "sample": Keep one in every ten new logs, discarding the oldest queued log to make room for it, and discard the rest.
+        - "block": Wait for room in the queue before returning from the logging call.
+        """,
+    )
+
     when_missing_flow: Literal["warn", "error", "ignore"] = Field(
         default="warn",
         description="""
@@ -47,3 +47,18 @@ class ResultsSettings(PrefectBaseSettings):
             "prefect_local_storage_path",
         ),
     )
+
+    memory_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description="The total size, in serialized bytes, of result records each result store keeps in memory. Records larger than this are never cached in memory.",
+    )
+
+    disk_cache_path: Optional[Path] = Field(
+        default=None,
+        description="A local directory used to cache serialized result records read from remote result storage. If not set, results are only cached in memory.",
+    )
+
+    disk_cache_max_bytes: int = Field(
+        default=1024 * 1024 * 1024,
+        description="The total size, in bytes, of result records to keep in the local disk cache.",
+    )
@@ -1,10 +1,11 @@
-from typing import ClassVar, Optional
+from functools import partial
+from typing import Annotated, ClassVar, Optional, Union
 
-from pydantic import Field
+from pydantic import BeforeValidator, Field
 from pydantic_settings import SettingsConfigDict
 
 from prefect.settings.base import PrefectBaseSettings, build_settings_config
-from prefect.types import LogLevel
+from prefect.types import LogLevel, validate_set_T_from_delim_string
 
 
 class RunnerServerSettings(PrefectBaseSettings):
@@ -42,6 +43,30 @@ class RunnerServerSettings(PrefectBaseSettings):
     )
 
 
+class RunnerWarmPoolSettings(PrefectBaseSettings):
+    """
+    Settings for controlling a runner's pool of warm interpreters
+    """
+
+    model_config: ClassVar[SettingsConfigDict] = build_settings_config(
+        ("runner", "warm_pool")
+    )
+
+    size: int = Field(
+        default=0,
+        ge=0,
+        description="Number of interpreters a runner keeps started, with Prefect already imported, to execute flow runs without waiting on a new interpreter. Each interpreter executes a single flow run. Set to 0 to start a new interpreter for every flow run.",
+    )
+
+    preload_modules: Annotated[
+        Union[str, list[str], None],
+        BeforeValidator(partial(validate_set_T_from_delim_string, type_=str)),
+    ] = Field(
+        default=None,
+        description="Additional modules each warm interpreter imports before it executes a flow run.",
+    )
+
+
 class RunnerSettings(PrefectBaseSettings):
     """
     Settings for controlling runner behavior
@@ -69,3 +94,8 @@ class RunnerSettings(PrefectBaseSettings):
         default_factory=RunnerServerSettings,
         description="Settings for controlling runner server behavior",
     )
+
+    warm_pool: RunnerWarmPoolSettings = Field(
+        default_factory=RunnerWarmPoolSettings,
+        description="Settings for controlling a runner's pool of warm interpreters",
+    )
@@ -1,4 +1,4 @@
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from pydantic import Field
 from pydantic_settings import SettingsConfigDict
@@ -15,3 +15,19 @@ class ServerConcurrencySettings(PrefectBaseSettings):
         default="prefect.server.concurrency.lease_storage.memory",
         description="The module to use for storing concurrency limit leases.",
     )
+
+    slot_ledger: Optional[str] = Field(
+        default=None,
+        description=(
+            "The module to use for counting concurrency limit slots in memory, such as "
+            "`prefect.server.concurrency.slot_ledger.memory`. Counts are written "
+            "through to the database periodically. When unset, every slot is counted "
+            "directly in the database."
+        ),
+    )
+
+    slot_ledger_flush_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="How often, in seconds, the slot ledger writes its counts to the database.",
+    )
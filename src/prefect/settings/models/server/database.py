@@ -270,6 +270,22 @@ class ServerDatabaseSettings(PrefectBaseSettings):
         ),
     )
 
+    read_replica_urls: Optional[SecretStr] = Field(
+        default=None,
+        description="""
+        A comma-separated list of connection URLs for read replicas of a Postgres
+        database. When set, read-only API queries, like filtering flow runs, task runs,
+        logs and events, are spread across the replicas instead of the primary
+        database.
+        """,
+    )
+
+    read_replica_max_lag: float = Field(
+        default=10.0,
+        ge=0,
+        description="The maximum replication lag, in seconds, of a read replica for read-only queries to be sent to it. When no read replica is within this lag, read-only queries are sent to the primary database. Defaults to `10`.",
+    )
+
     # handle deprecated fields
 
     def __getattribute__(self, name: str) -> Any:
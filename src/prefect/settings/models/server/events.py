@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import ClassVar
+from typing import ClassVar, Literal
 
 from pydantic import AliasChoices, AliasPath, Field
 from pydantic_settings import SettingsConfigDict
@@ -149,3 +149,8 @@ class ServerEventsSettings(PrefectBaseSettings):
             "prefect_server_events_maximum_event_name_length",
         ),
     )
+
+    postgres_write_method: Literal["insert", "copy"] = Field(
+        default="insert",
+        description="How events are written to a PostgreSQL database. `insert` uses batches of parameterized `INSERT` statements, while `copy` uses `COPY` through a temporary staging table, which has higher throughput but requires session-level connections (temporary tables are not compatible with transaction-pooling proxies). Has no effect for SQLite.",
+    )
@@ -34,3 +34,8 @@ class ServerFlowRunGraphSettings(PrefectBaseSettings):
             "prefect_api_max_flow_run_graph_artifacts",
         ),
     )
+
+    cache_max_nodes: int = Field(
+        default=100000,
+        description="The maximum total number of nodes of flow run graphs to cache in memory on the v2 API. Set to 0 to disable caching.",
+    )
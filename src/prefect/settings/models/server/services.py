@@ -429,6 +429,26 @@ class ServerServicesRepossessorSettings(ServicesBaseSetting):
     )
 
 
+class ServerServicesRunHistoryRollupsSettings(ServicesBaseSetting):
+    """
+    Settings for controlling the run history rollups service
+    """
+
+    model_config: ClassVar[SettingsConfigDict] = build_settings_config(
+        ("server", "services", "run_history_rollups")
+    )
+
+    enabled: bool = Field(
+        default=False,
+        description="Whether or not to maintain per-minute rollups of run history and use them to answer run history and dashboard queries.",
+    )
+
+    loop_seconds: float = Field(
+        default=30,
+        description="The run history rollups service will roll up newly finished runs this often. Defaults to `30`.",
+    )
+
+
 class ServerServicesTaskRunRecorderSettings(ServicesBaseSetting):
     """
     Settings for controlling the task run recorder service
@@ -448,6 +468,26 @@ class ServerServicesTaskRunRecorderSettings(ServicesBaseSetting):
         ),
     )
 
+    batch_size: int = Field(
+        default=1,
+        gt=0,
+        description="The number of task run events the task run recorder will attempt to record in one batch. When greater than 1, events are acknowledged once they are buffered and transitions of the same task run in a batch are collapsed into one update.",
+        validation_alias=AliasChoices(
+            AliasPath("batch_size"),
+            "prefect_server_services_task_run_recorder_batch_size",
+        ),
+    )
+
+    flush_interval: float = Field(
+        default=0.5,
+        gt=0.0,
+        description="The maximum number of seconds between flushes of the task run recorder when batching.",
+        validation_alias=AliasChoices(
+            AliasPath("flush_interval"),
+            "prefect_server_services_task_run_recorder_flush_interval",
+        ),
+    )
+
 
 class ServerServicesTriggersSettings(ServicesBaseSetting):
     """
@@ -536,6 +576,10 @@ class ServerServicesSettings(PrefectBaseSettings):
         default_factory=ServerServicesRepossessorSettings,
         description="Settings for controlling the repossessor service",
     )
+    run_history_rollups: ServerServicesRunHistoryRollupsSettings = Field(
+        default_factory=ServerServicesRunHistoryRollupsSettings,
+        description="Settings for controlling the run history rollups service",
+    )
     task_run_recorder: ServerServicesTaskRunRecorderSettings = Field(
         default_factory=ServerServicesTaskRunRecorderSettings,
         description="Settings for controlling the task run recorder service",
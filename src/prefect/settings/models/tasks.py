@@ -23,6 +23,18 @@ class TasksRunnerSettings(PrefectBaseSettings):
         ),
     )
 
+    process_pool_max_workers: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="The maximum number of worker processes for ProcessPoolTaskRunner. Defaults to the number of CPUs.",
+    )
+
+    process_pool_shared_memory_min_bytes: int = Field(
+        default=1024 * 1024,
+        ge=0,
+        description="The size at or above which bytes and NumPy array arguments are passed to ProcessPoolTaskRunner workers through shared memory instead of being pickled.",
+    )
+
 
 class TasksSchedulingSettings(PrefectBaseSettings):
     model_config: ClassVar[SettingsConfigDict] = build_settings_config(
@@ -40,6 +40,13 @@ class WorkerSettings(PrefectBaseSettings):
         description="The number of seconds into the future a worker should query for scheduled work.",
     )
 
+    long_poll_seconds: float = Field(
+        default=0,
+        ge=0,
+        le=30,
+        description="If set, workers hold each query for scheduled work open for up to this many seconds until flow runs are scheduled, and query again as soon as it returns. Set to 0 to query every `query_seconds` instead.",
+    )
+
     webserver: WorkerWebserverSettings = Field(
         default_factory=WorkerWebserverSettings,
         description="Settings for a worker's webserver",
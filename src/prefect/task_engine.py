@@ -698,15 +698,13 @@ class SyncTaskRunEngine(BaseTaskRunEngine[P, R]):
 
                 try:
                     if not self.task_run:
-                        self.task_run = run_coro_as_sync(
-                            self.task.create_local_run(
-                                id=task_run_id,
-                                parameters=self.parameters,
-                                flow_run_context=parent_flow_run_context,
-                                parent_task_run_context=parent_task_run_context,
-                                wait_for=self.wait_for,
-                                extra_task_inputs=dependencies,
-                            )
+                        self.task_run = self.task.build_local_run(
+                            id=task_run_id,
+                            parameters=self.parameters,
+                            flow_run_context=parent_flow_run_context,
+                            parent_task_run_context=parent_task_run_context,
+                            wait_for=self.wait_for,
+                            extra_task_inputs=dependencies,
                         )
                         # Emit an event to capture that the task run was in the `PENDING` state.
                         self._last_event = emit_task_run_state_change_event(
@@ -1282,7 +1280,7 @@ class AsyncTaskRunEngine(BaseTaskRunEngine[P, R]):
 
                 try:
                     if not self.task_run:
-                        self.task_run = await self.task.create_local_run(
+                        self.task_run = self.task.build_local_run(
                             id=task_run_id,
                             parameters=self.parameters,
                             flow_run_context=parent_flow_run_context,
@@ -2,20 +2,30 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import concurrent.futures
+import inspect
+import multiprocessing
+import os
 import sys
 import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from contextvars import copy_context
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing import shared_memory
 from typing import (
     TYPE_CHECKING,
     Any,
     Coroutine,
     Generic,
     Iterable,
+    Literal,
     overload,
 )
 
+import cloudpickle  # type: ignore  # no stubs available
 from typing_extensions import ParamSpec, Self, TypeVar
 
 from prefect._internal.uuid7 import uuid7
@@ -28,14 +38,19 @@ from prefect.futures import (
     PrefectFutureList,
 )
 from prefect.logging.loggers import get_logger, get_run_logger
-from prefect.settings import PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS
+from prefect.settings import (
+    PREFECT_API_URL,
+    PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS,
+    get_current_settings,
+    temporary_settings,
+)
 from prefect.utilities.annotations import allow_failure, quote, unmapped
 from prefect.utilities.callables import (
     collapse_variadic_parameters,
     explode_variadic_parameter,
     get_parameter_defaults,
 )
-from prefect.utilities.collections import isiterable
+from prefect.utilities.collections import isiterable, visit_collection
 
 if TYPE_CHECKING:
     import logging
@@ -180,18 +195,26 @@ class TaskRunner(abc.ABC, Generic[F]):
 
         map_length = list(lengths)[0]
 
+        # Every mapped child shares the same signature-derived values, so inspect the
+        # task function once here rather than once per child
+        parameter_defaults = get_parameter_defaults(task.fn)
+        call_parameter_keys = (
+            set(iterable_parameters) | set(static_parameters) | set(parameter_defaults)
+        )
+        needs_collapse = bool(
+            call_parameter_keys - set(inspect.signature(task.fn).parameters)
+        )
+
         futures: list[PrefectFuture[Any]] = []
         for i in range(map_length):
             call_parameters: dict[str, Any] = {
                 key: value[i] for key, value in iterable_parameters.items()
             }
-            call_parameters.update(
-                {key: value for key, value in static_parameters.items()}
-            )
+            call_parameters.update(static_parameters)
 
             # Add default values for parameters; these are skipped earlier since they should
             # not be mapped over
-            for key, value in get_parameter_defaults(task.fn).items():
+            for key, value in parameter_defaults.items():
                 call_parameters.setdefault(key, value)
 
             # Re-apply annotations to each key again
@@ -199,7 +222,8 @@ class TaskRunner(abc.ABC, Generic[F]):
                 call_parameters[key] = annotation.rewrap(call_parameters[key])
 
             # Collapse any previously exploded kwargs
-            call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
+            if needs_collapse:
+                call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
 
             futures.append(
                 self.submit(
@@ -402,6 +426,490 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
 ConcurrentTaskRunner = ThreadPoolTaskRunner
 
 
+@dataclass(frozen=True)
+class _SharedMemoryArgument:
+    """
+    A reference to a task argument that has been copied into a shared memory block
+    so that it does not need to be pickled to reach a worker process.
+    """
+
+    name: str
+    nbytes: int
+    kind: Literal["bytes", "bytearray", "ndarray"]
+    dtype: Any = None
+    shape: tuple[int, ...] = ()
+
+
+# Shared memory blocks attached in this worker process that could not be closed yet
+# because the task run kept a reference to their contents
+_unreleased_shared_memory: list[shared_memory.SharedMemory] = []
+
+
+def _share_large_arguments(
+    parameters: dict[str, Any], min_bytes: int
+) -> tuple[dict[str, Any], list[shared_memory.SharedMemory]]:
+    """
+    Copy large `bytes`, `bytearray` and NumPy array arguments into shared memory,
+    replacing them with references that can be cheaply pickled.
+
+    Returns:
+        The updated parameters and the shared memory blocks that were created, which
+        the caller is responsible for unlinking.
+    """
+    blocks: list[shared_memory.SharedMemory] = []
+    numpy = sys.modules.get("numpy")
+
+    def share(expr: Any) -> Any:
+        if isinstance(expr, (bytes, bytearray)) and len(expr) >= min_bytes:
+            block = shared_memory.SharedMemory(create=True, size=len(expr))
+            blocks.append(block)
+            block.buf[: len(expr)] = expr
+            return _SharedMemoryArgument(
+                name=block.name,
+                nbytes=len(expr),
+                kind="bytes" if isinstance(expr, bytes) else "bytearray",
+            )
+        if (
+            numpy is not None
+            and type(expr) is numpy.ndarray
+            and expr.nbytes >= min_bytes
+            and not expr.dtype.hasobject
+        ):
+            block = shared_memory.SharedMemory(create=True, size=expr.nbytes)
+            blocks.append(block)
+            copy = numpy.ndarray(expr.shape, dtype=expr.dtype, buffer=block.buf)
+            copy[...] = expr
+            del copy
+            return _SharedMemoryArgument(
+                name=block.name,
+                nbytes=expr.nbytes,
+                kind="ndarray",
+                dtype=expr.dtype,
+                shape=expr.shape,
+            )
+        return expr
+
+    try:
+        shared = visit_collection(parameters, visit_fn=share, return_data=True)
+    except BaseException:
+        _unlink_shared_memory(blocks)
+        raise
+    return shared, blocks
+
+
+def _attach_shared_arguments(
+    parameters: dict[str, Any],
+) -> tuple[dict[str, Any], list[shared_memory.SharedMemory]]:
+    """
+    Replace references to shared memory with the arguments they refer to.
+
+    NumPy arrays are backed by the shared memory block directly rather than copied.
+    """
+    blocks: list[shared_memory.SharedMemory] = []
+
+    def attach(expr: Any) -> Any:
+        if not isinstance(expr, _SharedMemoryArgument):
+            return expr
+        block = shared_memory.SharedMemory(name=expr.name)
+        blocks.append(block)
+        if expr.kind == "ndarray":
+            import numpy
+
+            return numpy.ndarray(expr.shape, dtype=expr.dtype, buffer=block.buf)
+        content = block.buf[: expr.nbytes]
+        try:
+            return bytes(content) if expr.kind == "bytes" else bytearray(content)
+        finally:
+            content.release()
+
+    return visit_collection(parameters, visit_fn=attach, return_data=True), blocks
+
+
+def _release_shared_memory(blocks: list[shared_memory.SharedMemory]) -> None:
+    """
+    Close shared memory blocks attached by a worker process.
+
+    Blocks whose contents are still referenced cannot be closed; they are retried
+    after later task runs instead.
+    """
+    pending = _unreleased_shared_memory + blocks
+    _unreleased_shared_memory.clear()
+    for block in pending:
+        try:
+            block.close()
+        except BufferError:
+            _unreleased_shared_memory.append(block)
+
+
+def _unlink_shared_memory(blocks: list[shared_memory.SharedMemory]) -> None:
+    for block in blocks:
+        try:
+            block.close()
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _run_task_in_process(payload: bytes) -> bytes:
+    """
+    Run a task in a `ProcessPoolTaskRunner` worker process.
+
+    The submission and the final state are pickled with `cloudpickle` so that tasks
+    and results defined interactively or in `__main__` can be exchanged.
+    """
+    from prefect.task_engine import run_task_async, run_task_sync
+
+    submit_kwargs: dict[str, Any] = cloudpickle.loads(payload)
+    submit_kwargs["parameters"], blocks = _attach_shared_arguments(
+        submit_kwargs["parameters"]
+    )
+    try:
+        if submit_kwargs["task"].isasync:
+            state = asyncio.run(run_task_async(**submit_kwargs))
+        else:
+            state = run_task_sync(**submit_kwargs)
+        return cloudpickle.dumps(state)
+    finally:
+        del submit_kwargs
+        _release_shared_memory(blocks)
+
+
+def _ephemeral_api_url() -> str | None:
+    """
+    Get the URL of the ephemeral API server started by this process, if no API URL is
+    configured and one is running.
+    """
+    if get_current_settings().api.url:
+        return None
+    server_module = sys.modules.get("prefect.server.api.server")
+    if server_module is None:
+        return None
+    server = server_module.SubprocessASGIServer._instances.get(None)
+    if server is None or not server.running:
+        return None
+    return server.api_url
+
+
+def _resolve_futures_to_states(expr: Any) -> Any:
+    """
+    Wait for any futures in an expression and replace them with their final states,
+    which, unlike futures, can be sent to another process.
+    """
+
+    def resolve(expr: Any) -> Any:
+        if isinstance(expr, PrefectFuture):
+            expr.wait()
+            return expr.state
+        return expr
+
+    return visit_collection(expr, visit_fn=resolve, return_data=True)
+
+
+def _collect_futures(expr: Any) -> list[PrefectFuture[Any]]:
+    """Find the futures in an expression."""
+    futures: list[PrefectFuture[Any]] = []
+
+    def collect(expr: Any) -> Any:
+        if isinstance(expr, PrefectFuture):
+            futures.append(expr)
+        return expr
+
+    visit_collection(expr, visit_fn=collect, return_data=False)
+    return futures
+
+
+class ProcessPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
+    """
+    A task runner that executes tasks in a pool of worker processes, allowing
+    CPU-bound tasks to run in parallel.
+
+    Worker processes are started on demand and reused across task runs. The run
+    context is serialized and re-created in the worker process for each task run, so
+    tasks, their parameters and their results must be picklable with `cloudpickle`.
+    `bytes`, `bytearray` and NumPy array arguments of at least
+    `shared_memory_min_bytes` are copied into shared memory instead of being pickled.
+
+    Upstream futures passed to a task are waited for in the submitting process and
+    replaced by their final states before the task is sent to a worker.
+
+    Attributes:
+        max_workers: The maximum number of worker processes to use for executing
+            tasks. Defaults to `PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS` or the
+            number of CPUs.
+        shared_memory_min_bytes: The size at or above which arguments are passed
+            through shared memory. Defaults to
+            `PREFECT_TASKS_RUNNER_PROCESS_POOL_SHARED_MEMORY_MIN_BYTES`.
+
+    Examples:
+        ```python
+        from prefect import flow, task
+        from prefect.task_runners import ProcessPoolTaskRunner
+
+        @task
+        def fib(n: int) -> int:
+            return n if n < 2 else fib.fn(n - 1) + fib.fn(n - 2)
+
+        @flow(task_runner=ProcessPoolTaskRunner(max_workers=4))
+        def my_flow():
+            return fib.map(range(25, 30)).result()
+
+        if __name__ == "__main__":
+            my_flow()
+        ```
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        shared_memory_min_bytes: int | None = None,
+    ):
+        super().__init__()
+        settings = get_current_settings().tasks.runner
+        self._executor: ProcessPoolExecutor | None = None
+        self._dispatcher: ThreadPoolExecutor | None = None
+        self._max_workers = (
+            (settings.process_pool_max_workers or os.cpu_count() or 1)
+            if max_workers is None
+            else max_workers
+        )
+        self._shared_memory_min_bytes = (
+            settings.process_pool_shared_memory_min_bytes
+            if shared_memory_min_bytes is None
+            else shared_memory_min_bytes
+        )
+
+    def duplicate(self) -> "ProcessPoolTaskRunner[R]":
+        return type(self)(
+            max_workers=self._max_workers,
+            shared_memory_min_bytes=self._shared_memory_min_bytes,
+        )
+
+    @overload
+    def submit(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+        dependencies: dict[str, set[RunInput]] | None = None,
+    ) -> PrefectConcurrentFuture[R]: ...
+
+    @overload
+    def submit(
+        self,
+        task: "Task[Any, R]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+        dependencies: dict[str, set[RunInput]] | None = None,
+    ) -> PrefectConcurrentFuture[R]: ...
+
+    def submit(
+        self,
+        task: "Task[P, R | Coroutine[Any, Any, R]]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+        dependencies: dict[str, set[RunInput]] | None = None,
+    ) -> PrefectConcurrentFuture[R]:
+        """
+        Submit a task to the task run engine running in a worker process.
+
+        Args:
+            task: The task to submit.
+            parameters: The parameters to use when running the task.
+            wait_for: A list of futures that the task depends on.
+
+        Returns:
+            A future object that can be used to wait for the task to complete and
+            retrieve the result.
+        """
+        if not self._started or self._executor is None or self._dispatcher is None:
+            raise RuntimeError("Task runner is not started")
+
+        from prefect.context import FlowRunContext, serialize_context
+        from prefect.utilities.engine import collect_task_run_inputs_sync
+
+        task_run_id = uuid7()
+
+        flow_run_ctx = FlowRunContext.get()
+        if flow_run_ctx:
+            get_run_logger(flow_run_ctx).debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+        else:
+            self.logger.debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+
+        # Upstream task runs are recorded from the futures before they are replaced by
+        # their states, and the context is captured from the submitting thread
+        task_inputs = {
+            k: collect_task_run_inputs_sync(v) for k, v in parameters.items()
+        }
+        if dependencies:
+            task_inputs = {
+                k: v.union(dependencies.get(k, set())) for k, v in task_inputs.items()
+            }
+        with ExitStack() as stack:
+            # Worker processes cannot start an ephemeral API server of their own
+            # while this process's server holds the database, so point them at it
+            if api_url := _ephemeral_api_url():
+                stack.enter_context(temporary_settings({PREFECT_API_URL: api_url}))
+            context = serialize_context(
+                asset_ctx_kwargs={
+                    "task": task,
+                    "task_run_id": task_run_id,
+                    "task_inputs": task_inputs,
+                    "copy_to_child_ctx": True,
+                }
+            )
+        submit_kwargs: dict[str, Any] = dict(
+            task=task,
+            task_run_id=task_run_id,
+            parameters=parameters,
+            wait_for=wait_for,
+            return_type="state",
+            dependencies=dependencies,
+            context=context,
+        )
+
+        future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+        if upstream := _collect_futures([parameters, wait_for]):
+            # Waiting for upstream futures must not block the caller, so the task is
+            # dispatched once the last of them completes
+            self._dispatch_when_done(future, submit_kwargs, upstream)
+        else:
+            self._dispatch(future, submit_kwargs)
+
+        return PrefectConcurrentFuture(task_run_id=task_run_id, wrapped_future=future)
+
+    def _dispatch_when_done(
+        self,
+        future: concurrent.futures.Future[Any],
+        submit_kwargs: dict[str, Any],
+        upstream: list[PrefectFuture[Any]],
+    ) -> None:
+        remaining = len(upstream)
+        lock = threading.Lock()
+
+        def on_upstream_done(_: PrefectFuture[Any]) -> None:
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                if remaining:
+                    return
+            # Callbacks run on the thread that completed the upstream future, so the
+            # task is handed to the dispatcher thread to be serialized and submitted
+            try:
+                if self._dispatcher is None:
+                    raise RuntimeError("Task runner is not started")
+                self._dispatcher.submit(self._dispatch, future, submit_kwargs)
+            except RuntimeError as exc:
+                future.set_exception(exc)
+
+        for upstream_future in upstream:
+            upstream_future.add_done_callback(on_upstream_done)
+
+    def _dispatch(
+        self, future: concurrent.futures.Future[Any], submit_kwargs: dict[str, Any]
+    ) -> None:
+        blocks: list[shared_memory.SharedMemory] = []
+        try:
+            executor = self._executor
+            if executor is None:
+                raise RuntimeError("Task runner is not started")
+            parameters = _resolve_futures_to_states(submit_kwargs["parameters"])
+            if submit_kwargs["wait_for"]:
+                submit_kwargs["wait_for"] = _resolve_futures_to_states(
+                    list(submit_kwargs["wait_for"])
+                )
+            submit_kwargs["parameters"], blocks = _share_large_arguments(
+                parameters, self._shared_memory_min_bytes
+            )
+            payload = cloudpickle.dumps(submit_kwargs)
+            process_future = executor.submit(_run_task_in_process, payload)
+        except BaseException as exc:
+            _unlink_shared_memory(blocks)
+            future.set_exception(exc)
+            return
+
+        process_future.add_done_callback(partial(self._complete, future, blocks=blocks))
+
+    @staticmethod
+    def _complete(
+        future: concurrent.futures.Future[Any],
+        process_future: concurrent.futures.Future[bytes],
+        blocks: list[shared_memory.SharedMemory],
+    ) -> None:
+        _unlink_shared_memory(blocks)
+        if process_future.cancelled():
+            future.cancel()
+        elif (exc := process_future.exception()) is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(cloudpickle.loads(process_future.result()))
+
+    @overload
+    def map(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]: ...
+
+    @overload
+    def map(
+        self,
+        task: "Task[Any, R]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]: ...
+
+    def map(
+        self,
+        task: "Task[P, R]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]:
+        return super().map(task, parameters, wait_for)
+
+    def cancel_all(self) -> None:
+        # Cancelling queued task runs first fails any submissions still waiting on
+        # them, so the dispatcher can be drained without cancelling its work, which
+        # would leave futures that never complete
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown()
+            self._dispatcher = None
+
+    def __enter__(self) -> Self:
+        super().__enter__()
+        # Worker processes are spawned rather than forked since the submitting process
+        # typically has threads running, e.g. for the API client and log handlers
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        # Submissions whose upstream futures have completed are dispatched one at a
+        # time on a single thread
+        self._dispatcher = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ProcessPoolTaskRunner"
+        )
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.cancel_all()
+        super().__exit__(exc_type, exc_value, traceback)
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, ProcessPoolTaskRunner):
+            return False
+        return (
+            self._max_workers == value._max_workers
+            and self._shared_memory_min_bytes == value._shared_memory_min_bytes
+        )
+
+
 class PrefectTaskRunner(TaskRunner[PrefectDistributedFuture[R]]):
     def __init__(self):
         super().__init__()
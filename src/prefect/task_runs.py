@@ -1,27 +1,25 @@
 from __future__ import annotations
 
-import asyncio
-import atexit
 import threading
 import uuid
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, ClassVar, Optional
 
-import anyio
-from cachetools import TTLCache
 from typing_extensions import Self
 
-from prefect._internal.concurrency.api import create_call, from_async, from_sync
-from prefect._internal.concurrency.threads import get_global_loop
+from prefect._waiters import _RunWaiter
+from prefect.client.schemas.filters import (
+    TaskRunFilter,
+    TaskRunFilterId,
+    TaskRunFilterState,
+    TaskRunFilterStateType,
+)
 from prefect.client.schemas.objects import TERMINAL_STATES
-from prefect.events.clients import get_events_subscriber
-from prefect.events.filters import EventFilter, EventNameFilter
-from prefect.logging.loggers import get_logger
 
 if TYPE_CHECKING:
-    import logging
+    from prefect.client.orchestration import PrefectClient
 
 
-class TaskRunWaiter:
+class TaskRunWaiter(_RunWaiter):
     """
     A service used for waiting for a task run to finish.
 
@@ -30,8 +28,9 @@ class TaskRunWaiter:
     continuing execution.
 
     The service is a singleton and must be started before use. The service will
-    automatically start when the first instance is created. A single websocket
-    connection is used to listen for task run events.
+    automatically start when the first instance is created. Task run events are
+    received through the websocket connection of the `RunEventSubscription`, which
+    is shared with the `FlowRunWaiter`.
 
     The service can be used to wait for a task run to finish by calling
     `TaskRunWaiter.wait_for_task_run` with the task run ID to wait for. The method
@@ -69,95 +68,24 @@ class TaskRunWaiter:
     ```
     """
 
+    resource_prefix: ClassVar[str] = "prefect.task-run"
+
     _instance: Optional[Self] = None
     _instance_lock = threading.Lock()
 
-    def __init__(self):
-        self.logger: "logging.Logger" = get_logger("TaskRunWaiter")
-        self._consumer_task: "asyncio.Task[None] | None" = None
-        self._observed_completed_task_runs: TTLCache[uuid.UUID, bool] = TTLCache(
-            maxsize=10000, ttl=600
-        )
-        self._completion_events: Dict[uuid.UUID, asyncio.Event] = {}
-        self._completion_callbacks: Dict[uuid.UUID, Callable[[], None]] = {}
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
-        self._observed_completed_task_runs_lock = threading.Lock()
-        self._completion_events_lock = threading.Lock()
-        self._started = False
-
-    def start(self) -> None:
-        """
-        Start the TaskRunWaiter service.
-        """
-        if self._started:
-            return
-        self.logger.debug("Starting TaskRunWaiter")
-        loop_thread = get_global_loop()
-
-        if not asyncio.get_running_loop() == loop_thread.loop:
-            raise RuntimeError("TaskRunWaiter must run on the global loop thread.")
-
-        self._loop = loop_thread.loop
-        if TYPE_CHECKING:
-            assert self._loop is not None
-
-        consumer_started = asyncio.Event()
-        self._consumer_task = self._loop.create_task(
-            self._consume_events(consumer_started)
+    async def read_finished_run_ids(
+        self, client: "PrefectClient", run_ids: list[uuid.UUID]
+    ) -> list[uuid.UUID]:
+        task_runs = await client.read_task_runs(
+            task_run_filter=TaskRunFilter(
+                id=TaskRunFilterId(any_=run_ids),
+                state=TaskRunFilterState(
+                    type=TaskRunFilterStateType(any_=list(TERMINAL_STATES))
+                ),
+            ),
+            limit=len(run_ids),
         )
-        asyncio.run_coroutine_threadsafe(consumer_started.wait(), self._loop)
-
-        loop_thread.add_shutdown_call(create_call(self.stop))
-        atexit.register(self.stop)
-        self._started = True
-
-    async def _consume_events(self, consumer_started: asyncio.Event):
-        async with get_events_subscriber(
-            filter=EventFilter(
-                event=EventNameFilter(
-                    name=[
-                        f"prefect.task-run.{state.name.title()}"
-                        for state in TERMINAL_STATES
-                    ],
-                )
-            )
-        ) as subscriber:
-            consumer_started.set()
-            async for event in subscriber:
-                try:
-                    self.logger.debug(
-                        f"Received event: {event.resource['prefect.resource.id']}"
-                    )
-                    task_run_id = uuid.UUID(
-                        event.resource["prefect.resource.id"].replace(
-                            "prefect.task-run.", ""
-                        )
-                    )
-
-                    with self._observed_completed_task_runs_lock:
-                        # Cache the task run ID for a short period of time to avoid
-                        # unnecessary waits
-                        self._observed_completed_task_runs[task_run_id] = True
-                    with self._completion_events_lock:
-                        # Set the event for the task run ID if it is in the cache
-                        # so the waiter can wake up the waiting coroutine
-                        if task_run_id in self._completion_events:
-                            self._completion_events[task_run_id].set()
-                        if task_run_id in self._completion_callbacks:
-                            self._completion_callbacks[task_run_id]()
-                except Exception as exc:
-                    self.logger.error(f"Error processing event: {exc}")
-
-    def stop(self) -> None:
-        """
-        Stop the TaskRunWaiter service.
-        """
-        self.logger.debug("Stopping TaskRunWaiter")
-        if self._consumer_task:
-            self._consumer_task.cancel()
-            self._consumer_task = None
-        self.__class__._instance = None
-        self._started = False
+        return [task_run.id for task_run in task_runs]
 
     @classmethod
     async def wait_for_task_run(
@@ -174,36 +102,7 @@ class TaskRunWaiter:
             timeout: The maximum time to wait for the task run to
                 finish. Defaults to None.
         """
-        instance = cls.instance()
-        with instance._observed_completed_task_runs_lock:
-            if task_run_id in instance._observed_completed_task_runs:
-                return
-
-        # Need to create event in loop thread to ensure it can be set
-        # from the loop thread
-        finished_event = await from_async.wait_for_call_in_loop_thread(
-            create_call(asyncio.Event)
-        )
-        with instance._completion_events_lock:
-            # Cache the event for the task run ID so the consumer can set it
-            # when the event is received
-            instance._completion_events[task_run_id] = finished_event
-
-        try:
-            # Now check one more time whether the task run arrived before we start to
-            # wait on it, in case it came in while we were setting up the event above.
-            with instance._observed_completed_task_runs_lock:
-                if task_run_id in instance._observed_completed_task_runs:
-                    return
-
-            with anyio.move_on_after(delay=timeout):
-                await from_async.wait_for_call_in_loop_thread(
-                    create_call(finished_event.wait)
-                )
-        finally:
-            with instance._completion_events_lock:
-                # Remove the event from the cache after it has been waited on
-                instance._completion_events.pop(task_run_id, None)
+        await cls.instance()._wait(task_run_id, timeout=timeout)
 
     @classmethod
     def add_done_callback(
@@ -216,34 +115,4 @@ class TaskRunWaiter:
             task_run_id: The ID of the task run to wait for.
             callback: The callback to call when the task run finishes.
         """
-        instance = cls.instance()
-        with instance._observed_completed_task_runs_lock:
-            if task_run_id in instance._observed_completed_task_runs:
-                callback()
-                return
-
-        with instance._completion_events_lock:
-            # Cache the event for the task run ID so the consumer can set it
-            # when the event is received
-            instance._completion_callbacks[task_run_id] = callback
-
-    @classmethod
-    def instance(cls) -> Self:
-        """
-        Get the singleton instance of TaskRunWaiter.
-        """
-        with cls._instance_lock:
-            if cls._instance is None:
-                cls._instance = cls._new_instance()
-            return cls._instance
-
-    @classmethod
-    def _new_instance(cls):
-        instance = cls()
-
-        if threading.get_ident() == get_global_loop().thread.ident:
-            instance.start()
-        else:
-            from_sync.call_soon_in_loop_thread(create_call(instance.start)).result()
-
-        return instance
+        cls.instance()._add_done_callback(task_run_id, callback)
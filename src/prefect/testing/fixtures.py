@@ -11,6 +11,7 @@ from uuid import UUID
 import anyio
 import httpx
 import pytest
+from pydantic import TypeAdapter
 from starlette.status import WS_1008_POLICY_VIOLATION
 from websockets.asyncio.server import (
     Server,
@@ -325,10 +326,14 @@ async def events_server(
             except ConnectionClosed:
                 return
 
-            event = Event.model_validate_json(message)
-            recorder.events.append(event)
+            if message.startswith("["):
+                events = TypeAdapter(List[Event]).validate_json(message)
+            else:
+                events = [Event.model_validate_json(message)]
 
-            if puppeteer.hard_disconnect_after == event.id:
+            recorder.events.extend(events)
+
+            if puppeteer.hard_disconnect_after in {event.id for event in events}:
                 puppeteer.hard_disconnect_after = None
                 raise ValueError("Disconnect after incoming event")
 
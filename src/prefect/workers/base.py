@@ -3,14 +3,18 @@ from __future__ import annotations
 import abc
 import asyncio
 import datetime
+import json
 import threading
+import time
 import uuid
 import warnings
 from contextlib import AsyncExitStack
+from contextvars import ContextVar
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
     Generic,
     Optional,
@@ -26,6 +30,7 @@ from exceptiongroup import BaseExceptionGroup, ExceptionGroup
 from importlib_metadata import (
     distributions,  # type: ignore[reportUnknownVariableType] incomplete typing
 )
+from prometheus_client import Histogram
 from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from pydantic.json_schema import GenerateJsonSchema
 from typing_extensions import Literal, Self, TypeVar
@@ -78,7 +83,10 @@ from prefect.tasks import Task
 from prefect.types import KeyValueLabels
 from prefect.utilities.dispatch import get_registry_for_type, register_base_type
 from prefect.utilities.engine import propose_state
-from prefect.utilities.services import critical_service_loop
+from prefect.utilities.services import (
+    critical_service_loop,
+    start_client_metrics_server,
+)
 from prefect.utilities.slugify import slugify
 from prefect.utilities.templating import (
     apply_values,
@@ -95,6 +103,16 @@ if TYPE_CHECKING:
     )
     from prefect.flows import Flow
 
+SCHEDULE_TO_START_SECONDS = Histogram(
+    "prefect_worker_schedule_to_start_seconds",
+    (
+        "The number of seconds between when flow runs were expected to start and when "
+        "workers started their infrastructure"
+    ),
+    labelnames=["work_pool", "worker"],
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, float("inf")),
+)
+
 
 class BaseJobConfiguration(BaseModel):
     command: Optional[str] = Field(
@@ -429,6 +447,57 @@ C = TypeVar("C", bound=BaseJobConfiguration)
 V = TypeVar("V", bound=BaseVariables)
 R = TypeVar("R", bound=BaseWorkerResult)
 FR = TypeVar("FR")  # used to capture the return type of a flow
+T = TypeVar("T")
+
+
+class _PollLookups:
+    """
+    The API reads shared by the flow runs submitted from one poll for scheduled flow
+    runs, so that runs of the same deployment read it, its flow, and its rendered job
+    configuration once, concurrently with the other runs being submitted.
+    """
+
+    def __init__(self, client: PrefectClient):
+        self._client = client
+        self._reads: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+
+    def _once(
+        self, key: tuple[Any, ...], read: Callable[[], Awaitable[T]]
+    ) -> asyncio.Future[T]:
+        if key not in self._reads:
+            self._reads[key] = future = asyncio.ensure_future(read())
+            # failed reads are retried by the next flow run that needs them
+            future.add_done_callback(
+                lambda future: future.exception() and self._reads.pop(key, None)
+            )
+        return self._reads[key]
+
+    async def read_deployment(self, deployment_id: UUID) -> "DeploymentResponse":
+        return await self._once(
+            ("deployment", deployment_id),
+            partial(self._client.read_deployment, deployment_id),
+        )
+
+    async def read_flow(self, flow_id: UUID) -> APIFlow:
+        return await self._once(
+            ("flow", flow_id), partial(self._client.read_flow, flow_id)
+        )
+
+    async def job_configuration(
+        self,
+        key: tuple[Any, ...],
+        render: Callable[[], Awaitable[C]],
+    ) -> C:
+        # every flow run prepares its own copy of the rendered configuration
+        configuration = await self._once(("job_configuration", *key), render)
+        return configuration.model_copy(deep=True)
+
+
+# the lookups of the poll whose flow runs are being submitted; the submissions started
+# by a poll inherit them, while other reads go to the API
+_poll_lookups: ContextVar[Optional[_PollLookups]] = ContextVar(
+    "_poll_lookups", default=None
+)
 
 
 @register_base_type
@@ -491,6 +560,7 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
         self._prefetch_seconds: float = (
             prefetch_seconds or PREFECT_WORKER_PREFETCH_SECONDS.value()
         )
+        self._long_poll_seconds: float = get_current_settings().worker.long_poll_seconds
         self.heartbeat_interval_seconds: int = (
             heartbeat_interval_seconds or PREFECT_WORKER_HEARTBEAT_SECONDS.value()
         )
@@ -629,6 +699,7 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
         """
         healthcheck_server = None
         healthcheck_thread = None
+        start_client_metrics_server()
         try:
             async with self as worker:
                 # schedule the scheduled flow run polling loop
@@ -636,7 +707,11 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
                     loops_task_group.start_soon(
                         partial(
                             critical_service_loop,
-                            workload=self.get_and_submit_flow_runs,
+                            workload=(
+                                self._long_poll_and_submit_flow_runs
+                                if self._long_poll_seconds and not run_once
+                                else self.get_and_submit_flow_runs
+                            ),
                             interval=PREFECT_WORKER_QUERY_SECONDS.value(),
                             run_once=run_once,
                             jitter_range=0.3,
@@ -964,7 +1039,50 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
 
         self._last_polled_time = prefect.types._datetime.now("UTC")
 
-        return await self._submit_scheduled_flow_runs(flow_run_response=runs_response)
+        # the submissions started here share the poll's reads; later reads don't
+        token = _poll_lookups.set(_PollLookups(self.client))
+        try:
+            return await self._submit_scheduled_flow_runs(
+                flow_run_response=runs_response
+            )
+        finally:
+            _poll_lookups.reset(token)
+
+    async def _long_poll_and_submit_flow_runs(self) -> None:
+        """
+        Polls for scheduled flow runs back to back, with the server holding each
+        query open until flow runs are scheduled or `PREFECT_WORKER_LONG_POLL_SECONDS`
+        pass.
+
+        An error after a successful poll ends the loop without raising, so that the
+        polling service loop waits before polling again and only backs off after
+        consecutive failures.
+        """
+        polled = False
+        while True:
+            started = time.monotonic()
+            already_submitting = set(self._submitting_flow_run_ids)
+            try:
+                flow_runs = await self.get_and_submit_flow_runs()
+            except Exception:
+                if not polled:
+                    raise
+                self._logger.debug(
+                    "Error while long polling for flow runs", exc_info=True
+                )
+                return
+            polled = True
+
+            if any(run.id not in already_submitting for run in flow_runs):
+                continue
+
+            # Nothing new was submitted, so the query returned without waiting: the
+            # worker is at its flow run limit, runs are still being submitted, or the
+            # server doesn't support long polling.  Wait out the rest of the poll
+            # rather than querying again right away.
+            await anyio.sleep(
+                max(self._long_poll_seconds - (time.monotonic() - started), 0)
+            )
 
     async def _update_local_work_pool_info(self) -> None:
         if TYPE_CHECKING:
@@ -1114,6 +1232,17 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
         scheduled_before = prefect.types._datetime.now("UTC") + datetime.timedelta(
             seconds=int(self._prefetch_seconds)
         )
+        limit = None
+        if self._limiter:
+            # Runs that are still being submitted are returned again until they're
+            # pending, so look past them for as many runs as there are free slots
+            limit = int(self._limiter.available_tokens) + len(
+                self._submitting_flow_run_ids
+            )
+            if not limit:
+                self._logger.debug("Flow run limit reached; skipping query.")
+                return []
+
         self._logger.debug(
             f"Querying for flow runs scheduled before {scheduled_before}"
         )
@@ -1123,6 +1252,8 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
                     work_pool_name=self._work_pool_name,
                     scheduled_before=scheduled_before,
                     work_queue_names=list(self._work_queues),
+                    limit=limit,
+                    wait_seconds=self._long_poll_seconds,
                 )
             )
             self._logger.debug(
@@ -1200,7 +1331,7 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
 
         if flow_run.deployment_id:
             try:
-                await self.client.read_deployment(flow_run.deployment_id)
+                await self._read_deployment(flow_run.deployment_id)
             except ObjectNotFound:
                 self._logger.exception(
                     f"Deployment {flow_run.deployment_id} no longer exists. "
@@ -1226,6 +1357,15 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
             )
 
             if readiness_result and not isinstance(readiness_result, Exception):
+                if flow_run.expected_start_time:
+                    SCHEDULE_TO_START_SECONDS.labels(
+                        work_pool=self._work_pool_name, worker=self.name
+                    ).observe(
+                        (
+                            prefect.types._datetime.now("UTC")
+                            - flow_run.expected_start_time
+                        ).total_seconds()
+                    )
                 try:
                     await self.client.update_flow_run(
                         flow_run_id=flow_run.id,
@@ -1343,9 +1483,13 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
         deployment: Optional["DeploymentResponse"] = None,
     ) -> C:
         if not deployment and flow_run.deployment_id:
-            deployment = await self.client.read_deployment(flow_run.deployment_id)
+            deployment = await self._read_deployment(flow_run.deployment_id)
 
-        flow = await self.client.read_flow(flow_run.flow_id)
+        lookups = _poll_lookups.get()
+        if lookups:
+            flow = await lookups.read_flow(flow_run.flow_id)
+        else:
+            flow = await self.client.read_flow(flow_run.flow_id)
 
         deployment_vars = getattr(deployment, "job_variables", {}) or {}
         flow_run_vars = flow_run.job_variables or {}
@@ -1356,11 +1500,22 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
             job_variables["env"].update(flow_run_vars.pop("env", {}))
         job_variables.update(flow_run_vars)
 
-        configuration = await self.job_configuration.from_template_and_values(
+        render = partial(
+            self.job_configuration.from_template_and_values,
             base_job_template=self.work_pool.base_job_template,
             values=job_variables,
             client=self.client,
         )
+        if lookups:
+            configuration = await lookups.job_configuration(
+                (
+                    getattr(deployment, "id", None),
+                    json.dumps(job_variables, sort_keys=True, default=str),
+                ),
+                render,
+            )
+        else:
+            configuration = await render()
         try:
             configuration.prepare_for_flow_run(
                 flow_run=flow_run,
@@ -1383,6 +1538,12 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
             )
         return configuration
 
+    async def _read_deployment(self, deployment_id: UUID) -> "DeploymentResponse":
+        lookups = _poll_lookups.get()
+        if lookups:
+            return await lookups.read_deployment(deployment_id)
+        return await self.client.read_deployment(deployment_id)
+
     async def _propose_pending_state(self, flow_run: "FlowRun") -> bool:
         run_logger = self.get_flow_run_logger(flow_run)
         state = flow_run.state
@@ -22,6 +22,7 @@ from prefect.exceptions import PrefectHTTPStatusError
 from prefect.settings import (
     PREFECT_API_URL,
     PREFECT_CLIENT_CUSTOM_HEADERS,
+    PREFECT_CLIENT_HTTP_CACHE_MAX_BYTES,
     PREFECT_CLIENT_MAX_RETRIES,
     PREFECT_CLIENT_RETRY_EXTRA_CODES,
     PREFECT_CLIENT_RETRY_JITTER_FACTOR,
@@ -744,6 +745,113 @@ class TestCsrfSupport:
             assert client.enable_csrf_support is False
 
 
+class TestHttpCache:
+    API_URL = "http://fake.url/api"
+
+    @staticmethod
+    def tagged_response(status_code: int, etag: str, **kwargs: Any) -> Response:
+        return Response(
+            status_code,
+            headers={"ETag": etag},
+            request=Request("GET", "http://fake.url/api/deployments/1"),
+            **kwargs,
+        )
+
+    async def test_revalidates_cached_responses(self):
+        responses = [
+            self.tagged_response(status.HTTP_200_OK, '"a"', json={"x": 1}),
+            self.tagged_response(status.HTTP_304_NOT_MODIFIED, '"a"'),
+        ]
+        async with mocked_client(responses, base_url=self.API_URL) as (client, send):
+            first = await client.get("/deployments/1")
+            second = await client.get("/deployments/1")
+
+        assert "If-None-Match" not in send.call_args_list[0][0][1].headers
+        assert send.call_args_list[1][0][1].headers["If-None-Match"] == '"a"'
+        assert second.status_code == status.HTTP_200_OK
+        assert second.json() == first.json() == {"x": 1}
+        assert second.request is send.call_args_list[1][0][1]
+
+    async def test_replaces_changed_responses(self):
+        responses = [
+            self.tagged_response(status.HTTP_200_OK, '"a"', json={"x": 1}),
+            self.tagged_response(status.HTTP_200_OK, '"b"', json={"x": 2}),
+            self.tagged_response(status.HTTP_304_NOT_MODIFIED, '"b"'),
+        ]
+        async with mocked_client(responses, base_url=self.API_URL) as (client, send):
+            await client.get("/deployments/1")
+            changed = await client.get("/deployments/1")
+            unchanged = await client.get("/deployments/1")
+
+        assert send.call_args_list[2][0][1].headers["If-None-Match"] == '"b"'
+        assert changed.json() == unchanged.json() == {"x": 2}
+
+    async def test_caches_by_url(self):
+        responses = [
+            self.tagged_response(status.HTTP_200_OK, '"a"', json={"x": 1}),
+            self.tagged_response(status.HTTP_200_OK, '"b"', json={"x": 2}),
+        ]
+        async with mocked_client(responses, base_url=self.API_URL) as (client, send):
+            await client.get("/deployments/1", params={"x": 1})
+            await client.get("/deployments/1", params={"x": 2})
+
+        assert "If-None-Match" not in send.call_args_list[1][0][1].headers
+
+    async def test_does_not_cache_other_methods(self):
+        responses = [
+            self.tagged_response(status.HTTP_200_OK, '"a"', json={"x": 1}),
+            self.tagged_response(status.HTTP_200_OK, '"a"', json={"x": 1}),
+        ]
+        async with mocked_client(responses, base_url=self.API_URL) as (client, send):
+            await client.post("/deployments/1")
+            await client.post("/deployments/1")
+
+        assert "If-None-Match" not in send.call_args_list[1][0][1].headers
+
+    async def test_does_not_cache_other_routes(self):
+        responses = [
+            self.tagged_response(status.HTTP_200_OK, '"a"', json={"x": 1}),
+            self.tagged_response(status.HTTP_200_OK, '"a"', json={"x": 1}),
+        ]
+        async with mocked_client(responses, base_url=self.API_URL) as (client, send):
+            await client.get("/flow_runs/1")
+            await client.get("/flow_runs/1")
+
+        assert not client.http_cache
+        assert "If-None-Match" not in send.call_args_list[1][0][1].headers
+
+    async def test_cache_is_bounded_by_bytes(self):
+        responses = [
+            self.tagged_response(status.HTTP_200_OK, '"a"', content=b"a" * 60),
+            self.tagged_response(status.HTTP_200_OK, '"b"', content=b"b" * 60),
+            self.tagged_response(status.HTTP_200_OK, '"c"', content=b"c" * 200),
+        ]
+        with temporary_settings({PREFECT_CLIENT_HTTP_CACHE_MAX_BYTES: 100}):
+            async with mocked_client(responses, base_url=self.API_URL) as (client, _):
+                await client.get("/deployments/1")
+                await client.get("/deployments/2")
+                await client.get("/deployments/3")
+
+        assert client.http_cache is not None
+        assert list(client.http_cache) == [f"{self.API_URL}/deployments/2"]
+
+    async def test_cache_can_be_disabled(self):
+        responses = [
+            self.tagged_response(status.HTTP_200_OK, '"a"', json={"x": 1}),
+            self.tagged_response(status.HTTP_200_OK, '"a"', json={"x": 1}),
+        ]
+        with temporary_settings({PREFECT_CLIENT_HTTP_CACHE_MAX_BYTES: 0}):
+            async with mocked_client(responses, base_url=self.API_URL) as (
+                client,
+                send,
+            ):
+                await client.get("/deployments/1")
+                await client.get("/deployments/1")
+
+        assert client.http_cache is None
+        assert "If-None-Match" not in send.call_args_list[1][0][1].headers
+
+
 class TestUserAgent:
     @pytest.fixture
     def prefect_version(self, monkeypatch: pytest.MonkeyPatch) -> str:
@@ -88,7 +88,7 @@ from prefect.settings import (
     PREFECT_TESTING_UNIT_TEST_MODE,
     temporary_settings,
 )
-from prefect.states import Completed, Pending, Running, Scheduled, State
+from prefect.states import Cancelled, Completed, Pending, Running, Scheduled, State
 from prefect.tasks import task
 from prefect.testing.utilities import AsyncMock, exceptions_equal
 from prefect.types._datetime import DateTime, now
@@ -1035,6 +1035,28 @@ async def test_set_flow_run_state_404_is_object_not_found(prefect_client):
         )
 
 
+async def test_set_flow_run_states(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    flow_run_ids = [(await prefect_client.create_flow_run(foo)).id for _ in range(3)]
+    results = await prefect_client.set_flow_run_states(
+        [*flow_run_ids, uuid4()],
+        state=Cancelled(message="Test!"),
+    )
+    assert set(results) == set(flow_run_ids)
+    for flow_run_id, result in results.items():
+        assert isinstance(result, OrchestrationResult)
+        assert result.status == SetStateStatus.ACCEPT
+        assert result.state.is_cancelled()
+        assert result.state.state_details.flow_run_id == flow_run_id
+
+        flow_run = await prefect_client.read_flow_run(flow_run_id)
+        assert flow_run.state.is_cancelled()
+        assert flow_run.state.message == "Test!"
+
+
 async def test_read_flow_runs_without_filter(prefect_client):
     @flow
     def foo():
@@ -0,0 +1,151 @@
+import asyncio
+from typing import Generator
+from unittest import mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect._internal.concurrency.api import create_call, from_async
+from prefect.client.orchestration import PrefectClient
+from prefect.concurrency.asyncio import concurrency
+from prefect.concurrency.services import ConcurrencySlotBroker
+from prefect.concurrency.sync import concurrency as sync_concurrency
+from prefect.server.models.concurrency_limits_v2 import (
+    create_concurrency_limit,
+    read_concurrency_limit,
+)
+from prefect.server.schemas.core import ConcurrencyLimitV2
+from prefect.settings import (
+    PREFECT_CLIENT_CONCURRENCY_LEASE_BLOCK_SIZE,
+    PREFECT_CLIENT_CONCURRENCY_LEASE_IDLE_TIMEOUT,
+    temporary_settings,
+)
+
+
+@pytest.fixture(autouse=True)
+def brokered_leases() -> Generator[None, None, None]:
+    with temporary_settings(
+        {
+            PREFECT_CLIENT_CONCURRENCY_LEASE_BLOCK_SIZE: 5,
+            PREFECT_CLIENT_CONCURRENCY_LEASE_IDLE_TIMEOUT: 0.5,
+        }
+    ):
+        yield
+
+    for broker in list(ConcurrencySlotBroker._instances.values()):
+        from_async.call_soon_in_loop_thread(create_call(broker.shutdown)).result()
+
+
+async def create_limit(session: AsyncSession, limit: int) -> ConcurrencyLimitV2:
+    concurrency_limit = await create_concurrency_limit(
+        session=session,
+        concurrency_limit=ConcurrencyLimitV2(name="test", limit=limit),
+    )
+    await session.commit()
+    return ConcurrencyLimitV2.model_validate(concurrency_limit, from_attributes=True)
+
+
+async def active_slots(session: AsyncSession, limit: ConcurrencyLimitV2) -> int:
+    session.expire_all()
+    concurrency_limit = await read_concurrency_limit(
+        session=session, concurrency_limit_id=limit.id
+    )
+    assert concurrency_limit
+    return concurrency_limit.active_slots
+
+
+@pytest.fixture
+def increment_spy() -> Generator[mock.MagicMock, None, None]:
+    with mock.patch.object(
+        PrefectClient,
+        "increment_concurrency_slots_with_lease",
+        autospec=True,
+        side_effect=PrefectClient.increment_concurrency_slots_with_lease,
+    ) as spy:
+        yield spy
+
+
+async def test_uses_share_a_leased_block(
+    session: AsyncSession, increment_spy: mock.MagicMock
+):
+    limit = await create_limit(session, limit=10)
+
+    for _ in range(20):
+        async with concurrency("test"):
+            # the whole block is held, not just the slot for this use
+            assert await active_slots(session, limit) == 5
+
+    assert increment_spy.call_count == 1
+
+    # the block is released once it's idle
+    for _ in range(50):
+        if not await active_slots(session, limit):
+            break
+        await asyncio.sleep(0.1)
+    assert await active_slots(session, limit) == 0
+
+
+async def test_limits_are_still_enforced(
+    session: AsyncSession, increment_spy: mock.MagicMock
+):
+    # a block of 5 slots is more than the limit allows, so slots are leased as needed
+    limit = await create_limit(session, limit=2)
+
+    running = 0
+    most_running = 0
+
+    async def use():
+        nonlocal running, most_running
+        async with concurrency("test"):
+            running += 1
+            most_running = max(most_running, running)
+            assert await active_slots(session, limit) <= 2
+            await asyncio.sleep(0.2)
+            running -= 1
+
+    await asyncio.gather(*(use() for _ in range(6)))
+
+    assert most_running == 2
+    assert increment_spy.call_args.kwargs["slots"] <= 2
+
+
+async def test_sync_uses_share_a_leased_block(
+    session: AsyncSession, increment_spy: mock.MagicMock
+):
+    limit = await create_limit(session, limit=10)
+
+    def uses():
+        for _ in range(5):
+            with sync_concurrency("test"):
+                pass
+
+    await asyncio.to_thread(uses)
+
+    assert increment_spy.call_count == 1
+    assert await active_slots(session, limit) == 5
+
+
+async def test_strict_uses_lease_their_own_slots(
+    session: AsyncSession, increment_spy: mock.MagicMock
+):
+    await create_limit(session, limit=10)
+
+    async with concurrency("test", strict=True):
+        pass
+
+    assert increment_spy.call_count == 1
+    assert increment_spy.call_args.kwargs["slots"] == 1
+    assert not ConcurrencySlotBroker._instances
+
+
+async def test_broker_is_replaced_after_shutdown(session: AsyncSession):
+    await create_limit(session, limit=10)
+
+    async with concurrency("test"):
+        pass
+
+    broker = ConcurrencySlotBroker.instance(frozenset(["test"]), 300)
+    from_async.call_soon_in_loop_thread(create_call(broker.shutdown)).result()
+
+    assert not ConcurrencySlotBroker._instances
+    assert ConcurrencySlotBroker.instance(frozenset(["test"]), 300) is not broker
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import ssl
 from typing import Type
@@ -17,6 +18,7 @@ from prefect.settings import (
     PREFECT_API_KEY,
     PREFECT_API_TLS_INSECURE_SKIP_VERIFY,
     PREFECT_API_URL,
+    PREFECT_CLIENT_EVENTS_BATCH_SIZE,
     PREFECT_CLOUD_API_URL,
     PREFECT_SERVER_ALLOW_EPHEMERAL_MODE,
     temporary_settings,
@@ -214,6 +216,117 @@ async def test_reconnects_and_resends_after_hard_disconnect(
     )
 
 
+async def test_emit_many_sends_events_in_batches(
+    events_api_url: str,
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    recorder: Recorder,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    client = PrefectEventsClient(events_api_url, batch_size=2)
+    sent: list[str] = []
+
+    async with client:
+        assert client._websocket
+        send = client._websocket.send
+
+        async def recording_send(message: str) -> None:
+            sent.append(message)
+            await send(message)
+
+        monkeypatch.setattr(client._websocket, "send", recording_send)
+        await client.emit_many([example_event_1, example_event_2, example_event_3])
+
+    assert [message.startswith("[") for message in sent] == [True, True]
+    assert recorder.events == [example_event_1, example_event_2, example_event_3]
+
+
+async def test_cloud_client_does_not_batch_events(
+    events_cloud_api_url: str,
+    example_event_1: Event,
+    example_event_2: Event,
+    recorder: Recorder,
+):
+    with temporary_settings({PREFECT_CLIENT_EVENTS_BATCH_SIZE: 10}):
+        client = PrefectCloudEventsClient(events_cloud_api_url, "my-token")
+    assert client._batch_size == 1
+
+    async with client:
+        await client.emit_many([example_event_1, example_event_2])
+
+    assert recorder.events == [example_event_1, example_event_2]
+
+
+async def test_reconnects_and_resends_batches_after_hard_disconnect(
+    events_api_url: str,
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    example_event_4: Event,
+    example_event_5: Event,
+    recorder: Recorder,
+    puppeteer: Puppeteer,
+):
+    client = PrefectEventsClient(events_api_url, checkpoint_every=1, batch_size=2)
+    async with client:
+        await client.emit_many([example_event_1])
+
+        puppeteer.hard_disconnect_after = example_event_2.id
+        await client.emit_many([example_event_2, example_event_3])
+        await client.emit_many([example_event_4, example_event_5])
+
+    assert recorder.connections == 2
+    assert_recorded_events_in_order(
+        recorder,
+        [
+            example_event_1,
+            example_event_2,
+            example_event_3,
+            example_event_4,
+            example_event_5,
+        ],
+    )
+
+
+async def test_pipelines_checkpoints_up_to_max_unconfirmed(
+    events_api_url: str,
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    example_event_4: Event,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    client = PrefectEventsClient(events_api_url, checkpoint_every=1, max_unconfirmed=3)
+    async with client:
+        pongs: list[asyncio.Future[float]] = []
+
+        async def ping() -> asyncio.Future[float]:
+            pongs.append(asyncio.get_running_loop().create_future())
+            return pongs[-1]
+
+        monkeypatch.setattr(client._websocket, "ping", ping)
+
+        # events are sent without waiting for their checkpoints...
+        await client.emit(example_event_1)
+        await client.emit(example_event_2)
+        assert client._unconfirmed_events == [example_event_1, example_event_2]
+
+        # ...and are confirmed as their checkpoints complete
+        pongs[0].set_result(0.0)
+        await client.emit(example_event_3)
+        assert client._unconfirmed_events == [example_event_2, example_event_3]
+
+        # once too many events are unconfirmed, the client waits for a checkpoint
+        emitting = asyncio.create_task(client.emit(example_event_4))
+        await asyncio.sleep(0.1)
+        assert not emitting.done()
+
+        pongs[1].set_result(0.0)
+        await emitting
+        assert client._unconfirmed_events == [example_event_3, example_event_4]
+
+
 @pytest.mark.parametrize("attempts", [4, 1, 0])
 async def test_gives_up_after_a_certain_amount_of_tries(
     Client: Type[PrefectEventsClient],
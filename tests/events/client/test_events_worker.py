@@ -13,6 +13,7 @@ from prefect.events.utilities import emit_event
 from prefect.events.worker import EventsWorker
 from prefect.settings import (
     PREFECT_API_URL,
+    PREFECT_CLIENT_EVENTS_BATCH_SIZE,
     temporary_settings,
 )
 
@@ -34,6 +35,34 @@ def test_emits_event_via_client(asserting_events_worker: EventsWorker, event: Ev
     assert asserting_events_worker._client.events == [event]
 
 
+def test_batched_events_are_emitted_when_one_fails(monkeypatch: pytest.MonkeyPatch):
+    events = [
+        Event(event=f"vogon.poetry.read.{i}", resource={"prefect.resource.id": "poem"})
+        for i in range(10)
+    ]
+    original = EventsWorker.attach_related_resources_from_context
+
+    async def attach_related_resources_from_context(self, event: Event) -> None:
+        if event is events[3]:
+            raise ValueError("Resistance is useless")
+        await original(self, event)
+
+    monkeypatch.setattr(
+        EventsWorker,
+        "attach_related_resources_from_context",
+        attach_related_resources_from_context,
+    )
+
+    with temporary_settings({PREFECT_CLIENT_EVENTS_BATCH_SIZE: 10}):
+        worker = EventsWorker.instance(AssertingEventsClient)
+        for event in events:
+            worker.send(event)
+        worker.drain()
+
+    assert isinstance(worker._client, AssertingEventsClient)
+    assert worker._client.events == events[:3] + events[4:]
+
+
 def test_worker_instance_server_client_non_cloud_api_url():
     with temporary_settings(updates={PREFECT_API_URL: "http://localhost:8080/api"}):
         worker = EventsWorker.instance()
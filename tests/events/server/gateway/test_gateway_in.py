@@ -63,6 +63,28 @@ def test_stream_events_in(
     stream_publish.assert_has_awaits([mock.call(event) for event in server_events])
 
 
+def test_stream_events_in_batches(
+    test_client: TestClient,
+    frozen_time: DateTime,
+    event1: Event,
+    event2: Event,
+    stream_publish: mock.AsyncMock,
+):
+    websocket: WebSocketTestSession
+    with test_client.websocket_connect("/api/events/in") as websocket:
+        websocket.send_text(
+            "[" + ",".join([event1.model_dump_json(), event2.model_dump_json()]) + "]"
+        )
+        websocket.send_text(event1.model_dump_json())
+
+    server_events = [
+        event1.receive(received=frozen_time),
+        event2.receive(received=frozen_time),
+        event1.receive(received=frozen_time),
+    ]
+    stream_publish.assert_has_awaits([mock.call(event) for event in server_events])
+
+
 def test_post_events(
     test_client: TestClient,
     frozen_time: DateTime,
@@ -22,6 +22,10 @@ from prefect.server.events.storage.database import (
     read_events,
     write_events,
 )
+from prefect.settings import (
+    PREFECT_SERVER_EVENTS_POSTGRES_WRITE_METHOD,
+    temporary_settings,
+)
 from prefect.types._datetime import DateTime, now
 
 
@@ -168,6 +172,82 @@ class TestWriteEvents:
                 assert len(list(results)) == len(event.related) + 1
 
 
+class TestCopyWriteMethod:
+    @pytest.fixture(autouse=True)
+    def copy_write_method(self):
+        with temporary_settings({PREFECT_SERVER_EVENTS_POSTGRES_WRITE_METHOD: "copy"}):
+            yield
+
+    async def test_write_events(
+        self,
+        session: AsyncSession,
+        db: PrefectDBInterface,
+        event: ReceivedEvent,
+        other_events: List[ReceivedEvent],
+    ):
+        # On SQLite the setting has no effect, so this is the regular write path
+        async with session as session:
+            await write_events(session=session, events=[event, *other_events])
+            await session.commit()
+
+        async with session as session:
+            events = await read_events(
+                session=session,
+                events_filter=EventFilter(id=EventIDFilter(id=[event.id])),
+            )
+            assert len(events) == 1
+            assert events[0].payload == {"hello": "world"}
+            assert events[0].related_resource_ids == [
+                "related-1",
+                "related-2",
+                "related-3",
+            ]
+
+            results = await session.execute(
+                sa.select(sa.func.count()).select_from(db.EventResource)
+            )
+            assert results.scalar() == 4 * (len(other_events) + 1)
+
+    async def test_write_events_ignores_duplicates(
+        self,
+        session: AsyncSession,
+        db: PrefectDBInterface,
+        event: ReceivedEvent,
+        other_events: List[ReceivedEvent],
+    ):
+        for chunk in (other_events[:500], other_events[500:]):
+            async with session as session:
+                await write_events(session=session, events=[*chunk, event])
+                await session.commit()
+
+        async with session as session:
+            results = await session.execute(
+                sa.select(db.Event).where(db.Event.id == event.id)
+            )
+            assert len(list(results)) == 1
+
+            results = await session.execute(
+                sa.select(db.EventResource).where(db.EventResource.event_id == event.id)
+            )
+            assert len(list(results)) == len(event.related) + 1
+
+    async def test_write_events_replaces_non_finite_json_values(
+        self, session: AsyncSession, event: ReceivedEvent
+    ):
+        event.payload = {"nan": float("nan"), "inf": float("inf"), "ok": 1.5}
+
+        async with session as session:
+            await write_events(session=session, events=[event])
+            await session.commit()
+
+        async with session as session:
+            events = await read_events(
+                session=session,
+                events_filter=EventFilter(id=EventIDFilter(id=[event.id])),
+            )
+            assert events[0].payload == {"nan": None, "inf": None, "ok": 1.5}
+
+
 class TestReadEvents:
     @pytest.fixture
     async def event_1(self, session: AsyncSession) -> ReceivedEvent:
@@ -0,0 +1,142 @@
+import datetime
+from uuid import uuid4
+
+import pytest
+
+from prefect.server.events.filters import (
+    EventAnyResourceFilter,
+    EventFilter,
+    EventIDFilter,
+    EventNameFilter,
+    EventOccurredFilter,
+    EventRelatedFilter,
+    EventResourceFilter,
+)
+from prefect.server.events.schemas.events import (
+    ReceivedEvent,
+    ResourceSpecification,
+    any_matcher,
+    matches,
+)
+from prefect.types._datetime import now
+
+NOW = now("UTC")
+EVENT_ID = uuid4()
+
+EVENTS = [
+    ReceivedEvent(
+        occurred=NOW,
+        event="prefect.flow-run.Completed",
+        resource={
+            "prefect.resource.id": "prefect.flow-run.abc",
+            "prefect.resource.name": "happy-otter",
+        },
+        related=[
+            {
+                "prefect.resource.id": "prefect.flow.123",
+                "prefect.resource.role": "flow",
+            },
+            {
+                "prefect.resource.id": "prefect.tag.nightly",
+                "prefect.resource.role": "tag",
+            },
+        ],
+        id=EVENT_ID,
+    ),
+    ReceivedEvent(
+        occurred=NOW - datetime.timedelta(days=2),
+        event="prefect.task-run.Failed",
+        resource={"prefect.resource.id": "prefect.task-run.def", "team": "data"},
+        id=uuid4(),
+    ),
+    ReceivedEvent(
+        occurred=NOW,
+        event="custom.thing",
+        resource={"prefect.resource.id": "custom.resource"},
+        related=[
+            {
+                "prefect.resource.id": "prefect.flow.456",
+                "prefect.resource.role": "flow",
+            },
+        ],
+        id=uuid4(),
+    ),
+]
+
+LIBERAL = EventOccurredFilter(
+    since=NOW - datetime.timedelta(days=1), until=NOW + datetime.timedelta(days=1)
+)
+
+FILTERS = [
+    EventFilter(),
+    EventFilter(occurred=LIBERAL),
+    EventFilter(occurred=LIBERAL, event=EventNameFilter()),
+    EventFilter(occurred=LIBERAL, event=EventNameFilter(prefix=["prefect.flow-run."])),
+    EventFilter(occurred=LIBERAL, event=EventNameFilter(exclude_prefix=["prefect."])),
+    EventFilter(occurred=LIBERAL, event=EventNameFilter(name=["custom.thing"])),
+    EventFilter(occurred=LIBERAL, event=EventNameFilter(exclude_name=["custom.thing"])),
+    EventFilter(
+        occurred=LIBERAL,
+        resource=EventResourceFilter(id=["prefect.flow-run.abc", "custom.resource"]),
+    ),
+    EventFilter(occurred=LIBERAL, resource=EventResourceFilter(id_prefix=["prefect."])),
+    EventFilter(
+        occurred=LIBERAL,
+        resource=EventResourceFilter(
+            labels=ResourceSpecification({"prefect.resource.name": "happy-*"})
+        ),
+    ),
+    EventFilter(
+        occurred=LIBERAL,
+        resource=EventResourceFilter(
+            labels=ResourceSpecification({"prefect.resource.id": "!prefect.task-run.*"})
+        ),
+    ),
+    EventFilter(
+        occurred=LIBERAL,
+        any_resource=EventAnyResourceFilter(id_prefix=["prefect.flow."]),
+    ),
+    EventFilter(
+        occurred=LIBERAL,
+        any_resource=[
+            EventAnyResourceFilter(id=["prefect.flow.123"]),
+            EventAnyResourceFilter(
+                labels=ResourceSpecification({"prefect.resource.role": "tag"})
+            ),
+        ],
+    ),
+    EventFilter(
+        occurred=LIBERAL,
+        related=EventRelatedFilter(id=["prefect.flow.123"]),
+    ),
+    EventFilter(id=EventIDFilter(id=[EVENT_ID])),
+]
+
+
+@pytest.mark.parametrize("filter", FILTERS)
+@pytest.mark.parametrize("event", EVENTS, ids=lambda event: event.event)
+def test_predicate_is_equivalent_to_includes(filter: EventFilter, event: ReceivedEvent):
+    assert filter.predicate()(event) == filter.includes(event)
+
+
+@pytest.mark.parametrize(
+    "expected",
+    [
+        [],
+        ["a"],
+        ["a*"],
+        ["*"],
+        ["!a"],
+        ["!a*"],
+        ["!a", "!b"],
+        ["!*"],
+        ["a", "!b*"],
+        ["abc", "b*", "!c"],
+        ["!"],
+    ],
+)
+@pytest.mark.parametrize("value", [None, "", "a", "abc", "b", "bcd", "c"])
+def test_any_matcher_is_equivalent_to_matches(expected: list[str], value: str):
+    assert any_matcher(expected)(value) == any(
+        matches(candidate, value) for candidate in expected
+    )
@@ -231,3 +231,78 @@ async def test_event_filter_is_applied_to_event_stream(
     # event 2 will be skipped because it doesn't match the filter
     streamed = await filtered_subscription.__anext__()
     assert streamed == received_event3
+
+
+async def test_subscribers_with_identical_filters_share_a_route(
+    default_liberal_filter: EventFilter,
+    filter_by_events: EventFilter,
+    received_event1: ReceivedEvent,
+    received_event2: ReceivedEvent,
+):
+    async with stream.subscribed(default_liberal_filter) as one:
+        async with stream.subscribed(default_liberal_filter.model_copy()) as two:
+            async with stream.subscribed(filter_by_events) as three:
+                routes = stream.routes()
+                assert len(routes) == 2
+                assert sorted(len(group) for _, group in routes) == [1, 2]
+                assert stream.routes() is routes
+
+                for includes, group in routes:
+                    queues = {queue for queue, _ in group}
+                    if three in queues:
+                        assert includes(received_event1)
+                        assert not includes(received_event2)
+                    else:
+                        assert queues == {one, two}
+                        assert includes(received_event2)
+
+            # routes are rebuilt when subscribers change
+            assert [{queue for queue, _ in group} for _, group in stream.routes()] == [
+                {one, two}
+            ]
+
+    assert stream.routes() == []
+
+
+async def test_subscribers_with_different_windows_share_a_route(
+    received_event1: ReceivedEvent,
+):
+    current = EventFilter(
+        occurred=EventOccurredFilter(
+            since=received_event1.occurred - datetime.timedelta(minutes=1),
+            until=received_event1.occurred + datetime.timedelta(minutes=1),
+        )
+    )
+    past = EventFilter(
+        occurred=EventOccurredFilter(
+            since=received_event1.occurred - datetime.timedelta(days=2),
+            until=received_event1.occurred - datetime.timedelta(days=1),
+        )
+    )
+
+    async with stream.subscribed(current) as one:
+        async with stream.subscribed(past) as two:
+            [(includes, group)] = stream.routes()
+            assert includes(received_event1)
+
+            occurred = dict(group)
+            assert occurred.keys() == {one, two}
+            assert occurred[one](received_event1)
+            assert not occurred[two](received_event1)
+
+
+async def test_events_outside_a_subscribers_window_are_not_streamed(
+    distributor_running: None,
+    received_event1: ReceivedEvent,
+):
+    past = EventFilter(
+        occurred=EventOccurredFilter(
+            since=received_event1.occurred - datetime.timedelta(days=2),
+            until=received_event1.occurred - datetime.timedelta(days=1),
+        )
+    )
+
+    async with stream.events(past) as subscription:
+        await messaging.publish([received_event1])
+
+        assert await subscription.__anext__() is None
@@ -92,6 +92,7 @@ async def test_loads_new_automations_on_changes(
 
         (trigger,) = new_automation.triggers_of_type(EventTrigger)
         assert trigger.id in triggers.triggers
+        assert trigger.id in triggers.trigger_index
 
 
 async def test_gracefully_handles_create_then_delete(
@@ -122,6 +123,7 @@ async def test_gracefully_handles_create_then_delete(
 
         (trigger,) = new_automation.triggers_of_type(EventTrigger)
         assert trigger.id not in triggers.triggers
+        assert trigger.id not in triggers.trigger_index
 
 
 async def test_updates_existing_automations_on_changes(
@@ -157,6 +159,7 @@ async def test_updates_existing_automations_on_changes(
 
         (trigger,) = automation_to_update.triggers_of_type(EventTrigger)
         assert trigger.id in triggers.triggers
+        assert trigger.id in triggers.trigger_index
 
 
 async def test_removes_disabled_automations(
@@ -190,6 +193,7 @@ async def test_removes_disabled_automations(
 
         (trigger,) = automation.triggers_of_type(EventTrigger)
         assert trigger.id not in triggers.triggers
+        assert trigger.id not in triggers.trigger_index
 
 
 async def test_removes_existing_automations_on_changes(
@@ -216,6 +220,7 @@ async def test_removes_existing_automations_on_changes(
 
         (trigger,) = automation.triggers_of_type(EventTrigger)
         assert trigger.id not in triggers.triggers
+        assert trigger.id not in triggers.trigger_index
 
 
 async def test_gracefully_handles_errors_during_changes(
@@ -247,6 +252,7 @@ async def test_gracefully_handles_errors_during_changes(
 
         (trigger,) = automation.triggers_of_type(EventTrigger)
         assert trigger.id in triggers.triggers
+        assert trigger.id in triggers.trigger_index
 
         # now do it again where no error will occur and ensure it takes effect
         automation = list(triggers.automations_by_id.values())[1]
@@ -266,3 +272,4 @@ async def test_gracefully_handles_errors_during_changes(
 
         (trigger,) = automation.triggers_of_type(EventTrigger)
         assert trigger.id not in triggers.triggers
+        assert trigger.id not in triggers.trigger_index
@@ -0,0 +1,135 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from prefect.server.events.schemas.automations import EventTrigger, Posture
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.events.trigger_index import TriggerIndex
+from prefect.types._datetime import now
+
+
+def make_trigger(**kwargs: Any) -> EventTrigger:
+    return EventTrigger(posture=Posture.Reactive, **kwargs)
+
+
+def make_event(event: str, resource_id: str, **labels: str) -> ReceivedEvent:
+    return ReceivedEvent(
+        occurred=now("UTC"),
+        event=event,
+        resource={"prefect.resource.id": resource_id, **labels},
+        id=uuid4(),
+    )
+
+
+TRIGGERS = {
+    "everything": make_trigger(),
+    "exact-event": make_trigger(expect={"prefect.flow-run.Failed"}),
+    "wildcard-event": make_trigger(expect={"prefect.flow-run.*"}),
+    "leading-wildcard-event": make_trigger(expect={"*.Failed"}),
+    "after-event": make_trigger(
+        expect={"prefect.flow-run.Completed"}, after={"prefect.flow-run.Running"}
+    ),
+    "exact-resource": make_trigger(
+        match={"prefect.resource.id": "prefect.flow-run.abc"}
+    ),
+    "wildcard-resource": make_trigger(
+        expect={"prefect.flow-run.Failed"},
+        match={"prefect.resource.id": ["prefect.deployment.*", "prefect.flow-run.*"]},
+    ),
+    "negated-resource": make_trigger(match={"prefect.resource.id": "!prefect.flow.*"}),
+    "other-label": make_trigger(match={"prefect.resource.name": "my-flow-run"}),
+    "mixed-labels": make_trigger(
+        match={"prefect.resource.id": "!prefect.flow.*", "team": ["data", "ml"]}
+    ),
+    "no-possible-values": make_trigger(
+        expect={"prefect.task-run.Failed"}, match={"team": []}
+    ),
+}
+
+EVENTS = [
+    make_event("prefect.flow-run.Failed", "prefect.flow-run.abc"),
+    make_event("prefect.flow-run.Failed", "prefect.flow-run.def"),
+    make_event("prefect.flow-run.Running", "prefect.flow-run.abc"),
+    make_event("prefect.flow-run.Completed", "prefect.flow-run.xyz"),
+    make_event("prefect.task-run.Failed", "prefect.task-run.abc", team="ml"),
+    make_event("prefect.flow.created", "prefect.flow.abc", team="data"),
+    make_event(
+        "prefect.flow-run.Failed",
+        "prefect.flow-run.ghi",
+        **{"prefect.resource.name": "my-flow-run"},
+    ),
+    make_event("prefect.deployment.updated", "prefect.deployment.abc", team="web"),
+]
+
+
+@pytest.fixture
+def index() -> TriggerIndex:
+    index = TriggerIndex()
+    for trigger in TRIGGERS.values():
+        index.add(trigger)
+    return index
+
+
+def covering(event: ReceivedEvent) -> set[str]:
+    return {name for name, trigger in TRIGGERS.items() if trigger.covers(event)}
+
+
+def candidates(index: TriggerIndex, event: ReceivedEvent) -> set[str]:
+    found = index.candidates(event)
+    return {name for name, trigger in TRIGGERS.items() if trigger.id in found}
+
+
+@pytest.mark.parametrize("event", EVENTS, ids=lambda event: event.event)
+def test_candidates_include_every_covering_trigger(
+    index: TriggerIndex, event: ReceivedEvent
+):
+    assert covering(event) <= candidates(index, event)
+
+
+def test_candidates_exclude_triggers_for_other_events_and_resources(
+    index: TriggerIndex,
+):
+    event = make_event("prefect.flow-run.Failed", "prefect.flow-run.def")
+
+    assert candidates(index, event) == {
+        "everything",
+        "exact-event",
+        "wildcard-event",
+        "leading-wildcard-event",
+        "wildcard-resource",
+        "negated-resource",
+    }
+
+
+def test_removing_triggers(index: TriggerIndex):
+    event = make_event("prefect.flow-run.Failed", "prefect.flow-run.abc")
+
+    for trigger in TRIGGERS.values():
+        index.remove(trigger.id)
+
+    assert len(index) == 0
+    assert index.candidates(event) == set()
+
+    # removing a trigger that isn't indexed is a no-op
+    index.remove(uuid4())
+
+
+def test_adding_a_trigger_again_replaces_it(index: TriggerIndex):
+    trigger = TRIGGERS["exact-event"]
+    changed = trigger.model_copy(update={"expect": {"prefect.flow-run.Crashed"}})
+
+    index.add(changed)
+
+    assert len(index) == len(TRIGGERS)
+    failed = make_event("prefect.flow-run.Failed", "prefect.flow-run.abc")
+    crashed = make_event("prefect.flow-run.Crashed", "prefect.flow-run.abc")
+    assert trigger.id not in index.candidates(failed)
+    assert trigger.id in index.candidates(crashed)
+
+
+def test_clear(index: TriggerIndex):
+    index.clear()
+
+    assert len(index) == 0
+    assert index.candidates(EVENTS[0]) == set()
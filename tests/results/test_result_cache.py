@@ -0,0 +1,212 @@
+import os
+
+import pytest
+from cachetools import LRUCache
+
+from prefect._result_cache import ResultDiskCache, ResultRecordCache
+from prefect._result_records import ResultRecord, ResultRecordMetadata
+from prefect.filesystems import RemoteFileSystem
+from prefect.results import ResultStore
+from prefect.serializers import JSONSerializer
+from prefect.settings import (
+    PREFECT_RESULTS_DISK_CACHE_PATH,
+    PREFECT_RESULTS_MEMORY_CACHE_MAX_BYTES,
+    temporary_settings,
+)
+
+
+def make_record(value: str, key: str = "key") -> ResultRecord[str]:
+    return ResultRecord(
+        result=value,
+        metadata=ResultRecordMetadata(storage_key=key, serializer=JSONSerializer()),
+    )
+
+
+class TestResultRecordCache:
+    def test_evicts_least_recently_used_records_by_size(self):
+        cache = ResultRecordCache(max_bytes=100)
+        cache.put("a", make_record("a"), nbytes=40)
+        cache.put("b", make_record("b"), nbytes=40)
+
+        # touch "a" so that "b" is the least recently used record
+        assert cache.lookup("a") is not None
+
+        cache.put("c", make_record("c"), nbytes=40)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.current_bytes == 80
+        assert cache.evictions == 1
+
+    def test_does_not_cache_records_larger_than_budget(self):
+        cache = ResultRecordCache(max_bytes=100)
+        cache.put("small", make_record("small"), nbytes=10)
+        cache.put("large", make_record("large"), nbytes=101)
+
+        assert "small" in cache
+        assert "large" not in cache
+        assert cache.current_bytes == 10
+
+    def test_replacing_a_record_updates_its_size(self):
+        cache = ResultRecordCache(max_bytes=100)
+        cache.put("a", make_record("a"), nbytes=40)
+        cache.put("a", make_record("a"), nbytes=10)
+
+        assert len(cache) == 1
+        assert cache.current_bytes == 10
+
+    def test_counts_hits_and_misses(self):
+        cache = ResultRecordCache(max_bytes=100)
+        cache.put("a", make_record("a"), nbytes=10)
+
+        assert cache.lookup("a") is not None
+        assert cache.lookup("missing") is None
+
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "entries": 1,
+            "bytes": 10,
+            "max_bytes": 100,
+        }
+
+    def test_item_assignment_weighs_record_by_serialized_size(self):
+        cache = ResultRecordCache(max_bytes=10_000)
+        record = make_record("hello")
+        cache["a"] = record
+
+        assert cache["a"] is record
+        assert cache.current_bytes == len(record.serialize())
+
+
+class TestResultDiskCache:
+    def test_round_trip(self, tmp_path):
+        cache = ResultDiskCache(path=tmp_path, max_bytes=100)
+        cache.put("some/key", b"content")
+
+        assert cache.get("some/key") == b"content"
+        assert cache.get("other/key") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_oldest_entries_over_budget(self, tmp_path):
+        cache = ResultDiskCache(path=tmp_path, max_bytes=100)
+        cache.put("a", b"a" * 40)
+        cache.put("b", b"b" * 40)
+
+        # make the entries' ages unambiguous regardless of filesystem time resolution
+        for path in tmp_path.iterdir():
+            age = 1000 if path.read_bytes().startswith(b"a") else 2000
+            os.utime(path, (age, age))
+
+        cache.put("c", b"c" * 40)
+
+        assert cache.get("a") is None
+        assert cache.get("c") == b"c" * 40
+
+    def test_discard(self, tmp_path):
+        cache = ResultDiskCache(path=tmp_path, max_bytes=100)
+        cache.put("a", b"a")
+        cache.discard("a")
+        cache.discard("never-written")
+
+        assert cache.get("a") is None
+
+
+class TestResultStoreCaching:
+    def test_default_cache_uses_settings(self, tmp_path):
+        with temporary_settings(
+            {
+                PREFECT_RESULTS_MEMORY_CACHE_MAX_BYTES: 1234,
+                PREFECT_RESULTS_DISK_CACHE_PATH: tmp_path,
+            }
+        ):
+            store = ResultStore()
+
+        assert store.cache.max_bytes == 1234
+        assert store.cache.disk_cache is not None
+        assert store.cache.disk_cache.path == tmp_path
+
+    async def test_persisted_records_are_cached_by_serialized_size(self):
+        store = ResultStore(serializer=JSONSerializer())
+        record = store.create_result_record("The results are in...", "the-key")
+        await store.apersist_result_record(record)
+
+        key = record.metadata.storage_key
+        assert key in store.cache
+        assert store.cache.current_bytes == len(record.serialize())
+
+        await store.aread("the-key")
+        assert store.cache.hits == 1
+
+    async def test_remote_reads_are_served_from_disk_cache(self, tmp_path):
+        storage = RemoteFileSystem(basepath="memory://result-cache-test")
+        writer = ResultStore(result_storage=storage, serializer=JSONSerializer())
+        record = writer.create_result_record("The results are in...", "the-key")
+        await writer.apersist_result_record(record)
+
+        reader = ResultStore(
+            result_storage=storage,
+            cache=ResultRecordCache(
+                max_bytes=1024, disk_cache=ResultDiskCache(tmp_path, max_bytes=1024)
+            ),
+            cache_result_in_memory=False,
+        )
+        assert reader.cache.disk_cache is not None
+
+        first = await reader.aread("the-key")
+        assert reader.cache.disk_cache.misses == 1
+
+        # overwrite the remote copy; the second read must come from the disk cache
+        await storage.write_path("the-key", b"not a result record")
+        second = await reader.aread("the-key")
+
+        assert first.result == second.result == "The results are in..."
+        assert reader.cache.disk_cache.hits == 1
+
+    @pytest.mark.parametrize("cache_result_in_memory", [True, False])
+    async def test_writes_invalidate_disk_cache(self, tmp_path, cache_result_in_memory):
+        storage = RemoteFileSystem(basepath="memory://result-cache-invalidation")
+        disk_cache = ResultDiskCache(tmp_path, max_bytes=1024)
+        store = ResultStore(
+            result_storage=storage,
+            serializer=JSONSerializer(),
+            cache=ResultRecordCache(max_bytes=1024, disk_cache=disk_cache),
+            cache_result_in_memory=cache_result_in_memory,
+        )
+        record = store.create_result_record("fresh", "the-key")
+        key = record.metadata.storage_key
+        assert key is not None
+        disk_cache.put(store._disk_cache_key(key), b"stale")
+
+        await store.apersist_result_record(record)
+
+        assert disk_cache.get(store._disk_cache_key(key)) is None
+
+    async def test_disk_cache_is_shared_by_key_and_storage(self, tmp_path):
+        disk_cache = ResultDiskCache(tmp_path, max_bytes=4096)
+        values = {}
+        for name in ("first", "second"):
+            storage = RemoteFileSystem(basepath=f"memory://result-cache-{name}")
+            writer = ResultStore(result_storage=storage, serializer=JSONSerializer())
+            await writer.apersist_result_record(
+                writer.create_result_record(name, "the-key")
+            )
+            reader = ResultStore(
+                result_storage=storage,
+                cache=ResultRecordCache(max_bytes=4096, disk_cache=disk_cache),
+                cache_result_in_memory=False,
+            )
+            values[name] = (await reader.aread("the-key")).result
+
+        assert values == {"first": "first", "second": "second"}
+        assert disk_cache.hits == 0
+
+    async def test_accepts_lru_cache(self):
+        store = ResultStore(serializer=JSONSerializer(), cache=LRUCache(maxsize=10))
+        record = store.create_result_record("The results are in...", "the-key")
+        await store.apersist_result_record(record)
+
+        assert record.metadata.storage_key in store.cache
+        assert (await store.aread("the-key")).result == "The results are in..."
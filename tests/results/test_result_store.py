@@ -1,19 +1,25 @@
 from unittest import mock
 
+import numpy as np
 import pytest
 
 import prefect.exceptions
 import prefect.results
 from prefect import flow, task
+from prefect._result_records import BUFFERED_RECORD_MARKER
 from prefect.context import FlowRunContext, get_run_context
-from prefect.filesystems import LocalFileSystem
+from prefect.filesystems import LocalFileSystem, RemoteFileSystem
 from prefect.locking.memory import MemoryLockManager
 from prefect.results import (
     ResultRecord,
     ResultStore,
     should_persist_result,
 )
-from prefect.serializers import JSONSerializer, PickleSerializer
+from prefect.serializers import (
+    JSONSerializer,
+    OutOfBandPickleSerializer,
+    PickleSerializer,
+)
 from prefect.settings import (
     PREFECT_LOCAL_STORAGE_PATH,
     PREFECT_RESULTS_DEFAULT_SERIALIZER,
@@ -958,3 +964,82 @@ class TestResultStoreEmitsEvents:
         ) as mock_emit:
             await result_store.aread(key="test")
             mock_emit.assert_not_called()
+
+
+class TestOutOfBandPickleResults:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        return LocalFileSystem(basepath=tmp_path)
+
+    async def test_records_are_written_in_buffered_form(self, storage, tmp_path):
+        store = ResultStore(
+            result_storage=storage, serializer=OutOfBandPickleSerializer()
+        )
+        await store.awrite(key="test", obj=np.arange(1000))
+
+        content = (tmp_path / "test").read_bytes()
+        assert content.startswith(BUFFERED_RECORD_MARKER)
+        # the record is a single file; no temporary files are left behind
+        assert [path.name for path in tmp_path.iterdir()] == ["test"]
+
+    async def test_buffered_records_are_memory_mapped_on_read(self, storage):
+        writer = ResultStore(
+            result_storage=storage, serializer=OutOfBandPickleSerializer()
+        )
+        data = np.arange(100_000, dtype="float64")
+        await writer.awrite(key="test", obj=data)
+
+        reader = ResultStore(result_storage=storage, cache_result_in_memory=False)
+        record = await reader.aread(key="test")
+
+        assert np.array_equal(record.result, data)
+        assert not record.result.flags.owndata
+        assert record.result.flags.writeable
+        assert isinstance(record.metadata.serializer, OutOfBandPickleSerializer)
+
+    async def test_overwriting_a_record_does_not_change_loaded_results(self, storage):
+        store = ResultStore(
+            result_storage=storage,
+            serializer=OutOfBandPickleSerializer(),
+            cache_result_in_memory=False,
+        )
+        await store.awrite(key="test", obj=np.zeros(1000))
+        loaded = (await store.aread(key="test")).result
+
+        await store.awrite(key="test", obj=np.ones(1000))
+
+        assert np.array_equal(loaded, np.zeros(1000))
+        assert np.array_equal((await store.aread(key="test")).result, np.ones(1000))
+
+    async def test_exists_reads_buffered_metadata(self, storage):
+        store = ResultStore(
+            result_storage=storage, serializer=OutOfBandPickleSerializer()
+        )
+        assert not await store.aexists(key="test")
+
+        await store.awrite(key="test", obj=np.arange(10))
+        assert await store.aexists(key="test")
+
+    async def test_buffered_records_can_be_deserialized(self, storage, tmp_path):
+        store = ResultStore(
+            result_storage=storage, serializer=OutOfBandPickleSerializer()
+        )
+        await store.awrite(key="test", obj=np.arange(10))
+
+        record = ResultRecord.deserialize((tmp_path / "test").read_bytes())
+
+        assert np.array_equal(record.result, np.arange(10))
+        assert isinstance(record.metadata.serializer, OutOfBandPickleSerializer)
+
+    async def test_remote_storage_uses_serialized_records(self):
+        storage = RemoteFileSystem(basepath="memory://out-of-band-results")
+        store = ResultStore(
+            result_storage=storage,
+            serializer=OutOfBandPickleSerializer(),
+            cache_result_in_memory=False,
+        )
+        await store.awrite(key="test", obj=np.arange(10))
+
+        content = await storage.read_path("test")
+        assert not content.startswith(BUFFERED_RECORD_MARKER)
+        assert np.array_equal((await store.aread(key="test")).result, np.arange(10))
@@ -68,6 +68,7 @@ from prefect.settings import (
     PREFECT_RUNNER_POLL_FREQUENCY,
     PREFECT_RUNNER_PROCESS_LIMIT,
     PREFECT_RUNNER_SERVER_ENABLE,
+    PREFECT_RUNNER_WARM_POOL_SIZE,
     temporary_settings,
 )
 from prefect.states import Cancelling, Crashed
@@ -1022,6 +1023,68 @@ class TestRunner:
         runner_2._mark_flow_run_as_cancelled.assert_not_called()
         runner_2._kill_process.assert_not_called()
 
+    async def test_runner_executes_flow_runs_in_warm_interpreters(
+        self, prefect_client: PrefectClient
+    ):
+        runner = Runner()
+        deployment_id = await (await dummy_flow_1.to_deployment(__file__)).apply()
+        flow_run = await prefect_client.create_flow_run_from_deployment(
+            deployment_id=deployment_id
+        )
+
+        with temporary_settings({PREFECT_RUNNER_WARM_POOL_SIZE: 1}):
+            async with runner:
+                assert runner._warm_pool is not None
+                (warm_process,) = runner._warm_pool._idle
+
+                process = await runner.execute_flow_run(flow_run.id)
+
+                assert process is warm_process
+                assert process.returncode == 0
+                # the pool started another interpreter in its place
+                (replacement,) = runner._warm_pool._idle
+                assert replacement.pid != warm_process.pid
+
+        flow_run = await prefect_client.read_flow_run(flow_run_id=flow_run.id)
+        assert flow_run.state
+        assert flow_run.state.is_completed()
+
+    async def test_runner_cancels_flow_runs_in_warm_interpreters(
+        self, prefect_client: PrefectClient
+    ):
+        runner = Runner()
+        deployment_id = await runner.add_deployment(
+            await tired_flow.to_deployment(__file__)
+        )
+        flow_run = await prefect_client.create_flow_run_from_deployment(
+            deployment_id=deployment_id
+        )
+
+        with temporary_settings({PREFECT_RUNNER_WARM_POOL_SIZE: 1}):
+            async with runner:
+                execute_task = asyncio.create_task(runner.execute_flow_run(flow_run.id))
+
+                while True:
+                    await anyio.sleep(0.5)
+                    flow_run = await prefect_client.read_flow_run(
+                        flow_run_id=flow_run.id
+                    )
+                    assert flow_run.state
+                    if flow_run.state.is_running():
+                        break
+
+                await prefect_client.set_flow_run_state(
+                    flow_run_id=flow_run.id,
+                    state=flow_run.state.model_copy(
+                        update={"name": "Cancelling", "type": StateType.CANCELLING}
+                    ),
+                )
+
+                await execute_task
+
+        flow_run = await prefect_client.read_flow_run(flow_run_id=flow_run.id)
+        assert flow_run.state.is_cancelled()
+
     @pytest.mark.usefixtures("use_hosted_api_server")
     async def test_runner_runs_on_cancellation_hooks_for_remotely_stored_flows(
         self,
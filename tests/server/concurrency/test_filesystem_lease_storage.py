@@ -1,12 +1,16 @@
 import json
 import tempfile
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from uuid import UUID, uuid4
 
 import pytest
 
-from prefect.server.concurrency.lease_storage import ConcurrencyLimitLeaseMetadata
+from prefect.server.concurrency.lease_storage import (
+    ConcurrencyLimitLeaseMetadata,
+    filesystem,
+)
 from prefect.server.concurrency.lease_storage.filesystem import (
     ConcurrencyLeaseStorage,
 )
@@ -352,3 +356,138 @@ class TestFilesystemConcurrencyLeaseStorage:
             read_lease = await storage.read_lease(lease_id)
             assert read_lease is not None
             assert read_lease.resource_ids == sample_resource_ids
+
+    async def test_read_expired_lease_ids_skips_renewed_and_revoked_leases(
+        self, storage: ConcurrencyLeaseStorage, sample_resource_ids: list[UUID]
+    ):
+        expired_ttl = timedelta(seconds=-1)
+        renewed = await storage.create_lease(sample_resource_ids, expired_ttl)
+        revoked = await storage.create_lease(sample_resource_ids, expired_ttl)
+        expired = await storage.create_lease(sample_resource_ids, expired_ttl)
+
+        await storage.renew_lease(renewed.id, timedelta(minutes=5))
+        await storage.revoke_lease(revoked.id)
+
+        assert await storage.read_expired_lease_ids() == [expired.id]
+        # reading expired leases doesn't consume them
+        assert await storage.read_expired_lease_ids() == [expired.id]
+        assert await storage.read_active_lease_ids() == [renewed.id]
+
+    async def test_expirations_are_appended_to_a_log(
+        self, storage: ConcurrencyLeaseStorage, sample_resource_ids: list[UUID]
+    ):
+        lease = await storage.create_lease(sample_resource_ids, timedelta(minutes=5))
+        await storage.renew_lease(lease.id, timedelta(minutes=10))
+        await storage.revoke_lease(lease.id)
+
+        lines = (storage.storage_path / "expirations.log").read_text().splitlines()
+        entries = [json.loads(line) for line in lines]
+        assert [entry["id"] for entry in entries] == [str(lease.id)] * 3
+        assert entries[-1]["expiration"] is None
+
+    @pytest.mark.skipif(
+        filesystem.fcntl is None, reason="The log is only compacted with file locks"
+    )
+    async def test_log_is_compacted(
+        self,
+        storage: ConcurrencyLeaseStorage,
+        sample_resource_ids: list[UUID],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(filesystem, "COMPACTION_MIN_ENTRIES", 10)
+
+        kept = await storage.create_lease(sample_resource_ids, timedelta(minutes=5))
+        for _ in range(10):
+            await storage.renew_lease(kept.id, timedelta(minutes=5))
+
+        lines = (storage.storage_path / "expirations.log").read_text().splitlines()
+        assert len(lines) < 10
+        assert await storage.read_active_lease_ids() == [kept.id]
+
+    async def test_reads_expirations_written_by_other_processes(
+        self,
+        storage: ConcurrencyLeaseStorage,
+        temp_dir: Path,
+        sample_resource_ids: list[UUID],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        lease = await storage.create_lease(sample_resource_ids, timedelta(minutes=5))
+
+        # another process has its own in-memory index of the same log
+        monkeypatch.setattr(filesystem, "_expiration_logs", {})
+        other = ConcurrencyLeaseStorage(storage_path=temp_dir)
+        assert await other.read_active_lease_ids() == [lease.id]
+
+        await other.renew_lease(lease.id, timedelta(seconds=-1))
+        monkeypatch.undo()
+        assert await storage.read_expired_lease_ids() == [lease.id]
+
+    @pytest.mark.skipif(
+        filesystem.fcntl is None, reason="The log is only compacted with file locks"
+    )
+    def test_readers_detect_a_compacted_log(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(filesystem, "COMPACTION_MIN_ENTRIES", 10)
+        now = datetime.now(timezone.utc)
+        kept, dropped = uuid4(), uuid4()
+        reader = filesystem._ExpirationLog(temp_dir)
+        writer = filesystem._ExpirationLog(temp_dir)
+
+        writer.set(dropped, now + timedelta(minutes=5))
+        assert reader.active(now, 10) == [dropped]
+
+        writer.remove(dropped)
+        for _ in range(20):
+            writer.set(kept, now + timedelta(minutes=5))
+        lines = (temp_dir / "expirations.log").read_text().splitlines()
+        assert "compacted" in json.loads(lines[0])
+
+        assert reader.active(now, 10) == [kept]
+
+    def test_concurrent_writers_do_not_lose_entries_during_compaction(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(filesystem, "COMPACTION_MIN_ENTRIES", 10)
+        expiration = datetime.now(timezone.utc) + timedelta(minutes=5)
+        lease_ids = [[uuid4() for _ in range(200)] for _ in range(4)]
+
+        def write(ids: list[UUID]):
+            # each writer has its own index of the log, like separate processes
+            log = filesystem._ExpirationLog(temp_dir)
+            for lease_id in ids:
+                log.set(lease_id, expiration)
+                log.remove(lease_id)
+                log.set(lease_id, expiration)
+
+        threads = [threading.Thread(target=write, args=(ids,)) for ids in lease_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        log = filesystem._ExpirationLog(temp_dir)
+        assert set(log.active(datetime.now(timezone.utc), 1000)) == {
+            lease_id for ids in lease_ids for lease_id in ids
+        }
+
+    async def test_imports_legacy_expiration_index(
+        self, temp_dir: Path, sample_resource_ids: list[UUID]
+    ):
+        expired_id, active_id = uuid4(), uuid4()
+        now = datetime.now(timezone.utc)
+        legacy_index = temp_dir / "expirations.json"
+        legacy_index.write_text(
+            json.dumps(
+                {
+                    str(expired_id): (now - timedelta(minutes=1)).isoformat(),
+                    str(active_id): (now + timedelta(minutes=1)).isoformat(),
+                }
+            )
+        )
+
+        storage = ConcurrencyLeaseStorage(storage_path=temp_dir)
+
+        assert await storage.read_expired_lease_ids() == [expired_id]
+        assert await storage.read_active_lease_ids() == [active_id]
+        assert not legacy_index.exists()
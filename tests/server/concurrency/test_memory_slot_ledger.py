@@ -0,0 +1,363 @@
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server.concurrency.slot_ledger import get_concurrency_slot_ledger
+from prefect.server.concurrency.slot_ledger.memory import ConcurrencySlotLedger
+from prefect.server.database import PrefectDBInterface
+from prefect.server.models.concurrency_limits_v2 import (
+    bulk_decrement_active_slots,
+    bulk_increment_active_slots,
+    bulk_read_concurrency_limits,
+    bulk_update_denied_slots,
+    create_concurrency_limit,
+    delete_concurrency_limit,
+    read_all_concurrency_limits,
+    read_concurrency_limit,
+    update_concurrency_limit,
+)
+from prefect.server.schemas.actions import ConcurrencyLimitV2Update
+from prefect.server.schemas.core import ConcurrencyLimitV2
+from prefect.settings import (
+    PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER,
+    temporary_settings,
+)
+
+MEMORY_LEDGER = "prefect.server.concurrency.slot_ledger.memory"
+
+
+def test_no_slot_ledger_by_default():
+    assert get_concurrency_slot_ledger() is None
+
+
+def test_singleton_pattern():
+    assert ConcurrencySlotLedger() is ConcurrencySlotLedger()
+
+
+@pytest.fixture
+async def ledger() -> AsyncGenerator[ConcurrencySlotLedger, None]:
+    ledger = ConcurrencySlotLedger()
+    ledger.counts.clear()
+    ledger.dirty.clear()
+    ledger.deferred_frees.clear()
+    with temporary_settings({PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER: MEMORY_LEDGER}):
+        assert get_concurrency_slot_ledger() is ledger
+        yield ledger
+    if ledger._flusher:
+        ledger._flusher.cancel()
+        ledger._flusher = None
+
+
+@pytest.fixture
+async def concurrency_limit(session: AsyncSession) -> ConcurrencyLimitV2:
+    concurrency_limit = await create_concurrency_limit(
+        session=session,
+        concurrency_limit=ConcurrencyLimitV2(
+            name="test_limit",
+            limit=10,
+            avg_slot_occupancy_seconds=0.5,
+        ),
+    )
+
+    await session.commit()
+
+    return ConcurrencyLimitV2.model_validate(concurrency_limit, from_attributes=True)
+
+
+async def read_from_database(
+    db: PrefectDBInterface, concurrency_limit: ConcurrencyLimitV2
+) -> ConcurrencyLimitV2:
+    # Reads through the models merge in the ledger's counts, so read the row directly
+    async with db.session_context() as session:
+        row = (
+            await session.execute(
+                sa.select(db.ConcurrencyLimitV2.__table__).where(
+                    db.ConcurrencyLimitV2.id == concurrency_limit.id
+                )
+            )
+        ).one()
+        return ConcurrencyLimitV2.model_validate(row, from_attributes=True)
+
+
+async def test_acquires_are_counted_in_memory_until_flushed(
+    ledger: ConcurrencySlotLedger,
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    for _ in range(2):
+        assert await bulk_increment_active_slots(
+            session=session, concurrency_limit_ids=[concurrency_limit.id], slots=4
+        )
+    assert not await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=4
+    )
+    assert ledger.counts[concurrency_limit.id].active_slots == 8
+    assert (await read_from_database(db, concurrency_limit)).active_slots == 0
+
+    await ledger.flush()
+
+    assert (await read_from_database(db, concurrency_limit)).active_slots == 8
+    assert not ledger.dirty
+
+
+async def test_increment_is_all_or_nothing(
+    ledger: ConcurrencySlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    other_limit = await create_concurrency_limit(
+        session=session,
+        concurrency_limit=ConcurrencyLimitV2(name="other_limit", limit=2),
+    )
+    await session.commit()
+
+    assert not await bulk_increment_active_slots(
+        session=session,
+        concurrency_limit_ids=[concurrency_limit.id, other_limit.id],
+        slots=3,
+    )
+    assert ledger.counts[concurrency_limit.id].active_slots == 0
+    assert ledger.counts[other_limit.id].active_slots == 0
+
+
+async def test_inactive_limits_are_not_incremented(
+    ledger: ConcurrencySlotLedger,
+    session: AsyncSession,
+):
+    inactive_limit = await create_concurrency_limit(
+        session=session,
+        concurrency_limit=ConcurrencyLimitV2(name="inactive", limit=2, active=False),
+    )
+    await session.commit()
+
+    assert not await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[inactive_limit.id], slots=1
+    )
+
+
+async def test_decrement_and_denied_slots(
+    ledger: ConcurrencySlotLedger,
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=3
+    )
+    assert await bulk_decrement_active_slots(
+        session=session,
+        concurrency_limit_ids=[concurrency_limit.id],
+        slots=5,
+        occupancy_seconds=10.0,
+    )
+    assert await bulk_update_denied_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=2
+    )
+    await session.commit()
+
+    await ledger.flush()
+
+    refreshed = await read_from_database(db, concurrency_limit)
+    assert refreshed.active_slots == 0
+    assert refreshed.denied_slots == 2
+    # weighted over limit * OCCUPANCY_SAMPLES_MULTIPLIER samples
+    assert refreshed.avg_slot_occupancy_seconds == pytest.approx(
+        0.5 + 2 / 20 - 0.5 / 20
+    )
+
+
+async def test_active_slots_decay(
+    ledger: ConcurrencySlotLedger,
+    session: AsyncSession,
+):
+    limit_with_decay = await create_concurrency_limit(
+        session=session,
+        concurrency_limit=ConcurrencyLimitV2(
+            name="decaying", limit=10, slot_decay_per_second=10.0
+        ),
+    )
+    await session.commit()
+
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[limit_with_decay.id], slots=10
+    )
+    assert not await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[limit_with_decay.id], slots=5
+    )
+
+    await asyncio.sleep(0.5)
+
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[limit_with_decay.id], slots=5
+    )
+
+
+async def test_updating_a_limit_writes_through_and_reloads_it(
+    ledger: ConcurrencySlotLedger,
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=8
+    )
+
+    assert await update_concurrency_limit(
+        session=session,
+        concurrency_limit=ConcurrencyLimitV2Update(limit=20),
+        concurrency_limit_id=concurrency_limit.id,
+    )
+    await session.commit()
+
+    assert concurrency_limit.id not in ledger.counts
+    refreshed = await read_from_database(db, concurrency_limit)
+    assert refreshed.active_slots == 8
+    assert refreshed.limit == 20
+
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=12
+    )
+
+
+async def test_deleting_a_limit_forgets_it(
+    ledger: ConcurrencySlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=1
+    )
+
+    assert await delete_concurrency_limit(session=session, name=concurrency_limit.name)
+    await session.commit()
+
+    assert concurrency_limit.id not in ledger.counts
+    assert not await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=1
+    )
+
+
+async def test_rolling_back_releases_occupied_slots(
+    ledger: ConcurrencySlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=4
+    )
+    await session.commit()
+
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=6
+    )
+    assert ledger.counts[concurrency_limit.id].active_slots == 10
+
+    await session.rollback()
+
+    assert ledger.counts[concurrency_limit.id].active_slots == 4
+
+
+async def test_rolling_back_a_savepoint_releases_only_its_slots(
+    ledger: ConcurrencySlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=4
+    )
+
+    savepoint = await session.begin_nested()
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=6
+    )
+    await savepoint.rollback()
+
+    assert ledger.counts[concurrency_limit.id].active_slots == 4
+
+    await session.commit()
+    assert ledger.counts[concurrency_limit.id].active_slots == 4
+
+
+async def test_freed_and_denied_slots_are_counted_on_commit(
+    ledger: ConcurrencySlotLedger,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=4
+    )
+    await session.commit()
+
+    assert await bulk_decrement_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=4
+    )
+    assert await bulk_update_denied_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=2
+    )
+    counts = ledger.counts[concurrency_limit.id]
+    assert (counts.active_slots, counts.denied_slots) == (4, 0)
+
+    await session.rollback()
+    assert (counts.active_slots, counts.denied_slots) == (4, 0)
+
+    assert await bulk_decrement_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=4
+    )
+    await session.commit()
+    assert counts.active_slots == 0
+
+
+async def test_slots_freed_after_an_eviction_are_applied_on_reload(
+    ledger: ConcurrencySlotLedger,
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=4
+    )
+    await session.commit()
+
+    assert await bulk_decrement_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=4
+    )
+    async with db.session_context(begin_transaction=True) as other_session:
+        await ledger.evict(other_session, [concurrency_limit.id])
+    await session.commit()
+
+    assert ledger.deferred_frees == {concurrency_limit.id: 4}
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=10
+    )
+    assert not ledger.deferred_frees
+
+
+async def test_reads_include_counts_that_are_not_yet_written(
+    ledger: ConcurrencySlotLedger,
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    concurrency_limit: ConcurrencyLimitV2,
+):
+    assert await bulk_increment_active_slots(
+        session=session, concurrency_limit_ids=[concurrency_limit.id], slots=4
+    )
+    await session.commit()
+
+    model = await read_concurrency_limit(
+        session=session, concurrency_limit_id=concurrency_limit.id
+    )
+    assert model.active_slots == 4
+    assert (await read_all_concurrency_limits(session, limit=10, offset=0))[
+        0
+    ].active_slots == 4
+    assert (
+        await bulk_read_concurrency_limits(session, names=[concurrency_limit.name])
+    )[0].active_slots == 4
+
+    # the merged counts are not written back with the session
+    await session.commit()
+    assert (await read_from_database(db, concurrency_limit)).active_slots == 0
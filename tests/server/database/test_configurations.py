@@ -0,0 +1,107 @@
+from typing import Optional
+from unittest import mock
+
+import pytest
+
+from prefect.server.database.configurations import (
+    AioSqliteConfiguration,
+    AsyncPostgresConfiguration,
+)
+
+PRIMARY_URL = "postgresql+asyncpg://prefect@primary/prefect"
+REPLICA_URLS = [
+    "postgresql+asyncpg://prefect@replica-1/prefect",
+    "postgresql+asyncpg://prefect@replica-2/prefect",
+]
+
+
+def postgres_configuration(
+    lags: dict[str, Optional[float]], **kwargs
+) -> AsyncPostgresConfiguration:
+    configuration = AsyncPostgresConfiguration(
+        connection_url=PRIMARY_URL, read_replica_max_lag=10, **kwargs
+    )
+
+    async def replica_lag(connection_url: str) -> Optional[float]:
+        return lags[connection_url]
+
+    configuration._replica_lag = replica_lag
+    return configuration
+
+
+class TestReadReplicas:
+    async def test_reads_from_primary_without_replicas(self):
+        configuration = postgres_configuration({}, read_replica_urls=[])
+
+        engine = await configuration.read_engine()
+
+        assert engine is await configuration.engine()
+
+    async def test_reads_from_replicas_within_max_lag(self):
+        configuration = postgres_configuration(
+            {REPLICA_URLS[0]: 0.5, REPLICA_URLS[1]: 10.0},
+            read_replica_urls=REPLICA_URLS,
+        )
+
+        urls = set()
+        for _ in range(20):
+            engine = await configuration.read_engine()
+            urls.add(engine.url.render_as_string(hide_password=False))
+
+        assert urls == set(REPLICA_URLS)
+
+    async def test_skips_lagging_and_unreachable_replicas(self):
+        configuration = postgres_configuration(
+            {REPLICA_URLS[0]: 10.5, REPLICA_URLS[1]: None},
+            read_replica_urls=REPLICA_URLS,
+        )
+
+        engine = await configuration.read_engine()
+
+        assert engine is await configuration.engine()
+
+    async def test_replica_lag_is_rechecked_periodically(self):
+        configuration = AsyncPostgresConfiguration(
+            connection_url=PRIMARY_URL, read_replica_urls=REPLICA_URLS[:1]
+        )
+
+        with mock.patch.object(
+            configuration, "engine", side_effect=ConnectionRefusedError
+        ) as engine:
+            assert await configuration._replica_lag(REPLICA_URLS[0]) is None
+            assert await configuration._replica_lag(REPLICA_URLS[0]) is None
+            assert engine.call_count == 1
+
+            with mock.patch(
+                "prefect.server.database.configurations.time.monotonic",
+                return_value=configuration._replica_lags[REPLICA_URLS[0]][0] + 60,
+            ):
+                assert await configuration._replica_lag(REPLICA_URLS[0]) is None
+            assert engine.call_count == 2
+
+    def test_replica_urls_are_read_from_settings(self):
+        from prefect.settings import (
+            PREFECT_SERVER_DATABASE_READ_REPLICA_URLS,
+            temporary_settings,
+        )
+
+        with temporary_settings(
+            {PREFECT_SERVER_DATABASE_READ_REPLICA_URLS: ", ".join(REPLICA_URLS)}
+        ):
+            configuration = AsyncPostgresConfiguration(connection_url=PRIMARY_URL)
+
+        assert configuration.read_replica_urls == REPLICA_URLS
+
+
+@pytest.mark.parametrize("read_only", [True, False])
+async def test_sqlite_always_uses_the_database(read_only: bool):
+    configuration = AioSqliteConfiguration(
+        connection_url="sqlite+aiosqlite:///:memory:",
+        read_replica_urls=["sqlite+aiosqlite:///replica.db"],
+    )
+
+    engine = await (
+        configuration.read_engine() if read_only else configuration.engine()
+    )
+
+    assert engine is await configuration.engine()
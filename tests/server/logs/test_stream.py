@@ -9,8 +9,10 @@ from prefect.server.logs.stream import (
     LogDistributor,
     distributor,
     filters,
+    log_filter_predicate,
     log_matches_filter,
     logs,
+    routes,
     start_distributor,
     stop_distributor,
     subscribed,
@@ -425,6 +427,78 @@ async def test_stop_distributor_not_started():
     await stop_distributor()
 
 
+@pytest.mark.asyncio
+async def test_subscribers_with_identical_filters_share_a_route(
+    sample_log1, sample_log2
+):
+    """Test that subscribers with equal filters are grouped under one predicate"""
+    errors_only = LogFilter(level=LogFilterLevel(ge_=40))
+
+    async with subscribed(LogFilter()) as one:
+        async with subscribed(LogFilter()) as two:
+            async with subscribed(errors_only) as three:
+                current = routes()
+                assert len(current) == 2
+                assert routes() is current
+
+                grouped = {
+                    frozenset(queue for queue, _ in group) for _, group in current
+                }
+                assert grouped == {frozenset({one, two}), frozenset({three})}
+
+            # Routes are rebuilt when subscribers change
+            assert [{queue for queue, _ in group} for _, group in routes()] == [
+                {one, two}
+            ]
+
+    assert routes() == []
+
+
+@pytest.mark.asyncio
+async def test_subscribers_with_different_windows_share_a_route(sample_log1):
+    """Test that subscribers differing only by timestamp share a predicate"""
+    current = LogFilter(
+        timestamp=LogFilterTimestamp(
+            after_=sample_log1.timestamp - datetime.timedelta(minutes=1)
+        )
+    )
+    past = LogFilter(
+        timestamp=LogFilterTimestamp(
+            before_=sample_log1.timestamp - datetime.timedelta(days=1)
+        )
+    )
+
+    async with subscribed(current) as one:
+        async with subscribed(past) as two:
+            async with subscribed(LogFilter()) as three:
+                [(matches, group)] = routes()
+                assert matches(sample_log1)
+
+                windows = dict(group)
+                assert windows.keys() == {one, two, three}
+                assert windows[one](sample_log1)
+                assert not windows[two](sample_log1)
+                assert windows[three] is None
+
+
+def test_log_filter_predicate_matches_log_matches_filter(sample_log1, sample_log2):
+    """Test that compiled predicates agree with log_matches_filter"""
+    log_filters = [
+        LogFilter(),
+        LogFilter(level=LogFilterLevel(ge_=20, le_=30)),
+        LogFilter(timestamp=LogFilterTimestamp(after_=sample_log1.timestamp)),
+        LogFilter(flow_run_id=LogFilterFlowRunId(any_=[sample_log1.flow_run_id])),
+        LogFilter(flow_run_id=LogFilterFlowRunId(any_=[])),
+        LogFilter(task_run_id=LogFilterTaskRunId(is_null_=True)),
+        LogFilter(task_run_id=LogFilterTaskRunId(any_=[sample_log1.task_run_id])),
+    ]
+
+    for filter in log_filters:
+        predicate = log_filter_predicate(filter)
+        for log in (sample_log1, sample_log2):
+            assert predicate(log) == log_matches_filter(log, filter)
+
+
 def test_log_matches_filter_complex_flow_run_id_case():
     """Test flow_run_id filtering edge case"""
     log = Log(
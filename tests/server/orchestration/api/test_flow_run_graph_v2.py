@@ -308,6 +308,96 @@ async def test_reading_graph_for_flow_run_with_flat_tasks(
     assert_graph_is_connected(graph)
 
 
+async def test_reading_graph_is_cached_until_its_runs_change(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    flat_tasks: List,  # List[db.TaskRun],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    graph_queries = 0
+    execute = session.execute
+
+    async def counting_execute(statement, *args, **kwargs):
+        nonlocal graph_queries
+        if statement is db.queries._flow_run_graph_v2_query:
+            graph_queries += 1
+        return await execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(session, "execute", counting_execute)
+
+    first = await read_flow_run_graph(session=session, flow_run_id=flow_run.id)
+    second = await read_flow_run_graph(session=session, flow_run_id=flow_run.id)
+    assert graph_queries == 1
+    assert second == first
+
+    flat_tasks[4].state_type = StateType.FAILED
+    await session.commit()
+
+    third = await read_flow_run_graph(session=session, flow_run_id=flow_run.id)
+    assert graph_queries == 2
+    assert dict(third.nodes)[flat_tasks[4].id].state_type == StateType.FAILED
+
+
+async def test_reading_graph_is_refreshed_when_updates_commit_out_of_order(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    flat_tasks: List,  # List[db.TaskRun],
+):
+    await session.execute(
+        sa.update(db.TaskRun)
+        .where(db.TaskRun.flow_run_id == flow_run.id)
+        .values(updated=now("UTC") - datetime.timedelta(hours=1))
+    )
+    await session.execute(
+        sa.update(db.TaskRun)
+        .where(db.TaskRun.id == flat_tasks[0].id)
+        .values(updated=now("UTC"))
+    )
+    await session.commit()
+    await read_flow_run_graph(session=session, flow_run_id=flow_run.id)
+
+    # an update that started before the latest one, but committed after it
+    await session.execute(
+        sa.update(db.TaskRun)
+        .where(db.TaskRun.id == flat_tasks[4].id)
+        .values(
+            state_type=StateType.FAILED,
+            updated=now("UTC") - datetime.timedelta(seconds=1),
+        )
+    )
+    await session.commit()
+
+    graph = await read_flow_run_graph(session=session, flow_run_id=flow_run.id)
+    assert dict(graph.nodes)[flat_tasks[4].id].state_type == StateType.FAILED
+
+
+async def test_reading_graph_updated_since(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    flat_tasks: List,  # List[db.TaskRun],
+):
+    await session.execute(
+        sa.update(db.TaskRun)
+        .where(db.TaskRun.flow_run_id == flow_run.id)
+        .values(updated=now("UTC") - datetime.timedelta(hours=1))
+    )
+    await session.commit()
+
+    updated_since = now("UTC") - datetime.timedelta(seconds=1)
+    flat_tasks[4].state_type = StateType.FAILED
+    await session.commit()
+
+    graph = await read_flow_run_graph(
+        session=session, flow_run_id=flow_run.id, updated_since=updated_since
+    )
+
+    assert [id for id, _ in graph.nodes] == [flat_tasks[4].id]
+    assert graph.nodes[0][1].state_type == StateType.FAILED
+
+
 @pytest.fixture
 async def nested_tasks(
     db: PrefectDBInterface,
@@ -775,6 +865,65 @@ async def test_reading_graph_for_flow_run_with_linked_tasks(
     ]
 
 
+async def test_reading_graph_updated_since_includes_updates_shortly_before(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    flat_tasks: List,  # List[db.TaskRun],
+):
+    await session.execute(
+        sa.update(db.TaskRun)
+        .where(db.TaskRun.flow_run_id == flow_run.id)
+        .values(updated=now("UTC") - datetime.timedelta(hours=1))
+    )
+    # an update that may have committed after the previous read
+    await session.execute(
+        sa.update(db.TaskRun)
+        .where(db.TaskRun.id == flat_tasks[4].id)
+        .values(updated=now("UTC") - datetime.timedelta(seconds=30))
+    )
+    await session.commit()
+
+    graph = await read_flow_run_graph(
+        session=session, flow_run_id=flow_run.id, updated_since=now("UTC")
+    )
+
+    assert [id for id, _ in graph.nodes] == [flat_tasks[4].id]
+
+
+async def test_reading_graph_updated_since_includes_parents_of_updated_runs(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run,  # db.FlowRun,
+    linked_tasks: List,  # List[db.TaskRun],
+):
+    full_graph = await read_flow_run_graph(session=session, flow_run_id=flow_run.id)
+    child_id, child = next((id, node) for id, node in full_graph.nodes if node.parents)
+
+    await session.execute(
+        sa.update(db.TaskRun)
+        .where(db.TaskRun.flow_run_id == flow_run.id)
+        .values(updated=now("UTC") - datetime.timedelta(hours=1))
+    )
+    await session.execute(
+        sa.update(db.TaskRun)
+        .where(db.TaskRun.id == child_id)
+        .values(state_type=StateType.FAILED)
+    )
+    await session.commit()
+
+    graph = await read_flow_run_graph(
+        session=session,
+        flow_run_id=flow_run.id,
+        updated_since=now("UTC") - datetime.timedelta(minutes=1),
+    )
+
+    assert {id for id, _ in graph.nodes} == {
+        child_id,
+        *(edge.id for edge in child.parents),
+    }
+
+
 async def test_reading_graph_for_flow_run_with_linked_unstarted_tasks(
     db: PrefectDBInterface,
     session: AsyncSession,
@@ -1484,7 +1633,10 @@ async def test_missing_flow_run_returns_404(
     assert response.status_code == 404, response.text
 
     model_method_mock.assert_awaited_once_with(
-        session=mock.ANY, flow_run_id=flow_run_id, since=earliest_possible_datetime()
+        session=mock.ANY,
+        flow_run_id=flow_run_id,
+        since=earliest_possible_datetime(),
+        updated_since=None,
     )
 
 
@@ -1499,7 +1651,10 @@ async def test_api_full(
     assert response.status_code == 200, response.text
 
     model_method_mock.assert_awaited_once_with(
-        session=mock.ANY, flow_run_id=flow_run_id, since=earliest_possible_datetime()
+        session=mock.ANY,
+        flow_run_id=flow_run_id,
+        since=earliest_possible_datetime(),
+        updated_since=None,
     )
     assert response.json() == graph.model_dump(mode="json")
 
@@ -1534,6 +1689,31 @@ async def test_api_incremental(
         session=mock.ANY,
         flow_run_id=flow_run_id,
         since=DateTime(2023, 6, 4, 1, 2, 3, tzinfo=ZoneInfo("UTC")),
+        updated_since=None,
+    )
+    assert response.json() == graph.model_dump(mode="json")
+
+
+async def test_api_updated_since(
+    client: AsyncClient,
+    model_method_mock: AsyncMock,
+    graph: Graph,
+):
+    flow_run_id = uuid4()
+
+    response = await client.get(
+        f"/flow_runs/{flow_run_id}/graph-v2",
+        params={
+            "updated_since": "2023-06-04T01:02:03Z",
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    model_method_mock.assert_awaited_once_with(
+        session=mock.ANY,
+        flow_run_id=flow_run_id,
+        since=earliest_possible_datetime(),
+        updated_since=DateTime(2023, 6, 4, 1, 2, 3, tzinfo=ZoneInfo("UTC")),
     )
     assert response.json() == graph.model_dump(mode="json")
 
@@ -2221,6 +2221,136 @@ class TestSetFlowRunState:
             assert concurrency_limit.json()["active_slots"] == 0
 
 
+class TestBulkSetFlowRunState:
+    @pytest.fixture
+    async def flow_runs(self, flow, session) -> list[core.FlowRun]:
+        flow_runs = [
+            await models.flow_runs.create_flow_run(
+                session=session, flow_run=schemas.core.FlowRun(flow_id=flow.id)
+            )
+            for _ in range(5)
+        ]
+        await session.commit()
+        return flow_runs
+
+    async def test_bulk_set_flow_run_state(self, flow_runs, client, session):
+        missing_id = uuid4()
+        response = await client.post(
+            "/flow_runs/set_state",
+            json=dict(
+                flow_run_ids=[str(run.id) for run in flow_runs] + [str(missing_id)],
+                state=dict(type="RUNNING", name="Test State"),
+            ),
+        )
+        assert response.status_code == 200, response.text
+
+        results = {
+            UUID(id): OrchestrationResult.model_validate(result)
+            for id, result in response.json().items()
+        }
+        assert set(results) == {run.id for run in flow_runs}
+        assert all(
+            result.status == responses.SetStateStatus.ACCEPT
+            for result in results.values()
+        )
+        # each run gets its own state
+        assert len({result.state.id for result in results.values()}) == len(flow_runs)
+
+        flow_run_ids = [run.id for run in flow_runs]
+        session.expire_all()
+        for flow_run_id in flow_run_ids:
+            refreshed = await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=flow_run_id
+            )
+            assert refreshed.state.type == StateType.RUNNING
+            assert refreshed.state.name == "Test State"
+            assert refreshed.state.state_details.flow_run_id == flow_run_id
+
+    async def test_bulk_set_flow_run_state_orchestrates_each_run(
+        self, flow_runs, client, session
+    ):
+        running, *others = flow_runs
+        response = await client.post(
+            f"/flow_runs/{running.id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+        assert response.status_code == 201, response.text
+
+        response = await client.post(
+            "/flow_runs/set_state",
+            json=dict(
+                flow_run_ids=[str(run.id) for run in flow_runs],
+                state=dict(type="PENDING"),
+            ),
+        )
+        assert response.status_code == 200, response.text
+
+        statuses = {
+            UUID(id): result["status"] for id, result in response.json().items()
+        }
+        assert statuses.pop(running.id) == "ABORT"
+        assert set(statuses.values()) == {"ACCEPT"}
+
+    async def test_bulk_set_flow_run_state_isolates_errors_to_their_run(
+        self, flow_runs, client, session, monkeypatch
+    ):
+        monkeypatch.setattr("prefect.server.api.flow_runs.BULK_SET_STATE_BATCH_SIZE", 2)
+        failing_run = flow_runs[1]
+        orchestrate = models.flow_runs._orchestrate_flow_run_state
+        orchestrated: list[UUID] = []
+
+        async def fail_for_one_run(**kwargs: Any):
+            orchestrated.append(kwargs["run"].id)
+            if kwargs["run"].id == failing_run.id:
+                raise ValueError("Boom!")
+            return await orchestrate(**kwargs)
+
+        monkeypatch.setattr(
+            models.flow_runs, "_orchestrate_flow_run_state", fail_for_one_run
+        )
+
+        response = await client.post(
+            "/flow_runs/set_state",
+            json=dict(
+                flow_run_ids=[str(run.id) for run in flow_runs],
+                state=dict(type="PENDING"),
+            ),
+        )
+        assert response.status_code == 200, response.text
+
+        results = {
+            UUID(id): OrchestrationResult.model_validate(result)
+            for id, result in response.json().items()
+        }
+        failed = results.pop(failing_run.id)
+        assert failed.status == responses.SetStateStatus.ABORT
+        assert "Boom!" in failed.details.reason
+        assert {result.status for result in results.values()} == {
+            responses.SetStateStatus.ACCEPT
+        }
+        # runs in the failing run's batch are not orchestrated again
+        assert sorted(orchestrated) == sorted(run.id for run in flow_runs)
+
+        failing_run_id = failing_run.id
+        flow_run_ids = [run.id for run in flow_runs]
+        session.expire_all()
+        for flow_run_id in flow_run_ids:
+            refreshed = await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=flow_run_id
+            )
+            if flow_run_id == failing_run_id:
+                assert refreshed.state is None
+            else:
+                assert refreshed.state.type == StateType.PENDING
+
+    async def test_bulk_set_flow_run_state_requires_flow_run_ids(self, client):
+        response = await client.post(
+            "/flow_runs/set_state",
+            json=dict(flow_run_ids=[], state=dict(type="PENDING")),
+        )
+        assert response.status_code == 422
+
+
 class TestManuallyRetryingFlowRuns:
     async def test_manual_flow_run_retries(
         self, failed_flow_run_with_deployment, client, session
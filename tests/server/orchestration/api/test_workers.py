@@ -1,3 +1,5 @@
+import asyncio
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import List
@@ -2252,3 +2254,89 @@ class TestGetScheduledRuns:
         updated_deployment_response = await client.get(f"/deployments/{deployment.id}")
         assert updated_deployment_response.status_code == status.HTTP_200_OK
         assert updated_deployment_response.json()["status"] == "READY"
+
+
+class TestLongPollScheduledRuns:
+    async def schedule_run(self, db, flow, work_pool, scheduled_time: datetime):
+        async with db.session_context(begin_transaction=True) as session:
+            return await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=prefect.server.schemas.states.Scheduled(
+                        scheduled_time=scheduled_time
+                    ),
+                    work_queue_id=work_pool.default_queue_id,
+                ),
+            )
+
+    async def test_returns_runs_without_waiting(self, client, db, flow, work_pool):
+        flow_run = await self.schedule_run(
+            db, flow, work_pool, datetime.now(timezone.utc)
+        )
+
+        started = time.monotonic()
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+            json=dict(
+                scheduled_before=datetime.now(timezone.utc).isoformat(),
+                wait_seconds=10,
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [r["flow_run"]["id"] for r in response.json()] == [str(flow_run.id)]
+        assert time.monotonic() - started < 5
+
+    async def test_returns_no_runs_after_waiting(self, client, work_pool):
+        started = time.monotonic()
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+            json=dict(
+                scheduled_before=datetime.now(timezone.utc).isoformat(),
+                wait_seconds=0.5,
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json() == []
+        assert time.monotonic() - started >= 0.5
+
+    async def test_wakes_when_runs_are_scheduled(self, client, db, flow, work_pool):
+        async def schedule_soon():
+            await asyncio.sleep(0.2)
+            return await self.schedule_run(
+                db, flow, work_pool, datetime.now(timezone.utc)
+            )
+
+        started = time.monotonic()
+        response, flow_run = await asyncio.gather(
+            client.post(
+                f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+                json=dict(
+                    scheduled_before=datetime.now(timezone.utc).isoformat(),
+                    wait_seconds=10,
+                ),
+            ),
+            schedule_soon(),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [r["flow_run"]["id"] for r in response.json()] == [str(flow_run.id)]
+        assert time.monotonic() - started < 5
+
+    async def test_wakes_when_scheduled_runs_come_due(
+        self, client, db, flow, work_pool
+    ):
+        flow_run = await self.schedule_run(
+            db, flow, work_pool, datetime.now(timezone.utc) + timedelta(seconds=1)
+        )
+
+        started = time.monotonic()
+        response = await client.post(
+            f"/work_pools/{work_pool.name}/get_scheduled_flow_runs",
+            json=dict(
+                scheduled_before=datetime.now(timezone.utc).isoformat(),
+                wait_seconds=10,
+            ),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [r["flow_run"]["id"] for r in response.json()] == [str(flow_run.id)]
+        assert 0.5 < time.monotonic() - started < 5
@@ -0,0 +1,386 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server import models, schemas
+from prefect.server.database import PrefectDBInterface
+from prefect.server.services.run_history_rollups import RunHistoryRollups
+from prefect.settings import (
+    PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED,
+    temporary_settings,
+)
+
+dt = datetime(2021, 7, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def rollups_enabled():
+    with temporary_settings(
+        {PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: True}
+    ):
+        yield
+
+
+async def create_flow_run(
+    session: AsyncSession, flow, state: schemas.states.State
+) -> schemas.core.FlowRun:
+    async with session.begin():
+        return await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(flow_id=flow.id, state=state),
+        )
+
+
+async def create_task_run(
+    session: AsyncSession, flow_run, start_time: datetime, state: schemas.states.State
+) -> schemas.core.TaskRun:
+    async with session.begin():
+        task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="task",
+                dynamic_key=str(start_time),
+                state=schemas.states.Running(timestamp=start_time),
+            ),
+        )
+        await models.task_runs.set_task_run_state(
+            session=session, task_run_id=task_run.id, state=state, force=True
+        )
+    return task_run
+
+
+async def backdate_updates(
+    db: PrefectDBInterface, session: AsyncSession, by: timedelta
+) -> None:
+    """Pretends that every run was last updated some time ago"""
+    async with session.begin():
+        for model in (db.FlowRun, db.TaskRun):
+            await session.execute(
+                sa.update(model).values(updated=sa.func.date_add(model.updated, -by))
+            )
+
+
+async def read_rollups(
+    db: PrefectDBInterface, session: AsyncSession, series: str
+) -> list[tuple[datetime, str, int]]:
+    async with session.begin():
+        result = await session.execute(
+            sa.select(
+                db.RunHistoryRollup.interval_start,
+                db.RunHistoryRollup.state_name,
+                db.RunHistoryRollup.count_runs,
+            )
+            .where(db.RunHistoryRollup.series == series)
+            .order_by(
+                db.RunHistoryRollup.interval_start, db.RunHistoryRollup.state_name
+            )
+        )
+        return [tuple(row) for row in result]
+
+
+async def test_rolls_up_finished_runs_by_minute(db, session, flow):
+    for offset in (timedelta(0), timedelta(seconds=30), timedelta(minutes=3)):
+        await create_flow_run(
+            session, flow, schemas.states.Completed(timestamp=dt + offset)
+        )
+    await create_flow_run(
+        session, flow, schemas.states.Failed(timestamp=dt + timedelta(seconds=59))
+    )
+    await create_flow_run(session, flow, schemas.states.Running(timestamp=dt))
+
+    await RunHistoryRollups().start(loops=1)
+
+    assert await read_rollups(db, session, "flow_run") == [
+        (dt, "Completed", 2),
+        (dt, "Failed", 1),
+        (dt + timedelta(minutes=3), "Completed", 1),
+    ]
+
+
+async def test_refreshes_minutes_with_updated_runs(db, session, flow):
+    flow_run = await create_flow_run(
+        session, flow, schemas.states.Running(timestamp=dt)
+    )
+    await create_flow_run(session, flow, schemas.states.Completed(timestamp=dt))
+
+    await RunHistoryRollups().start(loops=1)
+    assert await read_rollups(db, session, "flow_run") == [(dt, "Completed", 1)]
+
+    async with session.begin():
+        await models.flow_runs.set_flow_run_state(
+            session=session,
+            flow_run_id=flow_run.id,
+            state=schemas.states.Completed(timestamp=dt + timedelta(seconds=5)),
+        )
+
+    await RunHistoryRollups().start(loops=1)
+    assert await read_rollups(db, session, "flow_run") == [(dt, "Completed", 2)]
+
+
+async def read_work_queue_ids(
+    db: PrefectDBInterface, session: AsyncSession, series: str
+) -> list:
+    async with session.begin():
+        result = await session.execute(
+            sa.select(db.RunHistoryRollup.work_queue_id).where(
+                db.RunHistoryRollup.series == series
+            )
+        )
+        return list(result.scalars())
+
+
+async def read_frontier(session: AsyncSession, series: str) -> datetime:
+    async with session.begin():
+        frontier = await models.run_history_rollups.read_rollup_frontier(
+            session=session, series=series
+        )
+    assert frontier
+    return frontier
+
+
+async def test_refreshes_minutes_of_deleted_runs(db, session, flow, rollups_enabled):
+    flow_run = await create_flow_run(
+        session, flow, schemas.states.Completed(timestamp=dt)
+    )
+    await create_task_run(
+        session, flow_run, start_time=dt, state=schemas.states.Completed()
+    )
+    await create_flow_run(
+        session, flow, schemas.states.Completed(timestamp=dt + timedelta(seconds=30))
+    )
+
+    await RunHistoryRollups().start(loops=1)
+    await backdate_updates(db, session, timedelta(hours=1))
+    assert await read_rollups(db, session, "flow_run") == [(dt, "Completed", 2)]
+    assert await read_rollups(db, session, "task_run_start_time") == [
+        (dt, "Completed", 1)
+    ]
+    assert await read_frontier(session, "flow_run") > dt
+
+    async with session.begin():
+        await models.flow_runs.delete_flow_run(session=session, flow_run_id=flow_run.id)
+
+    # readers don't use the rollups of the deleted runs' minutes until they're
+    # recomputed
+    for series in models.run_history_rollups.SERIES:
+        assert await read_frontier(session, series) == dt
+
+    await RunHistoryRollups().start(loops=1)
+    assert await read_rollups(db, session, "flow_run") == [(dt, "Completed", 1)]
+    assert await read_rollups(db, session, "task_run_start_time") == []
+    assert await read_frontier(session, "flow_run") > dt
+
+
+async def test_refreshes_minutes_of_runs_whose_work_queue_is_deleted(
+    db, session, flow, work_queue, rollups_enabled
+):
+    async with session.begin():
+        await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                work_queue_id=work_queue.id,
+                state=schemas.states.Completed(timestamp=dt),
+            ),
+        )
+
+    await RunHistoryRollups().start(loops=1)
+    assert await read_work_queue_ids(db, session, "flow_run") == [work_queue.id]
+
+    async with session.begin():
+        await models.work_queues.delete_work_queue(
+            session=session, work_queue_id=work_queue.id
+        )
+
+    await RunHistoryRollups().start(loops=1)
+    assert await read_work_queue_ids(db, session, "flow_run") == [None]
+
+
+async def test_rolls_up_task_runs_by_start_time(db, session, flow, flow_run):
+    await create_task_run(
+        session,
+        flow_run,
+        start_time=dt + timedelta(minutes=1, seconds=10),
+        state=schemas.states.Completed(),
+    )
+
+    await RunHistoryRollups().start(loops=1)
+
+    assert await read_rollups(db, session, "task_run_start_time") == [
+        (dt + timedelta(minutes=1), "Completed", 1)
+    ]
+
+
+def sorted_states(history: list[dict]) -> list[dict]:
+    """The states of each interval are returned in no particular order"""
+    return [
+        {
+            **interval,
+            "states": sorted(
+                interval["states"],
+                key=lambda state: (state["state_type"], state["state_name"]),
+            ),
+        }
+        for interval in history
+    ]
+
+
+class TestReadingRollups:
+    @pytest.fixture
+    async def runs(self, db, session, flow):
+        """
+        Finished flow runs in the first ten minutes after `dt` that have been rolled
+        up, and a finished flow run at ten minutes that was the last one rolled up,
+        so that the rollups are only read before it.
+        """
+        for minute in range(10):
+            await create_flow_run(
+                session,
+                flow,
+                schemas.states.Completed(timestamp=dt + timedelta(minutes=minute)),
+            )
+            await create_flow_run(
+                session,
+                flow,
+                schemas.states.Failed(
+                    timestamp=dt + timedelta(minutes=minute, seconds=30)
+                ),
+            )
+        await backdate_updates(db, session, timedelta(hours=2))
+
+        await create_flow_run(
+            session,
+            flow,
+            schemas.states.Completed(timestamp=dt + timedelta(minutes=10)),
+        )
+        await backdate_updates(db, session, timedelta(hours=1))
+
+        await RunHistoryRollups().start(loops=1)
+
+        # changes after the rollups were computed are read from the runs
+        await create_flow_run(
+            session,
+            flow,
+            schemas.states.Completed(timestamp=dt + timedelta(minutes=12)),
+        )
+        await create_flow_run(
+            session, flow, schemas.states.Running(timestamp=dt + timedelta(minutes=2))
+        )
+
+    async def read_history(self, client, interval: timedelta, **filters):
+        response = await client.post(
+            "/flow_runs/history",
+            json=dict(
+                history_start=str(dt),
+                history_end=str(dt + timedelta(minutes=15)),
+                history_interval_seconds=interval.total_seconds(),
+                **filters,
+            ),
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    @pytest.mark.parametrize(
+        "interval", [timedelta(minutes=1), timedelta(minutes=5), timedelta(seconds=90)]
+    )
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {},
+            {"flow_runs": {"state": {"type": {"any_": ["COMPLETED"]}}}},
+            {"flow_runs": {"tags": {"all_": ["nope"]}}},
+        ],
+    )
+    async def test_history_is_the_same_with_rollups(
+        self, runs, client, interval, filters
+    ):
+        expected = sorted_states(await self.read_history(client, interval, **filters))
+
+        with temporary_settings(
+            {PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: True}
+        ):
+            history = await self.read_history(client, interval, **filters)
+            assert sorted_states(history) == expected
+
+    async def test_history_reads_finished_runs_from_rollups(
+        self, runs, db, session, client, rollups_enabled
+    ):
+        async with session.begin():
+            await session.execute(
+                sa.update(db.RunHistoryRollup)
+                .where(db.RunHistoryRollup.interval_start == dt)
+                .values(count_runs=db.RunHistoryRollup.count_runs + 100)
+            )
+
+        history = await self.read_history(client, timedelta(minutes=5))
+
+        first_interval = {
+            state["state_name"]: state["count_runs"] for state in history[0]["states"]
+        }
+        assert first_interval == {"Completed": 105, "Failed": 105, "Running": 1}
+        last_interval = {
+            state["state_name"]: state["count_runs"] for state in history[2]["states"]
+        }
+        assert last_interval == {"Completed": 2}
+
+
+async def test_dashboard_counts_are_the_same_with_rollups(
+    db, session, client, flow, flow_run
+):
+    for minute in range(10):
+        await create_task_run(
+            session,
+            flow_run,
+            start_time=dt + timedelta(minutes=minute, seconds=15),
+            state=schemas.states.Completed(),
+        )
+        await create_task_run(
+            session,
+            flow_run,
+            start_time=dt + timedelta(minutes=minute, seconds=45),
+            state=schemas.states.Failed(),
+        )
+    await backdate_updates(db, session, timedelta(hours=2))
+    await create_task_run(
+        session,
+        flow_run,
+        start_time=dt + timedelta(minutes=15),
+        state=schemas.states.Completed(),
+    )
+    await backdate_updates(db, session, timedelta(hours=1))
+
+    await RunHistoryRollups().start(loops=1)
+
+    async def read_counts():
+        response = await client.post(
+            "/ui/task_runs/dashboard/counts",
+            json={
+                "task_runs": {
+                    "start_time": {
+                        "after_": dt.isoformat(),
+                        "before_": (dt + timedelta(minutes=19)).isoformat(),
+                    }
+                }
+            },
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    expected = await read_counts()
+    assert sum(bucket["completed"] for bucket in expected) == 11
+
+    with temporary_settings(
+        {PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: True}
+    ):
+        assert await read_counts() == expected
+
+        async with session.begin():
+            await session.execute(
+                sa.update(db.RunHistoryRollup).values(
+                    count_runs=db.RunHistoryRollup.count_runs + 1
+                )
+            )
+        assert sum(bucket["completed"] for bucket in await read_counts()) == 21
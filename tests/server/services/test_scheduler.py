@@ -425,6 +425,84 @@ async def test_create_schedules_from_multiple_deployments_in_batches(flow, sessi
     assert len(runs) > PREFECT_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE.value()
 
 
+async def test_identical_schedules_are_expanded_once_per_page(
+    flow: schemas.core.Flow,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    schedule = schemas.schedules.CronSchedule(cron="0 0 * * *")
+    for i in range(5):
+        await models.deployments.create_deployment(
+            session=session,
+            deployment=schemas.core.Deployment(
+                name=f"test_{i}",
+                flow_id=flow.id,
+                schedules=[schemas.core.DeploymentSchedule(schedule=schedule)],
+            ),
+        )
+    await session.commit()
+
+    expansions = 0
+    get_scheduled_dates = models.deployments._get_scheduled_dates
+
+    def counting_get_scheduled_dates(*args, **kwargs):
+        nonlocal expansions
+        expansions += 1
+        return get_scheduled_dates(*args, **kwargs)
+
+    monkeypatch.setattr(
+        models.deployments, "_get_scheduled_dates", counting_get_scheduled_dates
+    )
+
+    service = Scheduler()
+    await service.start(loops=1)
+
+    assert expansions == 1
+    runs = await models.flow_runs.read_flow_runs(session)
+    assert len(runs) == 5 * service.min_runs
+    assert len({r.deployment_id for r in runs}) == 5
+    assert len({r.idempotency_key for r in runs}) == len(runs)
+
+
+async def test_scheduler_uses_overridden_per_deployment_hook(
+    session: AsyncSession, deployment_with_active_schedules: schemas.core.Deployment
+):
+    calls = []
+
+    class CustomScheduler(Scheduler):
+        async def _generate_scheduled_flow_runs(self, session, deployment_id, **kwargs):
+            calls.append(deployment_id)
+            return await super()._generate_scheduled_flow_runs(
+                session=session, deployment_id=deployment_id, **kwargs
+            )
+
+    service = CustomScheduler()
+    await service.start(loops=1)
+
+    assert calls == [deployment_with_active_schedules.id]
+    runs = await models.flow_runs.read_flow_runs(session)
+    # min_runs for each of the deployment's two active schedules
+    assert len(runs) == service.min_runs * 2
+
+
+async def test_scheduler_records_loop_timings(
+    session: AsyncSession, deployment_with_active_schedules: schemas.core.Deployment
+):
+    service = Scheduler()
+    await service.start(loops=1)
+
+    timings = service.last_loop_timings
+    assert timings["deployments"] == 1
+    assert timings["runs"] == await models.flow_runs.count_flow_runs(session) > 0
+    for phase in ("select", "generate", "insert"):
+        assert 0 <= timings[phase] <= timings["total"]
+
+    # a second loop has nothing to schedule
+    await service.start(loops=1)
+    assert service.last_loop_timings["deployments"] == 0
+    assert service.last_loop_timings["runs"] == 0
+
+
 async def test_scheduler_respects_paused(
     flow: schemas.core.Flow, session: AsyncSession
 ):
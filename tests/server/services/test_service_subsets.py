@@ -10,6 +10,7 @@ from prefect.server.services.foreman import Foreman
 from prefect.server.services.late_runs import MarkLateRuns
 from prefect.server.services.pause_expirations import FailExpiredPauses
 from prefect.server.services.repossessor import Repossessor
+from prefect.server.services.run_history_rollups import RunHistoryRollups
 from prefect.server.services.scheduler import RecentDeploymentsScheduler, Scheduler
 from prefect.server.services.task_run_recorder import TaskRunRecorder
 from prefect.server.services.telemetry import Telemetry
@@ -27,6 +28,7 @@ def test_the_all_service_subset():
         MarkLateRuns,
         RecentDeploymentsScheduler,
         Repossessor,
+        RunHistoryRollups,
         Scheduler,
         TaskRunRecorder,
         # Events services
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from prefect.server.events.schemas.events import ReceivedEvent
 from prefect.server.models.flow_runs import create_flow_run
+from prefect.server.models.run_history_rollups import read_stale_intervals
 from prefect.server.models.task_run_states import (
     read_task_run_state,
     read_task_run_states,
@@ -20,6 +21,10 @@ from prefect.server.schemas.states import StateDetails, StateType
 from prefect.server.services import task_run_recorder
 from prefect.server.utilities.messaging import MessageHandler, create_publisher
 from prefect.server.utilities.messaging.memory import MemoryMessage
+from prefect.settings import (
+    PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED,
+    temporary_settings,
+)
 
 
 async def test_start_and_stop_service():
@@ -461,6 +466,22 @@ async def test_recording_single_event(
     )
 
 
+async def test_recorded_states_keep_their_data(
+    session: AsyncSession,
+    completed_event: ReceivedEvent,
+    task_run_recorder_handler: MessageHandler,
+):
+    await task_run_recorder_handler(message(completed_event))
+
+    state = await read_task_run_state(
+        session=session,
+        task_run_state_id=UUID("33333333-3333-3333-3333-333333333333"),
+    )
+
+    assert state
+    assert state.data == {"type": "unpersisted"}
+
+
 async def test_updates_task_run_on_subsequent_state_changes(
     session: AsyncSession,
     pending_event: ReceivedEvent,
@@ -791,3 +812,137 @@ async def test_task_run_recorder_sends_repeated_failed_messages_to_dead_letter(
         await service_task
     except asyncio.CancelledError:
         pass
+
+
+class TestBatchedRecording:
+    async def test_events_are_recorded_when_the_batch_is_flushed(
+        self,
+        session: AsyncSession,
+        pending_event: ReceivedEvent,
+        running_event: ReceivedEvent,
+        completed_event: ReceivedEvent,
+    ):
+        async with task_run_recorder.consumer(
+            batch_size=10, flush_every=timedelta(minutes=1)
+        ) as handler:
+            for event in [completed_event, pending_event, running_event]:
+                await handler(message(event))
+
+            assert not await read_task_run(
+                session=session,
+                task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+            )
+
+        task_run = await read_task_run(
+            session=session,
+            task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+        )
+        assert task_run
+
+        # the transitions are collapsed as if they had been recorded in order
+        assert task_run.flow_run_run_count == 7
+        assert task_run.run_count == 8
+        assert task_run.expected_start_time == pending_event.occurred
+        assert task_run.start_time == running_event.occurred
+        assert task_run.end_time == completed_event.occurred
+        assert task_run.state_id == UUID("33333333-3333-3333-3333-333333333333")
+        assert task_run.state_type == StateType.COMPLETED
+        assert task_run.state_timestamp == completed_event.occurred
+
+        states = await read_task_run_states(session, task_run.id)
+        assert {state.type for state in states} == {
+            StateType.PENDING,
+            StateType.RUNNING,
+            StateType.COMPLETED,
+        }
+
+    async def test_batches_are_flushed_when_full(
+        self,
+        session: AsyncSession,
+        pending_event: ReceivedEvent,
+        running_event: ReceivedEvent,
+    ):
+        async with task_run_recorder.consumer(
+            batch_size=2, flush_every=timedelta(minutes=1)
+        ) as handler:
+            await handler(message(pending_event))
+            await handler(message(running_event))
+
+            task_run = await read_task_run(
+                session=session,
+                task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+            )
+            assert task_run
+            assert task_run.state_type == StateType.RUNNING
+
+    async def test_batches_are_flushed_periodically(
+        self,
+        session: AsyncSession,
+        pending_event: ReceivedEvent,
+    ):
+        async with task_run_recorder.consumer(
+            batch_size=10, flush_every=timedelta(seconds=0.1)
+        ) as handler:
+            await handler(message(pending_event))
+
+            task_run = None
+            for _ in range(50):
+                await asyncio.sleep(0.1)
+                if task_run := await read_task_run(
+                    session=session,
+                    task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+                ):
+                    break
+
+            assert task_run
+            assert task_run.state_type == StateType.PENDING
+
+    async def test_events_are_recorded_individually_when_a_batch_fails(
+        self,
+        session: AsyncSession,
+        pending_event: ReceivedEvent,
+        running_event: ReceivedEvent,
+    ):
+        # A state with the same task run and timestamp as another can't be recorded,
+        # and fails the whole batch it's in
+        duplicate_pending_event = pending_event.model_copy()
+        duplicate_pending_event.id = UUID("bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb")
+
+        async with task_run_recorder.consumer(
+            batch_size=10, flush_every=timedelta(minutes=1)
+        ) as handler:
+            for event in [pending_event, duplicate_pending_event, running_event]:
+                await handler(message(event))
+
+        task_run = await read_task_run(
+            session=session,
+            task_run_id=UUID("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"),
+        )
+        assert task_run
+        assert task_run.state_type == StateType.RUNNING
+
+        states = await read_task_run_states(session, task_run.id)
+        assert {state.id for state in states} == {
+            UUID("11111111-1111-1111-1111-111111111111"),
+            UUID("22222222-2222-2222-2222-222222222222"),
+        }
+
+
+async def test_marks_run_history_of_moved_task_runs_stale(
+    session: AsyncSession,
+    running_event: ReceivedEvent,
+    completed_event: ReceivedEvent,
+    task_run_recorder_handler: MessageHandler,
+):
+    completed_event.payload["task_run"]["start_time"] = "2024-01-01T00:05:00Z"
+
+    with temporary_settings(
+        {PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: True}
+    ):
+        await task_run_recorder_handler(message(running_event))
+        await task_run_recorder_handler(message(completed_event))
+
+    # the task run is no longer counted in the minute it started in before
+    assert await read_stale_intervals(
+        session=session, series="task_run_start_time"
+    ) == [datetime(2024, 1, 1, 0, 1, tzinfo=timezone.utc)]
@@ -633,6 +633,23 @@ class TestDateFunctions:
         # database rounnd-trips can be sloooow
         assert 17 <= result <= 17.1
 
+    async def test_date_trunc_minute(self, session: AsyncSession):
+        value = datetime.datetime(
+            2021, 7, 1, 12, 34, 59, 999999, tzinfo=datetime.timezone.utc
+        )
+        model = SQLTimestampModel(ts_1=value)
+        session.add(model)
+        await session.commit()
+
+        result = await session.scalar(
+            sa.select(sa.func.date_trunc_minute(SQLTimestampModel.ts_1)).where(
+                SQLTimestampModel.id == model.id
+            )
+        )
+        assert result == datetime.datetime(
+            2021, 7, 1, 12, 34, tzinfo=datetime.timezone.utc
+        )
+
 
 async def test_error_thrown_if_sqlite_version_is_below_minimum():
     with mock.patch.object(sqlite3, "sqlite_version_info", (3, 23, 9)):
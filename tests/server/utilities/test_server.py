@@ -30,3 +30,66 @@ class TestParsing:
         quoted_response = client.get(urllib.parse.quote(f"/{x}"))
 
         assert x == response.json() == quoted_response.json()
+
+
+class TestConditionalResponses:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        router = PrefectRouter()
+        values = {"x": 1}
+
+        @router.get("/value")
+        def read_value():
+            return values
+
+        @router.post("/value")
+        def write_value(x: int):
+            values["x"] = x
+            return values
+
+        app.include_router(router)
+        client = TestClient(app)
+        return client
+
+    def test_get_responses_have_etags(self, client):
+        response = client.get("/value")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"')
+        assert client.get("/value").headers["ETag"] == response.headers["ETag"]
+
+    def test_other_responses_do_not_have_etags(self, client):
+        response = client.post("/value", params={"x": 1})
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+
+    @pytest.mark.parametrize(
+        "if_none_match", ["{etag}", "{strong_etag}", '"other", {etag}', "*"]
+    )
+    def test_matching_etag_is_not_modified(self, client, if_none_match):
+        etag = client.get("/value").headers["ETag"]
+
+        response = client.get(
+            "/value",
+            headers={
+                "If-None-Match": if_none_match.format(
+                    etag=etag, strong_etag=etag.removeprefix("W/")
+                )
+            },
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_changed_response_is_sent_again(self, client):
+        etag = client.get("/value").headers["ETag"]
+        client.post("/value", params={"x": 2})
+
+        response = client.get("/value", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json() == {"x": 2}
+        assert response.headers["ETag"] != etag
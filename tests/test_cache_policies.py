@@ -15,6 +15,7 @@ from prefect.cache_policies import (
     _None,
 )
 from prefect.context import TaskRunContext
+from prefect.utilities.hashing import CONTENT_HASH_MIN_BYTES
 
 
 class TestBaseClass:
@@ -117,6 +118,86 @@ class TestInputsPolicy:
 
         assert key != other_key
 
+    def test_large_buffer_inputs_are_hashed_by_content(self):
+        policy = Inputs()
+        data = b"x" * CONTENT_HASH_MIN_BYTES
+
+        key = policy.compute_key(
+            task_ctx=None, inputs={"x": data}, flow_parameters=None
+        )
+        same_key = policy.compute_key(
+            task_ctx=None, inputs={"x": bytes(data)}, flow_parameters=None
+        )
+        other_key = policy.compute_key(
+            task_ctx=None,
+            inputs={"x": b"y" * CONTENT_HASH_MIN_BYTES},
+            flow_parameters=None,
+        )
+
+        assert key == same_key
+        assert key != other_key
+
+    def test_large_data_frames_are_hashed_by_content(self):
+        pd = pytest.importorskip("pandas")
+        policy = Inputs()
+        rows = CONTENT_HASH_MIN_BYTES // 8
+        df = pd.DataFrame({"a": range(rows), "b": range(rows)})
+
+        key = policy.compute_key(task_ctx=None, inputs={"df": df}, flow_parameters=None)
+        reordered_key = policy.compute_key(
+            task_ctx=None, inputs={"df": df[["b", "a"]]}, flow_parameters=None
+        )
+        changed = df.copy()
+        changed.loc[0, "a"] = -1
+        changed_key = policy.compute_key(
+            task_ctx=None, inputs={"df": changed}, flow_parameters=None
+        )
+
+        assert key == reordered_key
+        assert key != changed_key
+
+    def test_data_frames_with_values_of_different_types_have_different_keys(self):
+        pd = pytest.importorskip("pandas")
+        policy = Inputs()
+        rows = CONTENT_HASH_MIN_BYTES // 8
+        ints = pd.DataFrame({"a": pd.Series([1] * rows, dtype=object)})
+        strings = pd.DataFrame({"a": pd.Series(["1"] * rows, dtype=object)})
+
+        assert policy.compute_key(
+            task_ctx=None, inputs={"df": ints}, flow_parameters=None
+        ) != policy.compute_key(
+            task_ctx=None, inputs={"df": strings}, flow_parameters=None
+        )
+
+    def test_data_frames_with_mixed_value_types_have_different_keys(self):
+        pd = pytest.importorskip("pandas")
+        policy = Inputs()
+        rows = CONTENT_HASH_MIN_BYTES // 8
+        ints = pd.DataFrame({"a": pd.Series([1, "a"] * rows, dtype=object)})
+        strings = pd.DataFrame({"a": pd.Series(["1", "a"] * rows, dtype=object)})
+
+        assert policy.compute_key(
+            task_ctx=None, inputs={"df": ints}, flow_parameters=None
+        ) != policy.compute_key(
+            task_ctx=None, inputs={"df": strings}, flow_parameters=None
+        )
+
+    def test_data_frames_with_duplicate_column_names_are_hashed_by_content(self):
+        pd = pytest.importorskip("pandas")
+        policy = Inputs()
+        rows = CONTENT_HASH_MIN_BYTES // 8
+        df = pd.DataFrame({"a": range(rows), "b": range(rows)}).set_axis(
+            ["a", "a"], axis=1
+        )
+        changed = df.copy()
+        changed.iloc[0, 1] = -1
+
+        assert policy.compute_key(
+            task_ctx=None, inputs={"df": df}, flow_parameters=None
+        ) != policy.compute_key(
+            task_ctx=None, inputs={"df": changed}, flow_parameters=None
+        )
+
     def test_subtraction_results_in_new_policy_for_inputs(self):
         policy = Inputs()
         new_policy = policy - "foo"
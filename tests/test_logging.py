@@ -3,9 +3,11 @@ from __future__ import annotations
 import json
 import logging
 import sys
+import threading
 import time
 import uuid
 from contextlib import nullcontext
+from contextvars import copy_context
 from datetime import datetime
 from functools import partial
 from io import StringIO
@@ -25,6 +27,7 @@ import prefect.logging.configuration
 import prefect.settings
 from prefect import flow, task
 from prefect._internal.concurrency.api import create_call, from_sync
+from prefect._internal.concurrency.services import BatchedQueueService
 from prefect.client.orchestration import PrefectClient
 from prefect.context import FlowRunContext, TaskRunContext
 from prefect.exceptions import MissingContextError
@@ -37,6 +40,8 @@ from prefect.logging.configuration import (
 from prefect.logging.filters import ObfuscateApiKeyFilter
 from prefect.logging.formatters import JsonFormatter
 from prefect.logging.handlers import (
+    MIN_ADAPTIVE_BATCH_SIZE,
+    OVERFLOW_SAMPLE_RATE,
     APILogHandler,
     APILogWorker,
     PrefectConsoleHandler,
@@ -64,8 +69,11 @@ from prefect.settings import (
     PREFECT_LOGGING_SETTINGS_PATH,
     PREFECT_LOGGING_TO_API_BATCH_INTERVAL,
     PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_LOGGING_TO_API_COMPRESSION,
     PREFECT_LOGGING_TO_API_ENABLED,
     PREFECT_LOGGING_TO_API_MAX_LOG_SIZE,
+    PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE,
+    PREFECT_LOGGING_TO_API_QUEUE_OVERFLOW_POLICY,
     PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW,
     PREFECT_SERVER_LOGGING_LEVEL,
     PREFECT_TEST_MODE,
@@ -1112,6 +1120,191 @@ class TestAPILogWorker:
             assert len(logs) == 1
             assert logs[0]["worker_id"] == worker_id
 
+    async def test_send_logs_with_compression(
+        self,
+        log_dict: dict[str, Any],
+        prefect_client: PrefectClient,
+    ):
+        with temporary_settings(updates={PREFECT_LOGGING_TO_API_COMPRESSION: True}):
+            worker = APILogWorker.instance()
+            worker.send(log_dict)
+            await worker.drain()
+
+        logs = await prefect_client.read_logs()
+        assert len(logs) == 1
+        assert worker.stats()["sent"] == 1
+
+    async def test_counts_failed_logs(
+        self, log_dict: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(
+            "prefect.client.orchestration.PrefectClient.create_logs",
+            AsyncMock(side_effect=ValueError("Test")),
+        )
+
+        worker = APILogWorker.instance()
+        worker.send(log_dict)
+        worker.send(log_dict)
+        await worker.drain()
+
+        assert worker.stats()["failed"] == 2
+        assert worker.stats()["sent"] == 0
+
+
+class TestAPILogWorkerQueueOverflow:
+    @pytest.fixture
+    def worker(self):
+        # Not started, so that logs stay in the queue
+        return APILogWorker()
+
+    def queued_messages(self, worker: APILogWorker) -> list[str]:
+        return [item["message"] for item in worker._queue.queue]
+
+    @pytest.mark.parametrize("max_queue_size", [0, 10])
+    def test_logs_are_queued_up_to_max_queue_size(
+        self, worker: APILogWorker, max_queue_size: int
+    ):
+        with temporary_settings(
+            updates={PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE: max_queue_size}
+        ):
+            for i in range(10):
+                worker.send({"message": str(i)})
+
+        assert len(self.queued_messages(worker)) == 10
+        assert worker.dropped == 0
+
+    def test_drop_oldest(
+        self, worker: APILogWorker, capsys: pytest.CaptureFixture[str]
+    ):
+        with temporary_settings(
+            updates={
+                PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE: 3,
+                PREFECT_LOGGING_TO_API_QUEUE_OVERFLOW_POLICY: "drop-oldest",
+            }
+        ):
+            for i in range(5):
+                worker.send({"message": str(i)})
+
+        assert self.queued_messages(worker) == ["2", "3", "4"]
+        assert worker.stats()["dropped"] == 2
+        assert "Log queue is full" in capsys.readouterr().err
+
+    def test_sample(self, worker: APILogWorker):
+        with temporary_settings(
+            updates={
+                PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE: 3,
+                PREFECT_LOGGING_TO_API_QUEUE_OVERFLOW_POLICY: "sample",
+            }
+        ):
+            for i in range(3 + OVERFLOW_SAMPLE_RATE):
+                worker.send({"message": str(i)})
+
+        # Only one of the overflowing logs is kept, replacing the oldest
+        assert self.queued_messages(worker) == ["1", "2", str(2 + OVERFLOW_SAMPLE_RATE)]
+        assert worker.dropped == OVERFLOW_SAMPLE_RATE
+
+    def test_block_waits_for_room(self, worker: APILogWorker):
+        with temporary_settings(
+            updates={
+                PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE: 1,
+                PREFECT_LOGGING_TO_API_QUEUE_OVERFLOW_POLICY: "block",
+            }
+        ):
+            worker.send({"message": "0"})
+            sender = threading.Thread(
+                target=copy_context().run, args=(worker.send, {"message": "1"})
+            )
+            sender.start()
+
+            time.sleep(0.2)
+            assert sender.is_alive()
+
+            assert worker._queue.get_nowait() == {"message": "0"}
+            sender.join(timeout=5)
+
+        assert not sender.is_alive()
+        assert self.queued_messages(worker) == ["1"]
+        assert worker.dropped == 0
+
+
+class TestAPILogWorkerAdaptiveBatching:
+    @pytest.fixture(autouse=True)
+    def batch_settings(self):
+        with temporary_settings(
+            updates={
+                PREFECT_LOGGING_TO_API_BATCH_SIZE: 4_000_000,
+                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: 1_000_000,
+                PREFECT_LOGGING_TO_API_BATCH_INTERVAL: 2.0,
+            }
+        ):
+            yield
+
+    def test_uses_the_configured_batch_size_before_any_batches_are_sent(self):
+        assert APILogWorker().max_batch_size == 3_000_000
+
+    def test_batch_size_follows_arrival_rate(self):
+        worker = APILogWorker()
+        worker._bytes_per_second = 100_000
+        worker._latency = 0.1
+
+        # Enough for what arrives during the two second interval
+        assert worker.max_batch_size == 200_000
+
+        # Slow requests make batches larger
+        worker._latency = 5
+        assert worker.max_batch_size == 500_000
+
+    def test_batch_size_includes_backlog(self):
+        worker = APILogWorker()
+        worker._bytes_per_second = 100_000
+        worker.send({"message": "hello", "__payload_size__": 1_000_000})
+
+        assert worker.max_batch_size == 1_200_000
+
+    def test_counts_logs_taken_by_the_worker_before_send_returns(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Simulate the worker thread taking the log as soon as it is enqueued
+        monkeypatch.setattr(
+            BatchedQueueService, "send", lambda self, item: self._get_size(item)
+        )
+        worker = APILogWorker()
+        worker.send({"message": "hello", "__payload_size__": 100})
+
+        assert worker._enqueued_bytes == 100
+
+    def test_batch_size_is_bounded(self):
+        worker = APILogWorker()
+        worker._bytes_per_second = 0
+        assert worker.max_batch_size == MIN_ADAPTIVE_BATCH_SIZE
+
+        worker._bytes_per_second = 100_000_000
+        assert worker.max_batch_size == 3_000_000
+
+    async def test_observes_sent_batches(
+        self, monkeypatch: pytest.MonkeyPatch, log_dict: dict[str, Any]
+    ):
+        monkeypatch.setattr(
+            "prefect.client.orchestration.PrefectClient.create_logs", AsyncMock()
+        )
+        worker = APILogWorker.instance()
+        worker.send({**log_dict, "__payload_size__": 100})
+        await worker.drain()
+
+        assert worker._latency is not None
+        assert worker._bytes_per_second is not None
+        assert worker._handled_bytes == worker._enqueued_bytes == 100
+
+    @pytest.fixture
+    def log_dict(self):
+        return LogCreate(
+            flow_run_id=uuid.uuid4(),
+            name="test.logger",
+            level=10,
+            timestamp=now("UTC"),
+            message="hello",
+        ).model_dump(mode="json")
+
 
 def test_flow_run_logger(flow_run: "FlowRun"):
     logger = flow_run_logger(flow_run)
@@ -6,12 +6,14 @@ from dataclasses import dataclass
 from typing import Any
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from pydantic import BaseModel, ValidationError, field_validator
 
 from prefect.serializers import (
     CompressedSerializer,
     JSONSerializer,
+    OutOfBandPickleSerializer,
     PickleSerializer,
     Serializer,
     prefect_json_object_decoder,
@@ -203,6 +205,56 @@ class TestPickleSerializer:
             PickleSerializer(picklelib="pickle")
 
 
+class TestOutOfBandPickleSerializer:
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    def test_simple_roundtrip(self, data):
+        serializer = OutOfBandPickleSerializer()
+        serialized = serializer.dumps(data)
+        assert serializer.loads(serialized) == data
+
+    @pytest.mark.parametrize("data", EXCEPTION_TEST_CASES)
+    def test_exception_roundtrip(self, data):
+        serializer = OutOfBandPickleSerializer()
+        serialized = serializer.dumps(data)
+        assert exceptions_equal(serializer.loads(serialized), data)
+
+    def test_shorthand(self):
+        serializer = Serializer(type="pickle/out-of-band")
+        assert isinstance(serializer, OutOfBandPickleSerializer)
+
+    @pytest.mark.parametrize("picklelib", ["pickle", "cloudpickle"])
+    def test_frame_roundtrip_with_buffers(self, picklelib):
+        serializer = OutOfBandPickleSerializer(picklelib=picklelib)
+        data = {
+            "array": np.arange(1000, dtype="float64"),
+            "fortran": np.asfortranarray(np.ones((10, 20))),
+            "bytes": bytearray(b"x" * 1000),
+            "value": "test",
+        }
+
+        file = io.BytesIO()
+        size = serializer.write_frame(data, file)
+        assert size == len(file.getvalue())
+
+        loaded = serializer.read_frame(file.getbuffer())
+        assert np.array_equal(loaded["array"], data["array"])
+        assert np.array_equal(loaded["fortran"], data["fortran"])
+        assert loaded["bytes"] == data["bytes"]
+        assert loaded["value"] == "test"
+
+    def test_buffers_are_not_copied_on_read(self):
+        serializer = OutOfBandPickleSerializer()
+        file = io.BytesIO()
+        serializer.write_frame(np.arange(1000, dtype="int64"), file)
+
+        frame = bytearray(file.getvalue())
+        loaded = serializer.read_frame(frame)
+
+        assert not loaded.flags.owndata
+        # the loaded array is a view of the frame and is aligned within it
+        assert loaded.ctypes.data % 64 == np.frombuffer(frame, "u1").ctypes.data % 64
+
+
 class TestJSONSerializer:
     @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
     def test_simple_roundtrip(self, data: Any):
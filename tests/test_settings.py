@@ -193,9 +193,14 @@ SUPPORTED_SETTINGS = {
     "PREFECT_API_TASK_CACHE_KEY_MAX_LENGTH": {"test_value": 10, "legacy": True},
     "PREFECT_API_TLS_INSECURE_SKIP_VERIFY": {"test_value": True},
     "PREFECT_API_URL": {"test_value": "https://api.prefect.io"},
+    "PREFECT_CLIENT_CONCURRENCY_LEASE_BLOCK_SIZE": {"test_value": 10},
+    "PREFECT_CLIENT_CONCURRENCY_LEASE_IDLE_TIMEOUT": {"test_value": 2.0},
     "PREFECT_CLIENT_CSRF_SUPPORT_ENABLED": {"test_value": True},
     "PREFECT_CLIENT_CUSTOM_HEADERS": {"test_value": '{"X-CUSTOM": "foobar"}'},
     "PREFECT_CLIENT_ENABLE_METRICS": {"test_value": True, "legacy": True},
+    "PREFECT_CLIENT_EVENTS_BATCH_SIZE": {"test_value": 100},
+    "PREFECT_CLIENT_EVENTS_MAX_UNCONFIRMED": {"test_value": 5000},
+    "PREFECT_CLIENT_HTTP_CACHE_MAX_BYTES": {"test_value": 100},
     "PREFECT_CLIENT_MAX_RETRIES": {"test_value": 3},
     "PREFECT_CLIENT_METRICS_ENABLED": {
         "test_value": True,
@@ -270,8 +275,11 @@ SUPPORTED_SETTINGS = {
     },
     "PREFECT_LOGGING_TO_API_BATCH_INTERVAL": {"test_value": 10.0},
     "PREFECT_LOGGING_TO_API_BATCH_SIZE": {"test_value": 5_000_000},
+    "PREFECT_LOGGING_TO_API_COMPRESSION": {"test_value": True},
     "PREFECT_LOGGING_TO_API_ENABLED": {"test_value": True},
     "PREFECT_LOGGING_TO_API_MAX_LOG_SIZE": {"test_value": 10},
+    "PREFECT_LOGGING_TO_API_MAX_QUEUE_SIZE": {"test_value": 10},
+    "PREFECT_LOGGING_TO_API_QUEUE_OVERFLOW_POLICY": {"test_value": "block"},
     "PREFECT_LOGGING_TO_API_WHEN_MISSING_FLOW": {"test_value": "ignore"},
     "PREFECT_MEMOIZE_BLOCK_AUTO_REGISTRATION": {"test_value": True, "legacy": True},
     "PREFECT_MEMO_STORE_PATH": {"test_value": Path("/path/to/memo"), "legacy": True},
@@ -280,7 +288,10 @@ SUPPORTED_SETTINGS = {
     "PREFECT_PROFILES_PATH": {"test_value": Path("/path/to/profiles.toml")},
     "PREFECT_RESULTS_DEFAULT_SERIALIZER": {"test_value": "serializer"},
     "PREFECT_RESULTS_DEFAULT_STORAGE_BLOCK": {"test_value": "block"},
+    "PREFECT_RESULTS_DISK_CACHE_MAX_BYTES": {"test_value": 1024},
+    "PREFECT_RESULTS_DISK_CACHE_PATH": {"test_value": Path("/path/to/cache")},
     "PREFECT_RESULTS_LOCAL_STORAGE_PATH": {"test_value": Path("/path/to/storage")},
+    "PREFECT_RESULTS_MEMORY_CACHE_MAX_BYTES": {"test_value": 1024},
     "PREFECT_RESULTS_PERSIST_BY_DEFAULT": {"test_value": True},
     "PREFECT_RUNNER_HEARTBEAT_FREQUENCY": {"test_value": 30},
     "PREFECT_RUNNER_POLL_FREQUENCY": {"test_value": 10},
@@ -290,6 +301,8 @@ SUPPORTED_SETTINGS = {
     "PREFECT_RUNNER_SERVER_LOG_LEVEL": {"test_value": "INFO"},
     "PREFECT_RUNNER_SERVER_MISSED_POLLS_TOLERANCE": {"test_value": 10},
     "PREFECT_RUNNER_SERVER_PORT": {"test_value": 8080},
+    "PREFECT_RUNNER_WARM_POOL_PRELOAD_MODULES": {"test_value": ["json"]},
+    "PREFECT_RUNNER_WARM_POOL_SIZE": {"test_value": 2},
     "PREFECT_SERVER_ALLOW_EPHEMERAL_MODE": {"test_value": True, "legacy": True},
     "PREFECT_SERVER_API_AUTH_STRING": {"test_value": "admin:admin"},
     "PREFECT_SERVER_API_BASE_PATH": {"test_value": "/v2/api"},
@@ -306,6 +319,10 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_CONCURRENCY_LEASE_STORAGE": {
         "test_value": "prefect.server.concurrency.lease_storage.filesystem"
     },
+    "PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER": {
+        "test_value": "prefect.server.concurrency.slot_ledger.memory"
+    },
+    "PREFECT_SERVER_CONCURRENCY_SLOT_LEDGER_FLUSH_INTERVAL": {"test_value": 2.0},
     "PREFECT_SERVER_CORS_ALLOWED_HEADERS": {"test_value": "foo", "legacy": True},
     "PREFECT_SERVER_CORS_ALLOWED_METHODS": {"test_value": "foo", "legacy": True},
     "PREFECT_SERVER_CORS_ALLOWED_ORIGINS": {"test_value": "foo", "legacy": True},
@@ -323,6 +340,10 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_DATABASE_NAME": {"test_value": "prefect"},
     "PREFECT_SERVER_DATABASE_PASSWORD": {"test_value": "password"},
     "PREFECT_SERVER_DATABASE_PORT": {"test_value": 5432},
+    "PREFECT_SERVER_DATABASE_READ_REPLICA_MAX_LAG": {"test_value": 30.0},
+    "PREFECT_SERVER_DATABASE_READ_REPLICA_URLS": {
+        "test_value": "postgresql+asyncpg://replica/prefect"
+    },
     "PREFECT_SERVER_DATABASE_SQLALCHEMY_CONNECT_ARGS_APPLICATION_NAME": {
         "test_value": "prefect"
     },
@@ -363,6 +384,7 @@ SUPPORTED_SETTINGS = {
     },
     "PREFECT_SERVER_EVENTS_MESSAGING_BROKER": {"test_value": "broker"},
     "PREFECT_SERVER_EVENTS_MESSAGING_CACHE": {"test_value": "cache"},
+    "PREFECT_SERVER_EVENTS_POSTGRES_WRITE_METHOD": {"test_value": "copy"},
     "PREFECT_SERVER_EVENTS_PROACTIVE_GRANULARITY": {"test_value": timedelta(seconds=5)},
     "PREFECT_SERVER_EVENTS_RELATED_RESOURCE_CACHE_TTL": {
         "test_value": timedelta(seconds=10)
@@ -370,6 +392,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_EVENTS_RETENTION_PERIOD": {"test_value": timedelta(hours=7)},
     "PREFECT_SERVER_EVENTS_STREAM_OUT_ENABLED": {"test_value": True},
     "PREFECT_SERVER_EVENTS_WEBSOCKET_BACKFILL_PAGE_SIZE": {"test_value": 250},
+    "PREFECT_SERVER_FLOW_RUN_GRAPH_CACHE_MAX_NODES": {"test_value": 1000},
     "PREFECT_SERVER_FLOW_RUN_GRAPH_MAX_ARTIFACTS": {"test_value": 10},
     "PREFECT_SERVER_FLOW_RUN_GRAPH_MAX_NODES": {"test_value": 100},
     "PREFECT_SERVER_LOGGING_LEVEL": {"test_value": "INFO"},
@@ -408,6 +431,8 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_SERVICES_PAUSE_EXPIRATIONS_LOOP_SECONDS": {"test_value": 10.0},
     "PREFECT_SERVER_SERVICES_REPOSSESSOR_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_REPOSSESSOR_LOOP_SECONDS": {"test_value": 10.0},
+    "PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS": {"test_value": 10.0},
     "PREFECT_SERVER_SERVICES_SCHEDULER_DEPLOYMENT_BATCH_SIZE": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_SCHEDULER_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_SCHEDULER_INSERT_BATCH_SIZE": {"test_value": 10},
@@ -423,7 +448,9 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SERVER_SERVICES_SCHEDULER_MIN_SCHEDULED_TIME": {
         "test_value": timedelta(minutes=10)
     },
+    "PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_BATCH_SIZE": {"test_value": 10},
     "PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_ENABLED": {"test_value": True},
+    "PREFECT_SERVER_SERVICES_TASK_RUN_RECORDER_FLUSH_INTERVAL": {"test_value": 1.0},
     "PREFECT_SERVER_SERVICES_TRIGGERS_ENABLED": {"test_value": True},
     "PREFECT_SERVER_SERVICES_TRIGGERS_PG_NOTIFY_HEARTBEAT_INTERVAL_SECONDS": {
         "test_value": 5
@@ -453,6 +480,8 @@ SUPPORTED_SETTINGS = {
     "PREFECT_TASKS_DEFAULT_RETRY_DELAY_SECONDS": {"test_value": 10},
     "PREFECT_TASKS_DISABLE_CACHING": {"test_value": False},
     "PREFECT_TASKS_REFRESH_CACHE": {"test_value": True},
+    "PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS": {"test_value": 5},
+    "PREFECT_TASKS_RUNNER_PROCESS_POOL_SHARED_MEMORY_MIN_BYTES": {"test_value": 10},
     "PREFECT_TASKS_RUNNER_THREAD_POOL_MAX_WORKERS": {"test_value": 5},
     "PREFECT_TASKS_SCHEDULING_DEFAULT_STORAGE_BLOCK": {"test_value": "block"},
     "PREFECT_TASKS_SCHEDULING_DELETE_FAILED_SUBMISSIONS": {"test_value": True},
@@ -493,6 +522,7 @@ SUPPORTED_SETTINGS = {
     "PREFECT_UNIT_TEST_LOOP_DEBUG": {"test_value": True, "legacy": True},
     "PREFECT_UNIT_TEST_MODE": {"test_value": True, "legacy": True},
     "PREFECT_WORKER_HEARTBEAT_SECONDS": {"test_value": 10.0},
+    "PREFECT_WORKER_LONG_POLL_SECONDS": {"test_value": 5.0},
     "PREFECT_WORKER_PREFETCH_SECONDS": {"test_value": 10.0},
     "PREFECT_WORKER_QUERY_SECONDS": {"test_value": 10.0},
     "PREFECT_WORKER_WEBSERVER_HOST": {"test_value": "host"},
@@ -1,3 +1,4 @@
+import threading
 import time
 import uuid
 from concurrent.futures import Future
@@ -10,16 +11,30 @@ from prefect.client.orchestration import PrefectClient
 from prefect.context import TagsContext, tags
 from prefect.filesystems import LocalFileSystem
 from prefect.flows import flow
-from prefect.futures import PrefectFuture, PrefectWrappedFuture
+from prefect.futures import (
+    PrefectConcurrentFuture,
+    PrefectFuture,
+    PrefectWrappedFuture,
+)
 from prefect.results import _default_storages
 from prefect.settings import (
     PREFECT_DEFAULT_RESULT_STORAGE_BLOCK,
     PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS,
     PREFECT_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK,
+    PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS,
     temporary_settings,
 )
-from prefect.states import Completed, Running
-from prefect.task_runners import PrefectTaskRunner, ThreadPoolTaskRunner
+from prefect.states import Completed, Running, State
+from prefect.task_runners import (
+    PrefectTaskRunner,
+    ProcessPoolTaskRunner,
+    ThreadPoolTaskRunner,
+    _attach_shared_arguments,
+    _release_shared_memory,
+    _share_large_arguments,
+    _SharedMemoryArgument,
+    _unlink_shared_memory,
+)
 from prefect.task_worker import TaskWorker
 from prefect.tasks import task
 
@@ -232,6 +247,132 @@ class TestThreadPoolTaskRunner:
         assert test_flow().result() == 0
 
 
+class TestProcessPoolTaskRunner:
+    @pytest.fixture(autouse=True)
+    def default_storage_setting(self, tmp_path):
+        name = str(uuid.uuid4())
+        LocalFileSystem(basepath=tmp_path).save(name)
+        with temporary_settings(
+            {
+                PREFECT_DEFAULT_RESULT_STORAGE_BLOCK: f"local-file-system/{name}",
+            }
+        ):
+            yield
+
+    def test_duplicate(self):
+        runner = ProcessPoolTaskRunner(max_workers=3, shared_memory_min_bytes=10)
+        duplicate_runner = runner.duplicate()
+        assert isinstance(duplicate_runner, ProcessPoolTaskRunner)
+        assert duplicate_runner is not runner
+        assert duplicate_runner == runner
+        assert duplicate_runner != ProcessPoolTaskRunner(max_workers=3)
+
+    def test_runner_must_be_started(self):
+        runner = ProcessPoolTaskRunner()
+        with pytest.raises(RuntimeError, match="Task runner is not started"):
+            runner.submit(my_test_task, {})
+
+    def test_set_max_workers_through_settings(self):
+        with temporary_settings({PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS: 5}):
+            with ProcessPoolTaskRunner() as runner:
+                assert runner._executor._max_workers == 5
+
+    def test_shares_large_arguments(self):
+        np = pytest.importorskip("numpy")
+        array = np.arange(100, dtype="int64").reshape(10, 10)
+        parameters = {
+            "data": b"x" * 100,
+            "buffer": bytearray(b"y" * 100),
+            "nested": [array[:, ::2]],
+            "small": b"z",
+        }
+
+        shared, blocks = _share_large_arguments(parameters, min_bytes=100)
+        try:
+            assert len(blocks) == 3
+            assert isinstance(shared["data"], _SharedMemoryArgument)
+            assert isinstance(shared["buffer"], _SharedMemoryArgument)
+            assert isinstance(shared["nested"][0], _SharedMemoryArgument)
+            assert shared["small"] == b"z"
+
+            attached, attached_blocks = _attach_shared_arguments(shared)
+            assert attached["data"] == b"x" * 100
+            assert attached["buffer"] == bytearray(b"y" * 100)
+            assert isinstance(attached["buffer"], bytearray)
+            assert (attached["nested"][0] == array[:, ::2]).all()
+
+            del attached
+            _release_shared_memory(attached_blocks)
+        finally:
+            _unlink_shared_memory(blocks)
+
+    def test_does_not_share_object_arrays(self):
+        np = pytest.importorskip("numpy")
+        array = np.array([object()] * 100)
+
+        shared, blocks = _share_large_arguments({"x": array}, min_bytes=1)
+
+        assert shared["x"] is array
+        assert blocks == []
+
+    @pytest.mark.usefixtures("use_hosted_api_server")
+    def test_submit_and_map_tasks(self):
+        @task
+        def add(x, y):
+            return x + y
+
+        @task
+        async def add_async(x, y):
+            return x + y
+
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            future = runner.submit(add, {"x": 1, "y": 2})
+            assert isinstance(future, PrefectFuture)
+            assert isinstance(future.wrapped_future, Future)
+            assert future.result() == 3
+
+            # upstream futures are resolved before tasks are sent to a worker
+            futures = runner.map(add_async, {"x": [1, 2, 3], "y": future})
+            assert [future.result() for future in futures] == [4, 5, 6]
+
+    @pytest.mark.usefixtures("use_hosted_api_server")
+    def test_tasks_receive_context_and_shared_arguments(self):
+        np = pytest.importorskip("numpy")
+
+        @task
+        def summarize(data, array):
+            return len(data), float(array.sum()), TagsContext.get().current_tags
+
+        with tags("tag1"):
+            with ProcessPoolTaskRunner(
+                max_workers=1, shared_memory_min_bytes=1
+            ) as runner:
+                future = runner.submit(
+                    summarize, {"data": b"x" * 10, "array": np.ones(10)}
+                )
+                assert future.result() == (10, 10.0, {"tag1"})
+
+    @pytest.mark.usefixtures("use_hosted_api_server")
+    def test_tasks_waiting_on_upstream_futures_do_not_hold_threads(self):
+        @task
+        def identity(x):
+            return x
+
+        upstream_future: Future[State[int]] = Future()
+        upstream = PrefectConcurrentFuture(
+            task_run_id=uuid.uuid4(), wrapped_future=upstream_future
+        )
+
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            threads = threading.active_count()
+            futures = runner.map(identity, {"x": [upstream] * 50})
+            assert threading.active_count() <= threads + 1
+            assert not any(future.wrapped_future.done() for future in futures)
+
+            upstream_future.set_result(Completed(data=1))
+            assert [future.result() for future in futures] == [1] * 50
+
+
 class TestPrefectTaskRunner:
     @pytest.fixture(autouse=True)
     def clear_cache(self):
@@ -32,7 +32,7 @@ from prefect.cache_policies import (
 )
 from prefect.client.orchestration import PrefectClient
 from prefect.client.schemas.filters import LogFilter, LogFilterFlowRunId
-from prefect.client.schemas.objects import StateType, TaskRunResult
+from prefect.client.schemas.objects import StateDetails, StateType, TaskRunResult
 from prefect.context import FlowRunContext, TaskRunContext
 from prefect.exceptions import (
     ConfigurationError,
@@ -61,7 +61,7 @@ from prefect.settings import (
     PREFECT_UI_URL,
     temporary_settings,
 )
-from prefect.states import State
+from prefect.states import Completed, State
 from prefect.task_worker import read_parameters
 from prefect.tasks import Task, task, task_input_hash
 from prefect.testing.utilities import exceptions_equal
@@ -695,6 +695,87 @@ class TestTaskRun:
         assert await task_state.result() == 1
 
 
+class TestBuildLocalRun:
+    def test_builds_pending_run_outside_of_flow(self):
+        @task(tags=["a"], retries=2, retry_delay_seconds=3, version="1.0")
+        def foo(x):
+            return x
+
+        task_run = foo.build_local_run(parameters={"x": 1})
+
+        assert task_run.name == foo.name
+        assert task_run.flow_run_id is None
+        assert task_run.task_key == foo.task_key
+        assert task_run.dynamic_key.startswith(f"{foo.task_key}-")
+        assert task_run.task_version == "1.0"
+        assert task_run.tags == ["a"]
+        assert task_run.empirical_policy.retries == 2
+        assert task_run.empirical_policy.retry_delay == 3
+        assert task_run.task_inputs == {"x": []}
+
+        assert task_run.state.is_pending()
+        assert task_run.state.state_details.task_run_id == task_run.id
+        assert task_run.state_id == task_run.state.id
+        assert task_run.expected_start_time == task_run.state.timestamp
+
+    def test_uses_given_id(self):
+        @task
+        def foo():
+            pass
+
+        task_run_id = uuid4()
+        task_run = foo.build_local_run(id=task_run_id)
+
+        assert task_run.id == task_run_id
+        assert task_run.state.state_details.task_run_id == task_run_id
+
+    def test_builds_run_in_flow_run_context(self):
+        @task
+        def foo():
+            pass
+
+        @flow
+        def bar():
+            return FlowRunContext.get().flow_run.id, foo.build_local_run()
+
+        flow_run_id, task_run = bar()
+
+        assert task_run.flow_run_id == flow_run_id
+        assert task_run.state.state_details.flow_run_id == flow_run_id
+        assert task_run.name == f"{foo.name}-{task_run.dynamic_key[:3]}"
+
+    def test_includes_context_tags(self):
+        @task(tags=["a"])
+        def foo():
+            pass
+
+        with tags("b"):
+            task_run = foo.build_local_run()
+
+        assert set(task_run.tags) == {"a", "b"}
+
+    def test_collects_task_inputs(self):
+        @task
+        def foo(x, y):
+            pass
+
+        upstream_id, wait_for_id, extra_id = uuid4(), uuid4(), uuid4()
+        upstream = Completed(state_details=StateDetails(task_run_id=upstream_id))
+        wait_for = Completed(state_details=StateDetails(task_run_id=wait_for_id))
+
+        task_run = foo.build_local_run(
+            parameters={"x": upstream, "y": 1},
+            wait_for=[wait_for],
+            extra_task_inputs={"y": {TaskRunResult(id=extra_id)}},
+        )
+
+        assert comparable_inputs(task_run.task_inputs) == {
+            "x": {TaskRunResult(id=upstream_id)},
+            "y": {TaskRunResult(id=extra_id)},
+            "wait_for": {TaskRunResult(id=wait_for_id)},
+        }
+
+
 class TestTaskSubmit:
     def test_raises_outside_of_flow(self):
         @task
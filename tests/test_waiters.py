@@ -1,13 +1,20 @@
 import asyncio
+import threading
+import uuid
+from contextlib import asynccontextmanager
+from functools import partial
 
 import pytest
 
 from prefect import flow
-from prefect._waiters import FlowRunWaiter
+from prefect._waiters import FlowRunWaiter, RunEventSubscription, _RunWaiter
 from prefect.client.orchestration import PrefectClient
+from prefect.client.schemas.objects import TERMINAL_STATES
+from prefect.events import Event
 from prefect.flow_engine import run_flow_async
 from prefect.server.events.pipeline import EventsPipeline
-from prefect.states import Pending
+from prefect.states import Completed, Pending
+from prefect.task_runs import TaskRunWaiter
 
 
 class TestFlowRunWaiter:
@@ -127,3 +134,150 @@ class TestFlowRunWaiter:
 
         assert flow_run_2.state
         assert flow_run_2.state.is_completed()
+
+
+def stop_waiters() -> None:
+    for waiter in (FlowRunWaiter, TaskRunWaiter):
+        if waiter._instance is not None:
+            waiter._instance.stop()
+
+
+class TestRunEventSubscription:
+    @pytest.fixture(autouse=True)
+    def fresh_waiters(self):
+        # other tests may leave waiters running, which would already be subscribed
+        stop_waiters()
+        yield
+        stop_waiters()
+
+    def test_waiters_share_one_subscription(self):
+        subscription = RunEventSubscription.instance()
+
+        FlowRunWaiter.instance()
+        consumer_task = subscription._consumer_task
+        TaskRunWaiter.instance()
+
+        assert subscription._consumer_task is not None
+        assert subscription._waiters == {
+            "prefect.flow-run": FlowRunWaiter.instance(),
+            "prefect.task-run": TaskRunWaiter.instance(),
+        }
+        # the subscription is restarted to include task run events
+        assert subscription._consumer_task is not consumer_task
+        assert set(subscription._event_filter().event.name) == {
+            f"prefect.{kind}.{state.name.title()}"
+            for kind in ["flow-run", "task-run"]
+            for state in TERMINAL_STATES
+        }
+
+    def test_subscription_stops_with_its_last_waiter(self):
+        subscription = RunEventSubscription.instance()
+        FlowRunWaiter.instance()
+        TaskRunWaiter.instance()
+
+        FlowRunWaiter.instance().stop()
+        assert subscription._consumer_task is not None
+
+        TaskRunWaiter.instance().stop()
+        assert subscription._consumer_task is None
+
+    def test_events_are_routed_by_resource_id(self):
+        flow_run_id = uuid.uuid4()
+        task_run_id = uuid.uuid4()
+        finished: list[uuid.UUID] = []
+
+        FlowRunWaiter.add_done_callback(
+            flow_run_id, lambda: finished.append(flow_run_id)
+        )
+        TaskRunWaiter.add_done_callback(
+            task_run_id, lambda: finished.append(task_run_id)
+        )
+        assert FlowRunWaiter.instance().awaited_run_ids() == [flow_run_id]
+
+        subscription = RunEventSubscription.instance()
+        for resource_id in [
+            f"prefect.task-run.{task_run_id}",
+            f"prefect.flow-run.{task_run_id}",
+            f"prefect.flow-run.{flow_run_id}",
+            # a repeated event doesn't call the callbacks again
+            f"prefect.flow-run.{flow_run_id}",
+        ]:
+            subscription._route(
+                Event(
+                    event="prefect.run.Completed",
+                    resource={"prefect.resource.id": resource_id},
+                )
+            )
+
+        assert finished == [task_run_id, flow_run_id]
+        assert FlowRunWaiter.instance().awaited_run_ids() == []
+        assert TaskRunWaiter.instance().awaited_run_ids() == []
+
+        # runs that were seen finishing call new callbacks right away
+        FlowRunWaiter.add_done_callback(flow_run_id, lambda: finished.append(None))
+        assert finished == [task_run_id, flow_run_id, None]
+
+    async def test_polls_for_runs_that_finished_while_disconnected(
+        self, prefect_client: PrefectClient
+    ):
+        @flow
+        def test_flow():
+            pass
+
+        finished_run = await prefect_client.create_flow_run(
+            test_flow, state=Completed()
+        )
+        pending_run = await prefect_client.create_flow_run(test_flow, state=Pending())
+
+        finished: list[uuid.UUID] = []
+        for flow_run in [finished_run, pending_run]:
+            FlowRunWaiter.add_done_callback(
+                flow_run.id, partial(finished.append, flow_run.id)
+            )
+
+        await RunEventSubscription.instance()._poll_for_finished_runs()
+
+        assert finished == [finished_run.id]
+        assert FlowRunWaiter.instance().awaited_run_ids() == [pending_run.id]
+
+    async def test_polls_for_runs_that_finished_before_resubscribing(
+        self, prefect_client: PrefectClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        class Subscriber:
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                await asyncio.Event().wait()
+
+        @asynccontextmanager
+        async def get_events_subscriber(**kwargs):
+            yield Subscriber()
+
+        monkeypatch.setattr(
+            "prefect._waiters.get_events_subscriber", get_events_subscriber
+        )
+
+        @flow
+        def test_flow():
+            pass
+
+        finished_run = await prefect_client.create_flow_run(
+            test_flow, state=Completed()
+        )
+        finished = threading.Event()
+        FlowRunWaiter.add_done_callback(finished_run.id, finished.set)
+
+        # restarting the subscription to include task runs leaves a gap in which
+        # the flow run's event would have been missed
+        TaskRunWaiter.instance()
+
+        assert await asyncio.to_thread(finished.wait, 10)
+
+
+def test_run_waiters_must_read_finished_runs():
+    class IncompleteWaiter(_RunWaiter):
+        resource_prefix = "prefect.test-run"
+
+    with pytest.raises(TypeError):
+        IncompleteWaiter()
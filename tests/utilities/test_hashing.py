@@ -5,7 +5,15 @@ from unittest.mock import MagicMock
 import pytest
 
 from prefect.exceptions import HashError
-from prefect.utilities.hashing import file_hash, hash_objects, stable_hash
+from prefect.utilities.hashing import (
+    CONTENT_HASH_MIN_BYTES,
+    CONTENT_HASHERS,
+    content_hash,
+    file_hash,
+    hash_buffer,
+    hash_objects,
+    stable_hash,
+)
 
 
 @pytest.mark.parametrize(
@@ -83,3 +91,54 @@ class TestHashObjects:
         assert "Unable to create hash" in error_msg
         assert "JSON error" in error_msg
         assert "Pickle error" in error_msg
+
+
+class TestContentHash:
+    def test_small_buffers_are_not_content_hashed(self):
+        assert content_hash(b"x" * (CONTENT_HASH_MIN_BYTES - 1)) is None
+
+    def test_non_buffers_are_not_content_hashed(self):
+        assert content_hash("x" * CONTENT_HASH_MIN_BYTES) is None
+        assert content_hash({"x": 1}) is None
+
+    def test_large_buffers_are_hashed_by_content(self):
+        data = b"x" * CONTENT_HASH_MIN_BYTES
+        assert content_hash(data) == content_hash(bytes(data))
+        assert content_hash(data) != content_hash(b"y" * CONTENT_HASH_MIN_BYTES)
+
+    def test_type_is_part_of_the_hash(self):
+        data = b"x" * CONTENT_HASH_MIN_BYTES
+        assert content_hash(data) != content_hash(bytearray(data))
+
+    def test_registered_hashers_are_used(self, monkeypatch):
+        class Custom:
+            pass
+
+        monkeypatch.setitem(CONTENT_HASHERS, Custom, lambda obj: "custom-hash")
+        assert content_hash(Custom()) == "custom-hash"
+
+    def test_read_only_views_of_changed_buffers_are_rehashed(self):
+        data = bytearray(CONTENT_HASH_MIN_BYTES)
+        view = memoryview(data).toreadonly()
+        first = content_hash(view)
+        data[0] = 1
+
+        assert content_hash(view) != first
+
+
+class TestHashBuffer:
+    def test_chunked_hash_is_deterministic(self):
+        data = bytes(range(256)) * 100
+        assert hash_buffer(data, chunk_size=1000) == hash_buffer(
+            bytearray(data), chunk_size=1000
+        )
+
+    def test_chunked_hash_depends_on_every_chunk(self):
+        data = bytearray(10_000)
+        original = hash_buffer(data, chunk_size=1000)
+        data[-1] = 1
+        assert hash_buffer(data, chunk_size=1000) != original
+
+    def test_non_contiguous_buffers(self):
+        view = memoryview(bytes(range(100)))[::2]
+        assert hash_buffer(view) == hash_buffer(bytes(range(0, 100, 2)))
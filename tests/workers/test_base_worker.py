@@ -53,6 +53,7 @@ from prefect.settings import (
     PREFECT_API_URL,
     PREFECT_RESULTS_PERSIST_BY_DEFAULT,
     PREFECT_TEST_MODE,
+    PREFECT_WORKER_LONG_POLL_SECONDS,
     PREFECT_WORKER_PREFETCH_SECONDS,
     Setting,
     get_current_settings,
@@ -71,6 +72,7 @@ from prefect.types._datetime import now as now_fn
 from prefect.types._datetime import travel_to
 from prefect.utilities.pydantic import parse_obj_as
 from prefect.workers.base import (
+    SCHEDULE_TO_START_SECONDS,
     BaseJobConfiguration,
     BaseVariables,
     BaseWorker,
@@ -577,6 +579,146 @@ async def test_worker_calls_run_with_expected_arguments(
     }
 
 
+async def test_worker_queries_for_as_many_runs_as_it_has_free_slots(
+    prefect_client: PrefectClient,
+    worker_deployment_wq1: WorkQueue,
+    work_pool: WorkPool,
+):
+    for _ in range(3):
+        await prefect_client.create_flow_run_from_deployment(
+            worker_deployment_wq1.id,
+            state=Scheduled(scheduled_time=now_fn("UTC") - timedelta(minutes=1)),
+        )
+
+    async with WorkerTestImpl(work_pool_name=work_pool.name, limit=2) as worker:
+        worker._submit_run = AsyncMock()  # don't run anything
+        query = AsyncMock(wraps=worker.client.get_scheduled_flow_runs_for_work_pool)
+        worker.client.get_scheduled_flow_runs_for_work_pool = query
+
+        assert len(await worker.get_and_submit_flow_runs()) == 2
+        assert query.call_args.kwargs["limit"] == 2
+
+        # both slots are taken by runs that are still being submitted
+        await worker.get_and_submit_flow_runs()
+        assert query.call_args.kwargs["limit"] == 2
+
+        worker._submitting_flow_run_ids.clear()
+        query.reset_mock()
+        assert await worker.get_and_submit_flow_runs() == []
+        query.assert_not_called()
+
+
+async def test_worker_reads_deployments_and_flows_once_per_poll(
+    prefect_client: PrefectClient,
+    worker_deployment_wq1: WorkQueue,
+    work_pool: WorkPool,
+):
+    for _ in range(3):
+        await prefect_client.create_flow_run_from_deployment(
+            worker_deployment_wq1.id,
+            state=Scheduled(scheduled_time=now_fn("UTC") - timedelta(minutes=1)),
+        )
+
+    run_mock = AsyncMock()
+
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        worker._work_pool = work_pool
+        worker.run = run_mock  # don't run anything
+        read_deployment = AsyncMock(wraps=worker.client.read_deployment)
+        read_flow = AsyncMock(wraps=worker.client.read_flow)
+        worker.client.read_deployment = read_deployment
+        worker.client.read_flow = read_flow
+
+        await worker.get_and_submit_flow_runs()
+
+    assert run_mock.call_count == 3
+    assert read_deployment.await_count == 1
+    assert read_flow.await_count == 1
+    configurations = [call.kwargs["configuration"] for call in run_mock.call_args_list]
+    assert len({id(configuration) for configuration in configurations}) == 3
+    assert len({configuration.name for configuration in configurations}) == 3
+
+
+async def test_worker_reads_are_not_shared_after_a_poll(
+    prefect_client: PrefectClient,
+    worker_deployment_wq1: WorkQueue,
+    work_pool: WorkPool,
+):
+    await prefect_client.create_flow_run_from_deployment(
+        worker_deployment_wq1.id,
+        state=Scheduled(scheduled_time=now_fn("UTC") - timedelta(minutes=1)),
+    )
+
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        worker._work_pool = work_pool
+        worker._submit_run = AsyncMock()  # don't run anything
+        read_deployment = AsyncMock(wraps=worker.client.read_deployment)
+        worker.client.read_deployment = read_deployment
+
+        await worker.get_and_submit_flow_runs()
+        await worker._read_deployment(worker_deployment_wq1.id)
+        await worker._read_deployment(worker_deployment_wq1.id)
+
+    assert read_deployment.await_count == 2
+
+
+async def test_worker_long_polls_for_scheduled_runs(
+    prefect_client: PrefectClient,
+    worker_deployment_wq1: WorkQueue,
+    work_pool: WorkPool,
+):
+    with temporary_settings({PREFECT_WORKER_LONG_POLL_SECONDS: 10}):
+        async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+            worker._submit_run = AsyncMock()  # don't run anything
+            query = AsyncMock(wraps=worker.client.get_scheduled_flow_runs_for_work_pool)
+            worker.client.get_scheduled_flow_runs_for_work_pool = query
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(worker._long_poll_and_submit_flow_runs)
+                await anyio.sleep(0.5)
+                flow_run = await prefect_client.create_flow_run_from_deployment(
+                    worker_deployment_wq1.id,
+                    state=Scheduled(scheduled_time=now_fn("UTC")),
+                )
+
+                with anyio.fail_after(5):
+                    while flow_run.id not in worker._submitting_flow_run_ids:
+                        await anyio.sleep(0.1)
+                tg.cancel_scope.cancel()
+
+    assert query.call_args.kwargs["wait_seconds"] == 10
+
+
+async def test_worker_records_schedule_to_start_latency(
+    prefect_client: PrefectClient,
+    worker_deployment_wq1: WorkQueue,
+    work_pool: WorkPool,
+):
+    await prefect_client.create_flow_run_from_deployment(
+        worker_deployment_wq1.id,
+        state=Scheduled(scheduled_time=now_fn("UTC") - timedelta(minutes=1)),
+    )
+
+    async def run(
+        flow_run: FlowRun,
+        configuration: BaseJobConfiguration,
+        task_status: Optional[anyio.abc.TaskStatus[int]] = None,
+    ) -> BaseWorkerResult:
+        if task_status:
+            task_status.started(1234)
+        return BaseWorkerResult(identifier="1234", status_code=0)
+
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        worker._work_pool = work_pool
+        worker.run = run
+        await worker.get_and_submit_flow_runs()
+
+    histogram = SCHEDULE_TO_START_SECONDS.labels(
+        work_pool=work_pool.name, worker=worker.name
+    )
+    assert histogram._sum.get() >= 60
+
+
 async def test_worker_creates_only_one_client_context(
     prefect_client: PrefectClient,
     worker_deployment_wq1: WorkQueue,